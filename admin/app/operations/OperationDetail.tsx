@@ -12,6 +12,8 @@ import {
   runStateLabel,
   shouldPollRun,
   slackStateLabel,
+  stageTimingLabel,
+  stageTimingSummary,
   type OperationsMutationDescriptor,
 } from '@/lib/operations-center'
 import type { OperationsIncidentDetail, OperationsQueueRow } from '@/types'
@@ -146,6 +148,7 @@ export function OperationDetail(props: Props) {
       <section className="ops-detail-section">
         <h3>작업 진행</h3>
         {run ? <ol className="ops-timeline"><li><b>요청</b><span>{formatDate(run.requested_at)}</span></li><li><b>대기</b><span>{formatDate(run.queued_at)}</span></li><li><b>실행</b><span>{formatDate(run.started_at)}</span></li><li><b>{runStateLabel(run.state)}</b><span>{formatDate(run.completed_at)}</span></li></ol> : <p className="text-sm text-slate-500">연결된 자동 작업 기록이 없습니다.</p>}
+        {run?.stage_timings.length ? <dl className="mt-3 space-y-1 text-sm">{run.stage_timings.map((timing) => <div key={timing.stage} className="flex justify-between gap-3"><dt className="font-semibold text-slate-700">{stageTimingLabel(timing.stage)}</dt><dd className="shrink-0 text-slate-500">{stageTimingSummary(timing)}</dd></div>)}</dl> : null}
       </section>
 
       <section className="ops-detail-section">
@@ -18,6 +18,7 @@ import {
   shouldAutoRetrySlack,
   shouldPollRun,
   slackStateLabel,
+  stageTimingSummary,
   updateOperationsQuery,
 } from './operations-center.ts'
 import type { OperationsQueueRow, OperationsRunState } from '../types/index.ts'
@@ -88,7 +89,7 @@ test('generic incident cause falls through to a classified run cause', () => {
       total_count: 150, success_count: 0, failure_count: 150, skipped_count: 0,
       safe_error_code: 'V0_PROVIDER_UNAVAILABLE', safe_error_message: null,
       requested_at: '2026-08-10T01:00:00Z', queued_at: null, started_at: null,
-      completed_at: '2026-08-10T01:10:00Z', version: 1, retry: null,
+      completed_at: '2026-08-10T01:10:00Z', version: 1, retry: null, stage_timings: [],
     },
   })
 
@@ -153,6 +154,14 @@ test('run and Slack labels are exhaustive over every backend state', () => {
   assert.deepEqual(slackStates.map(slackStateLabel), ['발송 대기', '발송 중', '전송 재시도 대기', '전송 결과 확인 필요', '발송 완료', 'Slack 전달 실패'])
 })
 
+test('stage timings read as durations with repeat counts only when repeated', () => {
+  assert.equal(stageTimingSummary({ stage: 'brief', count: 1, total_ms: 850, max_ms: 850 }), '850ms')
+  assert.equal(
+    stageTimingSummary({ stage: 'provider_answer', count: 12, total_ms: 95_400, max_ms: 14_200 }),
+    '1분 35초 · 12회 · 최장 14.2초',
+  )
+})
+
 test('customer-facing operation labels never expose raw backend states', () => {
   const states = ['ONBOARDING', 'ANALYZING', 'BUILDING', 'PENDING_DOMAIN', 'ACTIVE', 'PAUSED', 'PUBLISH_DUE', 'REVIEW_PENDING', 'OVERDUE_REVIEW', 'MISSING', 'DELIVERY_PENDING', 'OPEN', 'RETRYING', 'RECOVERED', 'ACKNOWLEDGED']
 
@@ -176,7 +185,7 @@ test('developer support copy includes safe facts and excludes task payloads', ()
       run_id: 'run-1', parent_run_id: null, operation_type: 'CONTENT', state: 'RUNNING', attempt_count: 1,
       total_count: 1, success_count: 0, failure_count: 0, skipped_count: 0, safe_error_code: 'SAFE_TIMEOUT',
       safe_error_message: 'safe', requested_at: '2026-08-10T01:00:00Z', queued_at: null, started_at: null,
-      completed_at: null, version: 1, retry: null,
+      completed_at: null, version: 1, retry: null, stage_timings: [],
     },
   }, 'https://admin.example.test')
 
@@ -7,6 +7,7 @@ import {
   type OperationsQueueRow,
   type OperationsRunState,
   type OperationsSlackState,
+  type OperationsStageTiming,
 } from '../types/index.ts'
 
 export interface OperationsQuery {
@@ -132,6 +133,39 @@ export function runStateLabel(state: OperationsRunState): string {
   }
 }
 
+const STAGE_TIMING_LABELS: Readonly<Record<string, string>> = {
+  essence: '철학 확인',
+  generate: '본문 생성',
+  review: '자동 검수',
+  brief: '콘텐츠 브리프',
+  write_back: '결과 저장',
+  readiness: '발행 준비 점검',
+  image_enqueue: '이미지 단계 예약',
+  image: '이미지 생성',
+  spec_build: '측정 질문 구성',
+  provider_answer: 'AI 답변 수집',
+  judge: '언급 판정',
+  persistence: '측정 결과 저장',
+  exposure_refresh: '노출 보완 갱신',
+}
+
+export function stageTimingLabel(stage: string): string {
+  return STAGE_TIMING_LABELS[stage] ?? stage
+}
+
+export function formatStageDuration(ms: number): string {
+  if (ms < 1000) return `${ms}ms`
+  const seconds = ms / 1000
+  if (seconds < 60) return `${seconds.toFixed(1)}초`
+  return `${Math.floor(seconds / 60)}분 ${Math.round(seconds % 60)}초`
+}
+
+export function stageTimingSummary(timing: OperationsStageTiming): string {
+  const total = formatStageDuration(timing.total_ms)
+  if (timing.count <= 1) return total
+  return `${total} · ${timing.count}회 · 최장 ${formatStageDuration(timing.max_ms)}`
+}
+
 export function slackStateLabel(state: OperationsSlackState): string {
   switch (state) {
     case 'PENDING': return '발송 대기'
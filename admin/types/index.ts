@@ -616,6 +616,13 @@ export interface OperationsOverviewResponse {
   readonly items: readonly OperationsQueueRow[]
 }
 
+export interface OperationsStageTiming {
+  readonly stage: string
+  readonly count: number
+  readonly total_ms: number
+  readonly max_ms: number
+}
+
 export interface OperationsRunSummary {
   readonly run_id: string
   readonly parent_run_id: string | null
@@ -634,6 +641,7 @@ export interface OperationsRunSummary {
   readonly completed_at: string | null
   readonly version: number
   readonly retry: OperationsAction | null
+  readonly stage_timings: readonly OperationsStageTiming[]
 }
 
 export interface OperationsIncidentDetail {
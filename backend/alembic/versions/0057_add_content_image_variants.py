@@ -0,0 +1,33 @@
+"""Store responsive image derivative manifests on content items.
+
+Revision ID: 0057_add_content_image_variants
+Revises: 0056_add_domain_live_check
+
+The public hub redirected every content image request to the full-size PNG the
+image model produced.  Generation now also writes width-bounded AVIF/WebP
+derivatives next to the original; this column records where they are, plus
+the original dimensions and a tiny placeholder, so the public image endpoint
+can negotiate a variant without listing the bucket.  NULL means "serve the
+original", which is also what every existing row keeps doing.
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "0057_add_content_image_variants"
+down_revision: str | None = "0056_add_domain_live_check"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "content_items",
+        sa.Column("image_variants", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("content_items", "image_variants")
@@ -0,0 +1,40 @@
+"""Track the decoupled cover-image stage on content items.
+
+Revision ID: 0058_add_content_image_stage_state
+Revises: 0057_add_content_image_variants
+
+Nightly generation used to call the image provider inline, so every item waited
+for its cover image before the next item's text generation could start.  Images
+are now produced by a separate task on the `images` queue after the text is
+written back.  `image_status` says whether that stage is pending, done, or
+failed, and `image_requested_at` lets the recovery sweep tell a stage that is
+still in flight from one whose message was lost.
+
+Rows that already have an image are marked READY so they look the same as
+items finished by the new stage.
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0058_add_content_image_stage_state"
+down_revision: str | None = "0057_add_content_image_variants"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.add_column("content_items", sa.Column("image_status", sa.String(20), nullable=True))
+    op.add_column(
+        "content_items",
+        sa.Column("image_requested_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute(
+        "UPDATE content_items SET image_status = 'READY' WHERE image_url IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("content_items", "image_requested_at")
+    op.drop_column("content_items", "image_status")
@@ -0,0 +1,65 @@
+"""Persist the per-hospital essence readiness projection.
+
+Revision ID: 0059_add_hospital_essence_readiness
+Revises: 0058_add_content_image_stage_state
+
+Every public hub request and every nightly item resolved readiness by loading
+all of the hospital's non-excluded source rows, text included, to recompute the
+source snapshot hash.  `hospital_essence_readiness` stores the resolved counts,
+snapshot hash and approved/public philosophy ids; the application rewrites it
+inside each flush that touches sources or philosophies.
+
+No backfill: reads fall back to the recomputation while a hospital has no row,
+and `reconcile_essence_snapshots` writes the missing rows as its rotating
+window passes over them.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "0059_add_hospital_essence_readiness"
+down_revision: str | None = "0058_add_content_image_stage_state"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "hospital_essence_readiness",
+        sa.Column(
+            "hospital_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("hospitals.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "approved_philosophy_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("hospital_content_philosophies.id", ondelete="SET NULL"),
+        ),
+        sa.Column(
+            "public_philosophy_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("hospital_content_philosophies.id", ondelete="SET NULL"),
+        ),
+        sa.Column("processed_source_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("required_source_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("current_snapshot_hash", sa.String(64), nullable=False),
+        sa.Column(
+            "complete_snapshot_is_fresh",
+            sa.Boolean(),
+            server_default=sa.false(),
+            nullable=False,
+        ),
+        sa.Column(
+            "refreshed_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("hospital_essence_readiness")
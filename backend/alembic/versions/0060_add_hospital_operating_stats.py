@@ -0,0 +1,56 @@
+"""Persist per-hospital operating counters for admin readiness and lists.
+
+Revision ID: 0060_add_hospital_operating_stats
+Revises: 0059_add_hospital_essence_readiness
+
+The admin readiness view counted published content, essence-blocked content,
+monthly reports and SoV records (the largest table, unindexed by hospital) on
+every request, and the hospital list could not show any of them.
+`hospital_operating_stats` keeps those counts plus the latest finished
+measurement time and its SoV. Flushes only collect the hospitals whose
+underlying rows changed; each of those rows is rewritten once in
+`before_commit`, inside the same transaction as the change.
+
+No backfill: reads count from the source tables while a hospital has no row,
+and `reconcile_hospital_operating_stats` writes every missing row on its first
+daily run.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "0060_add_hospital_operating_stats"
+down_revision: str | None = "0059_add_hospital_essence_readiness"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "hospital_operating_stats",
+        sa.Column(
+            "hospital_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("hospitals.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("published_content_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "essence_blocked_content_count", sa.Integer(), server_default="0", nullable=False
+        ),
+        sa.Column("report_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("sov_record_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("last_measured_at", sa.DateTime(timezone=True)),
+        sa.Column("latest_sov_pct", sa.Float()),
+        sa.Column(
+            "refreshed_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("hospital_operating_stats")
@@ -0,0 +1,29 @@
+"""Record per-stage timings on measurement runs.
+
+Revision ID: 0061_add_measurement_run_stage_timings
+Revises: 0060_add_hospital_operating_stats
+
+A weekly SoV run only recorded counts and start/finish times, so a slow run
+could not be attributed to provider answers, judge calls or persistence.
+`stage_timings` holds the compact `{stage: {count, total_ms, max_ms}}` summary
+written when the run finishes. Older runs stay NULL.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0061_add_measurement_run_stage_timings"
+down_revision: str | None = "0060_add_hospital_operating_stats"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("measurement_runs", sa.Column("stage_timings", sa.JSON()))
+
+
+def downgrade() -> None:
+    op.drop_column("measurement_runs", "stage_timings")
@@ -26,6 +26,7 @@ from sqlalchemy.orm import selectinload
 from app.core.database import get_db
 from app.models.content import ContentItem, ContentSchedule, ContentStatus
 from app.models.hospital import Hospital, HospitalStatus, Plan
+from app.models.operating_stats import mark_operating_stats_stale
 from app.models.sov import AIQueryTarget, ExposureAction
 from app.schemas.content import ContentBriefUpdate, ContentItemDetail, ContentItemResponse
 from app.services.audit_log import default_actor, write_audit_log
@@ -239,6 +240,7 @@ async def set_schedule(
                 ContentItem.carried_over_from.is_(None),
             )
         )
+        mark_operating_stats_stale(db, hospital_id)
 
     schedule = ContentSchedule(
         hospital_id=hospital_id,
@@ -866,6 +868,8 @@ async def reject_content(
     item.body = None  # 초기화 → 야간 생성 태스크가 다시 처리
     item.title = None
     item.image_url = None
+    item.image_variants = None
+    item.image_status = None
     # 발행됐던 아이템을 반려하면 발행 메타도 초기화 — 재생성·재발행 시 이전 발행 기록이
     # 새 본문에 잘못 남는 것 방지.
     item.published_at = None
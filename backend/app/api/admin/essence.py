@@ -64,7 +64,9 @@ from app.services.essence_engine import (
     validate_philosophy_grounding,
     validate_source_excerpt,
 )
+from app.services.evidence_extraction_cache import default_extraction_cache
 from app.services.gcs_utils import get_signed_url
+from app.services.image_derivatives import store_image_variants
 from app.services.incident_types import IncidentFingerprint
 from app.services.naver_handoff import (
     NaverCrawlOptions,
@@ -570,7 +572,9 @@ async def process_source(
         # 동기 LLM 호출을 워커 스레드로 — 단일 uvicorn worker의 이벤트 루프 블로킹 방지
         # (이 파일의 PDF/DOCX 추출도 동일하게 to_thread 사용).
         async with metered_llm_calls():
-            payloads = await asyncio.to_thread(process_source_asset, source)
+            payloads = await asyncio.to_thread(
+                process_source_asset, source, cache=default_extraction_cache()
+            )
         for payload in payloads:
             if not validate_source_excerpt(source, payload.source_excerpt):
                 raise ValueError(
@@ -772,6 +776,12 @@ async def upload_source_file(
         mime_type=mime_type or "application/octet-stream",
     )
 
+    image_variants = None
+    if is_photo_type:
+        # 공개 사진은 허브 카드·원장 소개에 그대로 쓰인다. 원본 바이트가 손에 있을 때 한 번만
+        # 폭별 AVIF/WebP를 만들어 두면 공개 프록시가 휴대폰에 원본 대신 파생본을 준다.
+        image_variants = await asyncio.to_thread(store_image_variants, file_url, data)
+
     raw_text: str | None = None
     if extractor_kind == "PDF":
         raw_text = await asyncio.to_thread(extract_pdf_text, data) or None
@@ -788,11 +798,10 @@ async def upload_source_file(
         url=None,
         raw_text=raw_text,
         operator_note=_clean_optional(operator_note),
-        source_metadata=build_photo_source_metadata(
-            source_type,
-            asset_kind,
-            file.filename or "",
-        ),
+        source_metadata={
+            **build_photo_source_metadata(source_type, asset_kind, file.filename or ""),
+            **({"image_variants": image_variants} if image_variants else {}),
+        },
         file_url=file_url,
         mime_type=mime_type or None,
         file_size_bytes=len(data),
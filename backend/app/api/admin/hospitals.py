@@ -18,7 +18,7 @@ from urllib.parse import urlparse
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field, field_validator
 from slugify import slugify
-from sqlalchemy import func, or_, select
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -28,18 +28,12 @@ from app.api.admin.domain import (
     domain_dns_strategy_for_hospital,
 )
 from app.core.database import get_db
+from app.core.query_budget import query_budget
 from app.models.admin_user import AdminUser
-from app.models.content import ContentItem, ContentStatus
 from app.models.handoff import HandoffSource, HandoffState, HospitalHandoff
 from app.models.hospital import Hospital, HospitalStatus, Plan
-from app.models.report import MonthlyReport
-from app.models.sov import SovRecord
 from app.schemas.hospital import HospitalDetail, HospitalListItem
 from app.services.audit_log import default_actor, write_audit_log
-from app.services.essence_engine import (
-    ESSENCE_STATUS_MISSING_APPROVED,
-    ESSENCE_STATUS_NEEDS_REVIEW,
-)
 from app.services.essence_readiness import get_essence_readiness
 from app.services.hospital_duplicates import find_duplicate_hospitals, normalize_hospital_name
 from app.services.hospital_lifecycle import (
@@ -54,6 +48,7 @@ from app.services.keyword_analysis import (
 from app.services.keyword_analysis import (
     normalize as normalize_keyword,
 )
+from app.services.operating_stats import load_operating_stats
 from app.services.operation_runs import (
     OperationCommand,
     OperationQueueUnavailable,
@@ -534,7 +529,7 @@ async def list_hospital_name_candidates(
     }
 
 
-@router.get("", response_model=list[HospitalListItem])
+@router.get("", response_model=list[HospitalListItem], dependencies=[query_budget(15)])
 async def list_hospitals(
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=50, ge=1, le=200),
@@ -545,7 +540,8 @@ async def list_hospitals(
         select(Hospital).order_by(Hospital.created_at.desc()).offset(skip).limit(limit)
     )
     hospitals = result.scalars().all()
-    return [_serialize_list(h) for h in hospitals]
+    stats = await load_operating_stats(db, [h.id for h in hospitals])
+    return [_serialize_list(h, stats.get(h.id)) for h in hospitals]
 
 
 @router.get("/{hospital_id}", response_model=HospitalDetail)
@@ -941,47 +937,17 @@ async def get_readiness(hospital_id: uuid.UUID, db: AsyncSession = Depends(get_d
     """병원별 AI 검색 운영 준비도를 계산한다."""
     h = await _get_or_404(db, hospital_id)
 
-    published_count = await _count(
-        db,
-        select(func.count())
-        .select_from(ContentItem)
-        .where(ContentItem.hospital_id == h.id, ContentItem.status == ContentStatus.PUBLISHED),
-    )
-    sov_count = await _count(
-        db,
-        select(func.count()).select_from(SovRecord).where(SovRecord.hospital_id == h.id),
-    )
-    report_count = await _count(
-        db,
-        select(func.count()).select_from(MonthlyReport).where(MonthlyReport.hospital_id == h.id),
-    )
     essence = await get_essence_readiness(db, h.id)
     approved_philosophy = essence.approved
     essence_fresh = essence.is_fresh
-    blocked_content_condition = ContentItem.essence_status.in_(
-        [
-            ESSENCE_STATUS_MISSING_APPROVED,
-            ESSENCE_STATUS_NEEDS_REVIEW,
-        ]
-    )
-    if essence.current is not None:
-        # 새 Essence를 승인한 뒤에도 이전 버전에 연결된 콘텐츠는 공개 API에서
-        # 의도적으로 숨겨진다. 상태 문자열이 ALIGNED였다는 이유로 준비 완료로
-        # 오판하지 않도록 실제 현재 버전 연결까지 같은 서버 게이트에서 확인한다.
-        blocked_content_condition = or_(
-            blocked_content_condition,
-            ContentItem.content_philosophy_id.is_distinct_from(essence.current.id),
-        )
-    essence_blocked_content_count = await _count(
-        db,
-        select(func.count())
-        .select_from(ContentItem)
-        .where(
-            ContentItem.hospital_id == h.id,
-            ContentItem.body.is_not(None),
-            blocked_content_condition,
-        ),
-    )
+    # 카운트는 쓰기 쪽이 유지하는 `HospitalOperatingStats` 한 행 — 병원 상세를 열 때마다
+    # 콘텐츠·SoV 레코드·리포트 테이블을 세지 않는다. 막힌 본문은 현재 공개 Essence와의
+    # 실제 연결까지 같은 기준으로 센 값이다(`operating_stats.compute_operating_stats`).
+    stats = (await load_operating_stats(db, [h.id]))[h.id]
+    published_count = stats["published_content_count"]
+    sov_count = stats["sov_record_count"]
+    report_count = stats["report_count"]
+    essence_blocked_content_count = stats["essence_blocked_content_count"]
 
     has_core_profile = not missing_profile_requirement_keys(h)
     has_local_entity = bool(h.google_business_profile_url or h.google_maps_url)
@@ -1122,11 +1088,6 @@ async def _get_or_404(db: AsyncSession, hospital_id: uuid.UUID) -> Hospital:
     return h
 
 
-async def _count(db: AsyncSession, stmt) -> int:
-    result = await db.execute(stmt)
-    return int(result.scalar_one() or 0)
-
-
 def _has_public_site(h: Hospital) -> bool:
     return h.status == HospitalStatus.ACTIVE and bool(h.site_live)
 
@@ -1211,7 +1172,7 @@ def _enum_value(value: object, default: str) -> str:
     return str(value)
 
 
-def _serialize_list(h: Hospital) -> dict:
+def _serialize_list(h: Hospital, stats: dict | None = None) -> dict:
     return {
         "id": str(h.id),
         "name": h.name,
@@ -1231,6 +1192,19 @@ def _serialize_list(h: Hospital) -> dict:
         "domain_cert_job_state": getattr(h, "domain_cert_job_state", None),
         **_serialize_domain_live_check(h),
         "created_at": h.created_at.isoformat() if h.created_at else None,
+        "operating": _serialize_operating_stats(stats) if stats is not None else None,
+    }
+
+
+def _serialize_operating_stats(stats: dict) -> dict:
+    last_measured_at = stats.get("last_measured_at")
+    return {
+        "published_content_count": stats.get("published_content_count", 0),
+        "essence_blocked_content_count": stats.get("essence_blocked_content_count", 0),
+        "report_count": stats.get("report_count", 0),
+        "sov_record_count": stats.get("sov_record_count", 0),
+        "last_measured_at": last_measured_at.isoformat() if last_measured_at else None,
+        "latest_sov_pct": stats.get("latest_sov_pct"),
     }
 
 
@@ -1,10 +1,13 @@
 """Read-only routes for the unified operations center."""
 
+import asyncio
 import uuid
+from collections.abc import Sequence
+from dataclasses import asdict
 from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from app.api.admin.operations_center_actions import (
     operations_error,
@@ -17,6 +20,7 @@ from app.api.admin.operations_center_queries import load_operations_queue
 from app.api.admin.operations_center_query_common import OperationsFilters, normalize_filters
 from app.api.admin.operations_center_serializers import run_summary
 from app.core.database import get_db
+from app.core.query_budget import query_budget
 from app.models.admin_user import AdminUser
 from app.models.operations import OperationRun
 from app.schemas.operations import (
@@ -24,16 +28,22 @@ from app.schemas.operations import (
     OperationsOverviewResponse,
     OperationsQueue,
     OperationsQueueResponse,
+    OperationsQueueRow,
     OperationsQueueSummary,
     OperationsRunSummary,
 )
+from app.services import operations_overview_cache as overview_cache
 
 router = APIRouter()
 _PAGE_SIZE = 25
 _OVERVIEW_SIZE = 5
 
 
-@router.get("/overview", response_model=OperationsOverviewResponse)
+@router.get(
+    "/overview",
+    response_model=OperationsOverviewResponse,
+    dependencies=[query_budget(10)],
+)
 async def get_operations_overview(
     owner: str | None = None,
     status: str | None = None,
@@ -42,14 +52,58 @@ async def get_operations_overview(
     db: AsyncSession = Depends(get_db),
     _actor: AdminUser = Depends(require_operations_account),
 ) -> OperationsOverviewResponse:
-    """Return all queue counts plus the first five tasks in four fixed queries."""
+    """Return all queue counts plus the first five tasks in four fixed queries.
+
+    Sessions on the engine share a short-lived cached copy and, on a miss, load the
+    four queues concurrently so latency is the slowest queue rather than the sum.
+    The request's session (already holding a connection from the auth lookup) takes
+    the first queue and one extra session each takes the others, so a miss uses at
+    most one connection per queue. A session pinned to a connection (an open
+    transaction) may see uncommitted rows, so it reads sequentially and neither
+    reads nor fills the shared cache.
+    """
     filters = normalize_filters(owner=owner, status=status, severity=severity, sla=sla)
-    summaries: list[OperationsQueueSummary] = []
-    items = []
-    for queue in OperationsQueue:
-        total, rows = await load_operations_queue(
-            db, queue, filters, page=1, page_size=_OVERVIEW_SIZE, overview=True
+    if not isinstance(db.bind, AsyncEngine):
+        return _overview_response(
+            [
+                await load_operations_queue(
+                    db, queue, filters, page=1, page_size=_OVERVIEW_SIZE, overview=True
+                )
+                for queue in OperationsQueue
+            ]
+        )
+
+    cache_scope = asdict(filters)
+    cached, version = await overview_cache.load_overview(cache_scope)
+    if cached is not None:
+        return cached
+    sessions = async_sessionmaker(db.bind, class_=AsyncSession, expire_on_commit=False)
+
+    async def load(queue: OperationsQueue, session: AsyncSession):
+        return await load_operations_queue(
+            session, queue, filters, page=1, page_size=_OVERVIEW_SIZE, overview=True
         )
+
+    async def load_on_own_session(queue: OperationsQueue):
+        async with sessions() as session:
+            return await load(queue, session)
+
+    first, *others = OperationsQueue
+    results = await asyncio.gather(
+        load(first, db), *(load_on_own_session(queue) for queue in others)
+    )
+    response = _overview_response(results)
+    if version is not None:
+        await overview_cache.store_overview(cache_scope, version, response)
+    return response
+
+
+def _overview_response(
+    results: Sequence[tuple[int, list[OperationsQueueRow]]],
+) -> OperationsOverviewResponse:
+    summaries: list[OperationsQueueSummary] = []
+    items: list[OperationsQueueRow] = []
+    for queue, (total, rows) in zip(OperationsQueue, results, strict=True):
         summaries.append(
             OperationsQueueSummary(
                 queue=queue,
@@ -61,7 +115,11 @@ async def get_operations_overview(
     return OperationsOverviewResponse(queues=summaries, items=items)
 
 
-@router.get("/queues/{queue}", response_model=OperationsQueueResponse)
+@router.get(
+    "/queues/{queue}",
+    response_model=OperationsQueueResponse,
+    dependencies=[query_budget(6)],
+)
 async def get_operations_queue(
     queue: OperationsQueue,
     owner: str | None = None,
@@ -18,6 +18,7 @@ from app.schemas.operations import (
     OperationsQueueRow,
     OperationsRunSummary,
     OperationsSlackState,
+    OperationsStageTiming,
 )
 
 __all__ = (
@@ -29,6 +30,7 @@ __all__ = (
     "serialize_incident_row",
     "slack_state",
     "sla_state",
+    "stage_timings",
 )
 
 SlaState = Literal["NONE", "OVERDUE", "DUE"]
@@ -129,9 +131,38 @@ def run_summary(hospital_id: uuid.UUID, run: OperationRun | None) -> OperationsR
         completed_at=run.completed_at,
         version=run.version,
         retry=retry_action(hospital_id, run),
+        stage_timings=stage_timings(run.result_summary),
     )
 
 
+def stage_timings(result_summary: object) -> list[OperationsStageTiming]:
+    """Project persisted stage durations, slowest first.
+
+    Batch runs keep them at the top level; single-item runs (one content image
+    stage) keep them on their only item.
+    """
+    if not isinstance(result_summary, dict):
+        return []
+    timings = result_summary.get("stage_timings")
+    items = result_summary.get("items")
+    if timings is None and isinstance(items, dict) and len(items) == 1:
+        (item,) = items.values()
+        timings = item.get("stage_timings") if isinstance(item, dict) else None
+    if not isinstance(timings, dict):
+        return []
+    rows = [
+        OperationsStageTiming(
+            stage=str(name),
+            count=int(values.get("count", 0)),
+            total_ms=int(values.get("total_ms", 0)),
+            max_ms=int(values.get("max_ms", 0)),
+        )
+        for name, values in timings.items()
+        if isinstance(values, dict)
+    ]
+    return sorted(rows, key=lambda row: row.total_ms, reverse=True)
+
+
 def serialize_incident_row(
     incident: Incident,
     hospital: Hospital | None,
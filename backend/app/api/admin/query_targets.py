@@ -20,6 +20,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
+from app.core.query_budget import query_budget
 from app.models.hospital import Hospital
 from app.models.sov import (
     AIQueryTarget,
@@ -81,7 +82,11 @@ def _platform_label(platform: str | None) -> str | None:
     return PLATFORM_DISPLAY_LABELS.get(str(platform).upper(), str(platform))
 
 
-@router.get("/{hospital_id}/query-targets", response_model=list[AIQueryTargetListItem])
+@router.get(
+    "/{hospital_id}/query-targets",
+    response_model=list[AIQueryTargetListItem],
+    dependencies=[query_budget(10)],
+)
 async def list_query_targets(
     hospital_id: uuid.UUID,
     include_archived: bool = Query(default=False),
@@ -15,6 +15,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.query_budget import query_budget
 from app.models.hospital import Hospital
 from app.models.sov import MeasurementRun, QueryMatrix, SovRecord
 from app.services import sov_engine
@@ -51,7 +52,7 @@ def _display_label(labels: dict[str, str], value: str | None) -> str | None:
     return labels.get(str(value).upper(), str(value))
 
 
-@router.get("/{hospital_id}/sov/measurement-runs")
+@router.get("/{hospital_id}/sov/measurement-runs", dependencies=[query_budget(6)])
 async def get_sov_measurement_runs(
     hospital_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
@@ -71,7 +72,7 @@ async def get_sov_measurement_runs(
     return [_serialize_measurement_run(run) for run in runs]
 
 
-@router.get("/{hospital_id}/sov/trend")
+@router.get("/{hospital_id}/sov/trend", dependencies=[query_budget(6)])
 async def get_sov_trend(hospital_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """
     최근 12주 주간 AI 답변 언급률 추이.
@@ -127,7 +128,7 @@ async def get_sov_trend(hospital_id: uuid.UUID, db: AsyncSession = Depends(get_d
     return result
 
 
-@router.get("/{hospital_id}/sov/queries")
+@router.get("/{hospital_id}/sov/queries", dependencies=[query_budget(6)])
 async def get_sov_queries(hospital_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """
     쿼리별 멘션율.
@@ -5,8 +5,13 @@ from fastapi import HTTPException
 from fastapi.responses import FileResponse, RedirectResponse
 from starlette.responses import Response
 
-from app.services.asset_storage import resolve_legacy_asset_path, resolve_local_asset_path
+from app.services.asset_storage import (
+    derived_asset_ref,
+    resolve_legacy_asset_path,
+    resolve_local_asset_path,
+)
 from app.services.gcs_utils import get_signed_url
+from app.services.image_derivatives import FORMAT_MEDIA_TYPES, choose_image_variant
 
 
 def public_asset_url(slug: str, source_id: uuid.UUID) -> str:
@@ -34,6 +39,40 @@ def public_asset_response(asset_ref: str, *, hospital_id: uuid.UUID, media_type:
     raise HTTPException(status_code=404, detail="Asset not found")
 
 
+def public_image_response(
+    original_ref: str,
+    variants: dict | None,
+    *,
+    hospital_id: uuid.UUID,
+    media_type: str | None,
+    accept: str | None,
+    width: int | None = None,
+    image_format: str | None = None,
+) -> Response:
+    """`Accept`와 `w`/`format` 쿼리로 파생본을 골라 서빙한다. 맞는 파생본이 없으면 원본."""
+    variant = choose_image_variant(
+        variants, accept=accept, width=width, image_format=image_format
+    )
+    if variant is not None and variant["ref"] != derived_asset_ref(
+        original_ref, f".w{variant['width']}.{variant['format']}"
+    ):
+        # 사진 manifest는 운영자가 PATCH할 수 있는 source_metadata 안에 있다. 원본 옆 결정적
+        # 경로가 아닌 reference는 따르지 않는다 — 다른 버킷 객체를 서명해 주지 않게.
+        variant = None
+    if variant is None:
+        response = public_asset_response(original_ref, hospital_id=hospital_id, media_type=media_type)
+    else:
+        response = public_asset_response(
+            variant["ref"],
+            hospital_id=hospital_id,
+            media_type=FORMAT_MEDIA_TYPES[variant["format"]],
+        )
+    # 같은 URL이 Accept에 따라 다른 객체로 간다 — 공유 캐시가 AVIF를 못 읽는 브라우저에
+    # 돌려주지 않게 한다.
+    response.headers["Vary"] = "Accept"
+    return response
+
+
 def _is_external_url(value: str) -> bool:
     parsed = urlparse(value)
     return parsed.scheme in {"http", "https"} and bool(parsed.netloc)
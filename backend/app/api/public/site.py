@@ -8,9 +8,10 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.api.public.assets import public_asset_response, public_asset_url
+from app.api.public.assets import public_asset_url, public_image_response
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.query_budget import query_budget
 from app.core.rate_limit import limiter
 from app.models.content import ContentItem, ContentStatus
 from app.models.essence import (
@@ -24,6 +25,7 @@ from app.models.essence import (
 from app.models.hospital import Hospital, HospitalStatus
 from app.services.essence_engine import ESSENCE_STATUS_ALIGNED
 from app.services.essence_readiness import get_essence_readiness
+from app.services.image_derivatives import image_dimensions
 from app.services.photo_assets import effective_photo_metadata
 from app.utils.domain import normalize_domain
 from app.utils.error_page import looks_like_error_page_text
@@ -40,6 +42,9 @@ domain_router = APIRouter(prefix="/public/site/hospitals", tags=["Public — Sit
 # 와일드카드 cert가 이들도 커버하므로 slug로 오인하지 않도록 명시 차단.
 _RESERVED_PLATFORM_LABELS = frozenset({"www", "admin", "api", "cname", "static", "assets"})
 
+# 공개 이미지 `format` 쿼리 — 파생본 형식 또는 원본 강제.
+_IMAGE_FORMAT_PATTERN = "^(avif|webp|original)$"
+
 
 class TenantHealthLookup(BaseModel):
     hospital_id: uuid.UUID
@@ -153,7 +158,7 @@ async def get_tenant_health_by_domain(
     )
 
 
-@router.get("")
+@router.get("", dependencies=[query_budget(2)])
 @limiter.limit(settings.PUBLIC_SITE_RATE_LIMIT)
 async def list_hospitals(request: Request, db: AsyncSession = Depends(get_db)):
     """Public list of active hospitals for sitemap generation."""
@@ -189,7 +194,7 @@ def _serialize_hospital_summary(h: Hospital) -> dict:
     }
 
 
-@router.get("/{slug}")
+@router.get("/{slug}", dependencies=[query_budget(8)])
 @limiter.limit(settings.PUBLIC_SITE_RATE_LIMIT)
 async def get_hospital_public(request: Request, slug: str, db: AsyncSession = Depends(get_db)):
     """병원 기본정보 (ACTIVE 상태 병원만 공개) + AE가 검수해 공개로 표시한 사진."""
@@ -226,6 +231,8 @@ async def get_public_hospital_asset(
     request: Request,
     slug: str,
     source_id: uuid.UUID,
+    w: int | None = Query(default=None, ge=1, le=4096),
+    image_format: str | None = Query(default=None, alias="format", pattern=_IMAGE_FORMAT_PATTERN),
     db: AsyncSession = Depends(get_db),
 ):
     """Serve only photos explicitly approved for public site exposure."""
@@ -243,10 +250,18 @@ async def get_public_hospital_asset(
     asset = result.scalar_one_or_none()
     if not asset or not asset.file_url:
         raise HTTPException(status_code=404, detail="Asset not found")
-    return public_asset_response(asset.file_url, hospital_id=h.id, media_type=asset.mime_type)
+    return public_image_response(
+        asset.file_url,
+        (asset.source_metadata or {}).get("image_variants"),
+        hospital_id=h.id,
+        media_type=asset.mime_type,
+        accept=request.headers.get("accept"),
+        width=w,
+        image_format=image_format,
+    )
 
 
-@router.get("/{slug}/contents")
+@router.get("/{slug}/contents", dependencies=[query_budget(8)])
 @limiter.limit(settings.PUBLIC_SITE_RATE_LIMIT)
 async def list_published_contents(
     request: Request,
@@ -283,7 +298,7 @@ async def list_published_contents(
     return [_serialize_item(item, h.slug) for item in items]
 
 
-@router.get("/{slug}/contents/{content_id}")
+@router.get("/{slug}/contents/{content_id}", dependencies=[query_budget(8)])
 @limiter.limit(settings.PUBLIC_SITE_RATE_LIMIT)
 async def get_content_public(
     request: Request, slug: str, content_id: uuid.UUID, db: AsyncSession = Depends(get_db)
@@ -311,9 +326,17 @@ async def get_content_public(
 @router.get("/{slug}/contents/{content_id}/image")
 @limiter.limit(settings.PUBLIC_SITE_RATE_LIMIT)
 async def get_public_content_image(
-    request: Request, slug: str, content_id: uuid.UUID, db: AsyncSession = Depends(get_db)
+    request: Request,
+    slug: str,
+    content_id: uuid.UUID,
+    w: int | None = Query(default=None, ge=1, le=4096),
+    image_format: str | None = Query(default=None, alias="format", pattern=_IMAGE_FORMAT_PATTERN),
+    db: AsyncSession = Depends(get_db),
 ):
-    """발행된 콘텐츠 대표 이미지를 안정 URL로 서빙 (요청마다 fresh signed URL로 302)."""
+    """발행된 콘텐츠 대표 이미지를 안정 URL로 서빙 (요청마다 fresh signed URL로 302).
+
+    파생본이 있으면 `Accept`(AVIF > WebP)와 `w`(이상인 것 중 최소 폭)로 고른다.
+    `format=original`이면 항상 원본이다."""
     h = await _get_active_hospital(db, slug)
     essence = await get_essence_readiness(db, h.id)
     public_philosophy = essence.public_philosophy
@@ -325,7 +348,15 @@ async def get_public_content_image(
         or not item.image_url
     ):
         raise HTTPException(status_code=404, detail="Content image not found")
-    return public_asset_response(item.image_url, hospital_id=h.id, media_type="image/png")
+    return public_image_response(
+        item.image_url,
+        item.image_variants,
+        hospital_id=h.id,
+        media_type="image/png",
+        accept=request.headers.get("accept"),
+        width=w,
+        image_format=image_format,
+    )
 
 
 # ── 헬퍼 ─────────────────────────────────────────────────────────
@@ -402,6 +433,7 @@ def _serialize_hospital(
             else asset.source_type,
             "title": asset.title,
             "url": public_asset_url(h.slug, asset.id),
+            **image_dimensions((asset.source_metadata or {}).get("image_variants")),
             "asset_kind": photo_metadata(asset).get("asset_kind"),
             "approved_usage": photo_metadata(asset).get("approved_usage"),
         }
@@ -534,6 +566,12 @@ def _content_image_url(slug: str, item: ContentItem) -> str:
     return ref
 
 
+def _content_image_dimensions(item: ContentItem) -> dict:
+    # 파생본은 프록시 경로로만 협상되므로 gs:// 원본일 때만 크기·placeholder를 낸다.
+    manifest = item.image_variants if (item.image_url or "").startswith("gs://") else None
+    return image_dimensions(manifest)
+
+
 def _safe_external_url(value: str | None) -> str | None:
     if not value:
         return None
@@ -565,6 +603,7 @@ def _serialize_item(item: ContentItem, slug: str, full: bool = False) -> dict:
         "title": item.title,
         "meta_description": item.meta_description,
         "image_url": _content_image_url(slug, item) if item.image_url else None,
+        **_content_image_dimensions(item),
         "scheduled_date": str(item.scheduled_date),
         "published_at": item.published_at.isoformat() if item.published_at else None,
         "body_updated_at": item.body_updated_at.isoformat() if item.body_updated_at else None,
@@ -15,7 +15,7 @@ from app.workers.dispatch_auth import (
 # Redis에 저장된 정적 스케줄과 배포 이미지의 선언을 맞출 때 사용하는 명시적 버전.
 # beat_schedule을 추가/삭제/시간 변경할 때 반드시 올린다. 배포 스크립트의
 # reconcile-redbeat Job이 이 버전을 기록하고, --check 모드가 드리프트를 차단한다.
-REDBEAT_SCHEDULE_VERSION = "2026-08-21.1"
+REDBEAT_SCHEDULE_VERSION = "2026-10-19.1"
 
 # Worker logs share the API's structured format + request_id filter (OBS-1/OBS-2).
 configure_logging(level=settings.LOG_LEVEL, json_logs=settings.LOG_JSON)
@@ -75,19 +75,25 @@ celery_app = Celery(
     broker=settings.REDIS_URL,
     backend=settings.REDIS_URL,
     task_cls=AuthenticatedTask,
-    include=[
-        "app.workers.tasks",
-        "app.workers.naver_sync",
-        "app.workers.lead_diagnosis_tasks",
-        "app.workers.notification_tasks",
-        "app.workers.milestone_event_tasks",
-        "app.workers.monthly_artifact_reconciliation",
-        "app.workers.autonomous_recovery",
-        "app.workers.content_backlog_recovery",
-        "app.workers.domain_certificate_tasks",
-        "app.workers.operation_run_signals",
-        "app.workers.canary_tasks",
-    ],
+)
+
+# 태스크를 정의한 워커 모듈. 각 모듈이 어느 큐에 속하는지는 task_routes에서 읽는다.
+WORKER_TASK_MODULES = (
+    "app.workers.tasks",
+    "app.workers.naver_sync",
+    "app.workers.lead_diagnosis_tasks",
+    "app.workers.notification_tasks",
+    "app.workers.milestone_event_tasks",
+    "app.workers.monthly_artifact_reconciliation",
+    "app.workers.autonomous_recovery",
+    "app.workers.content_backlog_recovery",
+    "app.workers.domain_certificate_tasks",
+    "app.workers.canary_tasks",
+)
+# 시그널 핸들러만 있는 모듈 — 어떤 큐를 소비하든 모든 워커가 로드한다.
+WORKER_SIGNAL_MODULES = (
+    "app.workers.operation_run_signals",
+    "app.workers.task_metrics",
 )
 
 before_task_publish.connect(stamp_published_message, weak=False)
@@ -129,7 +135,11 @@ celery_app.conf.update(
         "app.workers.tasks.regenerate_content_item": {"queue": "content"},
         "app.workers.tasks.auto_review_essence_snapshot": {"queue": "content"},
         "app.workers.tasks.reconcile_essence_snapshots": {"queue": "default"},
+        "app.workers.tasks.reconcile_hospital_operating_stats": {"queue": "default"},
         "app.workers.tasks.morning_content_auto_publish": {"queue": "content"},
+        # 대표 이미지 단계 — 본문 생성(content)과 워커 슬롯을 나눈다. 전용 풀은
+        # SERVICE=image-worker로 띄운다(docker-entrypoint.sh).
+        "app.workers.tasks.generate_content_image_stage": {"queue": "images"},
         "app.workers.tasks.run_sov_for_hospital": {"queue": "sov"},
         "app.workers.tasks.run_weekly_monitoring": {"queue": "sov"},
         "app.workers.tasks.run_monthly_reports": {"queue": "reports"},
@@ -163,6 +173,7 @@ celery_app.conf.update(
         },
         "app.workers.canary_tasks.canary_default": {"queue": "default"},
         "app.workers.canary_tasks.canary_content": {"queue": "content"},
+        "app.workers.canary_tasks.canary_images": {"queue": "images"},
         "app.workers.canary_tasks.canary_sov": {"queue": "sov"},
         "app.workers.canary_tasks.canary_reports": {"queue": "reports"},
         "app.workers.canary_tasks.canary_leadgen": {"queue": "leadgen"},
@@ -201,6 +212,13 @@ celery_app.conf.update(
             "schedule": crontab(minute="*/15"),
             "options": {"headers": build_dispatch_headers("reconcile-essence-snapshots")},
         },
+        # 매일 04:30 — 병원별 운영 카운터를 원천에서 다시 세어 flush 밖 쓰기로 생긴
+        # 어긋남을 고친다. 리드 파기(04:00) 뒤, 아침 자동 발행(08:00) 전.
+        "reconcile-hospital-operating-stats": {
+            "task": "app.workers.tasks.reconcile_hospital_operating_stats",
+            "schedule": crontab(hour=4, minute=30),
+            "options": {"headers": build_dispatch_headers("reconcile-hospital-operating-stats")},
+        },
         # 매일 아침 08:00 — 자동 안전검사 후 발행 + 자동 복구 소진 예외 요약
         "morning-content-auto-publish": {
             "task": "app.workers.tasks.morning_content_auto_publish",
@@ -283,6 +301,11 @@ celery_app.conf.update(
             "schedule": crontab(minute="*/5"),
             "options": {"headers": build_dispatch_headers("canary-content")},
         },
+        "canary-images": {
+            "task": "app.workers.canary_tasks.canary_images",
+            "schedule": crontab(minute="*/5"),
+            "options": {"headers": build_dispatch_headers("canary-images")},
+        },
         "canary-sov": {
             "task": "app.workers.canary_tasks.canary_sov",
             "schedule": crontab(minute="*/5"),
@@ -305,3 +328,28 @@ celery_app.conf.update(
         },
     },
 )
+
+
+def worker_modules(queues: str) -> list[str]:
+    """워커가 부팅 때 import할 모듈 — 소비하는 큐로 라우팅된 태스크의 모듈만.
+
+    빈 값이면 전부다(로컬 compose 워커, API·beat 프로세스). 큐를 좁힌 워커는 다른
+    큐의 태스크 모듈을 import하지 않으므로, 예컨대 leadgen·certificates 전용 워커가
+    콘텐츠 생성·리포트 PDF 스택을 올리지 않는다.
+    """
+    selected = {queue.strip() for queue in queues.split(",") if queue.strip()}
+    if not selected:
+        return [*WORKER_TASK_MODULES, *WORKER_SIGNAL_MODULES]
+    routed = {
+        task_name.rsplit(".", 1)[0]
+        for task_name, route in celery_app.conf.task_routes.items()
+        if route.get("queue") in selected
+    }
+    return [module for module in WORKER_TASK_MODULES if module in routed] + list(
+        WORKER_SIGNAL_MODULES
+    )
+
+
+# -Q와 같은 값을 CELERY_WORKER_QUEUES로 받는다(docker-entrypoint.sh). Celery는 include
+# 모듈을 -Q를 해석하기 전에 import하므로 워커 인자에서 직접 읽을 수 없다.
+celery_app.conf.include = worker_modules(settings.CELERY_WORKER_QUEUES)
@@ -16,6 +16,7 @@ _CRITICAL_PRODUCTION_SECRETS = (
     "ADMIN_SECRET_KEY",
     "WORKER_DISPATCH_SECRET",
     "SLACK_WEBHOOK_URL",
+    "METRICS_BEARER_TOKEN",
 )
 
 
@@ -72,6 +73,9 @@ class Settings(BaseSettings):
             # 조회하면 정상 부팅마다 IAM 403 경고가 남으므로, 키가 필요할 때만
             # Cloud Run env/secret mount로 명시적으로 주입한다.
             self.SLACK_WEBHOOK_URL = _resolve_secret("SLACK_WEBHOOK_URL", self.SLACK_WEBHOOK_URL)
+            self.METRICS_BEARER_TOKEN = _resolve_secret(
+                "METRICS_BEARER_TOKEN", self.METRICS_BEARER_TOKEN
+            )
             self.DB_PASSWORD = _resolve_secret("DB_PASSWORD", self.DB_PASSWORD)
             self._build_database_urls_from_secret_parts()
             self.SITE_REVALIDATE_SECRET = _resolve_secret(
@@ -305,10 +309,18 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # Celery 워커가 소비하는 큐(쉼표 구분). docker-entrypoint.sh가 -Q와 같은 값으로 채우고,
+    # celery_app은 이 큐로 라우팅된 태스크 모듈만 import한다. 비어 있으면 전부 로드한다.
+    CELERY_WORKER_QUEUES: str = ""
+
     # Anthropic — 콘텐츠 생성
     ANTHROPIC_API_KEY: str = ""
     CLAUDE_MODEL: str = "claude-sonnet-4-5"
     CLAUDE_MODEL_FAST: str = "claude-haiku-4-5-20251001"
+    # 프로세스 공용 클라이언트(services/anthropic_client)의 HTTP 연결 풀 크기와
+    # 모델별 동시 호출 상한. 상한을 넘는 호출은 대기한다 — 429 재시도보다 싸다.
+    ANTHROPIC_MAX_CONNECTIONS: int = 20
+    ANTHROPIC_MODEL_CONCURRENCY: int = 8
 
     # Jina Reader — 프로파일 자동 채우기 시 네이버 플레이스 등 봇 차단 사이트 우회 읽기.
     # 선택값: 비어 있어도 무인증 free tier로 동작(분당 제한 빡빡). 키가 있으면 상향.
@@ -400,6 +412,18 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     LOG_JSON: bool = True
 
+    # Prometheus /metrics (API와 워커 헬스 서버)와 /queues/backlog의 스크레이프 토큰.
+    # 비어 있으면 토큰 없이 열리므로 로컬/테스트 전용 — 프로덕션은 critical secret으로
+    # 요구한다(Cloud Run 서비스 URL은 로드밸런서를 거치지 않고도 닿는다).
+    METRICS_BEARER_TOKEN: str = ""
+
+    # SQL 쿼리 예산 (app/core/query_budget.py). N+1로 번지기 쉬운 라우트는 요청당 SQL
+    # 문장 수 상한을 선언하고, 넘으면 경고 로그를 남긴다. STRICT이면 예외로 바꿔 그
+    # 라우트를 친 테스트가 실패하게 한다 — 테스트 전용이며 운영에서는 켜지 않는다.
+    QUERY_BUDGET_STRICT: bool = False
+    # 이보다 오래 걸린 SQL 문장은 요청/태스크 추적 여부와 무관하게 경고 로그로 남긴다.
+    SLOW_QUERY_MS: int = 500
+
     # SoV
     # 주간 측정 반복 횟수. 월간 리포트는 새로 측정하지 않고 이 기록을 집계하므로
     # 이 값이 곧 원장 보고 숫자의 표본 크기다.
@@ -8,6 +8,7 @@ from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
+from app.core.metrics import TimedAsyncAdaptedQueuePool, TimedQueuePool, instrument_pool
 
 engine = None
 AsyncSessionLocal = None
@@ -53,11 +54,15 @@ def get_async_sessionmaker():
             engine_kwargs["poolclass"] = NullPool
         else:
             engine_kwargs.update(
+                poolclass=TimedAsyncAdaptedQueuePool,
+                pool_logging_name="api",
                 pool_size=settings.DB_POOL_SIZE,
                 max_overflow=settings.DB_MAX_OVERFLOW,
                 pool_timeout=settings.DB_POOL_TIMEOUT,
             )
         engine = create_async_engine(settings.DATABASE_URL, **engine_kwargs)
+        if not worker_process:
+            instrument_pool(engine.sync_engine)
         AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
     return AsyncSessionLocal
 
@@ -77,11 +82,14 @@ def get_sync_engine():
             settings.SYNC_DATABASE_URL,
             echo=settings.APP_ENV == "development",
             pool_pre_ping=True,
+            poolclass=TimedQueuePool,
+            pool_logging_name="worker",
             pool_size=settings.DB_WORKER_POOL_SIZE,
             max_overflow=settings.DB_WORKER_MAX_OVERFLOW,
             pool_timeout=settings.DB_POOL_TIMEOUT,
             connect_args=_sync_connect_args(),
         )
+        instrument_pool(_sync_engine)
     return _sync_engine
 
 
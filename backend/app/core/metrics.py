@@ -0,0 +1,223 @@
+"""Prometheus metrics for the API, Celery workers and outbound provider calls.
+
+Metric objects live here so every process registers the same names and labels.
+Labels are kept bounded: HTTP routes use the matched path template (never the raw
+URL), provider calls use the configured model name, and errors collapse to an
+HTTP status code or a fixed word.
+
+Celery prefork children cannot each serve HTTP, so worker containers set
+``PROMETHEUS_MULTIPROC_DIR`` (see docker-entrypoint.sh). prometheus_client then
+writes samples to per-process files in that directory and the health-server
+sidecar aggregates them on ``/metrics``. The API runs one uvicorn process and
+uses the default in-process registry.
+"""
+import hmac
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+# Request latency spans cheap reads (~5ms) to PDF/report endpoints (~10s).
+_HTTP_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+_HTTP_SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+# Tasks range from sub-second fan-out to multi-minute SoV runs and nightly batches.
+_TASK_BUCKETS = (0.1, 0.5, 1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600)
+_QUEUE_WAIT_BUCKETS = (0.05, 0.25, 1, 5, 15, 60, 300, 900, 3600)
+# LLM calls: parse calls ~1s, web-search answers ~10-40s, image generation up to ~3m.
+_PROVIDER_BUCKETS = (0.25, 0.5, 1, 2.5, 5, 10, 20, 40, 60, 120, 180)
+_POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30)
+# SQL statements per request/task; a route drifting into N+1 moves up these buckets.
+_DB_STATEMENT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 250, 1000)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "reputation_http_request_duration_seconds",
+    "API request latency by route template.",
+    ("method", "route", "status"),
+    buckets=_HTTP_LATENCY_BUCKETS,
+)
+HTTP_RESPONSE_BYTES = Histogram(
+    "reputation_http_response_size_bytes",
+    "API response body size by route template (responses with Content-Length).",
+    ("method", "route", "status"),
+    buckets=_HTTP_SIZE_BUCKETS,
+)
+TASK_RUNTIME_SECONDS = Histogram(
+    "reputation_celery_task_runtime_seconds",
+    "Celery task execution time by final state.",
+    ("task", "queue", "state"),
+    buckets=_TASK_BUCKETS,
+)
+TASK_QUEUE_WAIT_SECONDS = Histogram(
+    "reputation_celery_task_queue_wait_seconds",
+    "Time from publish (or ETA) until a worker started the task.",
+    ("task", "queue"),
+    buckets=_QUEUE_WAIT_BUCKETS,
+)
+TASK_RETRIES = Counter(
+    "reputation_celery_task_retries_total",
+    "Celery task retries requested.",
+    ("task", "queue"),
+)
+PROVIDER_CALL_SECONDS = Histogram(
+    "reputation_provider_call_duration_seconds",
+    "Outbound LLM/image provider call latency.",
+    ("provider", "model", "status"),
+    buckets=_PROVIDER_BUCKETS,
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "reputation_db_pool_checkout_seconds",
+    "Time to obtain a pooled DB connection, including waits for a free slot.",
+    ("pool",),
+    buckets=_POOL_WAIT_BUCKETS,
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "reputation_db_pool_checked_out_connections",
+    "Pooled DB connections currently checked out.",
+    ("pool",),
+    multiprocess_mode="livesum",
+)
+HTTP_DB_STATEMENTS = Histogram(
+    "reputation_http_db_statements",
+    "SQL statements executed per API request by route template.",
+    ("method", "route"),
+    buckets=_DB_STATEMENT_BUCKETS,
+)
+TASK_DB_STATEMENTS = Histogram(
+    "reputation_celery_task_db_statements",
+    "SQL statements executed per Celery task run.",
+    ("task", "queue"),
+    buckets=_DB_STATEMENT_BUCKETS,
+)
+# Broker backlog, refreshed from Redis by the API before each scrape
+# (app/services/queue_backlog.py). Every API instance reports the same values, so
+# aggregate with max(), not sum().
+CELERY_QUEUE_READY = Gauge(
+    "reputation_celery_queue_ready_messages",
+    "Messages waiting in the broker queue for a worker.",
+    ("queue",),
+)
+CELERY_QUEUE_IN_FLIGHT = Gauge(
+    "reputation_celery_queue_in_flight_messages",
+    "Messages taken by a worker and not yet acknowledged (tasks running).",
+    ("queue",),
+)
+CELERY_QUEUE_SCHEDULED = Gauge(
+    "reputation_celery_queue_scheduled_messages",
+    "Countdown/ETA messages held by a worker until their ETA.",
+    ("queue",),
+)
+CELERY_QUEUE_OLDEST_AGE_SECONDS = Gauge(
+    "reputation_celery_queue_oldest_message_age_seconds",
+    "Age of the oldest message waiting in the queue.",
+    ("queue",),
+)
+CELERY_QUEUE_PREDICTED_DRAIN_SECONDS = Gauge(
+    "reputation_celery_queue_predicted_drain_seconds",
+    "Predicted time to empty the queue at the current consumers and recent runtimes.",
+    ("queue",),
+)
+CACHE_REQUESTS = Counter(
+    "reputation_cache_requests_total",
+    "Cache lookups by outcome (hit, miss, error).",
+    ("cache", "result"),
+)
+
+
+def metrics_payload() -> tuple[bytes, str]:
+    """Render every metric this process can see, plus its content type."""
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def metrics_authorized(authorization: str | None) -> bool:
+    """With ``METRICS_BEARER_TOKEN`` set, only that bearer token may scrape."""
+    token = settings.METRICS_BEARER_TOKEN
+    if not token:
+        return True
+    scheme, _, value = (authorization or "").partition(" ")
+    return scheme.lower() == "bearer" and hmac.compare_digest(value.strip(), token)
+
+
+def _provider_status(exc: BaseException) -> str:
+    # openai/anthropic errors carry ``status_code``; google-genai's APIError uses ``code``.
+    for attr in ("status_code", "code"):
+        status_code = getattr(exc, attr, None)
+        if isinstance(status_code, int):
+            return str(status_code)
+    if isinstance(exc, TimeoutError):
+        return "timeout"
+    return "error"
+
+
+@contextmanager
+def observe_provider_call(provider: str, model: str) -> Iterator[None]:
+    """Time one provider HTTP call. Wrap the SDK call itself, not the retry loop."""
+    started = time.perf_counter()
+    status = "ok"
+    try:
+        yield
+    except BaseException as exc:
+        status = _provider_status(exc)
+        raise
+    finally:
+        PROVIDER_CALL_SECONDS.labels(provider, model or "unknown", status).observe(
+            time.perf_counter() - started
+        )
+
+
+def record_cache_lookup(cache: str, result: str, count: int = 1) -> None:
+    if count > 0:
+        CACHE_REQUESTS.labels(cache, result).inc(count)
+
+
+class _TimedPoolMixin:
+    """SQLAlchemy has no event before checkout, so the wait is timed around ``connect``.
+
+    The span also covers opening a new connection and the pre-ping, which is what a
+    caller actually waits for. The engine's ``pool_logging_name`` is the label.
+    """
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.labels(self.logging_name or "default").observe(
+                time.perf_counter() - started
+            )
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_pool(engine: Engine) -> None:
+    """Track checked-out connections of ``engine``'s pool (survives pool recreation)."""
+    gauge = DB_POOL_CHECKED_OUT.labels(engine.pool.logging_name or "default")
+    event.listen(engine, "checkout", lambda *_args: gauge.inc())
+    event.listen(engine, "checkin", lambda *_args: gauge.dec())
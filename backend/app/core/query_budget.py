@@ -0,0 +1,206 @@
+"""Per-request and per-task SQL statement counts, DB time and query budgets.
+
+Listeners on every SQLAlchemy ``Engine`` (async engines included, via their sync
+engine) count statements and the time spent in the driver while a `QueryStats`
+is active in the current context. `QueryStatsMiddleware` activates one per API
+request and writes the totals into the request log line; the Celery task signals
+in app/workers/task_metrics.py do the same per task. The context propagates into
+``asyncio.gather`` children and threadpool work, so concurrent reads (e.g. the
+operations overview's per-queue loads, which run on the request session and one
+extra session per remaining queue) count towards the request.
+
+Routes prone to N+1 patterns declare a fixed budget with
+``dependencies=[query_budget(n)]``. The budget covers every statement the request
+runs, admin auth lookups included, and should not depend on the number of rows.
+Going over it logs a warning with the route template; with ``QUERY_BUDGET_STRICT``
+(set by the test suite) the request raises `QueryBudgetExceeded` instead so the
+test that hit the route fails.
+
+Statements slower than ``SLOW_QUERY_MS`` are logged whether or not a tracker is
+active.
+"""
+import json
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any
+
+from sqlalchemy import Engine, event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import HTTP_DB_STATEMENTS
+from app.core.observability import set_request_id
+
+logger = logging.getLogger(__name__)
+access_logger = logging.getLogger("app.access")
+
+_current: ContextVar["QueryStats | None"] = ContextVar("query_stats", default=None)
+_STARTED_KEY = "query_budget_started"
+_SLOW_STATEMENT_CHARS = 300
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """A route ran more SQL statements than it declared (strict mode only)."""
+
+
+class QueryStats:
+    """Statement count and DB time for one request or task."""
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.db_ms = 0.0
+        self.budget: int | None = None
+        self._lock = threading.Lock()
+
+    def record(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.statements += 1
+            self.db_ms += elapsed_ms
+
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.statements > self.budget
+
+    def fields(self) -> dict[str, Any]:
+        return {
+            "db_statements": self.statements,
+            "db_ms": round(self.db_ms, 1),
+            "query_budget": self.budget,
+        }
+
+
+def current() -> QueryStats | None:
+    return _current.get()
+
+
+def start() -> tuple[QueryStats, Token]:
+    """Begin tracking in the current context. Pair with `stop` (or use `track`)."""
+    stats = QueryStats()
+    return stats, _current.set(stats)
+
+
+def stop(token: Token) -> None:
+    _current.reset(token)
+
+
+@contextmanager
+def track() -> Iterator[QueryStats]:
+    stats, token = start()
+    try:
+        yield stats
+    finally:
+        stop(token)
+
+
+def query_budget(limit: int) -> Any:
+    """Route dependency declaring the most SQL statements one request may run."""
+    # Workers import this module through the task signals; only routes need FastAPI.
+    from fastapi import Depends
+
+    async def declare_query_budget() -> None:
+        stats = _current.get()
+        if stats is not None:
+            stats.budget = limit
+
+    return Depends(declare_query_budget)
+
+
+def enforce_budget(stats: QueryStats, route: str) -> None:
+    if not stats.over_budget():
+        return
+    message = f"{route} ran {stats.statements} SQL statements (budget {stats.budget})"
+    if settings.QUERY_BUDGET_STRICT:
+        raise QueryBudgetExceeded(message)
+    logger.warning("query budget exceeded: %s", message)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+    _finish_statement(conn, statement)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context) -> None:
+    conn = exception_context.connection
+    if conn is not None and exception_context.cursor is not None:
+        _finish_statement(conn, exception_context.statement)
+
+
+def _finish_statement(conn, statement: str | None) -> None:
+    started = conn.info.get(_STARTED_KEY)
+    if not started:
+        return
+    elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+    stats = _current.get()
+    if stats is not None:
+        stats.record(elapsed_ms)
+    if elapsed_ms >= settings.SLOW_QUERY_MS:
+        logger.warning(
+            "slow SQL statement (%.0f ms): %s",
+            elapsed_ms,
+            " ".join((statement or "").split())[:_SLOW_STATEMENT_CHARS],
+        )
+
+
+class QueryStatsMiddleware:
+    """Track each HTTP request and emit one request log line with its DB totals.
+
+    Plain ASGI rather than ``BaseHTTPMiddleware`` so the line is written after the
+    last body chunk, counting statements run while a response streams.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+        request_id: str | None = None
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status, request_id
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                for name, value in message.get("headers", ()):
+                    if name.lower() == b"x-request-id":
+                        request_id = value.decode("latin-1")
+            await send(message)
+
+        with track() as stats:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                # The router stores the matched route on the shared scope.
+                route = getattr(scope.get("route"), "path", "unmatched")
+                # RequestIdMiddleware sets the id in an inner context; adopt it for our line.
+                if request_id is not None:
+                    set_request_id(request_id)
+                HTTP_DB_STATEMENTS.labels(scope["method"], route).observe(stats.statements)
+                access_logger.info(
+                    "request %s",
+                    json.dumps(
+                        {
+                            "method": scope["method"],
+                            "path": scope["path"],
+                            "route": route,
+                            "status": status,
+                            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+                            **stats.fields(),
+                        },
+                        ensure_ascii=False,
+                        sort_keys=True,
+                    ),
+                )
+            enforce_budget(stats, f"{scope['method']} {route}")
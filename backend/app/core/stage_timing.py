@@ -0,0 +1,115 @@
+"""Per-stage timing for long batch runs (nightly generation, weekly measurement).
+
+Run rows record outcomes; this records where the time went. A `StageTimer` is
+activated around one unit of work, and code anywhere below it (including async
+helpers run through `_run_async`) wraps its stages in `stage("name")`. With no
+active timer, `stage` is a no-op, so shared helpers stay usable elsewhere.
+
+The compact summary (`{"stage": {"count", "total_ms", "max_ms"}}`) is persisted
+on the run rows. Stages that run concurrently (SoV repeats) add up, so totals are
+busy time per stage rather than wall time.
+
+Each stage is also an OpenTelemetry span when `opentelemetry-api` is installed.
+Without an SDK configured (e.g. by `opentelemetry-instrument` and the usual
+``OTEL_*`` variables) those spans are no-ops; the persisted summary and the
+`log_summary` line do not depend on it.
+"""
+import json
+import logging
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # pragma: no cover - optional dependency
+    otel_trace = None
+
+logger = logging.getLogger(__name__)
+
+_current: ContextVar["StageTimer | None"] = ContextVar("stage_timer", default=None)
+
+
+class StageTimer:
+    """Accumulates stage durations for one run or item. Thread-safe for concurrent stages."""
+
+    def __init__(self, name: str, **attributes: str) -> None:
+        self.name = name
+        self.attributes = {key: str(value) for key, value in attributes.items()}
+        self._lock = threading.Lock()
+        self._stages: dict[str, dict[str, int]] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        with _otel_span(f"{self.name}.{name}", self.attributes):
+            try:
+                yield
+            finally:
+                self.add(name, (time.perf_counter() - started) * 1000)
+
+    def add(self, name: str, elapsed_ms: float) -> None:
+        elapsed = round(elapsed_ms)
+        with self._lock:
+            entry = self._stages.setdefault(name, {"count": 0, "total_ms": 0, "max_ms": 0})
+            entry["count"] += 1
+            entry["total_ms"] += elapsed
+            entry["max_ms"] = max(entry["max_ms"], elapsed)
+
+    def merge(self, summary: Mapping[str, Mapping[str, int]]) -> None:
+        """Fold another timer's summary in (item timers into their batch)."""
+        with self._lock:
+            for name, values in summary.items():
+                entry = self._stages.setdefault(name, {"count": 0, "total_ms": 0, "max_ms": 0})
+                entry["count"] += int(values.get("count", 0))
+                entry["total_ms"] += int(values.get("total_ms", 0))
+                entry["max_ms"] = max(entry["max_ms"], int(values.get("max_ms", 0)))
+
+    def summary(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {name: dict(values) for name, values in self._stages.items()}
+
+    @contextmanager
+    def activate(self) -> Iterator["StageTimer"]:
+        token = _current.set(self)
+        try:
+            yield self
+        finally:
+            _current.reset(token)
+
+    def log_summary(self, **fields: Any) -> None:
+        """One structured log line per run, for log-based exporters."""
+        logger.info(
+            "stage timings %s",
+            json.dumps(
+                {"run": self.name, **self.attributes, **fields, "stages": self.summary()},
+                ensure_ascii=False,
+                default=str,
+                sort_keys=True,
+            ),
+        )
+
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a stage on the active timer, if any."""
+    timer = _current.get()
+    if timer is None:
+        yield
+        return
+    with timer.stage(name):
+        yield
+
+
+@contextmanager
+def _otel_span(name: str, attributes: Mapping[str, str]) -> Iterator[None]:
+    if otel_trace is None:
+        yield
+        return
+    tracer = otel_trace.get_tracer("reputation.stage_timing")
+    with tracer.start_as_current_span(name, attributes=dict(attributes)):
+        yield
@@ -1,7 +1,9 @@
+import time
 import uuid
 from contextlib import asynccontextmanager
+from datetime import UTC, datetime
 
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from slowapi import _rate_limit_exceeded_handler
@@ -32,9 +34,17 @@ from app.api.public import diagnosis as public_diagnosis
 from app.api.public import leads as public_leads
 from app.api.public import site as public_site
 from app.core.config import settings
+from app.core.metrics import (
+    HTTP_REQUEST_SECONDS,
+    HTTP_RESPONSE_BYTES,
+    metrics_authorized,
+    metrics_payload,
+)
 from app.core.observability import configure_logging, sentry_before_send, set_request_id
+from app.core.query_budget import QueryStatsMiddleware
 from app.core.rate_limit import limiter
 from app.core.security import capture_admin_actor, verify_admin_key, verify_admin_rate_limit
+from app.services.queue_backlog import read_backlog, refresh_backlog_metrics
 
 # Configure logging before anything emits (OBS-1).
 configure_logging(level=settings.LOG_LEVEL, json_logs=settings.LOG_JSON)
@@ -155,6 +165,30 @@ class PublicApiCacheMiddleware(BaseHTTPMiddleware):
 
 app.add_middleware(PublicApiCacheMiddleware)
 
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """Per-route latency/size histograms for Prometheus.
+
+    The label is the matched route template (``/api/v1/admin/hospitals/{hospital_id}``)
+    so ids never become label values. Unmatched paths (scanners, typos) share one label.
+    """
+
+    async def dispatch(self, request: StarletteRequest, call_next):
+        started = time.perf_counter()
+        response = None
+        try:
+            response = await call_next(request)
+            return response
+        finally:
+            # 처리되지 않은 예외는 바깥 ServerErrorMiddleware가 500으로 바꾼다.
+            status = str(response.status_code) if response is not None else "500"
+            route = request.scope.get("route")
+            labels = (request.method, getattr(route, "path", "unmatched"), status)
+            HTTP_REQUEST_SECONDS.labels(*labels).observe(time.perf_counter() - started)
+            length = response.headers.get("content-length") if response is not None else None
+            if length:
+                HTTP_RESPONSE_BYTES.labels(*labels).observe(int(length))
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS,
@@ -163,6 +197,11 @@ app.add_middleware(
     allow_headers=["Content-Type", "X-Admin-Key", "Authorization"],
 )
 
+# CORS 바깥 — preflight와 CORS 거부 응답까지 포함한 전체 시간을 잰다.
+app.add_middleware(MetricsMiddleware)
+# 맨 바깥 — 요청 로그 한 줄에 SQL 문장 수·DB 시간을 싣고 라우트 쿼리 예산을 확인한다.
+app.add_middleware(QueryStatsMiddleware)
+
 # Admin 라우터: rate limit first, then X-Admin-Key auth.
 admin_deps = [
     Depends(verify_admin_rate_limit),
@@ -252,3 +291,37 @@ async def readiness():
 async def liveness():
     """Cloud Run liveness probe — 기본 응답."""
     return {"status": "ok"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics(authorization: str | None = Header(default=None)):
+    """Prometheus scrape endpoint. LB는 /api/v1만 라우팅하므로 외부 도메인에는 없다."""
+    if not metrics_authorized(authorization):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    await refresh_backlog_metrics()
+    payload, content_type = metrics_payload()
+    return Response(content=payload, media_type=content_type)
+
+
+@app.get("/queues/backlog", include_in_schema=False)
+async def queue_backlog(authorization: str | None = Header(default=None)):
+    """큐별 대기·실행 중 메시지와 예상 소진 시간 — KEDA metrics-api 등 스케일링 신호용.
+
+    스케일러는 `queues.<큐>.outstanding_work_seconds`를 읽고, 목표값을
+    (소진 목표 초 × 인스턴스당 동시성)으로 둔다. /metrics와 같은 토큰을 쓴다.
+    """
+    if not metrics_authorized(authorization):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    from redis.exceptions import RedisError
+
+    try:
+        backlog = await read_backlog()
+    except (OSError, RedisError) as e:
+        raise HTTPException(
+            status_code=503,
+            detail={"status": "error", "redis": "unavailable"},
+        ) from e
+    return {
+        "observed_at": datetime.now(UTC).isoformat(),
+        "queues": {entry.queue: entry.as_payload() for entry in backlog},
+    }
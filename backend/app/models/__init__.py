@@ -10,6 +10,7 @@ from app.models.content import (
 from app.models.essence import (
     EvidenceNoteType,
     HospitalContentPhilosophy,
+    HospitalEssenceReadiness,
     HospitalSourceAsset,
     HospitalSourceEvidenceNote,
     PhilosophyStatus,
@@ -48,6 +49,7 @@ from app.models.monthly_control import (
     MonthlyMeasurementManifest,
     MonthlyReportArtifact,
 )
+from app.models.operating_stats import HospitalOperatingStats
 from app.models.operations import (
     Incident,
     IncidentSeverity,
@@ -74,10 +76,11 @@ __all__ = [
     "AdminAuditLog", "AdminUser",
     "ContentSchedule", "ContentItem", "ContentType", "ContentStatus", "PLAN_DISTRIBUTION",
     "HospitalSourceAsset", "HospitalSourceEvidenceNote", "HospitalContentPhilosophy",
+    "HospitalEssenceReadiness",
     "SourceType", "SourceStatus", "EvidenceNoteType", "PhilosophyStatus",
     "AIQueryTarget", "AIQueryVariant", "ExposureAction", "ExposureGap",
     "MeasurementRun", "QueryMatrix", "SovRecord",
-    "MonthlyReport",
+    "MonthlyReport", "HospitalOperatingStats",
     "MonthlyMeasurementManifest", "MonthlyMeasurementCell", "MonthlyMeasurementAttempt",
     "HospitalServiceInterval", "MonthlyReportArtifact", "MonthlyDeliveryEvent",
     "Incident", "IncidentState", "IncidentSeverity",
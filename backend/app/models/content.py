@@ -154,6 +154,12 @@ class ContentItem(Base):
     # 이미지
     image_url: Mapped[str | None] = mapped_column(String(500))    # GCS public URL
     image_prompt: Mapped[str | None] = mapped_column(Text)        # 생성에 쓴 프롬프트
+    # 반응형 파생본 manifest — 원본 크기·placeholder·폭별 AVIF/WebP (image_derivatives)
+    image_variants: Mapped[dict | None] = mapped_column(_jsonb_type())
+    # 이미지 단계 상태 — 본문 write-back 뒤 별도 큐(images)에서 생성한다.
+    # PENDING(요청됨) / READY / FAILED, 이력 없는 행은 NULL (nightly_generation_batch)
+    image_status: Mapped[str | None] = mapped_column(String(20))
+    image_requested_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     # 스케줄·상태
     scheduled_date: Mapped[date] = mapped_column(Date, nullable=False)
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 
 from sqlalchemy import (
     JSON,
+    Boolean,
     CheckConstraint,
     DateTime,
     Enum,
@@ -14,11 +15,13 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    event,
     func,
+    inspect,
     text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from app.core.database import Base
 
@@ -235,3 +238,97 @@ class HospitalContentPhilosophy(Base):
 
     hospital: Mapped["Hospital"] = relationship(back_populates="content_philosophies")
     content_items: Mapped[list["ContentItem"]] = relationship(back_populates="content_philosophy")
+
+
+class HospitalEssenceReadiness(Base):
+    """병원별 운영 기준 준비 상태 투영 — 공개 읽기가 근거 원문 전체를 다시 읽지 않게 한다.
+
+    `essence_readiness.resolve_essence_readiness`의 결과를 그대로 저장한다. 근거 자산이나
+    운영 기준이 바뀌는 flush마다 같은 트랜잭션 안에서 다시 계산되므로(아래 after_flush),
+    커밋된 투영은 커밋된 원천과 어긋나지 않는다. 행이 없으면 읽기 쪽이 원천에서 계산한다.
+    """
+
+    __tablename__ = "hospital_essence_readiness"
+
+    hospital_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("hospitals.id", ondelete="CASCADE"), primary_key=True
+    )
+    approved_philosophy_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("hospital_content_philosophies.id", ondelete="SET NULL")
+    )
+    public_philosophy_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("hospital_content_philosophies.id", ondelete="SET NULL")
+    )
+    processed_source_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    required_source_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    current_snapshot_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    complete_snapshot_is_fresh: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False
+    )
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+# 준비 상태 계산에 들어가는 속성. 나머지(제목·원문·메타데이터 등)는 content_hash로만 반영된다.
+_READINESS_SOURCE_ATTRS = ("hospital_id", "source_type", "status", "content_hash", "processed_at")
+_READINESS_PHILOSOPHY_ATTRS = ("hospital_id", "status", "source_snapshot_hash", "source_asset_ids")
+
+
+def _readiness_attrs(obj: object) -> tuple[str, ...]:
+    if isinstance(obj, HospitalSourceAsset):
+        return _READINESS_SOURCE_ATTRS
+    if isinstance(obj, HospitalContentPhilosophy):
+        return _READINESS_PHILOSOPHY_ATTRS
+    return ()
+
+
+_DELETED_READINESS_KEY = "essence_readiness_deleted_hospitals"
+
+
+def _remember_deleted_readiness(session: Session, _flush_context, _instances) -> None:
+    """before_flush — 삭제될 행의 병원은 flush 뒤에는 만료 속성을 다시 읽을 수 없다."""
+    deleted = {obj.hospital_id for obj in session.deleted if _readiness_attrs(obj)}
+    if deleted:
+        session.info.setdefault(_DELETED_READINESS_KEY, set()).update(deleted)
+
+
+def _readiness_hospital_ids(session: Session) -> set[uuid.UUID]:
+    hospital_ids: set[uuid.UUID] = set(session.info.get(_DELETED_READINESS_KEY, ()))
+    changed = [obj for obj in session.new if _readiness_attrs(obj)]
+    changed.extend(
+        obj
+        for obj in session.dirty
+        if any(inspect(obj).attrs[name].history.has_changes() for name in _readiness_attrs(obj))
+    )
+    for obj in changed:
+        # 병원을 옮긴 행은 이전 병원의 투영도 바뀐다.
+        moved_from = inspect(obj).attrs["hospital_id"].history.deleted or ()
+        hospital_ids.update(value for value in (*moved_from, obj.hospital_id) if value)
+    return hospital_ids
+
+
+def _refresh_essence_readiness(session: Session, _flush_context) -> None:
+    """after_flush — 세션의 new/dirty/deleted와 속성 history가 아직 flush 전 상태다."""
+    hospital_ids = _readiness_hospital_ids(session)
+    if not hospital_ids:
+        return
+    connection = session.connection()
+    if connection.dialect.name != "postgresql":
+        # 투영은 Postgres에서만 유지한다. 다른 바인딩(단위 테스트 SQLite)은 읽기가 항상
+        # 원천에서 계산하므로 어긋날 투영이 없다.
+        return
+    # services가 models를 import하므로 지연 import — 등록은 모델과 함께여야 빠짐이 없다.
+    from app.services.essence_readiness import refresh_essence_readiness_projection
+
+    refresh_essence_readiness_projection(connection, hospital_ids)
+
+
+def _forget_deleted_readiness(session: Session, _flush_context) -> None:
+    # 다른 after_flush 리스너(operating_stats)도 같은 집합을 읽으므로 flush가 끝난 뒤 비운다.
+    session.info.pop(_DELETED_READINESS_KEY, None)
+
+
+event.listen(Session, "before_flush", _remember_deleted_readiness)
+event.listen(Session, "after_flush", _refresh_essence_readiness)
+event.listen(Session, "after_flush_postexec", _forget_deleted_readiness)
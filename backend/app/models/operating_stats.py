@@ -0,0 +1,163 @@
+import uuid
+import weakref
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, event, func, inspect
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from app.core.database import Base
+from app.models.content import ContentItem
+from app.models.essence import _readiness_hospital_ids
+from app.models.report import MonthlyReport
+from app.models.sov import MeasurementRun, SovRecord
+from app.utils.db_locks import is_postgres_bind
+
+
+class HospitalOperatingStats(Base):
+    """병원별 운영 카운터 투영 — 준비도·목록 화면이 병원마다 count(*)를 돌리지 않게 한다.
+
+    아래 리스너가 flush마다 바뀐 병원을 모으고, 콘텐츠·리포트·측정 쓰기와 같은 트랜잭션의
+    commit 직전에 한 번 갱신한다.
+    `sov_record_count`만 증감으로 유지한다(가장 큰 테이블이라 다시 세지 않는다).
+    ORM을 거치지 않는 쓰기는 `mark_operating_stats_stale`로 알리고, 남은 어긋남은
+    `reconcile_hospital_operating_stats`가 매일 전체를 다시 세어 고친다.
+    """
+
+    __tablename__ = "hospital_operating_stats"
+
+    hospital_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("hospitals.id", ondelete="CASCADE"), primary_key=True
+    )
+    published_content_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # 현재 공개 Essence 기준으로 막힌 본문 수 — admin `get_readiness`의 content_alignment 조건.
+    essence_blocked_content_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+    report_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sov_record_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # 마지막으로 끝난(COMPLETED/PARTIAL) 측정 run과 그 run의 확정 레코드 언급률.
+    last_measured_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    latest_sov_pct: Mapped[float | None] = mapped_column(Float)
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+# 카운터에 들어가는 속성. 본문은 "있는가"만 세지만 생성 write-back을 놓치지 않도록 본다.
+_STATS_ATTRS: dict[type, tuple[str, ...]] = {
+    ContentItem: ("hospital_id", "status", "essence_status", "content_philosophy_id", "body"),
+    MonthlyReport: ("hospital_id",),
+    MeasurementRun: ("hospital_id", "status", "completed_at"),
+    SovRecord: ("hospital_id", "measurement_status", "mention_verdict", "is_mentioned"),
+}
+_STALE_STATS_KEY = "operating_stats_stale_hospitals"
+_SOV_DELTA_KEY = "operating_stats_sov_delta"
+_SAVEPOINT_STATS_KEY = "operating_stats_savepoints"
+
+
+def mark_operating_stats_stale(session, hospital_id: uuid.UUID) -> None:
+    """ORM flush를 거치지 않는 쓰기(bulk update/delete) 뒤에 호출한다.
+
+    같은 트랜잭션의 commit 직전에 다시 계산된다. AsyncSession도 받는다
+    (`info`는 sync_session과 같은 dict). 투영이 없는 바인딩에서는 아무것도 하지 않는다.
+    """
+    if not is_postgres_bind(session):
+        return
+    session.info.setdefault(_STALE_STATS_KEY, set()).add(hospital_id)
+
+
+def _remember_deleted_stats(session: Session, _flush_context, _instances) -> None:
+    """before_flush — 삭제될 행의 병원은 flush 뒤에는 만료 속성을 다시 읽을 수 없다."""
+    stale = session.info.setdefault(_STALE_STATS_KEY, set())
+    sov_delta = session.info.setdefault(_SOV_DELTA_KEY, Counter())
+    for obj in session.deleted:
+        if type(obj) in _STATS_ATTRS:
+            stale.add(obj.hospital_id)
+            if isinstance(obj, SovRecord):
+                sov_delta[obj.hospital_id] -= 1
+
+
+def _stats_hospital_ids(session: Session) -> set[uuid.UUID]:
+    hospital_ids = set(session.info.pop(_STALE_STATS_KEY, ()))
+    sov_delta = session.info.setdefault(_SOV_DELTA_KEY, Counter())
+    for obj in session.new:
+        if type(obj) in _STATS_ATTRS:
+            hospital_ids.add(obj.hospital_id)
+            if isinstance(obj, SovRecord):
+                sov_delta[obj.hospital_id] += 1
+    for obj in session.dirty:
+        attrs = _STATS_ATTRS.get(type(obj))
+        if not attrs:
+            continue
+        state = inspect(obj)
+        if any(state.attrs[name].history.has_changes() for name in attrs):
+            hospital_ids.update(state.attrs["hospital_id"].history.deleted or ())
+            hospital_ids.add(obj.hospital_id)
+    # Essence 기준이 바뀌면 막힌 본문 수의 기준(현재 공개 기준)도 바뀐다.
+    hospital_ids.update(_readiness_hospital_ids(session))
+    hospital_ids.update(sov_delta)
+    hospital_ids.discard(None)
+    return hospital_ids
+
+
+def _refresh_pending_stats(session: Session, hospital_ids: set[uuid.UUID]) -> None:
+    sov_delta = session.info.pop(_SOV_DELTA_KEY, Counter())
+    if not hospital_ids:
+        return
+    connection = session.connection()
+    if connection.dialect.name != "postgresql":
+        # essence 투영과 같은 규칙 — 투영은 Postgres에서만 유지하고 다른 바인딩은 원천을 센다.
+        return
+    from app.services.operating_stats import refresh_operating_stats
+
+    refresh_operating_stats(connection, hospital_ids, sov_record_deltas=sov_delta)
+
+
+def _collect_operating_stats_after_flush(session: Session, _flush_context) -> None:
+    # 생성·SoV 배치는 한 트랜잭션에서 여러 번 flush한다. flush마다 다시 세면 병원 행 잠금과
+    # 카운트 쿼리가 flush 수만큼 반복되므로, 여기서는 병원만 모으고 commit 직전에 한 번 센다.
+    pending = _stats_hospital_ids(session)
+    if pending:
+        session.info.setdefault(_STALE_STATS_KEY, set()).update(pending)
+
+
+def _refresh_operating_stats_before_commit(session: Session) -> None:
+    # commit은 before_commit 뒤에 남은 변경을 flush한다. 그 변경까지 모으려고 먼저 flush한다.
+    session.flush()
+    _refresh_pending_stats(session, session.info.pop(_STALE_STATS_KEY, set()))
+
+
+def _snapshot_pending_stats(session: Session, transaction) -> None:
+    """savepoint 시작 시점의 모은 병원·증감 — savepoint만 롤백되면 이 상태로 되돌린다."""
+    if transaction.nested:
+        # 커밋된 savepoint의 스냅샷은 트랜잭션 객체와 함께 사라진다.
+        snapshots = session.info.setdefault(_SAVEPOINT_STATS_KEY, weakref.WeakKeyDictionary())
+        snapshots[transaction] = (
+            set(session.info.get(_STALE_STATS_KEY, ())),
+            Counter(session.info.get(_SOV_DELTA_KEY, ())),
+        )
+
+
+def _discard_rolled_back_stats(session: Session, previous_transaction) -> None:
+    # 롤백된 flush의 증감(특히 삭제 -1)이 남으면 재시도한 flush가 같은 변경을 두 번 센다.
+    if previous_transaction.parent is None:
+        session.info.pop(_STALE_STATS_KEY, None)
+        session.info.pop(_SOV_DELTA_KEY, None)
+        session.info.pop(_SAVEPOINT_STATS_KEY, None)
+        return
+    snapshots = session.info.get(_SAVEPOINT_STATS_KEY)
+    snapshot = snapshots.pop(previous_transaction, None) if snapshots is not None else None
+    if snapshot is not None:
+        session.info[_STALE_STATS_KEY], session.info[_SOV_DELTA_KEY] = (
+            set(snapshot[0]),
+            Counter(snapshot[1]),
+        )
+
+
+event.listen(Session, "before_flush", _remember_deleted_stats)
+event.listen(Session, "after_flush", _collect_operating_stats_after_flush)
+event.listen(Session, "before_commit", _refresh_operating_stats_before_commit)
+event.listen(Session, "after_transaction_create", _snapshot_pending_stats)
+event.listen(Session, "after_soft_rollback", _discard_rolled_back_stats)
@@ -1,6 +1,7 @@
 import uuid
 from datetime import datetime
 from enum import StrEnum
+from itertools import chain
 from typing import TypeAlias
 
 from sqlalchemy import (
@@ -13,13 +14,15 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    event,
     func,
     text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, ORMExecuteState, Session, mapped_column
 
 from app.core.database import Base
+from app.models.content import ContentItem
 
 JSONScalar: TypeAlias = str | int | float | bool | None
 JSONValue: TypeAlias = JSONScalar | list["JSONValue"] | dict[str, "JSONValue"]
@@ -333,3 +336,46 @@ class NotificationOutbox(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
+
+
+# Rows the operations-center overview is built from. A commit that wrote any of
+# them, through the unit of work or an ORM-enabled INSERT/UPDATE/DELETE, bumps
+# the overview cache version (`app.services.operations_overview_cache`).
+_OVERVIEW_MODELS = (Incident, OperationRun, ContentItem)
+_OVERVIEW_WRITES_KEY = "operations_overview_writes"
+
+
+def _note_overview_flush(session: Session, _flush_context) -> None:
+    if any(
+        isinstance(obj, _OVERVIEW_MODELS)
+        for obj in chain(session.new, session.dirty, session.deleted)
+    ):
+        session.info[_OVERVIEW_WRITES_KEY] = True
+
+
+def _note_overview_statement(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_select:
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and issubclass(mapper.class_, _OVERVIEW_MODELS):
+        orm_execute_state.session.info[_OVERVIEW_WRITES_KEY] = True
+
+
+def _invalidate_overview_after_commit(session: Session) -> None:
+    if session.info.pop(_OVERVIEW_WRITES_KEY, False):
+        from app.services.operations_overview_cache import invalidate_operations_overview
+
+        invalidate_operations_overview()
+
+
+def _forget_overview_writes(session: Session, previous_transaction) -> None:
+    # A savepoint rollback keeps the outer transaction's writes; only the outermost
+    # rollback discards them all.
+    if previous_transaction.parent is None:
+        session.info.pop(_OVERVIEW_WRITES_KEY, None)
+
+
+event.listen(Session, "after_flush", _note_overview_flush)
+event.listen(Session, "do_orm_execute", _note_overview_statement)
+event.listen(Session, "after_commit", _invalidate_overview_after_commit)
+event.listen(Session, "after_soft_rollback", _forget_overview_writes)
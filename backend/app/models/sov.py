@@ -177,6 +177,9 @@ class MeasurementRun(Base):
     search_mode: Mapped[str | None] = mapped_column(String(50))
     config: Mapped[dict | None] = mapped_column(JSON)
     error_summary: Mapped[dict | None] = mapped_column(JSON)
+    # 단계별 소요 시간 요약 {stage: {count, total_ms, max_ms}} — 느린 주간 측정이
+    # 답변 호출·판정·저장 중 어디서 시간을 썼는지 run 단위로 남긴다.
+    stage_timings: Mapped[dict | None] = mapped_column(JSON)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
@@ -3,6 +3,15 @@ from typing import Any, Optional
 from pydantic import BaseModel
 
 
+class HospitalOperatingSummary(BaseModel):
+    published_content_count: int = 0
+    essence_blocked_content_count: int = 0
+    report_count: int = 0
+    sov_record_count: int = 0
+    last_measured_at: Optional[str] = None
+    latest_sov_pct: Optional[float] = None
+
+
 class HospitalListItem(BaseModel):
     id: str
     name: str
@@ -19,6 +28,7 @@ class HospitalListItem(BaseModel):
     domain_cert_dns_verified_at: Optional[str] = None
     domain_cert_job_state: Optional[str] = None
     created_at: Optional[str]
+    operating: Optional[HospitalOperatingSummary] = None
 
 
 class HospitalDetail(HospitalListItem):
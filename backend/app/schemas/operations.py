@@ -136,6 +136,13 @@ class OperationsSlackState(OperationsSchema):
     version: int
 
 
+class OperationsStageTiming(OperationsSchema):
+    stage: str
+    count: int
+    total_ms: int
+    max_ms: int
+
+
 class OperationsRunSummary(OperationsSchema):
     run_id: UUID
     parent_run_id: UUID | None
@@ -154,6 +161,7 @@ class OperationsRunSummary(OperationsSchema):
     completed_at: datetime | None
     version: int
     retry: OperationsAction | None
+    stage_timings: list[OperationsStageTiming] = []
 
 
 class OperationsQueueRow(OperationsSchema):
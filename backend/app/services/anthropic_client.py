@@ -0,0 +1,131 @@
+"""프로세스 공용 Anthropic 클라이언트 — 연결 풀 재사용 + 모델별 동시 호출 상한.
+
+종전에는 콘텐츠 생성·자동 채우기·독립 AI 검수가 sync 클라이언트를 기본 executor
+스레드에서 돌렸고, 운영 기준 처리는 호출 시도마다 클라이언트를 새로 만들었다.
+그러면 호출마다 TLS 핸드셰이크를 새로 하고, 생성·합성·검수가 같은 기본 스레드 풀을
+두고 경쟁한다(기본 풀은 DB 세션 정리·파일 추출 등 다른 to_thread 작업과도 공유된다).
+
+- async 경로(`create_message`)는 이벤트 루프당 하나의 `AsyncAnthropic`을 쓴다.
+  httpx 연결은 만든 루프에 묶이므로 루프마다 클라이언트를 따로 두고 보관한다. 워커
+  모듈마다 스레드 루프가 따로 있어(`tasks._run_async`, `lead_diagnosis_tasks._run_async`
+  등) 한 자리를 갈아 끼우면 태스크가 바뀔 때마다 옛 클라이언트의 연결 풀이 닫히지 않고
+  버려졌다. 닫힌 루프의 클라이언트는 다음 조회 때 놓아 준다.
+- 운영 기준 처리(`essence_engine`)는 호출 체인 전체가 동기이고 `asyncio.to_thread`
+  안에서 돈다. 그 경로는 프로세스 하나의 sync 클라이언트를 공유한다 — httpx의 sync
+  연결 풀은 스레드 안전하다.
+- 두 경로 모두 모델별 세마포어로 동시 호출 수를 묶는다. 같은 키의 burst가 429로
+  돌아오면 tenacity 재시도가 실제 비용만 늘린다.
+
+SDK 내부 재시도는 끈다. 재시도 횟수는 각 호출부의 tenacity가 유일하게 통제하고,
+비용 가드는 "본문 1회 실행 = HTTP 요청 1회"를 전제로 실제 호출을 센다.
+
+`anthropic` SDK는 클라이언트를 처음 만들 때 import한다. import만 2초 가까이 걸리고,
+이 모듈은 API 라우터와 여러 워커 모듈이 import 체인으로 당겨 오므로 Claude를 부르지
+않는 프로세스의 콜드 스타트에 그 시간이 그대로 얹혔다.
+"""
+import asyncio
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from app.core.config import settings
+from app.core.metrics import observe_provider_call
+
+if TYPE_CHECKING:
+    import anthropic
+
+DEFAULT_TIMEOUT_SECONDS = 90.0
+
+_lock = threading.Lock()
+# 루프 → (클라이언트, 모델별 세마포어). asyncio 세마포어도 처음 쓴 루프에 묶인다.
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop,
+    tuple["anthropic.AsyncAnthropic", dict[str, asyncio.Semaphore]],
+] = weakref.WeakKeyDictionary()
+_sync_client: "anthropic.Anthropic | None" = None
+_sync_semaphores: dict[str, threading.BoundedSemaphore] = {}
+
+
+def _http_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.ANTHROPIC_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.ANTHROPIC_MAX_CONNECTIONS,
+        keepalive_expiry=60.0,
+    )
+
+
+def _loop_entry() -> tuple["anthropic.AsyncAnthropic", dict[str, asyncio.Semaphore]]:
+    current_loop = asyncio.get_running_loop()
+    with _lock:
+        # 연결(transport)이 루프를 참조하므로 약한 키만으로는 닫힌 루프가 풀려나지 않는다.
+        for loop in [loop for loop in _async_clients if loop.is_closed()]:
+            del _async_clients[loop]
+        entry = _async_clients.get(current_loop)
+        if entry is None:
+            import anthropic
+
+            client = anthropic.AsyncAnthropic(
+                api_key=settings.ANTHROPIC_API_KEY,
+                timeout=DEFAULT_TIMEOUT_SECONDS,
+                max_retries=0,
+                http_client=anthropic.DefaultAsyncHttpxClient(limits=_http_limits()),
+            )
+            entry = _async_clients[current_loop] = (client, {})
+        return entry
+
+
+def get_async_client() -> "anthropic.AsyncAnthropic":
+    """현재 이벤트 루프에 묶인 공용 async 클라이언트. 루프마다 하나씩 만든다."""
+    return _loop_entry()[0]
+
+
+def _async_model_semaphore(model: str) -> asyncio.Semaphore:
+    semaphores = _loop_entry()[1]
+    with _lock:
+        if model not in semaphores:
+            semaphores[model] = asyncio.Semaphore(settings.ANTHROPIC_MODEL_CONCURRENCY)
+        return semaphores[model]
+
+
+async def create_message(
+    *,
+    model: str,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    **request: Any,
+) -> Any:
+    """공용 async 클라이언트로 `messages.create` 한 번. 모델별 동시 호출 상한을 지킨다."""
+    client = get_async_client()
+    async with _async_model_semaphore(model):
+        # 세마포어 대기는 빼고 HTTP 호출만 잰다 — 공급자 지연과 우리 쪽 줄서기를 가른다.
+        with observe_provider_call("anthropic", model):
+            return await client.messages.create(model=model, timeout=timeout, **request)
+
+
+def get_sync_client() -> "anthropic.Anthropic | None":
+    """동기 호출 체인(운영 기준 처리)용 프로세스 공용 클라이언트. 키가 없으면 None."""
+    global _sync_client
+    if not settings.ANTHROPIC_API_KEY:
+        return None
+    with _lock:
+        if _sync_client is None:
+            import anthropic
+
+            _sync_client = anthropic.Anthropic(
+                api_key=settings.ANTHROPIC_API_KEY,
+                timeout=DEFAULT_TIMEOUT_SECONDS,
+                max_retries=0,
+                http_client=anthropic.DefaultHttpxClient(limits=_http_limits()),
+            )
+        return _sync_client
+
+
+def sync_model_slot(model: str) -> threading.BoundedSemaphore:
+    """동기 호출용 모델별 슬롯. `with sync_model_slot(model): ...`로 감싼다."""
+    with _lock:
+        if model not in _sync_semaphores:
+            _sync_semaphores[model] = threading.BoundedSemaphore(
+                settings.ANTHROPIC_MODEL_CONCURRENCY
+            )
+        return _sync_semaphores[model]
@@ -14,6 +14,7 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
 import hashlib
 import io
 import ipaddress
@@ -26,6 +27,7 @@ from urllib.parse import parse_qs, urljoin, urlparse
 import html2text
 import httpx
 
+from app.services import naver_feed_cache
 from app.utils.error_page import looks_like_error_page_text
 
 logger = logging.getLogger(__name__)
@@ -34,6 +36,7 @@ DEFAULT_FETCH_TIMEOUT = 12.0
 MAX_HTML_BYTES = 4 * 1024 * 1024  # 4MB
 MAX_RAW_TEXT_LENGTH = 60_000
 MAX_REDIRECTS = 4
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
 
 # fetch 품질 게이트 — 셸/프레임셋만 받아오면 본문이 비었으므로 거부 판단에 쓴다.
 # 'PostView.naver'는 정상 m.blog 본문(링크/스크립트)에도 흔히 등장해 짧은 정상 글을
@@ -133,17 +136,29 @@ async def fetch_url_text(url: str) -> tuple[str, str | None, FetchQuality | None
     try:
         current_target = target
         async with httpx.AsyncClient(timeout=DEFAULT_FETCH_TIMEOUT, follow_redirects=False) as client:
-            response: httpx.Response | None = None
             for _ in range(MAX_REDIRECTS + 1):
-                response = await client.get(current_target.url, headers=_browser_headers())
-                peer_error = _validate_response_peer(response, current_target)
-                if peer_error:
-                    return "", peer_error, None
-                if response.status_code not in {301, 302, 303, 307, 308}:
-                    break
-                location = response.headers.get("location")
-                if not location:
-                    break
+                # 본문은 스트림으로 받는다 — 리다이렉트·오류·비 HTML 응답은 본문을 읽지 않고
+                # 닫고, HTML도 MAX_HTML_BYTES에서 읽기를 멈춰 큰 페이지를 통째로 버퍼링하지 않는다.
+                async with client.stream(
+                    "GET", current_target.url, headers=_browser_headers()
+                ) as response:
+                    peer_error = _validate_response_peer(response, current_target)
+                    if peer_error:
+                        return "", peer_error, None
+                    location = (
+                        response.headers.get("location")
+                        if response.status_code in _REDIRECT_STATUSES
+                        else None
+                    )
+                    if location is None:
+                        if response.status_code in _REDIRECT_STATUSES:
+                            return "", "리다이렉트가 너무 많습니다.", None
+                        response.raise_for_status()
+                        content_type = response.headers.get("content-type", "")
+                        if "html" not in content_type and "text" not in content_type:
+                            return "", f"HTML이 아닌 콘텐츠({content_type})는 자동 추출 불가.", None
+                        html = await _read_html_capped(response)
+                        break
                 next_url = urljoin(current_target.url, location)
                 next_target, validation_error = await asyncio.to_thread(
                     _validate_fetch_target, next_url
@@ -151,25 +166,17 @@ async def fetch_url_text(url: str) -> tuple[str, str | None, FetchQuality | None
                 if validation_error or next_target is None:
                     return "", f"리다이렉트 대상 차단: {validation_error}", None
                 current_target = next_target
-            if response is None:
-                return "", "URL 접근 실패.", None
-            if response.status_code in {301, 302, 303, 307, 308}:
+            else:
                 return "", "리다이렉트가 너무 많습니다.", None
-            response.raise_for_status()
-            content_type = response.headers.get("content-type", "")
-            if "html" not in content_type and "text" not in content_type:
-                return "", f"HTML이 아닌 콘텐츠({content_type})는 자동 추출 불가.", None
-            content = response.content[:MAX_HTML_BYTES]
-            html = content.decode(response.encoding or "utf-8", errors="ignore")
-            scoped_html = _scope_to_content_container(html)
-            text = _html_to_markdown(scoped_html)
-            quality = _assess_fetch_quality(html, text)
-            # 200으로 돌아온 차단·오류 페이지(soft 403 등)나 리더 폴백의 "Title: 403 Forbidden"
-            # 잔재는 근거 자료가 아니라 오류로 취급한다 — 근거 파이프라인/공개 표면 오염을 원천 차단.
-            # (본문이 지나치게 짧은 셸/프레임셋은 기존 quality.looks_like_shell 체계가 호출부에서 처리.)
-            if looks_like_error_page_text(text):
-                return "", "차단 또는 오류 페이지로 확인되어 본문을 수집하지 않았습니다.", None
-            return text[:MAX_RAW_TEXT_LENGTH], None, quality
+        # lxml 파싱과 html2text 변환은 수 MB 페이지에서 수백 ms를 쓰는 CPU 작업이다.
+        # 이벤트 루프에서 돌리면 같은 프로세스의 관리자 요청·동시 수집이 그동안 멈춘다.
+        text, quality = await asyncio.to_thread(_extract_page_text, html)
+        # 200으로 돌아온 차단·오류 페이지(soft 403 등)나 리더 폴백의 "Title: 403 Forbidden"
+        # 잔재는 근거 자료가 아니라 오류로 취급한다 — 근거 파이프라인/공개 표면 오염을 원천 차단.
+        # (본문이 지나치게 짧은 셸/프레임셋은 기존 quality.looks_like_shell 체계가 호출부에서 처리.)
+        if looks_like_error_page_text(text):
+            return "", "차단 또는 오류 페이지로 확인되어 본문을 수집하지 않았습니다.", None
+        return text[:MAX_RAW_TEXT_LENGTH], None, quality
     except httpx.HTTPStatusError as exc:
         return "", f"HTTP {exc.response.status_code} — URL 접근 실패.", None
     except Exception as exc:
@@ -177,6 +184,31 @@ async def fetch_url_text(url: str) -> tuple[str, str | None, FetchQuality | None
         return "", f"URL 접근 중 오류 — {exc}", None
 
 
+async def _read_html_capped(response: httpx.Response) -> str:
+    """응답 본문을 MAX_HTML_BYTES까지만 읽어 증분 디코딩한다. 나머지는 받지 않는다."""
+    try:
+        decoder = codecs.getincrementaldecoder(response.charset_encoding or "utf-8")(
+            errors="ignore"
+        )
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    parts: list[str] = []
+    remaining = MAX_HTML_BYTES
+    async for chunk in response.aiter_bytes():
+        parts.append(decoder.decode(chunk[:remaining]))
+        remaining -= len(chunk)
+        if remaining <= 0:
+            break
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
+def _extract_page_text(html: str) -> tuple[str, FetchQuality]:
+    scoped_html = _scope_to_content_container(html)
+    text = _html_to_markdown(scoped_html)
+    return text, _assess_fetch_quality(html, text)
+
+
 def naver_blog_id_from(value: str) -> str | None:
     """네이버 블로그 URL 또는 blogId 문자열에서 blogId만 추출한다.
 
@@ -210,6 +242,9 @@ async def fetch_naver_blog_post_urls(
     RSS(``https://rss.blog.naver.com/{blogId}.xml``)는 서버 렌더 XML이라 프레임셋 셸
     문제가 없다. 반환 URL은 ``blog.naver.com/{blogId}/{logNo}`` 형태이고, fetch_url_text가
     다시 모바일 본문 URL로 정규화한다. 실패 시 ([], 사유)를 반환한다.
+
+    직전 응답의 검증자(`naver_feed_cache`)가 있으면 조건부 요청을 보내고, 304이거나
+    본문이 같으면 XML을 다시 해석하지 않고 저장된 목록을 쓴다.
     """
     blog_id = naver_blog_id_from(blog_ref)
     if not blog_id:
@@ -218,12 +253,18 @@ async def fetch_naver_blog_post_urls(
     target, validation_error = await asyncio.to_thread(_validate_fetch_target, rss_url)
     if validation_error or target is None:
         return [], validation_error or "RSS 주소 검증에 실패했습니다."
+    cached = await naver_feed_cache.load_feed(blog_id)
+    headers = _browser_headers()
+    if cached is not None:
+        headers.update(cached.conditional_headers())
     try:
         async with httpx.AsyncClient(timeout=DEFAULT_FETCH_TIMEOUT, follow_redirects=False) as client:
-            response = await client.get(target.url, headers=_browser_headers())
+            response = await client.get(target.url, headers=headers)
             peer_error = _validate_response_peer(response, target)
             if peer_error:
                 return [], peer_error
+            if cached is not None and response.status_code == 304:
+                return list(cached.urls[:max_posts]), None
             response.raise_for_status()
             xml_bytes = response.content[:MAX_HTML_BYTES]
     except httpx.HTTPStatusError as exc:
@@ -232,6 +273,10 @@ async def fetch_naver_blog_post_urls(
         logger.warning("naver rss fetch failed for %s: %s", blog_id, exc)
         return [], f"RSS 가져오기 실패 — {exc}"
 
+    body_sha256 = naver_feed_cache.feed_body_hash(xml_bytes)
+    if cached is not None and cached.body_sha256 == body_sha256:
+        return list(cached.urls[:max_posts]), None
+
     try:
         from lxml import etree  # noqa: WPS433
 
@@ -240,6 +285,7 @@ async def fetch_naver_blog_post_urls(
         logger.warning("naver rss parse failed for %s: %s", blog_id, exc)
         return [], "RSS 응답을 해석하지 못했습니다."
 
+    # 캐시는 호출마다 다른 max_posts에 답해야 하므로 피드의 글 목록 전체를 해석해 둔다.
     urls: list[str] = []
     seen: set[str] = set()
     for link_el in root.iter("link"):
@@ -254,11 +300,18 @@ async def fetch_naver_blog_post_urls(
                 continue
             seen.add(canonical)
             urls.append(canonical)
-            if len(urls) >= max_posts:
-                break
     if not urls:
         return [], "RSS에서 글 목록을 찾지 못했습니다."
-    return urls, None
+    await naver_feed_cache.store_feed(
+        blog_id,
+        naver_feed_cache.CachedFeed(
+            urls=tuple(urls),
+            body_sha256=body_sha256,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        ),
+    )
+    return urls[:max_posts], None
 
 
 def _normalize_naver_blog_url(url: str) -> str:
@@ -132,3 +132,61 @@ def resolve_legacy_asset_path(asset_ref: str, *, expected_hospital_id: uuid.UUID
 
 def is_private_asset_ref(asset_ref: str | None) -> bool:
     return bool(asset_ref and (asset_ref.startswith("local://") or asset_ref.startswith("gs://")))
+
+
+def derived_asset_ref(asset_ref: str, suffix: str) -> str | None:
+    """원본 reference 옆에 놓일 파생본 reference (`…/name.png` → `…/name{suffix}`).
+
+    파생본은 원본과 같은 병원 디렉터리·버킷 경로에 두어 기존 hospital 경계 검증을
+    그대로 통과하게 한다.
+    """
+    if not asset_ref.startswith(("local://", "gs://")) or "/" in suffix:
+        return None
+    head, _, name = asset_ref.rpartition("/")
+    stem = name.rsplit(".", 1)[0] if "." in name else name
+    if not stem:
+        return None
+    return f"{head}/{stem}{suffix}"
+
+
+def read_asset_bytes(asset_ref: str) -> bytes | None:
+    """private reference의 원본 바이트. 지원하지 않는 reference거나 파일이 없으면 None."""
+    if asset_ref.startswith("local://"):
+        path = resolve_local_asset_path(asset_ref)
+        if not path or not path.exists():
+            return None
+        return path.read_bytes()
+    if asset_ref.startswith("gs://"):
+        from app.services.gcs_utils import _get_gcs_client
+
+        bucket_name, _, blob_path = asset_ref[len("gs://"):].partition("/")
+        if not bucket_name or not blob_path:
+            return None
+        return _get_gcs_client().bucket(bucket_name).blob(blob_path).download_as_bytes()
+    return None
+
+
+def store_derived_asset_bytes(
+    asset_ref: str, *, suffix: str, data: bytes, mime_type: str
+) -> str | None:
+    """원본 옆에 파생본을 저장하고 그 reference를 반환한다.
+
+    파생본 이름은 원본(uuid 포함)에서 결정적으로 나오므로 재생성하면 같은 객체를 덮어쓴다.
+    """
+    derived = derived_asset_ref(asset_ref, suffix)
+    if derived is None:
+        return None
+    if derived.startswith("local://"):
+        path = resolve_local_asset_path(derived)
+        if path is None:
+            return None
+        path.write_bytes(data)
+        return derived
+    from app.services.gcs_utils import _get_gcs_client
+
+    bucket_name, _, blob_path = derived[len("gs://"):].partition("/")
+    blob = _get_gcs_client().bucket(bucket_name).blob(blob_path)
+    # 공개 표면은 signed URL로 302하므로 CDN·브라우저가 파생본을 오래 캐시해도 된다.
+    blob.cache_control = "public, max-age=31536000, immutable"
+    blob.upload_from_string(data, content_type=mime_type)
+    return derived
@@ -6,20 +6,18 @@ stored candidate still has to pass the deterministic publication assessment.
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import Any
 
-import anthropic
-
 from app.core.config import settings
 from app.models.essence import HospitalContentPhilosophy
 from app.models.hospital import Hospital
 from app.services import cost_guard
 from app.services.ai_prompt_boundary import untrusted_json_block
+from app.services.anthropic_client import create_message
 from app.services.essence_engine import effective_safety_policy
 
 logger = logging.getLogger(__name__)
@@ -199,26 +197,19 @@ async def review_generated_content(
             content_brief=content_brief,
         )
     )
-    client = anthropic.Anthropic(
-        api_key=settings.ANTHROPIC_API_KEY,
-        timeout=60.0,
-        max_retries=0,
-    )
     try:
         await cost_guard.record_provider_call("content")
-        response = await asyncio.get_running_loop().run_in_executor(
-            None,
-            lambda: client.messages.create(
-                model=settings.CLAUDE_MODEL_FAST,
-                max_tokens=1200,
-                system=_SYSTEM_PROMPT,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": payload,
-                    }
-                ],
-            ),
+        response = await create_message(
+            model=settings.CLAUDE_MODEL_FAST,
+            max_tokens=1200,
+            system=_SYSTEM_PROMPT,
+            messages=[
+                {
+                    "role": "user",
+                    "content": payload,
+                }
+            ],
+            timeout=60.0,
         )
         return _parse_response(response.content[0].text)
     except Exception as exc:  # provider and parser failures are advisory-unavailable
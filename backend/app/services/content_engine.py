@@ -8,15 +8,15 @@ import logging
 import re
 from urllib.parse import urlparse
 
-import anthropic
-import httpx
 from tenacity import before_sleep_log, retry, stop_after_attempt, wait_exponential
 
 from app.core.config import settings
 from app.models.content import ContentType
 from app.models.essence import HospitalContentPhilosophy
 from app.models.hospital import Hospital
+from app.services.anthropic_client import create_message
 from app.services.essence_engine import effective_safety_policy
+from app.services.reference_link_health import BROKEN_STATUS_CODES, check_reference_links
 from app.utils.authority_sources import (
     infer_source_type,
     is_citable_reference_url,
@@ -25,6 +25,7 @@ from app.utils.authority_sources import (
     select_curated_authority_sources,
 )
 from app.utils.medical_filter import check_forbidden_content_fields
+from app.utils.title_similarity import PROMPT_NEIGHBOR_LIMIT, TitleSimilarityIndex
 
 logger = logging.getLogger(__name__)
 
@@ -78,11 +79,9 @@ SEASON_MONTHS = {
     "겨울": {12, 1, 2},
 }
 
-client = anthropic.Anthropic(
-    api_key=settings.ANTHROPIC_API_KEY,
-    timeout=90.0,
-    max_retries=0,  # tenacity handles retries with backoff
-)
+# 공급자 호출은 프로세스 공용 async 클라이언트(anthropic_client)를 쓴다. SDK 재시도는 꺼져
+# 있고 tenacity가 백오프 재시도를 관리한다.
+GENERATION_TIMEOUT_SECONDS = 90.0
 
 # ── 시스템 프롬프트 ───────────────────────────────────────────────
 # 검색·AI용 별도 문법을 가장하지 않고, 환자에게 유용한 고유 정보·정확한 출처·명확한
@@ -398,7 +397,6 @@ async def generate_content(
     Claude Sonnet으로 콘텐츠 생성.
     Returns: {"title": str, "body": str, "meta_description": str}
     """
-    import asyncio
     import json
 
     profile_ctx = _build_profile_context(hospital)
@@ -406,9 +404,8 @@ async def generate_content(
     brief_ctx = _build_content_brief_context(content_brief)
     type_prompt = _fill_type_prompt(content_type, hospital)
 
-    avoid_titles = ""
-    if existing_titles:
-        avoid_titles = "\n\n이미 작성된 제목 (중복 금지):\n" + "\n".join(f"- {t}" for t in existing_titles)
+    title_index = TitleSimilarityIndex(existing_titles or [])
+    avoid_titles = _render_avoid_titles(title_index, content_brief)
 
     essence_context = f"\n\n{philosophy_ctx}" if philosophy_ctx else ""
     brief_context = f"\n\n{brief_ctx}" if brief_ctx else ""
@@ -439,22 +436,19 @@ async def generate_content(
 
     await cost_guard.record_provider_call("content")
 
-    # asyncio에서 sync anthropic 클라이언트 호출
-    loop = asyncio.get_running_loop()
-    response = await loop.run_in_executor(
-        None,
-        lambda: client.messages.create(
-            model=settings.CLAUDE_MODEL,
-            max_tokens=5500,
-            system=SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": user_message}],
-        ),
+    response = await create_message(
+        model=settings.CLAUDE_MODEL,
+        max_tokens=5500,
+        system=SYSTEM_PROMPT,
+        messages=[{"role": "user", "content": user_message}],
+        timeout=GENERATION_TIMEOUT_SECONDS,
     )
 
     raw = response.content[0].text
 
     result = _parse_json_response(raw, json_module=json)
 
+    _validate_title_not_duplicate(result.get("title"), title_index)
     _validate_body_length(result.get("body"))
     _validate_unverified_price_claims(result.get("body"))
 
@@ -496,13 +490,13 @@ async def generate_content(
 
     # 금지 표현 검사 — 1차 시도 실패 시 자동 정제 (재시도보다 안정적)
     #
-    # 검사는 **렌더 결과 기준**이고 정제기는 **원문 기준**이다. 이 비대칭은 의도된 것이다:
-    # 정제기를 렌더 텍스트에 돌리면 본문의 링크 목적지까지 사라져 참고자료 링크가 깨진다.
-    # 대신 `최**고**의`처럼 강조가 낀 위반은 정제되지 않고 재검사에서 걸려 재생성으로 간다.
+    # 검사는 **렌더 결과 기준**이다. 정제기는 원문 기준으로 지운 뒤, 본문은 렌더 해석의
+    # 원문 위치로 화면 글자만 한 번 더 지운다 — `최**고**의`처럼 강조가 낀 위반도 정제되고,
+    # 화면에 없는 링크 목적지는 건드리지 않아 참고자료 링크가 깨지지 않는다.
     #
-    # 그 결과 정제로 못 고치는 위반 클래스가 존재하며, 이는 재시도를 소진해 슬롯을 비울 수
-    # 있다. 빈도를 모른 채 두면 조용히 콘텐츠 기아가 되므로 별도 마커로 남겨 측정 가능하게
-    # 한다("SANITIZE_FAILED"로 집계하면 규칙별 실패율을 볼 수 있다).
+    # 그래도 정제로 못 고치는 위반(지운 자리가 새 위반을 만드는 경우 등)은 재시도를 소진해
+    # 슬롯을 비울 수 있다. 빈도를 모른 채 두면 조용히 콘텐츠 기아가 되므로 별도 마커로 남겨
+    # 측정 가능하게 한다("SANITIZE_FAILED"로 집계하면 규칙별 실패율을 볼 수 있다).
     violations = check_forbidden_content_fields(result, FORBIDDEN_CHECK_FIELDS)
     if violations:
         logger.warning(f"Forbidden expressions found: {violations} — auto-sanitizing")
@@ -593,6 +587,32 @@ def _parse_json_response(raw: str, *, json_module) -> dict:
     return result
 
 
+def _render_avoid_titles(title_index: TitleSimilarityIndex, content_brief: dict | None) -> str:
+    """이번 주제와 가까운 기존 제목만 "중복 금지" 힌트로 넣는다.
+
+    전체 이력을 넣으면 프롬프트가 병원 운영 기간에 비례해 커진다. 실제 중복 판정은
+    `_validate_title_not_duplicate`가 로컬에서 하므로 여기서는 상위 K개면 충분하다.
+    브리프가 없어 주제를 알 수 없으면 최근 제목으로 대신한다.
+    """
+    focus = _curated_reference_focus(content_brief)
+    titles = title_index.nearest(focus) if focus else []
+    if not titles:
+        titles = title_index.recent(PROMPT_NEIGHBOR_LIMIT)
+    if not titles:
+        return ""
+    return "\n\n이미 작성된 제목 (중복 금지):\n" + "\n".join(f"- {t}" for t in titles)
+
+
+def _validate_title_not_duplicate(title: object, title_index: TitleSimilarityIndex) -> None:
+    if not isinstance(title, str):
+        return
+    duplicate = title_index.near_duplicate(title)
+    if duplicate is not None:
+        raise ValueError(
+            f"Generated title duplicates existing content: {title[:80]} ~ {duplicate[:80]}"
+        )
+
+
 def _trim_or_none(value: object, max_length: int) -> str | None:
     if not isinstance(value, str):
         return None
@@ -790,7 +810,12 @@ def _sanitize_forbidden(result: dict, violations: list[str]) -> dict:
     Only used as a fallback when Claude generates text containing banned terms
     despite prompt instructions.
     """
-    from app.utils.medical_filter import FORBIDDEN_PATTERNS, normalize_for_check
+    from app.utils.medical_filter import (
+        FORBIDDEN_PATTERNS,
+        MARKDOWN_RENDERED_FIELDS,
+        normalize_for_check,
+        sanitize_forbidden_markdown,
+    )
 
     sanitized = dict(result)
     for field in FORBIDDEN_CHECK_FIELDS:
@@ -805,6 +830,9 @@ def _sanitize_forbidden(result: dict, violations: list[str]) -> dict:
             pattern = FORBIDDEN_PATTERNS.get(label)
             if pattern:
                 text = pattern.sub("", text)
+        if field in MARKDOWN_RENDERED_FIELDS:
+            # 원문에 연속으로 있지 않은(강조가 낀) 위반은 화면 위치로 지운다.
+            text = sanitize_forbidden_markdown(text, violations)
         sanitized[field] = text
     return sanitized
 
@@ -839,35 +867,28 @@ async def _drop_definitively_broken_references(references: list[dict]) -> list[d
 
     권위 사이트가 봇 요청을 403/429로 막거나 일시 네트워크 오류가 난 경우에는 정상
     자료를 잘못 버리지 않기 위해 유지한다. 404/410과 최종 호스트 이탈만 실패로 본다.
+    확인 자체는 `reference_link_health`가 캐시·병렬로 수행한다.
     """
+    health_by_url = await check_reference_links([reference["url"] for reference in references])
     kept: list[dict] = []
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
-            "Chrome/126.0.0.0 Safari/537.36"
-        )
-    }
-    async with httpx.AsyncClient(timeout=8, follow_redirects=True) as client:
-        for reference in references:
-            url = reference["url"]
-            try:
-                response = await client.get(url, headers=headers)
-            except (httpx.TimeoutException, httpx.NetworkError):
-                kept.append(reference)
-                continue
-            if response.status_code in {404, 410}:
-                logger.warning(
-                    "Dropping broken authority reference status=%s host=%s",
-                    response.status_code,
-                    urlparse(url).hostname,
-                )
-                continue
-            final_url = str(response.url)
-            if not is_whitelisted_url(final_url):
-                logger.warning(
-                    "Dropping authority reference redirected outside whitelist: host=%s",
-                    urlparse(final_url).hostname,
-                )
-                continue
+    for reference in references:
+        url = reference["url"]
+        health = health_by_url.get(url)
+        if health is None or health.transient:
             kept.append(reference)
+            continue
+        if health.status_code in BROKEN_STATUS_CODES:
+            logger.warning(
+                "Dropping broken authority reference status=%s host=%s",
+                health.status_code,
+                urlparse(url).hostname,
+            )
+            continue
+        if not is_whitelisted_url(health.final_url):
+            logger.warning(
+                "Dropping authority reference redirected outside whitelist: host=%s",
+                urlparse(health.final_url).hostname,
+            )
+            continue
+        kept.append(reference)
     return kept
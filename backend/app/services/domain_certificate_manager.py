@@ -8,6 +8,9 @@
 먼저 탐색한다. 없을 때만 SHA-256 기반 결정적 ID로 LB authorization managed certificate와
 map entry를 생성한다. 모든 오류는 fail-closed 상태로 축약하며 GCP 원문 오류는 외부로
 반환하거나 로그에 기록하지 않는다.
+
+GCP SDK(gRPC 스택)는 호출하는 함수 안에서 import한다. Admin 도메인 라우터가 인증서
+태스크를 통해 이 모듈을 import하므로, 모듈 수준 import는 API 콜드 스타트에 얹힌다.
 """
 
 from __future__ import annotations
@@ -15,15 +18,14 @@ from __future__ import annotations
 import hashlib
 import logging
 from dataclasses import dataclass
-from typing import Literal
-
-from google.api_core import exceptions as google_exceptions
-from google.auth import exceptions as google_auth_exceptions
-from google.cloud import certificate_manager_v1
+from typing import TYPE_CHECKING, Literal
 
 from app.core.config import settings
 from app.utils.domain import is_valid_hostname, normalize_domain
 
+if TYPE_CHECKING:
+    from google.cloud import certificate_manager_v1
+
 logger = logging.getLogger(__name__)
 
 DomainCertificatePhase = Literal[
@@ -79,6 +81,8 @@ def _normalize_hostname(hostname: str) -> str | None:
 
 
 def _certificate_state(certificate: certificate_manager_v1.Certificate) -> str:
+    from google.cloud import certificate_manager_v1
+
     try:
         return certificate_manager_v1.Certificate.ManagedCertificate.State(
             certificate.managed.state
@@ -88,6 +92,8 @@ def _certificate_state(certificate: certificate_manager_v1.Certificate) -> str:
 
 
 def _map_entry_state(entry: certificate_manager_v1.CertificateMapEntry) -> str:
+    from google.cloud import certificate_manager_v1
+
     try:
         return certificate_manager_v1.ServingState(entry.state).name
     except (TypeError, ValueError):
@@ -228,6 +234,10 @@ def inspect_domain_certificate(
     client: certificate_manager_v1.CertificateManagerClient | None = None,
 ) -> DomainCertificateResult:
     """기존 map entry와 참조 인증서 상태를 읽기 전용으로 확인한다."""
+    from google.api_core import exceptions as google_exceptions
+    from google.auth import exceptions as google_auth_exceptions
+    from google.cloud import certificate_manager_v1
+
     normalized = _normalize_hostname(hostname)
     if not normalized:
         return _invalid_result(hostname)
@@ -265,6 +275,9 @@ def _get_or_create_certificate(
     location_parent: str,
     hostname: str,
 ) -> certificate_manager_v1.Certificate:
+    from google.api_core import exceptions as google_exceptions
+    from google.cloud import certificate_manager_v1
+
     certificate_id, _ = _resource_ids(hostname)
     certificate_name = f"{location_parent}/certificates/{certificate_id}"
     try:
@@ -300,6 +313,9 @@ def _get_or_create_entry(
     hostname: str,
     certificate_name: str,
 ) -> certificate_manager_v1.CertificateMapEntry:
+    from google.api_core import exceptions as google_exceptions
+    from google.cloud import certificate_manager_v1
+
     _, entry_id = _resource_ids(hostname)
     entry_name = f"{map_path}/certificateMapEntries/{entry_id}"
     try:
@@ -338,6 +354,10 @@ def ensure_domain_certificate(
     client: certificate_manager_v1.CertificateManagerClient | None = None,
 ) -> DomainCertificateResult:
     """도메인의 managed cert/map entry를 멱등 생성하고 현재 준비 상태를 반환한다."""
+    from google.api_core import exceptions as google_exceptions
+    from google.auth import exceptions as google_auth_exceptions
+    from google.cloud import certificate_manager_v1
+
     normalized = _normalize_hostname(hostname)
     if not normalized:
         return _invalid_result(hostname)
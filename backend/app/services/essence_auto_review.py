@@ -8,7 +8,7 @@ import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import StrEnum
-from typing import Any, Callable
+from typing import Any, Callable, Mapping, Sequence
 
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
@@ -31,6 +31,7 @@ from app.services.essence_engine import (
     apply_mandatory_safety_policy,
     compute_sources_snapshot_hash,
     find_error_marker_fields,
+    load_snapshot_sources,
     mandatory_safety_findings,
     screen_content_against_philosophy,
     synthesize_philosophy,
@@ -234,17 +235,6 @@ def _approved(db: Session, hospital_id: uuid.UUID) -> HospitalContentPhilosophy
     )
 
 
-def _approved_unlocked(db: Session, hospital_id: uuid.UUID) -> HospitalContentPhilosophy | None:
-    """Read-only reconciliation lookup; correctness is rechecked under lock later."""
-
-    return db.scalar(
-        select(HospitalContentPhilosophy).where(
-            HospitalContentPhilosophy.hospital_id == hospital_id,
-            HospitalContentPhilosophy.status == PhilosophyStatus.APPROVED,
-        )
-    )
-
-
 def _notes_for_sources(
     db: Session,
     hospital_id: uuid.UUID,
@@ -766,18 +756,56 @@ def _rescreen_content(
     return counts
 
 
-def essence_refresh_needed(db: Session, hospital_id: uuid.UUID) -> bool:
-    """Cheap lock-free preflight; the worker rechecks every fact under its lock."""
+def essence_refresh_candidates(
+    db: Session,
+    hospital_ids: Sequence[uuid.UUID],
+    *,
+    snapshot_sources: Mapping[uuid.UUID, list[Any]] | None = None,
+) -> list[uuid.UUID]:
+    """Batched lock-free preflight; the worker rechecks every fact under its lock.
+
+    Snapshot hashes come from one column-projected source query for all hospitals,
+    so a reconcile window costs the same two queries however many it covers. Only a
+    hospital whose processed snapshot moved past its approved one pays for the
+    draft and evidence-note lookups.
+    """
+
+    if snapshot_sources is None:
+        snapshot_sources = load_snapshot_sources(db, hospital_ids)
+    approved_hashes = dict(
+        db.execute(
+            select(
+                HospitalContentPhilosophy.hospital_id,
+                HospitalContentPhilosophy.source_snapshot_hash,
+            ).where(
+                HospitalContentPhilosophy.hospital_id.in_(list(hospital_ids)),
+                HospitalContentPhilosophy.status == PhilosophyStatus.APPROVED,
+            )
+        ).all()
+    )
+    needed: list[uuid.UUID] = []
+    for hospital_id in hospital_ids:
+        sources = snapshot_sources.get(hospital_id) or []
+        if not sources or any(
+            _status_value(source.status) != SourceStatus.PROCESSED.value for source in sources
+        ):
+            continue
+        snapshot_hash = compute_sources_snapshot_hash(sources)
+        if approved_hashes.get(hospital_id) == snapshot_hash:
+            continue
+        if _snapshot_refresh_unclaimed(
+            db, hospital_id, snapshot_hash, [source.id for source in sources]
+        ):
+            needed.append(hospital_id)
+    return needed
 
-    previous = _approved_unlocked(db, hospital_id)
-    sources = _required_sources(db, hospital_id)
-    if not sources or any(
-        _status_value(source.status) != SourceStatus.PROCESSED.value for source in sources
-    ):
-        return False
-    snapshot_hash = compute_sources_snapshot_hash(sources)
-    if previous is not None and previous.source_snapshot_hash == snapshot_hash:
-        return False
+
+def _snapshot_refresh_unclaimed(
+    db: Session,
+    hospital_id: uuid.UUID,
+    snapshot_hash: str,
+    source_ids: list[uuid.UUID],
+) -> bool:
     existing_drafts = _drafts_for_snapshot(db, hospital_id, snapshot_hash)
     if existing_drafts:
         # A legacy automatic escalation gets exactly one recovery cycle after this
@@ -788,10 +816,15 @@ def essence_refresh_needed(db: Session, hospital_id: uuid.UUID) -> bool:
         existing_draft = existing_drafts[0]
         if not _is_untouched_legacy_auto_draft(existing_draft):
             return False
-    source_ids = [source.id for source in sources]
     return bool(_notes_for_sources(db, hospital_id, source_ids))
 
 
+def essence_refresh_needed(db: Session, hospital_id: uuid.UUID) -> bool:
+    """Cheap lock-free preflight; the worker rechecks every fact under its lock."""
+
+    return bool(essence_refresh_candidates(db, [hospital_id]))
+
+
 def refresh_essence_snapshot(
     db: Session,
     hospital_id: uuid.UUID,
@@ -1105,6 +1138,7 @@ __all__ = (
     "EssenceRefreshResult",
     "EssenceRefreshStatus",
     "deterministic_candidate_findings",
+    "essence_refresh_candidates",
     "essence_refresh_needed",
     "refresh_essence_snapshot",
     "review_essence_candidate",
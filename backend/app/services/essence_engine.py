@@ -15,17 +15,19 @@ import hashlib
 import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from contextvars import ContextVar
+from contextvars import ContextVar, copy_context
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, AsyncIterator, Iterable
+from itertools import zip_longest
+from typing import TYPE_CHECKING, Any, AsyncIterator, Collection, Iterable
 
-import anthropic
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from tenacity import Retrying, stop_after_attempt, wait_exponential
 
 from app.core.config import settings
+from app.core.metrics import observe_provider_call
 from app.models.content import ContentItem
 from app.models.essence import (
     PHOTO_SOURCE_TYPES,
@@ -37,9 +39,14 @@ from app.models.essence import (
     SourceStatus,
 )
 from app.models.hospital import Hospital
+from app.services.anthropic_client import get_sync_client, sync_model_slot
+from app.services.evidence_extraction_cache import ExtractionCache, extraction_cache_key
 from app.utils.error_page import looks_like_error_page_text
 from app.utils.medical_filter import FORBIDDEN_EXPRESSIONS, check_forbidden
 
+if TYPE_CHECKING:
+    import anthropic
+
 logger = logging.getLogger(__name__)
 
 ESSENCE_STATUS_ALIGNED = "ALIGNED"
@@ -98,9 +105,19 @@ def mandatory_safety_findings(payload: Any) -> list[str]:
             findings.append(f"{field_name} 필드에 플랫폼 공통 의료광고 안전 규칙이 없습니다.")
     return findings
 
-# content_engine.py와 동일한 sync Anthropic 클라이언트 패턴 — tenacity가 재시도를 관리하므로
-# SDK 내부 재시도는 끈다. 키가 없으면 lazy하게 None을 유지해 deterministic 폴백으로 떨어진다.
+# 프로세스 공용 sync Anthropic 클라이언트(anthropic_client)를 쓴다 — 이 모듈의 호출 체인은
+# 동기이고 asyncio.to_thread 안에서 돈다. tenacity가 재시도를 관리하므로 SDK 내부 재시도는
+# 꺼져 있다. 키가 없으면 None이라 deterministic 폴백으로 떨어진다.
+# 한 번의 추출 호출에 넣는 원문 상한. 더 긴 원문은 이 크기의 구간으로 나눠 추출한다.
 _RAW_TEXT_FOR_LLM_LIMIT = 24_000
+_RAW_TEXT_CHUNK_OVERLAP = 800
+# 비용 상한 — 구간 8개(약 19만 자)를 넘는 원문은 앞부분만 추출하고 경고를 남긴다.
+_RAW_TEXT_MAX_CHUNKS = 8
+_SOURCE_PROCESSING_MAX_TOKENS = 3000
+_MAX_NOTES_PER_SOURCE = 20
+_MAX_NOTES_PER_CHUNKED_SOURCE = 40
+# 구간별 노트를 돌아가며 합칠 때 먼저 끝난 구간 자리를 메우는 표식(노트 값 None과 구분).
+_NO_NOTE = object()
 _VALID_NOTE_TYPES = {note_type.value for note_type in EvidenceNoteType}
 _LOCAL_CONTEXT_PATTERN = re.compile(
     r"(?<![가-힣])(?:"
@@ -110,14 +127,8 @@ _LOCAL_CONTEXT_PATTERN = re.compile(
 )
 
 
-def _anthropic_client() -> anthropic.Anthropic | None:
-    if not settings.ANTHROPIC_API_KEY:
-        return None
-    return anthropic.Anthropic(
-        api_key=settings.ANTHROPIC_API_KEY,
-        timeout=60.0,
-        max_retries=0,
-    )
+def _anthropic_client() -> "anthropic.Anthropic | None":
+    return get_sync_client()
 
 
 def llm_enabled() -> bool:
@@ -152,7 +163,40 @@ def compute_source_content_hash(
     return hashlib.sha256(source.encode("utf-8")).hexdigest()
 
 
-def compute_sources_snapshot_hash(sources: Iterable[HospitalSourceAsset]) -> str:
+# compute_sources_snapshot_hash가 읽는 컬럼 전부. 해시만 필요한 경로는 이 컬럼만 조회해
+# raw_text/operator_note(원문 전체)를 DB에서 끌어오지 않는다.
+SNAPSHOT_SOURCE_COLUMNS = (
+    HospitalSourceAsset.id,
+    HospitalSourceAsset.content_hash,
+    HospitalSourceAsset.status,
+    HospitalSourceAsset.processed_at,
+)
+
+
+def load_snapshot_sources(db, hospital_ids: Collection[Any]) -> dict[Any, list[Row]]:
+    """병원별 필수 자료(제외·사진 아님)의 스냅샷 컬럼 행 — 병원 수와 무관하게 쿼리 한 번.
+
+    행은 `compute_sources_snapshot_hash`가 읽는 속성을 그대로 가지므로 ORM 객체 대신 넘길
+    수 있다. 자료가 없는 병원은 빈 목록. Session과 Connection 모두 받는다.
+    """
+    grouped: dict[Any, list[Row]] = {hospital_id: [] for hospital_id in hospital_ids}
+    if not grouped:
+        return grouped
+    rows = db.execute(
+        select(HospitalSourceAsset.hospital_id, *SNAPSHOT_SOURCE_COLUMNS)
+        .where(
+            HospitalSourceAsset.hospital_id.in_(list(grouped)),
+            HospitalSourceAsset.status != SourceStatus.EXCLUDED,
+            HospitalSourceAsset.source_type.notin_(list(PHOTO_SOURCE_TYPES)),
+        )
+        .order_by(HospitalSourceAsset.hospital_id, HospitalSourceAsset.id)
+    )
+    for row in rows:
+        grouped[row.hospital_id].append(row)
+    return grouped
+
+
+def compute_sources_snapshot_hash(sources: Iterable[HospitalSourceAsset | Row]) -> str:
     parts = []
     for source in sorted(sources, key=lambda item: str(item.id)):
         parts.append(
@@ -191,20 +235,24 @@ def validate_source_excerpt(asset: HospitalSourceAsset, excerpt: str) -> bool:
 
 
 def process_source_asset(
-    asset: HospitalSourceAsset, *, use_llm: bool = True
+    asset: HospitalSourceAsset,
+    *,
+    use_llm: bool = True,
+    cache: ExtractionCache | None = None,
 ) -> list[EvidenceNotePayload]:
     """자료 원문에서 근거 노트를 추출한다.
 
     ANTHROPIC_API_KEY가 있으면 Claude로 추출하고, 없으면 deterministic 폴백을 쓴다.
     LLM 호출이 실패하면 deterministic 폴백으로 안전하게 떨어진다.
     어느 경로든 source_excerpt는 원문 verbatim이어야 한다.
+    `cache`를 주면 같은 원문의 LLM 추출 결과를 재사용한다(evidence_extraction_cache).
     """
     if not asset.raw_text or not asset.raw_text.strip():
         raise ValueError("원문 텍스트가 없는 자료는 처리할 수 없습니다.")
 
     if use_llm and llm_enabled():
         try:
-            payloads = _process_source_asset_llm(asset)
+            payloads = _process_source_asset_llm(asset, cache)
             if payloads:
                 return payloads
             logger.info(
@@ -369,7 +417,10 @@ def _call_anthropic_json(
                 request["output_config"] = {
                     "format": {"type": "json_schema", "schema": output_schema}
                 }
-            response = client.messages.create(**request, timeout=timeout_seconds)
+            with sync_model_slot(settings.CLAUDE_MODEL_FAST), observe_provider_call(
+                "anthropic", settings.CLAUDE_MODEL_FAST
+            ):
+                response = client.messages.create(**request, timeout=timeout_seconds)
             stop_reason = getattr(response, "stop_reason", None)
             if stop_reason in {"max_tokens", "refusal"}:
                 raise ValueError(f"essence LLM incomplete structured output: {stop_reason}")
@@ -387,25 +438,183 @@ def _call_anthropic_json(
     raise RuntimeError("essence LLM retry loop ended without a result")  # pragma: no cover
 
 
-def _process_source_asset_llm(asset: HospitalSourceAsset) -> list[EvidenceNotePayload]:
-    """Claude로 근거 노트를 추출하고, 원문 verbatim 가드를 통과한 노트만 남긴다."""
-    raw_text = (asset.raw_text or "")[:_RAW_TEXT_FOR_LLM_LIMIT]
-    operator_note = (asset.operator_note or "").strip()
-    user_message = (
-        f"[원문 raw_text]\n{raw_text}\n\n"
+def source_extraction_fingerprint() -> str:
+    """근거 추출 **프로토콜**의 지문 — 모델·지시문·스키마·입력 분할 규칙이 바뀌면 달라진다."""
+    material = json.dumps(
+        {
+            "model": settings.CLAUDE_MODEL_FAST,
+            "system": _SOURCE_PROCESSING_SYSTEM,
+            "schema": _SOURCE_PROCESSING_OUTPUT_SCHEMA,
+            "raw_text_limit": _RAW_TEXT_FOR_LLM_LIMIT,
+            "chunk_overlap": _RAW_TEXT_CHUNK_OVERLAP,
+            "max_chunks": _RAW_TEXT_MAX_CHUNKS,
+            "chunk_merge": "round_robin",
+            "max_tokens": _SOURCE_PROCESSING_MAX_TOKENS,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+
+def split_raw_text_chunks(
+    raw_text: str,
+    *,
+    chunk_chars: int = _RAW_TEXT_FOR_LLM_LIMIT,
+    overlap_chars: int = _RAW_TEXT_CHUNK_OVERLAP,
+) -> list[str]:
+    """긴 원문을 문단 경계에서 겹치게 자른다.
+
+    각 구간은 원문의 **연속 부분문자열**이다 — 구간에서 뽑은 발췌가 원문 전체에 대해서도
+    verbatim이어야 하기 때문이다. 경계는 구간 후반부의 빈 줄(없으면 줄바꿈)을 고르고,
+    다음 구간은 `overlap_chars`만큼 앞에서 시작해 경계에 걸친 문장을 놓치지 않는다.
+    """
+    if len(raw_text) <= chunk_chars:
+        return [raw_text]
+    chunks: list[str] = []
+    start = 0
+    while start < len(raw_text):
+        end = min(start + chunk_chars, len(raw_text))
+        if end < len(raw_text):
+            floor = start + chunk_chars // 2
+            cut = raw_text.rfind("\n\n", floor, end)
+            if cut < 0:
+                cut = raw_text.rfind("\n", floor, end)
+            if cut > start:
+                end = cut
+        chunks.append(raw_text[start:end])
+        if end >= len(raw_text):
+            break
+        start = max(end - overlap_chars, start + 1)
+    return chunks
+
+
+def _source_processing_message(
+    raw_text: str, operator_note: str, *, chunk_index: int = 0, chunk_count: int = 1
+) -> str:
+    label = (
+        f"[원문 raw_text — 전체 {chunk_count}개 구간 중 {chunk_index + 1}번째]"
+        if chunk_count > 1
+        else "[원문 raw_text]"
+    )
+    return (
+        f"{label}\n{raw_text}\n\n"
         + (f"[운영자 메모 operator_note]\n{operator_note}\n\n" if operator_note else "")
         + "위 원문에서만 근거 노트를 추출해 JSON으로 출력하세요."
     )
+
+
+def _extract_raw_notes(user_message: str) -> list[Any]:
     data = _call_anthropic_json(
         _SOURCE_PROCESSING_SYSTEM,
         user_message,
-        max_tokens=3000,
+        max_tokens=_SOURCE_PROCESSING_MAX_TOKENS,
         output_schema=_SOURCE_PROCESSING_OUTPUT_SCHEMA,
     )
+    return _as_list(data.get("evidence_notes"))
+
+
+def _extract_raw_notes_chunked(chunks: list[str], operator_note: str) -> tuple[list[Any], bool]:
+    """구간별 추출을 동시에 실행하고 원시 노트를 구간을 돌아가며 하나씩 합친다.
+
+    구간 순서대로 이어 붙이면 앞 두 구간의 노트만으로 노트 상한이 차서 긴 PDF의 뒷부분이
+    빠진다. 돌아가며 합치면 상한 안에서 모든 구간이 고르게 남는다(중복 제거는 그 뒤에 한다).
+    반환값의 두 번째 값은 모든 구간이 성공했는지다. 일부 구간이 실패해도 나머지 구간의
+    노트는 살리되, 불완전한 결과는 캐시하지 않아 다음 처리에서 다시 시도하게 한다.
+    운영자 메모는 첫 구간에만 붙인다 — 구간마다 붙이면 같은 노트를 반복 추출한다.
+    각 작업은 호출자의 컨텍스트를 복사해 실행한다(metered_llm_calls 계수 유지).
+    """
+    messages = [
+        _source_processing_message(
+            chunk,
+            operator_note if index == 0 else "",
+            chunk_index=index,
+            chunk_count=len(chunks),
+        )
+        for index, chunk in enumerate(chunks)
+    ]
+    workers = max(1, min(len(messages), settings.ANTHROPIC_MODEL_CONCURRENCY))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="essence-chunk") as pool:
+        futures = [
+            pool.submit(copy_context().run, _extract_raw_notes, message) for message in messages
+        ]
+    per_chunk: list[list[Any]] = []
+    failures = 0
+    for index, future in enumerate(futures):
+        try:
+            per_chunk.append(future.result())
+        except Exception as exc:  # noqa: BLE001 — 구간 하나의 실패가 나머지를 버리지 않게
+            failures += 1
+            logger.warning(
+                "essence chunk extraction failed (%d/%d): %s", index + 1, len(futures), exc
+            )
+    if failures == len(futures):
+        raise RuntimeError("essence chunked extraction failed for every chunk")
+    raw_notes = [
+        note
+        for round_notes in zip_longest(*per_chunk, fillvalue=_NO_NOTE)
+        for note in round_notes
+        if note is not _NO_NOTE
+    ]
+    return raw_notes, failures == 0
 
+
+def _process_source_asset_llm(
+    asset: HospitalSourceAsset, cache: ExtractionCache | None = None
+) -> list[EvidenceNotePayload]:
+    """Claude로 근거 노트를 추출하고, 원문 verbatim 가드를 통과한 노트만 남긴다.
+
+    `_RAW_TEXT_FOR_LLM_LIMIT`보다 긴 원문(브로슈어·치료 안내 PDF)은 잘라 버리지 않고
+    구간으로 나눠 동시에 추출한 뒤 합친다. 지연은 가장 느린 구간이 정한다.
+    verbatim 가드와 중복 제거는 합친 뒤 원문 **전체**에 대해 한 번 수행한다.
+
+    `cache`가 있으면 같은 원문·같은 프로토콜의 모델 응답을 재사용한다. 캐시에는 모델의
+    원시 노트를 두고 아래 후처리(verbatim 가드·금지 표현 분류)는 적중해도 다시 돈다.
+    """
+    cache_key = None
+    raw_notes: list[Any] | None = None
+    if cache is not None:
+        cache_key = extraction_cache_key(
+            compute_source_content_hash(
+                asset.title, asset.url, asset.raw_text, asset.operator_note
+            ),
+            source_extraction_fingerprint(),
+        )
+        raw_notes = cache.get(cache_key)
+    cacheable = raw_notes is None
+    note_limit = _MAX_NOTES_PER_SOURCE
+    operator_note = (asset.operator_note or "").strip()
+    chunks = split_raw_text_chunks(asset.raw_text or "")
+    if len(chunks) > 1:
+        note_limit = _MAX_NOTES_PER_CHUNKED_SOURCE
+        if len(chunks) > _RAW_TEXT_MAX_CHUNKS:
+            logger.warning(
+                "essence source text exceeds %d chunks (%d); extracting the first %d",
+                _RAW_TEXT_MAX_CHUNKS,
+                len(chunks),
+                _RAW_TEXT_MAX_CHUNKS,
+            )
+            chunks = chunks[:_RAW_TEXT_MAX_CHUNKS]
+    if raw_notes is None:
+        if len(chunks) > 1:
+            raw_notes, complete = _extract_raw_notes_chunked(chunks, operator_note)
+            cacheable = complete
+        else:
+            raw_notes = _extract_raw_notes(_source_processing_message(chunks[0], operator_note))
+
+    payloads = _evidence_payloads_from_llm_notes(asset, raw_notes, limit=note_limit)
+    # 쓸 만한 노트가 없던 응답은 저장하지 않는다 — 다음 처리에서 다시 추출을 시도한다.
+    if cache is not None and cache_key is not None and payloads and cacheable:
+        cache.set(cache_key, raw_notes)
+    return payloads
+
+
+def _evidence_payloads_from_llm_notes(
+    asset: HospitalSourceAsset, raw_notes: list[Any], *, limit: int = _MAX_NOTES_PER_SOURCE
+) -> list[EvidenceNotePayload]:
     payloads: list[EvidenceNotePayload] = []
     seen: set[tuple[str, str]] = set()
-    for raw_note in _as_list(data.get("evidence_notes")):
+    for raw_note in raw_notes:
         if not isinstance(raw_note, dict):
             continue
         note_type = _coerce_note_type(raw_note.get("note_type"))
@@ -450,7 +659,7 @@ def _process_source_asset_llm(asset: HospitalSourceAsset) -> list[EvidenceNotePa
                 note_metadata=metadata,
             )
         )
-        if len(payloads) >= 20:
+        if len(payloads) >= limit:
             break
     return payloads
 
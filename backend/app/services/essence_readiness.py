@@ -4,25 +4,41 @@ Approval alone is insufficient: processed sources can change after approval.
 Generation, publication, and public reads may keep using the intact approved
 processed-source baseline while a new source is pending, but must stop if that
 approved baseline changes.
+
+The resolved state is persisted per hospital in `HospitalEssenceReadiness` and
+rewritten inside every flush that touches sources or philosophies (see the
+listener in `app.models.essence`). Reads are a primary-key lookup joined to the
+approved philosophy; `compute_essence_readiness*` recomputes from the source
+rows and serves as the fallback and as the verifier the reconcile loop runs.
 """
 
 from __future__ import annotations
 
 import uuid
+from collections.abc import Collection, Iterable, Mapping, Sequence
 from dataclasses import dataclass
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Connection, Row, func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.essence import (
     PHOTO_SOURCE_TYPES,
     HospitalContentPhilosophy,
+    HospitalEssenceReadiness,
     HospitalSourceAsset,
     PhilosophyStatus,
     SourceStatus,
 )
-from app.services.essence_engine import compute_sources_snapshot_hash
+from app.models.hospital import Hospital
+from app.services.essence_engine import (
+    SNAPSHOT_SOURCE_COLUMNS,
+    compute_sources_snapshot_hash,
+    load_snapshot_sources,
+)
+from app.utils.db_locks import is_postgres_bind
 
 
 @dataclass(frozen=True)
@@ -53,8 +69,8 @@ class EssenceReadiness:
 
 
 def resolve_essence_readiness(
-    approved: HospitalContentPhilosophy | None,
-    required_sources: list[HospitalSourceAsset],
+    approved: HospitalContentPhilosophy | Row | None,
+    required_sources: Sequence[HospitalSourceAsset | Row],
 ) -> EssenceReadiness:
     processed_sources = [
         source for source in required_sources if source.status == SourceStatus.PROCESSED
@@ -91,46 +107,209 @@ def resolve_essence_readiness(
     )
 
 
-async def get_essence_readiness(
+def _approved_statement(hospital_id: uuid.UUID):
+    return select(HospitalContentPhilosophy).where(
+        HospitalContentPhilosophy.hospital_id == hospital_id,
+        HospitalContentPhilosophy.status == PhilosophyStatus.APPROVED,
+    )
+
+
+def _required_sources_statement(hospital_id: uuid.UUID):
+    return select(*SNAPSHOT_SOURCE_COLUMNS).where(
+        HospitalSourceAsset.hospital_id == hospital_id,
+        HospitalSourceAsset.status != SourceStatus.EXCLUDED,
+        HospitalSourceAsset.source_type.notin_(list(PHOTO_SOURCE_TYPES)),
+    )
+
+
+async def compute_essence_readiness(
     db: AsyncSession,
     hospital_id: uuid.UUID,
 ) -> EssenceReadiness:
-    approved_result = await db.execute(
-        select(HospitalContentPhilosophy).where(
-            HospitalContentPhilosophy.hospital_id == hospital_id,
-            HospitalContentPhilosophy.status == PhilosophyStatus.APPROVED,
+    approved = (await db.execute(_approved_statement(hospital_id))).scalar_one_or_none()
+    sources_result = await db.execute(_required_sources_statement(hospital_id))
+    return resolve_essence_readiness(approved, list(sources_result.all()))
+
+
+def compute_essence_readiness_sync(db: Session, hospital_id: uuid.UUID) -> EssenceReadiness:
+    approved = db.execute(_approved_statement(hospital_id)).scalar_one_or_none()
+    required_sources = list(db.execute(_required_sources_statement(hospital_id)).all())
+    return resolve_essence_readiness(approved, required_sources)
+
+
+_PROJECTION_COLUMNS = (
+    HospitalEssenceReadiness.approved_philosophy_id,
+    HospitalEssenceReadiness.public_philosophy_id,
+    HospitalEssenceReadiness.processed_source_count,
+    HospitalEssenceReadiness.required_source_count,
+    HospitalEssenceReadiness.current_snapshot_hash,
+    HospitalEssenceReadiness.complete_snapshot_is_fresh,
+)
+
+
+def _projection_statement(hospital_id: uuid.UUID):
+    # Columns rather than the entity: the listener rewrites the row with Core
+    # statements, which would not refresh an instance already in the identity map.
+    return (
+        select(*_PROJECTION_COLUMNS, HospitalContentPhilosophy)
+        .select_from(HospitalEssenceReadiness)
+        .outerjoin(
+            HospitalContentPhilosophy,
+            HospitalContentPhilosophy.id == HospitalEssenceReadiness.approved_philosophy_id,
         )
+        .where(HospitalEssenceReadiness.hospital_id == hospital_id)
     )
-    approved = approved_result.scalar_one_or_none()
-    sources_result = await db.execute(
-        select(HospitalSourceAsset).where(
-            HospitalSourceAsset.hospital_id == hospital_id,
-            HospitalSourceAsset.status != SourceStatus.EXCLUDED,
-            HospitalSourceAsset.source_type.notin_(list(PHOTO_SOURCE_TYPES)),
-        )
+
+
+def _readiness_from_projection(row: Any) -> EssenceReadiness | None:
+    approved = row.HospitalContentPhilosophy
+    if row.approved_philosophy_id is not None and (
+        approved is None or approved.status != PhilosophyStatus.APPROVED
+    ):
+        return None
+    public_philosophy = (
+        approved
+        if approved is not None and row.public_philosophy_id == approved.id
+        else None
     )
-    return resolve_essence_readiness(approved, list(sources_result.scalars().all()))
+    return EssenceReadiness(
+        approved=approved,
+        current=public_philosophy,
+        public_philosophy=public_philosophy,
+        processed_source_count=row.processed_source_count,
+        required_source_count=row.required_source_count,
+        current_snapshot_hash=row.current_snapshot_hash,
+        complete_snapshot_is_fresh=row.complete_snapshot_is_fresh,
+    )
+
+
+async def get_essence_readiness(
+    db: AsyncSession,
+    hospital_id: uuid.UUID,
+) -> EssenceReadiness:
+    if is_postgres_bind(db):
+        row = (await db.execute(_projection_statement(hospital_id))).first()
+        readiness = _readiness_from_projection(row) if row is not None else None
+        if readiness is not None:
+            return readiness
+    return await compute_essence_readiness(db, hospital_id)
 
 
 def get_essence_readiness_sync(db: Session, hospital_id: uuid.UUID) -> EssenceReadiness:
-    approved = db.execute(
-        select(HospitalContentPhilosophy).where(
-            HospitalContentPhilosophy.hospital_id == hospital_id,
+    if is_postgres_bind(db):
+        row = db.execute(_projection_statement(hospital_id)).first()
+        readiness = _readiness_from_projection(row) if row is not None else None
+        if readiness is not None:
+            return readiness
+    return compute_essence_readiness_sync(db, hospital_id)
+
+
+def _projection_values_by_hospital(
+    db: Session | Connection,
+    hospital_ids: Collection[uuid.UUID],
+    snapshot_sources: Mapping[uuid.UUID, list[Any]] | None = None,
+) -> dict[uuid.UUID, dict[str, Any]]:
+    """Recompute projections from the snapshot columns only — never the source text.
+
+    Two queries for any number of hospitals; `snapshot_sources` lets a caller that
+    already ran `load_snapshot_sources` for the same hospitals skip the second.
+    """
+    if snapshot_sources is None:
+        snapshot_sources = load_snapshot_sources(db, hospital_ids)
+    approved_rows = db.execute(
+        select(
+            HospitalContentPhilosophy.hospital_id,
+            HospitalContentPhilosophy.id,
+            HospitalContentPhilosophy.source_snapshot_hash,
+            HospitalContentPhilosophy.source_asset_ids,
+        ).where(
+            HospitalContentPhilosophy.hospital_id.in_(list(hospital_ids)),
             HospitalContentPhilosophy.status == PhilosophyStatus.APPROVED,
         )
-    ).scalar_one_or_none()
-    required_sources = list(
-        db.execute(
-            select(HospitalSourceAsset).where(
-                HospitalSourceAsset.hospital_id == hospital_id,
-                HospitalSourceAsset.status != SourceStatus.EXCLUDED,
-                HospitalSourceAsset.source_type.notin_(list(PHOTO_SOURCE_TYPES)),
+    )
+    approved_by_hospital = {row.hospital_id: row for row in approved_rows}
+    values: dict[uuid.UUID, dict[str, Any]] = {}
+    for hospital_id in hospital_ids:
+        approved = approved_by_hospital.get(hospital_id)
+        readiness = resolve_essence_readiness(approved, snapshot_sources.get(hospital_id, []))
+        values[hospital_id] = {
+            "approved_philosophy_id": approved.id if approved is not None else None,
+            "public_philosophy_id": (
+                readiness.public_philosophy.id
+                if readiness.public_philosophy is not None
+                else None
+            ),
+            "processed_source_count": readiness.processed_source_count,
+            "required_source_count": readiness.required_source_count,
+            "current_snapshot_hash": readiness.current_snapshot_hash,
+            "complete_snapshot_is_fresh": bool(readiness.complete_snapshot_is_fresh),
+        }
+    return values
+
+
+def refresh_essence_readiness_projection(
+    connection: Connection,
+    hospital_ids: Iterable[uuid.UUID],
+) -> None:
+    """Rewrite the projection rows inside the caller's transaction (Postgres only).
+
+    The row is locked before the sources are read, so two transactions touching
+    the same hospital recompute one after the other and the later one sees the
+    earlier commit. Hospitals are visited in id order to keep the lock order
+    stable across transactions.
+    """
+    for hospital_id in sorted(set(hospital_ids), key=str):
+        if connection.scalar(select(Hospital.id).where(Hospital.id == hospital_id)) is None:
+            # Deleted in the same flush; the projection row goes with it (CASCADE).
+            continue
+        connection.execute(
+            insert(HospitalEssenceReadiness)
+            .values(hospital_id=hospital_id, current_snapshot_hash="")
+            .on_conflict_do_update(
+                index_elements=[HospitalEssenceReadiness.hospital_id],
+                set_={"refreshed_at": func.now()},
             )
         )
-        .scalars()
-        .all()
-    )
-    return resolve_essence_readiness(approved, required_sources)
+        connection.execute(
+            update(HospitalEssenceReadiness)
+            .where(HospitalEssenceReadiness.hospital_id == hospital_id)
+            .values(
+                **_projection_values_by_hospital(connection, [hospital_id])[hospital_id],
+                refreshed_at=func.now(),
+            )
+        )
+
+
+def verify_essence_readiness_projections(
+    db: Session,
+    hospital_ids: Collection[uuid.UUID],
+    *,
+    snapshot_sources: Mapping[uuid.UUID, list[Any]] | None = None,
+) -> int:
+    """Compare stored projections with a recomputation; rewrite the ones that differ.
+
+    Returns how many rows were missing or stale. Writes that bypass the ORM flush
+    (raw SQL, data migrations) are the only way for the two to drift.
+    """
+    if not hospital_ids or not is_postgres_bind(db):
+        return 0
+    stored = {
+        row.hospital_id: row._asdict()
+        for row in db.execute(
+            select(HospitalEssenceReadiness.hospital_id, *_PROJECTION_COLUMNS).where(
+                HospitalEssenceReadiness.hospital_id.in_(list(hospital_ids))
+            )
+        )
+    }
+    expected = _projection_values_by_hospital(db, hospital_ids, snapshot_sources)
+    drifted = [
+        hospital_id
+        for hospital_id, values in expected.items()
+        if stored.get(hospital_id) != {"hospital_id": hospital_id, **values}
+    ]
+    if drifted:
+        refresh_essence_readiness_projection(db.connection(), drifted)
+    return len(drifted)
 
 
 async def get_current_approved_philosophy(
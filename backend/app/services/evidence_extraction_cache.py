@@ -0,0 +1,85 @@
+"""근거 노트 추출 결과 캐시 — 같은 원문은 같은 프롬프트로 한 번만 추출한다.
+
+`process_source_asset_task`는 주간 네이버 동기화와 reconcile 루프가 다시 큐잉할 때마다
+Claude 추출을 새로 돌린다. 원문이 한 글자도 바뀌지 않았어도(같은 블로그 글의 재인입,
+내용 변화 없는 수정 후 재처리) 빠른 모델 호출이 그대로 나간다.
+
+키는 `compute_source_content_hash`(제목·URL·원문·운영자 메모)와 추출 프롬프트·스키마·
+모델 지문의 조합이다. 프롬프트나 모델을 바꾸면 지문이 바뀌어 옛 결과가 자동으로
+무효화된다 — 수동 버전 문자열은 올리는 것을 잊는다(`lead_query_cache.prompt_version`과
+같은 규칙).
+
+값은 노트 dict 목록이다. 적중해도 호출자가 원문 verbatim 가드를 다시 통과시킨다.
+Redis 장애는 fail-open — 캐시 없이 추출한다. 원문은 저장하지 않고 발췌만 저장한다.
+"""
+import json
+import logging
+from typing import Any, Protocol
+
+import redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.metrics import record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "essence-extraction:"
+# 원문이 같으면 결과도 같아야 하므로 길게 둔다. 프롬프트 변경은 지문이 처리한다.
+CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+
+class ExtractionCache(Protocol):
+    def get(self, key: str) -> list[dict[str, Any]] | None: ...
+
+    def set(self, key: str, notes: list[dict[str, Any]]) -> None: ...
+
+
+def extraction_cache_key(content_hash: str, fingerprint: str) -> str:
+    return f"{KEY_PREFIX}{fingerprint}:{content_hash}"
+
+
+class RedisExtractionCache:
+    """동기 Redis 캐시 — 추출 체인이 `asyncio.to_thread` 안에서 동기로 돌기 때문이다."""
+
+    def __init__(self, client: redis.Redis):
+        self._client = client
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        try:
+            raw = self._client.get(key)
+        except (RedisError, OSError):
+            logger.warning("Evidence extraction cache unavailable; extracting directly")
+            record_cache_lookup("evidence_extraction", "error")
+            return None
+        try:
+            notes = json.loads(raw) if raw is not None else None
+        except ValueError:
+            notes = None
+        if not isinstance(notes, list):
+            record_cache_lookup("evidence_extraction", "miss")
+            return None
+        record_cache_lookup("evidence_extraction", "hit")
+        return notes
+
+    def set(self, key: str, notes: list[dict[str, Any]]) -> None:
+        try:
+            self._client.set(key, json.dumps(notes, ensure_ascii=False), ex=CACHE_TTL_SECONDS)
+        except (RedisError, OSError):
+            logger.warning("Evidence extraction cache write failed; result not shared")
+
+
+_default_cache: RedisExtractionCache | None = None
+
+
+def default_extraction_cache() -> RedisExtractionCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = RedisExtractionCache(
+            redis.from_url(
+                settings.REDIS_URL,
+                socket_connect_timeout=2,
+                socket_timeout=2,
+            )
+        )
+    return _default_cache
@@ -15,23 +15,17 @@ import logging
 import re
 from dataclasses import dataclass, field
 
-import anthropic
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.core.config import settings
 from app.services import naver_place
+from app.services.anthropic_client import create_message
 from app.services.asset_extractor import fetch_url_text
 from app.services.content_engine import _parse_json_response
 from app.utils.medical_filter import check_forbidden
 
 logger = logging.getLogger(__name__)
 
-_client = anthropic.Anthropic(
-    api_key=settings.ANTHROPIC_API_KEY,
-    timeout=90.0,
-    max_retries=0,  # tenacity가 백오프로 재시도
-)
-
 # 소스별 입력 텍스트 상한 — 토큰/비용 통제. 합쳐 ~50K자.
 _MAX_PER_SOURCE = 18_000
 
@@ -180,15 +174,13 @@ async def _extract_with_claude(name: str, aggregated_text: str) -> dict:
 
     await cost_guard.record_provider_call("content")
 
-    loop = asyncio.get_running_loop()
-    response = await loop.run_in_executor(
-        None,
-        lambda: _client.messages.create(
-            model=settings.CLAUDE_MODEL,
-            max_tokens=3000,
-            system=EXTRACTION_SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": user_message}],
-        ),
+    # 공용 async 클라이언트는 SDK 재시도가 꺼져 있어 tenacity가 백오프로 재시도한다.
+    response = await create_message(
+        model=settings.CLAUDE_MODEL,
+        max_tokens=3000,
+        system=EXTRACTION_SYSTEM_PROMPT,
+        messages=[{"role": "user", "content": user_message}],
+        timeout=90.0,
     )
     raw = response.content[0].text
     parsed = _parse_json_response(raw, json_module=json)
@@ -0,0 +1,217 @@
+"""공개 이미지 반응형 파생본 — 폭별 AVIF/WebP, 블러 placeholder, 원본 크기.
+
+콘텐츠 대표 이미지와 병원 사진은 생성·업로드된 원본(PNG/JPEG, 수 MB)만 저장되고, 공개
+프록시는 요청마다 그 원본으로 302했다. 허브 방문자는 대부분 LTE 휴대폰이라 카드 썸네일
+하나에 원본 전체를 받으며 LCP가 그 다운로드에 묶인다.
+
+원본을 저장할 때 한 번만 폭별 파생본을 만들어 원본 옆(`name.w960.avif` 등)에 두고,
+파생본 목록·원본 크기·작은 placeholder를 manifest dict로 돌려준다. 호출자는 이를 항목에
+저장하고(`ContentItem.image_variants`, 사진은 `source_metadata["image_variants"]`),
+공개 엔드포인트는 `Accept`와 `w`/`format` 쿼리로 manifest에서 고른다.
+
+- 원본보다 넓은 파생본은 만들지 않는다. 원본이 가장 작은 폭보다 좁으면 원본 폭 하나만 만든다.
+- AVIF는 Pillow 빌드가 지원할 때만 만든다. WebP만 있어도 협상은 그대로 동작한다.
+- 실패는 fail-open — manifest가 None이면 공개 표면은 종전처럼 원본을 준다.
+"""
+import base64
+import logging
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Any
+
+from PIL import Image, ImageOps, features
+
+from app.services.asset_storage import read_asset_bytes, store_derived_asset_bytes
+
+logger = logging.getLogger(__name__)
+
+# 카드 썸네일(모바일 1x/2x)·본문 폭·데스크톱 히어로. 생성 이미지는 1K~1.5K라 마지막 폭은
+# 대부분 원본 폭으로 잘린다.
+VARIANT_WIDTHS = (480, 960, 1600)
+PLACEHOLDER_WIDTH = 16
+
+# 선호 순서 — 같은 품질에서 AVIF가 WebP보다 작다.
+FORMAT_MEDIA_TYPES = {"avif": "image/avif", "webp": "image/webp"}
+_ENCODE_OPTIONS: dict[str, dict[str, Any]] = {
+    "avif": {"format": "AVIF", "quality": 55, "speed": 6},
+    "webp": {"format": "WEBP", "quality": 78, "method": 4},
+}
+
+
+@dataclass(frozen=True)
+class EncodedVariant:
+    format: str
+    width: int
+    height: int
+    data: bytes
+
+
+def available_formats() -> tuple[str, ...]:
+    formats = []
+    if features.check("avif"):
+        formats.append("avif")
+    if features.check("webp"):
+        formats.append("webp")
+    return tuple(formats)
+
+
+def _target_widths(original_width: int) -> list[int]:
+    widths = [width for width in VARIANT_WIDTHS if width < original_width]
+    widths.append(min(original_width, VARIANT_WIDTHS[-1]))
+    return sorted(set(widths))
+
+
+def _encode(image: Image.Image, fmt: str) -> bytes:
+    buffer = BytesIO()
+    image.save(buffer, **_ENCODE_OPTIONS[fmt])
+    return buffer.getvalue()
+
+
+def _placeholder(image: Image.Image) -> str:
+    height = max(1, round(image.height * PLACEHOLDER_WIDTH / image.width))
+    tiny = image.resize((PLACEHOLDER_WIDTH, height), Image.Resampling.BILINEAR)
+    buffer = BytesIO()
+    tiny.save(buffer, format="WEBP", quality=40)
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def render_variants(image_bytes: bytes) -> tuple[dict[str, Any], list[EncodedVariant]]:
+    """원본 바이트 → (크기·placeholder, 인코딩된 파생본). 저장소는 건드리지 않는다."""
+    with Image.open(BytesIO(image_bytes)) as opened:
+        # EXIF 회전을 먼저 적용해야 휴대폰 사진의 width/height가 보이는 방향과 맞는다.
+        image = ImageOps.exif_transpose(opened)
+        image = image.convert("RGBA" if image.mode in {"RGBA", "LA", "P"} else "RGB")
+    width, height = image.size
+    encoded: list[EncodedVariant] = []
+    formats = available_formats()
+    for target in _target_widths(width):
+        target_height = max(1, round(height * target / width))
+        resized = (
+            image
+            if target == width
+            else image.resize((target, target_height), Image.Resampling.LANCZOS)
+        )
+        for fmt in formats:
+            encoded.append(EncodedVariant(fmt, target, target_height, _encode(resized, fmt)))
+    summary = {
+        "width": width,
+        "height": height,
+        "placeholder": _placeholder(image) if "webp" in formats else None,
+    }
+    return summary, encoded
+
+
+def store_image_variants(original_ref: str, image_bytes: bytes) -> dict[str, Any] | None:
+    """파생본을 원본 옆에 저장하고 manifest를 반환한다. 실패하면 None(원본만 서빙)."""
+    try:
+        summary, encoded = render_variants(image_bytes)
+        variants = []
+        for variant in encoded:
+            ref = store_derived_asset_bytes(
+                original_ref,
+                suffix=f".w{variant.width}.{variant.format}",
+                data=variant.data,
+                mime_type=FORMAT_MEDIA_TYPES[variant.format],
+            )
+            if ref is None:
+                return None
+            variants.append(
+                {
+                    "format": variant.format,
+                    "width": variant.width,
+                    "height": variant.height,
+                    "ref": ref,
+                }
+            )
+    except Exception as exc:  # noqa: BLE001 — 파생본 실패가 원본 저장을 막지 않는다.
+        logger.warning("Image variants skipped for %s: %s", original_ref, exc)
+        return None
+    return {**summary, "variants": variants}
+
+
+def build_image_variants(original_ref: str) -> dict[str, Any] | None:
+    """이미 저장된 원본을 읽어 파생본을 만든다. 원본 바이트를 들고 있지 않은 경로용."""
+    try:
+        image_bytes = read_asset_bytes(original_ref)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Image variants skipped; original unreadable %s: %s", original_ref, exc)
+        return None
+    if not image_bytes:
+        return None
+    return store_image_variants(original_ref, image_bytes)
+
+
+def _is_refused(param: str) -> bool:
+    name, _, value = param.partition("=")
+    if name.strip().lower() != "q":
+        return False
+    try:
+        return float(value) <= 0
+    except ValueError:
+        return False
+
+
+def _accepted_formats(accept: str | None) -> list[str]:
+    accepted: set[str] = set()
+    for media_range in (accept or "").split(","):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        if any(_is_refused(param) for param in params):
+            continue
+        for fmt, known in FORMAT_MEDIA_TYPES.items():
+            if media_type.lower() == known:
+                accepted.add(fmt)
+    return [fmt for fmt in FORMAT_MEDIA_TYPES if fmt in accepted]
+
+
+def choose_image_variant(
+    manifest: dict[str, Any] | None,
+    *,
+    accept: str | None,
+    width: int | None = None,
+    image_format: str | None = None,
+) -> dict[str, Any] | None:
+    """요청에 맞는 파생본. 맞는 것이 없으면 None — 호출자는 원본을 준다.
+
+    `image_format`이 있으면 `Accept`보다 우선한다("original"은 항상 원본). 폭은 `width`
+    이상인 것 중 가장 작은 것, 없으면 가장 큰 것이다(늘린 이미지는 만들지 않았다).
+    """
+    if not isinstance(manifest, dict) or image_format == "original":
+        return None
+    variants = [
+        variant
+        for variant in manifest.get("variants") or []
+        if isinstance(variant, dict)
+        and variant.get("format") in FORMAT_MEDIA_TYPES
+        and isinstance(variant.get("width"), int)
+        and isinstance(variant.get("ref"), str)
+    ]
+    formats = [image_format] if image_format else _accepted_formats(accept)
+    for fmt in formats:
+        candidates = sorted(
+            (variant for variant in variants if variant["format"] == fmt),
+            key=lambda variant: variant["width"],
+        )
+        if not candidates:
+            continue
+        if width is None:
+            return candidates[-1]
+        return next(
+            (variant for variant in candidates if variant["width"] >= width),
+            candidates[-1],
+        )
+    return None
+
+
+def image_dimensions(manifest: dict[str, Any] | None) -> dict[str, Any]:
+    """공개 직렬화용 원본 크기·placeholder. manifest가 없으면 모두 None.
+
+    콘텐츠 항목과 병원 사진이 같은 키(`image_width`/`image_height`/`image_placeholder`)를
+    쓰도록 여기서 키까지 정한다.
+    """
+    if not isinstance(manifest, dict):
+        manifest = {}
+    return {
+        "image_width": manifest.get("width"),
+        "image_height": manifest.get("height"),
+        "image_placeholder": manifest.get("placeholder"),
+    }
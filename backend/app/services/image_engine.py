@@ -3,6 +3,8 @@
 - 기본: Vertex AI **Gemini 3.1 Flash Image**
 - 선택: OpenAI **gpt-image-2**, 실패 시 Google 경로로 폴백
 - 생성물은 GCS에 저장 후 gs:// 경로 반환 (공개 표면은 안정 프록시로 서빙)
+- 같은 병원의 최근 이미지와 거의 같은 그림은 올리지 않고, 고정 안전 프롬프트 결과는
+  재사용한다 (`image_reuse_index`)
 
 설계 메모: 콘텐츠 카드 이미지가 유형별 고정 프롬프트라 "파란 빈 방"이 반복되던 슬롭 문제를
 없애기 위해, 각 항목의 제목(topic)을 프롬프트에 주입해 항목마다 다른 그림이 나오게 한다.
@@ -17,12 +19,22 @@ from io import BytesIO
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from app.core.config import settings
+from app.core.metrics import observe_provider_call
 from app.models.content import ContentType
 from app.services.image_direction import HospitalImageDirection, image_direction_prompt
+from app.services.image_reuse_index import (
+    default_image_reuse_index,
+    perceptual_hash,
+    prompt_fingerprint,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class NearDuplicateImageError(ValueError):
+    """같은 병원의 최근 이미지와 거의 같은 그림 — 업로드하지 않고 다시 생성한다."""
+
+
 def _is_transient_openai_error(exc: BaseException) -> bool:
     """결정적 4xx(예: moderation_blocked)는 재시도해도 항상 실패하므로 재시도 금지 —
     바로 Google 경로로 넘겨 시간/비용 낭비와 Job 타임아웃을 막는다. 5xx/네트워크만 재시도."""
@@ -244,10 +256,8 @@ async def generate_image(
         try:
             url = await loop.run_in_executor(
                 None,
-                lambda: _generate_and_upload(
-                    GOOGLE_SAFETY_FALLBACK_PROMPT,
-                    hospital_name,
-                    counter=fallback_attempts,
+                lambda: _reuse_or_generate_safety_fallback(
+                    hospital_name, counter=fallback_attempts
                 ),
             )
             return url, GOOGLE_SAFETY_FALLBACK_PROMPT
@@ -258,6 +268,45 @@ async def generate_image(
         await _record_image_calls(fallback_attempts)
 
 
+def _reuse_or_generate_safety_fallback(
+    hospital_name: str, *, counter: _CallCounter | None = None
+) -> str:
+    """동기 — 고정 안전 프롬프트는 주제가 없어 결과가 사실상 같다. 이미 만든 자산이 있으면
+    병원과 무관하게 그 경로를 쓰고 공급자를 부르지 않는다."""
+    index = default_image_reuse_index()
+    fingerprint = prompt_fingerprint(settings.GOOGLE_IMAGE_MODEL, GOOGLE_SAFETY_FALLBACK_PROMPT)
+    reused = index.find_prompt_asset(fingerprint)
+    if reused:
+        logger.info("Safety fallback image reused: %s", reused)
+        return reused
+    url = _generate_and_upload(GOOGLE_SAFETY_FALLBACK_PROMPT, hospital_name, counter=counter)
+    if url:
+        index.remember_prompt_asset(fingerprint, url)
+    return url
+
+
+def _store_generated_png(image_bytes: bytes, hospital_name: str, prompt: str) -> str:
+    """업로드 전에 같은 병원의 최근 이미지와 지각 해시를 비교하고, 올린 뒤 색인에 남긴다.
+
+    거의 같은 그림이면 `NearDuplicateImageError` — 호출부의 tenacity 재시도가 같은
+    예산 안에서 다시 생성한다. 고정 안전 프롬프트는 원래 같은 그림이므로 비교하지 않는다.
+    """
+    index = default_image_reuse_index()
+    try:
+        phash = perceptual_hash(image_bytes)
+    except Exception as exc:  # noqa: BLE001 — 해시 실패가 업로드를 막지 않는다.
+        logger.warning("Perceptual hash skipped: %s", exc)
+        phash = None
+    if phash is not None and prompt != GOOGLE_SAFETY_FALLBACK_PROMPT:
+        duplicate = index.near_duplicate(hospital_name, phash)
+        if duplicate:
+            raise NearDuplicateImageError(f"near-duplicate of {duplicate}")
+    gcs_path = _upload_png_to_gcs(image_bytes, hospital_name)
+    if phash is not None:
+        index.remember_image(hospital_name, phash, gcs_path)
+    return gcs_path
+
+
 def _upload_png_to_gcs(image_bytes: bytes, hospital_name: str) -> str:
     """PNG 바이트를 GCS content/{hospital}/{uuid}.png 로 업로드하고 gs:// 경로 반환."""
     from app.services.gcs_utils import _get_gcs_client
@@ -324,20 +373,21 @@ def _openai_generate_and_upload(
         client = OpenAI(api_key=settings.OPENAI_API_KEY, timeout=180.0, max_retries=0)
         # response_format은 gpt-image 계열에서 기본 b64_json이며 일부 버전이 명시 전달을
         # 거부하므로 전달하지 않는다(기본값 사용).
-        result = client.images.generate(
-            model=settings.OPENAI_IMAGE_MODEL,
-            prompt=prompt,
-            size=settings.OPENAI_IMAGE_SIZE,
-            quality=settings.OPENAI_IMAGE_QUALITY,
-            n=1,
-        )
+        with observe_provider_call("openai", settings.OPENAI_IMAGE_MODEL):
+            result = client.images.generate(
+                model=settings.OPENAI_IMAGE_MODEL,
+                prompt=prompt,
+                size=settings.OPENAI_IMAGE_SIZE,
+                quality=settings.OPENAI_IMAGE_QUALITY,
+                n=1,
+            )
         if not result.data:
             raise ValueError("gpt-image-2 returned no data")
         b64 = result.data[0].b64_json
         if not b64:
             raise ValueError("gpt-image-2 returned no b64_json payload")
         image_bytes = base64.b64decode(b64)
-        return _upload_png_to_gcs(image_bytes, hospital_name)
+        return _store_generated_png(image_bytes, hospital_name, prompt)
     except ImportError:
         logger.error("openai SDK not installed")
         return ""
@@ -363,19 +413,20 @@ def _generate_and_upload(
             location=settings.GOOGLE_IMAGE_LOCATION,
             http_options=types.HttpOptions(api_version="v1"),
         )
-        response = client.models.generate_content(
-            model=settings.GOOGLE_IMAGE_MODEL,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                response_modalities=[types.Modality.TEXT, types.Modality.IMAGE],
-                candidate_count=1,
-                image_config=types.ImageConfig(
-                    aspect_ratio="16:9",
-                    image_size="1K",
-                    person_generation="ALLOW_NONE",
+        with observe_provider_call("vertex", settings.GOOGLE_IMAGE_MODEL):
+            response = client.models.generate_content(
+                model=settings.GOOGLE_IMAGE_MODEL,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    response_modalities=[types.Modality.TEXT, types.Modality.IMAGE],
+                    candidate_count=1,
+                    image_config=types.ImageConfig(
+                        aspect_ratio="16:9",
+                        image_size="1K",
+                        person_generation="ALLOW_NONE",
+                    ),
                 ),
-            ),
-        )
+            )
         parts = (
             response.candidates[0].content.parts
             if response.candidates and response.candidates[0].content
@@ -398,7 +449,7 @@ def _generate_and_upload(
                 "Google image model returned no image payload "
                 f"(finish_reasons={finish_reasons})"
             )
-        return _upload_png_to_gcs(image_bytes, hospital_name)
+        return _store_generated_png(image_bytes, hospital_name, prompt)
 
     except ImportError:
         logger.error("Google Gen AI or GCS SDK not installed")
@@ -0,0 +1,126 @@
+"""생성 이미지 재사용 색인 — 프롬프트 지문과 지각 해시(dHash).
+
+대표 이미지는 생성할 때마다 `content/{hospital}/{uuid}.png`로 새로 올라간다. 주제 장면이
+안전 필터에 걸리면 쓰는 `GOOGLE_SAFETY_FALLBACK_PROMPT`는 주제가 없는 고정 문장이라
+병원과 무관하게 거의 같은 그림을 매번 새로 사서 새로 저장한다. 주제 프롬프트도 같은
+병원 안에서 비슷한 제목이 이어지면 사실상 같은 구도("파란 빈 방")가 허브에 반복된다.
+
+- 프롬프트 지문(모델+프롬프트 sha256) → gs:// 경로. 고정 프롬프트는 이미 만든 자산을
+  그대로 쓰고 공급자를 부르지 않는다. 생성 객체는 지우지 않으므로 경로는 계속 유효하다.
+- 병원별 최근 지각 해시 목록. 업로드 전에 새 이미지의 해시가 기존 것과 가까우면 중복으로
+  본다 — 호출부가 업로드하지 않고 다시 생성하게 한다.
+
+Redis 장애는 fail-open — 색인 없이 종전처럼 생성·업로드한다. 생성 경로 전체가 실행기
+스레드에서 동기로 돌기 때문에 동기 클라이언트를 쓴다(`evidence_extraction_cache`와 같은 규칙).
+"""
+import hashlib
+import logging
+from io import BytesIO
+
+import redis
+from PIL import Image
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.metrics import record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "image-reuse:"
+# 64비트 dHash 중 이만큼 이하로 다르면 같은 그림으로 본다. 재압축·미세한 색 차이는 보통
+# 0~4비트, 구도가 다른 그림은 20비트 이상 벌어진다.
+NEAR_DUPLICATE_DISTANCE = 6
+# 병원당 비교 대상 — 월 발행량 몇 달 치. 오래된 이미지와 닮은 건 반복으로 보이지 않는다.
+RECENT_HASHES_PER_HOSPITAL = 200
+PROMPT_ASSET_TTL_SECONDS = 180 * 24 * 3600
+
+
+def prompt_fingerprint(model: str, prompt: str) -> str:
+    return hashlib.sha256(f"{model}\n{prompt}".encode()).hexdigest()
+
+
+def perceptual_hash(image_bytes: bytes) -> int:
+    """64비트 difference hash — 9x8 회색조에서 가로 이웃 밝기 비교."""
+    with Image.open(BytesIO(image_bytes)) as image:
+        pixels = image.convert("L").resize((9, 8), Image.Resampling.LANCZOS).tobytes()
+    value = 0
+    for row in range(8):
+        for column in range(8):
+            left = pixels[row * 9 + column]
+            right = pixels[row * 9 + column + 1]
+            value = (value << 1) | (left > right)
+    return value
+
+
+def hash_distance(left: int, right: int) -> int:
+    return (left ^ right).bit_count()
+
+
+class ImageReuseIndex:
+    def __init__(self, client: redis.Redis):
+        self._client = client
+
+    def find_prompt_asset(self, fingerprint: str) -> str | None:
+        try:
+            raw = self._client.get(f"{KEY_PREFIX}prompt:{fingerprint}")
+        except (RedisError, OSError):
+            logger.warning("Image reuse index unavailable; generating a new image")
+            record_cache_lookup("image_prompt_asset", "error")
+            return None
+        ref = raw.decode() if isinstance(raw, bytes) else str(raw or "")
+        if not ref.startswith("gs://"):
+            record_cache_lookup("image_prompt_asset", "miss")
+            return None
+        record_cache_lookup("image_prompt_asset", "hit")
+        return ref
+
+    def remember_prompt_asset(self, fingerprint: str, ref: str) -> None:
+        try:
+            self._client.set(
+                f"{KEY_PREFIX}prompt:{fingerprint}", ref, ex=PROMPT_ASSET_TTL_SECONDS
+            )
+        except (RedisError, OSError):
+            logger.warning("Image reuse index write failed; prompt asset not shared")
+
+    def near_duplicate(self, scope: str, phash: int) -> str | None:
+        """같은 병원의 최근 이미지 중 `phash`와 가까운 것의 경로. 없으면 None."""
+        try:
+            entries = self._client.lrange(f"{KEY_PREFIX}phash:{scope}", 0, -1)
+        except (RedisError, OSError):
+            logger.warning("Image reuse index unavailable; skipping near-duplicate check")
+            return None
+        for entry in entries:
+            text = entry.decode() if isinstance(entry, bytes) else str(entry)
+            stored_hash, _, ref = text.partition(" ")
+            try:
+                if hash_distance(int(stored_hash, 16), phash) <= NEAR_DUPLICATE_DISTANCE:
+                    return ref
+            except ValueError:
+                continue
+        return None
+
+    def remember_image(self, scope: str, phash: int, ref: str) -> None:
+        key = f"{KEY_PREFIX}phash:{scope}"
+        try:
+            pipe = self._client.pipeline()
+            pipe.lpush(key, f"{phash:016x} {ref}")
+            pipe.ltrim(key, 0, RECENT_HASHES_PER_HOSPITAL - 1)
+            pipe.execute()
+        except (RedisError, OSError):
+            logger.warning("Image reuse index write failed; %s not indexed", ref)
+
+
+_default_index: ImageReuseIndex | None = None
+
+
+def default_image_reuse_index() -> ImageReuseIndex:
+    global _default_index
+    if _default_index is None:
+        _default_index = ImageReuseIndex(
+            redis.from_url(
+                settings.REDIS_URL,
+                socket_connect_timeout=2,
+                socket_timeout=2,
+            )
+        )
+    return _default_index
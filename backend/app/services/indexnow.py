@@ -27,7 +27,7 @@ from urllib.parse import urlparse
 import httpx
 
 from app.core.config import settings
-from app.services.site_revalidate import content_site_paths, hospital_site_paths
+from app.services.site_revalidate import contents_site_paths, hospital_site_paths
 
 logger = logging.getLogger(__name__)
 
@@ -188,9 +188,22 @@ async def submit_content_published(
     treatments: list | None = None,
 ) -> bool:
     """콘텐츠 발행 직후 호출 — 새 글과 그 글이 노출되는 목록/허브 페이지를 함께 알린다."""
+    return await submit_contents_published(
+        slug=slug, content_ids=[content_id], aeo_domain=aeo_domain, treatments=treatments
+    )
+
+
+async def submit_contents_published(
+    *,
+    slug: str,
+    content_ids: list,
+    aeo_domain: str | None,
+    treatments: list | None = None,
+) -> bool:
+    """같은 호스트에 발행된 여러 글을 한 번에 제출한다 — 허브·목록 URL은 한 번만 보낸다."""
     base = public_base_url(aeo_domain)
     return await submit_urls(
-        base_url=base, urls=_absolute(base, content_site_paths(slug, content_id, treatments))
+        base_url=base, urls=_absolute(base, contents_site_paths(slug, content_ids, treatments))
     )
 
 
@@ -230,10 +243,24 @@ async def submit_content_published_safe(
     treatments: list | None = None,
 ) -> bool:
     """예외를 삼킨다 — 색인 신호 실패가 발행 파이프라인을 멈추게 두지 않는다."""
+    return await submit_contents_published_safe(
+        slug=slug, content_ids=[content_id], aeo_domain=aeo_domain, treatments=treatments
+    )
+
+
+async def submit_contents_published_safe(
+    *,
+    slug: str,
+    content_ids: list,
+    aeo_domain: str | None,
+    treatments: list | None = None,
+) -> bool:
     try:
-        return await submit_content_published(
-            slug=slug, content_id=content_id, aeo_domain=aeo_domain, treatments=treatments
+        return await submit_contents_published(
+            slug=slug, content_ids=content_ids, aeo_domain=aeo_domain, treatments=treatments
         )
     except Exception as exc:  # noqa: BLE001
-        logger.warning("IndexNow 제출 중 예외 (slug=%s, content=%s): %s", slug, content_id, exc)
+        logger.warning(
+            "IndexNow 제출 중 예외 (slug=%s, contents=%d): %s", slug, len(content_ids), exc
+        )
         return False
@@ -23,6 +23,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.metrics import record_cache_lookup
 from app.models.lead_diagnosis import LeadQueryAnswer
 from app.services import sov_engine
 
@@ -80,7 +81,11 @@ async def get_cached_answers(
             )
         )
     ).scalars().all()
-    return {row.repeat_no: row for row in rows}
+    answers = {row.repeat_no: row for row in rows}
+    # 회차 단위로 센다 — 부분 적중의 절감이 적중률에 그대로 보이게.
+    record_cache_lookup("lead_query_answer", "hit", len(answers))
+    record_cache_lookup("lead_query_answer", "miss", repeat_count - len(answers))
+    return answers
 
 
 async def store_answer(
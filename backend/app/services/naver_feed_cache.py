@@ -0,0 +1,102 @@
+"""네이버 블로그 RSS 조건부 재요청용 검증자 캐시.
+
+주간 동기화는 병원마다 RSS 전체를 매주 다시 받아 파싱한다. 글 본문은 실행당 중복
+색인(`naver_handoff_sources.NaverDedupeIndex`)이 이미 아는 URL을 건너뛰므로, 변화가
+없는 블로그에서 반복되는 다운로드는 사실상 피드 하나다.
+
+직전 응답의 ETag·Last-Modified·본문 해시와 그때 해석한 글 URL 목록을 blogId별로
+저장해 두고, 다음 요청에 `If-None-Match`/`If-Modified-Since`를 붙인다. 304이거나
+본문 해시가 같으면 XML 해석 없이 저장된 목록을 그대로 쓴다.
+
+피드는 근거 자산이 아니어서 `HospitalSourceAsset.source_metadata`에 둘 자리가 없고,
+같은 블로그를 여러 병원이 등록해도 한 번만 저장하면 된다. Redis 장애는 fail-open —
+조건 없이 전체를 받는다.
+"""
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+
+import redis.asyncio as redis_async
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.metrics import record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "naver-feed:"
+# 주간 실행 두 번을 덮는다. 한 주를 건너뛰어도 다음 실행이 조건부 요청을 보낸다.
+CACHE_TTL_SECONDS = 15 * 24 * 3600
+
+
+@dataclass(frozen=True)
+class CachedFeed:
+    urls: tuple[str, ...]
+    body_sha256: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def feed_body_hash(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+_redis_client: redis_async.Redis | None = None
+
+
+def _client() -> redis_async.Redis:
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis_async.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+        )
+    return _redis_client
+
+
+async def load_feed(blog_id: str) -> CachedFeed | None:
+    try:
+        raw = await _client().get(KEY_PREFIX + blog_id)
+    except (RedisError, OSError):
+        logger.warning("Naver feed cache unavailable; fetching the full feed")
+        record_cache_lookup("naver_feed", "error")
+        return None
+    if raw is None:
+        record_cache_lookup("naver_feed", "miss")
+        return None
+    try:
+        payload = json.loads(raw)
+        feed = CachedFeed(
+            urls=tuple(str(url) for url in payload["urls"]),
+            body_sha256=str(payload["body_sha256"]),
+            etag=payload.get("etag"),
+            last_modified=payload.get("last_modified"),
+        )
+    except (ValueError, KeyError, TypeError):
+        record_cache_lookup("naver_feed", "miss")
+        return None
+    record_cache_lookup("naver_feed", "hit")
+    return feed
+
+
+async def store_feed(blog_id: str, feed: CachedFeed) -> None:
+    payload = {
+        "urls": list(feed.urls),
+        "body_sha256": feed.body_sha256,
+        "etag": feed.etag,
+        "last_modified": feed.last_modified,
+    }
+    try:
+        await _client().set(KEY_PREFIX + blog_id, json.dumps(payload), ex=CACHE_TTL_SECONDS)
+    except (RedisError, OSError):
+        logger.warning("Naver feed cache write failed; next sync fetches the full feed")
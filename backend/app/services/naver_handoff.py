@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from dataclasses import dataclass
 
@@ -39,9 +40,17 @@ from app.services.naver_handoff_runs import (
 from app.services.naver_handoff_sources import (
     NaverHospitalRef,
     NaverSourceProcess,
+    load_naver_dedupe_index,
+    naver_duplicate,
     process_naver_item,
+    store_naver_fetch,
 )
 
+# Naver throttles bursts from one client; a handful of overlapping reads is enough to
+# hide per-post latency without tripping rate limits.
+NAVER_FETCH_CONCURRENCY = 4
+NAVER_CHECKPOINT_ITEMS = 5
+
 
 @dataclass(frozen=True, slots=True)
 class NaverCrawlOptions:
@@ -84,14 +93,10 @@ async def sync_hospital_naver_sources(
         await finish_naver_run(db, run, items, run_error=("NAVER_RSS_FAILED", message))
         return NaverHandoffResult(blog_id=blog_id, run_id=run.id, error=message)
 
-    outcomes = list(items)
     process = NaverSourceProcess(
         db, hospital, run.id, options.operator_note, options.created_by, options.actor
     )
-    for index, item in enumerate(items):
-        outcomes[index] = await process_naver_item(process, item, fetch_url_text)
-        await save_naver_items(db, run, tuple(outcomes))
-    final_items = tuple(outcomes)
+    final_items = await _ingest_items(process, run, items)
     await finish_naver_run(db, run, final_items)
     return _result(blog_id, run, final_items)
 
@@ -171,6 +176,63 @@ async def retry_failed_naver_source(
     return _result(naver_blog_id_from(failed.url), run, (outcome,))
 
 
+async def _ingest_items(
+    process: NaverSourceProcess,
+    run: OperationRun,
+    items: tuple[NaverHandoffItem, ...],
+) -> tuple[NaverHandoffItem, ...]:
+    """Fetch posts concurrently and persist outcomes serially in discovery order.
+
+    The dedupe index is loaded once, so known posts are skipped without a fetch or a
+    rescan. Network reads overlap up to `NAVER_FETCH_CONCURRENCY`; the session is used
+    by one coroutine only. Every fetched post that reached the database is committed
+    with the run items before the next fetch is awaited, so the hospital advisory lock
+    covers only its dedupe check and insert and a crash loses no stored source. Only
+    outcomes that wrote nothing (known duplicates, empty bodies) batch their summary
+    rewrite, every `NAVER_CHECKPOINT_ITEMS`.
+    """
+    index = await load_naver_dedupe_index(process.db, process.hospital.id)
+    limit = asyncio.Semaphore(NAVER_FETCH_CONCURRENCY)
+
+    async def fetch(url: str):
+        async with limit:
+            return await fetch_url_text(url)
+
+    fetches = {
+        position: asyncio.create_task(fetch(item.url))
+        for position, item in enumerate(items)
+        if not index.contains(item.url)
+    }
+    outcomes = list(items)
+    unsaved = 0
+    try:
+        for position, item in enumerate(items):
+            task = fetches.get(position)
+            if task is None:
+                outcomes[position] = naver_duplicate(item)
+                stored = False
+            else:
+                outcomes[position] = await store_naver_fetch(process, item, await task, index)
+                stored = _touched_database(outcomes[position])
+            unsaved += 1
+            if stored or unsaved >= NAVER_CHECKPOINT_ITEMS:
+                await save_naver_items(process.db, run, tuple(outcomes))
+                unsaved = 0
+    finally:
+        for task in fetches.values():
+            task.cancel()
+    return tuple(outcomes)
+
+
+def _touched_database(item: NaverHandoffItem) -> bool:
+    """Whether `store_naver_fetch` wrote a row or took the hospital lock for this item.
+
+    Inserts and lock-time duplicates hold the advisory lock; failures open an incident.
+    Only an empty body returns before either.
+    """
+    return item.safe_error_code != "EMPTY_CONTENT"
+
+
 def _unique_post_urls(post_urls: list[str]) -> tuple[str, ...]:
     unique: dict[str, str] = {}
     for url in post_urls:
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Awaitable, Callable, Protocol
 
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.essence import HospitalSourceAsset, SourceStatus, SourceType
@@ -46,15 +46,53 @@ class NaverSourceProcess:
     actor: str
 
 
+@dataclass(slots=True)
+class NaverDedupeIndex:
+    """Hospital source keys loaded once per run and extended with this run's inserts."""
+
+    urls: set[str]
+    hashes: set[str]
+
+    def contains(self, url: str, content_hash: str | None = None) -> bool:
+        return url in self.urls or (content_hash is not None and content_hash in self.hashes)
+
+    def add(self, url: str, content_hash: str) -> None:
+        self.urls.add(url)
+        self.hashes.add(content_hash)
+
+
+async def load_naver_dedupe_index(
+    db: AsyncSession, hospital_id: uuid.UUID
+) -> NaverDedupeIndex:
+    urls, hashes = await _existing_source_keys(db, hospital_id)
+    return NaverDedupeIndex(urls, hashes)
+
+
 async def process_naver_item(
     context: NaverSourceProcess,
     item: NaverHandoffItem,
     fetch_text: FetchText,
+    index: NaverDedupeIndex | None = None,
 ) -> NaverHandoffItem:
-    existing_urls, existing_hashes = await _existing_source_keys(context.db, context.hospital.id)
-    if item.url in existing_urls:
-        return _duplicate(item)
-    text, error, quality = await fetch_text(item.url)
+    if index is None:
+        index = await load_naver_dedupe_index(context.db, context.hospital.id)
+    if index.contains(item.url):
+        return naver_duplicate(item)
+    return await store_naver_fetch(context, item, await fetch_text(item.url), index)
+
+
+async def store_naver_fetch(
+    context: NaverSourceProcess,
+    item: NaverHandoffItem,
+    fetched: tuple[str, str | None, FetchQuality | None],
+    index: NaverDedupeIndex,
+) -> NaverHandoffItem:
+    """Persist one fetched post. The caller fetches, and commits as soon as this returns.
+
+    The hospital advisory lock taken here lasts until that commit, so it must not be
+    held across the next network read.
+    """
+    text, error, quality = fetched
     if error:
         failed = failed_item(item, error)
         await record_naver_failure(
@@ -79,9 +117,13 @@ async def process_naver_item(
     title = f"네이버 블로그 {blog_id} {item.url.rsplit('/', 1)[-1]}"
     content_hash = compute_source_content_hash(title, item.url, text, context.operator_note)
     await acquire_hospital_advisory_lock(context.db, context.hospital.id)
-    existing_urls, existing_hashes = await _existing_source_keys(context.db, context.hospital.id)
-    if item.url in existing_urls or content_hash in existing_hashes:
-        return _duplicate(item)
+    # The preloaded index covers everything committed before the run; the point lookup
+    # under the lock covers writers (manual crawl, admin retry) that committed since.
+    if index.contains(item.url, content_hash) or await _inserted_since_load(
+        context.db, context.hospital.id, item.url, content_hash
+    ):
+        index.add(item.url, content_hash)
+        return naver_duplicate(item)
     source_id = uuid.uuid4()
     context.db.add(
         HospitalSourceAsset(
@@ -104,6 +146,7 @@ async def process_naver_item(
         )
     )
     await context.db.flush()
+    index.add(item.url, content_hash)
     return ingested_item(item, source_id)
 
 
@@ -122,5 +165,25 @@ async def _existing_source_keys(
     return urls, hashes
 
 
-def _duplicate(item: NaverHandoffItem) -> NaverHandoffItem:
+async def _inserted_since_load(
+    db: AsyncSession, hospital_id: uuid.UUID, url: str, content_hash: str
+) -> bool:
+    rows = (
+        await db.execute(
+            select(HospitalSourceAsset.url, HospitalSourceAsset.content_hash).where(
+                HospitalSourceAsset.hospital_id == hospital_id,
+                or_(
+                    HospitalSourceAsset.url == url,
+                    HospitalSourceAsset.content_hash == content_hash,
+                ),
+            )
+        )
+    ).all()
+    return any(
+        (row_url and naver_blog_post_identity(row_url) == url) or row_hash == content_hash
+        for row_url, row_hash in rows
+    )
+
+
+def naver_duplicate(item: NaverHandoffItem) -> NaverHandoffItem:
     return skipped_item(item, "DUPLICATE_SOURCE", "이미 수집된 글이라 다시 추가하지 않았습니다.")
@@ -0,0 +1,277 @@
+"""병원별 운영 카운터(`HospitalOperatingStats`) 계산·갱신·복구.
+
+admin 준비도는 조회마다 콘텐츠·SoV 레코드·리포트를 각각 count(*)하고, 목록은 이 신호를
+아예 보여주지 못했다(병원 수만큼 쿼리가 늘어난다). 카운터는 쓰기 쪽에서 유지한다.
+
+- `compute_operating_stats` — 원천 테이블에서 병원 묶음을 한 번에 센다. 쿼리 수는 병원
+  수와 무관하다. 투영이 없을 때(Postgres 아닌 바인딩, 백필 전)의 읽기 경로이기도 하다.
+- `refresh_operating_stats` — 모델 리스너가 flush마다 모은 병원을 commit 직전에 같은
+  트랜잭션 안에서 한 번 넘긴다. 행을 잠근 뒤 다시 세므로 같은 병원을 건드린 두
+  트랜잭션은 차례로 반영된다. SoV 레코드 수만은 다시 세지 않고 flush들에서 본 증감을
+  더한다.
+- `reconcile_operating_stats` — 일일 작업. 다시 센 값과 다르면 덮어쓴다. bulk 쓰기나
+  데이터 마이그레이션처럼 ORM flush를 거치지 않은 변경이 어긋남의 유일한 원인이다.
+"""
+import uuid
+from collections.abc import Collection, Iterable, Mapping
+from typing import Any
+
+from sqlalchemy import Connection, and_, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.content import ContentItem, ContentStatus
+from app.models.hospital import Hospital
+from app.models.operating_stats import HospitalOperatingStats
+from app.models.report import MonthlyReport
+from app.models.sov import MeasurementRun, SovRecord
+from app.services.essence_engine import (
+    ESSENCE_STATUS_MISSING_APPROVED,
+    ESSENCE_STATUS_NEEDS_REVIEW,
+)
+from app.services.essence_readiness import _projection_values_by_hospital
+from app.services.sov_engine import VERDICT_AMBIGUOUS
+from app.utils.db_locks import is_postgres_bind
+
+STATS_COLUMNS = (
+    HospitalOperatingStats.published_content_count,
+    HospitalOperatingStats.essence_blocked_content_count,
+    HospitalOperatingStats.report_count,
+    HospitalOperatingStats.sov_record_count,
+    HospitalOperatingStats.last_measured_at,
+    HospitalOperatingStats.latest_sov_pct,
+)
+# 언급률에 들어가는 측정 run — 진행 중·실패 run은 "마지막 측정"이 아니다.
+FINISHED_RUN_STATUSES = ("COMPLETED", "PARTIAL")
+
+# `sov_engine.record_is_confirmed`의 SQL판 — 두 조건이 갈라지면 화면마다 언급률이 달라진다.
+_CONFIRMED_RECORD = and_(
+    func.upper(func.coalesce(SovRecord.measurement_status, "SUCCESS")) == "SUCCESS",
+    SovRecord.mention_verdict.is_distinct_from(VERDICT_AMBIGUOUS),
+    SovRecord.is_mentioned.is_not(None),
+)
+
+
+def _empty_stats() -> dict[str, Any]:
+    return {
+        "published_content_count": 0,
+        "essence_blocked_content_count": 0,
+        "report_count": 0,
+        "sov_record_count": 0,
+        "last_measured_at": None,
+        "latest_sov_pct": None,
+    }
+
+
+def compute_operating_stats(
+    db: Session | Connection,
+    hospital_ids: Collection[uuid.UUID],
+    *,
+    count_sov_records: bool = True,
+) -> dict[uuid.UUID, dict[str, Any]]:
+    """병원별 카운터를 원천에서 다시 센다. `count_sov_records=False`면 SoV 레코드 수는 0."""
+    ids = list(hospital_ids)
+    stats = {hospital_id: _empty_stats() for hospital_id in ids}
+    if not ids:
+        return stats
+
+    # 막힌 본문 판정은 병원마다 현재 공개 Essence id가 필요하다 — 그 값은 essence 투영과
+    # 같은 계산(스냅샷 컬럼만)으로 얻고, 콘텐츠는 판정에 필요한 축으로만 묶어 센다.
+    essence = _projection_values_by_hospital(db, ids)
+    flagged = ContentItem.essence_status.in_(
+        [ESSENCE_STATUS_MISSING_APPROVED, ESSENCE_STATUS_NEEDS_REVIEW]
+    )
+    published = ContentItem.status == ContentStatus.PUBLISHED
+    has_body = ContentItem.body.is_not(None)
+    content_rows = db.execute(
+        select(
+            ContentItem.hospital_id,
+            ContentItem.content_philosophy_id,
+            published.label("published"),
+            func.coalesce(flagged, False).label("flagged"),
+            has_body.label("has_body"),
+            func.count().label("count"),
+        )
+        .where(ContentItem.hospital_id.in_(ids))
+        .group_by(
+            ContentItem.hospital_id,
+            ContentItem.content_philosophy_id,
+            published,
+            func.coalesce(flagged, False),
+            has_body,
+        )
+    )
+    for row in content_rows:
+        values = stats[row.hospital_id]
+        if row.published:
+            values["published_content_count"] += row.count
+        current_id = essence[row.hospital_id]["public_philosophy_id"]
+        misaligned = current_id is not None and row.content_philosophy_id != current_id
+        if row.has_body and (row.flagged or misaligned):
+            values["essence_blocked_content_count"] += row.count
+
+    for hospital_id, count in db.execute(
+        select(MonthlyReport.hospital_id, func.count())
+        .where(MonthlyReport.hospital_id.in_(ids))
+        .group_by(MonthlyReport.hospital_id)
+    ):
+        stats[hospital_id]["report_count"] = count
+
+    if count_sov_records:
+        for hospital_id, count in db.execute(
+            select(SovRecord.hospital_id, func.count())
+            .where(SovRecord.hospital_id.in_(ids))
+            .group_by(SovRecord.hospital_id)
+        ):
+            stats[hospital_id]["sov_record_count"] = count
+
+    finished = and_(
+        MeasurementRun.hospital_id.in_(ids),
+        MeasurementRun.status.in_(FINISHED_RUN_STATUSES),
+        MeasurementRun.completed_at.is_not(None),
+    )
+    latest = (
+        select(
+            MeasurementRun.hospital_id,
+            func.max(MeasurementRun.completed_at).label("completed_at"),
+        )
+        .where(finished)
+        .group_by(MeasurementRun.hospital_id)
+        .subquery()
+    )
+    latest_runs = db.execute(
+        select(MeasurementRun.hospital_id, MeasurementRun.id, MeasurementRun.completed_at)
+        .join(
+            latest,
+            and_(
+                latest.c.hospital_id == MeasurementRun.hospital_id,
+                latest.c.completed_at == MeasurementRun.completed_at,
+            ),
+        )
+        .where(finished)
+        .order_by(MeasurementRun.hospital_id, MeasurementRun.id)
+    ).all()
+    latest_by_hospital: dict[uuid.UUID, Any] = {}
+    for row in latest_runs:
+        # 같은 시각에 끝난 run이 둘이면 id가 작은 쪽 — 재계산마다 같은 run을 고른다.
+        latest_by_hospital.setdefault(row.hospital_id, row)
+    run_hospital = {row.id: hospital_id for hospital_id, row in latest_by_hospital.items()}
+    for hospital_id, row in latest_by_hospital.items():
+        stats[hospital_id]["last_measured_at"] = row.completed_at
+    if run_hospital:
+        for run_id, confirmed, mentioned in db.execute(
+            select(
+                SovRecord.measurement_run_id,
+                func.count(),
+                func.count().filter(SovRecord.is_mentioned.is_(True)),
+            )
+            .where(SovRecord.measurement_run_id.in_(list(run_hospital)), _CONFIRMED_RECORD)
+            .group_by(SovRecord.measurement_run_id)
+        ):
+            if confirmed:
+                stats[run_hospital[run_id]]["latest_sov_pct"] = round(
+                    mentioned / confirmed * 100, 1
+                )
+    return stats
+
+
+def refresh_operating_stats(
+    connection: Connection,
+    hospital_ids: Iterable[uuid.UUID],
+    *,
+    sov_record_deltas: Mapping[uuid.UUID, int] | None = None,
+) -> None:
+    """호출자 트랜잭션 안에서 카운터 행을 다시 쓴다(Postgres 전용).
+
+    행이 이번에 처음 생기면 SoV 레코드도 센다 — flush가 끝난 뒤라 방금 넣은 레코드가
+    이미 포함되므로 증감을 더하지 않는다. 잠금 순서가 트랜잭션마다 같도록 id 순으로 돈다.
+    """
+    deltas = sov_record_deltas or {}
+    for hospital_id in sorted(set(hospital_ids), key=str):
+        if connection.scalar(select(Hospital.id).where(Hospital.id == hospital_id)) is None:
+            # 같은 flush에서 병원이 삭제됐다 — 카운터 행은 CASCADE로 함께 지워진다.
+            continue
+        created = (
+            connection.scalar(
+                insert(HospitalOperatingStats)
+                .values(hospital_id=hospital_id)
+                .on_conflict_do_nothing(index_elements=[HospitalOperatingStats.hospital_id])
+                .returning(HospitalOperatingStats.hospital_id)
+            )
+            is not None
+        )
+        if not created:
+            connection.execute(
+                select(HospitalOperatingStats.hospital_id)
+                .where(HospitalOperatingStats.hospital_id == hospital_id)
+                .with_for_update()
+            )
+        values = compute_operating_stats(connection, [hospital_id], count_sov_records=created)[
+            hospital_id
+        ]
+        if not created:
+            values["sov_record_count"] = func.greatest(
+                HospitalOperatingStats.sov_record_count + deltas.get(hospital_id, 0), 0
+            )
+        connection.execute(
+            update(HospitalOperatingStats)
+            .where(HospitalOperatingStats.hospital_id == hospital_id)
+            .values(**values, refreshed_at=func.now())
+        )
+
+
+def reconcile_operating_stats(db: Session, hospital_ids: Collection[uuid.UUID]) -> int:
+    """저장된 카운터를 다시 센 값과 비교해 다른 행을 덮어쓴다. 고친 행 수를 돌려준다."""
+    if not hospital_ids or not is_postgres_bind(db):
+        return 0
+    stored = {
+        row.hospital_id: row._asdict()
+        for row in db.execute(
+            select(HospitalOperatingStats.hospital_id, *STATS_COLUMNS).where(
+                HospitalOperatingStats.hospital_id.in_(list(hospital_ids))
+            )
+        )
+    }
+    expected = compute_operating_stats(db, hospital_ids)
+    drifted = 0
+    for hospital_id in sorted(expected, key=str):
+        values = expected[hospital_id]
+        if stored.get(hospital_id) == {"hospital_id": hospital_id, **values}:
+            continue
+        drifted += 1
+        db.execute(
+            insert(HospitalOperatingStats)
+            .values(hospital_id=hospital_id, **values)
+            .on_conflict_do_update(
+                index_elements=[HospitalOperatingStats.hospital_id],
+                set_={**values, "refreshed_at": func.now()},
+            )
+        )
+    return drifted
+
+
+async def load_operating_stats(
+    db: AsyncSession,
+    hospital_ids: Collection[uuid.UUID],
+) -> dict[uuid.UUID, dict[str, Any]]:
+    """화면용 카운터. 투영 행을 기본키로 읽고, 없는 병원만 원천에서 묶어 센다."""
+    ids = list(hospital_ids)
+    if not ids:
+        return {}
+    stats: dict[uuid.UUID, dict[str, Any]] = {}
+    if is_postgres_bind(db):
+        rows = await db.execute(
+            select(HospitalOperatingStats.hospital_id, *STATS_COLUMNS).where(
+                HospitalOperatingStats.hospital_id.in_(ids)
+            )
+        )
+        for row in rows:
+            values = row._asdict()
+            stats[values.pop("hospital_id")] = values
+    missing = [hospital_id for hospital_id in ids if hospital_id not in stats]
+    if missing:
+        stats.update(
+            await db.run_sync(lambda session: compute_operating_stats(session, missing))
+        )
+    return stats
@@ -0,0 +1,147 @@
+"""Short-lived shared cache for the operations-center overview.
+
+Every open admin tab polls the overview, and each poll ran the four queue
+readers. The rendered response is cached in Redis per filter set for a few
+seconds, so AEs polling the same view share one computation.
+
+Entries carry the value of a version counter read before the computation.
+Commits that write incidents, operation runs or content items bump the counter
+(see the listeners in `app.models.operations`), so those changes show up on the
+next poll instead of after the TTL. Other inputs (handoffs, reports) and the
+clock-based SLA states only age out with the TTL, which is why it stays short.
+
+Redis failures are fail-open: the overview is computed as before.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Mapping
+
+import redis
+import redis.asyncio as redis_async
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.metrics import record_cache_lookup
+from app.schemas.operations import OperationsOverviewResponse
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "ops-overview:"
+VERSION_KEY = f"{KEY_PREFIX}version"
+# Matches the console's polling interval; a stale SLA label lives at most this long.
+OVERVIEW_TTL_SECONDS = 15
+
+
+def overview_cache_key(filters: Mapping[str, object]) -> str:
+    """One entry per filter combination; the overview does not depend on the viewer."""
+    material = json.dumps(dict(filters), sort_keys=True, default=str)
+    return f"{KEY_PREFIX}entry:{hashlib.sha256(material.encode()).hexdigest()}"
+
+
+_async_client: redis_async.Redis | None = None
+_sync_client: redis.Redis | None = None
+
+
+def _client() -> redis_async.Redis:
+    global _async_client
+    if _async_client is None:
+        _async_client = redis_async.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+        )
+    return _async_client
+
+
+def _invalidation_client() -> redis.Redis:
+    global _sync_client
+    if _sync_client is None:
+        # Runs inside worker commit hooks; keep a dead Redis from stalling the
+        # commit that triggered it.
+        _sync_client = redis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5,
+        )
+    return _sync_client
+
+
+async def load_overview(
+    filters: Mapping[str, object],
+) -> tuple[OperationsOverviewResponse | None, str | None]:
+    """Return the cached overview if still current, plus the version to store under.
+
+    The version is None when Redis is unavailable; the caller then skips the store.
+    """
+    try:
+        version_raw, entry_raw = await _client().mget(VERSION_KEY, overview_cache_key(filters))
+    except (RedisError, OSError):
+        logger.warning("Operations overview cache unavailable; computing the overview")
+        record_cache_lookup("operations_overview", "error")
+        return None, None
+    version = version_raw.decode() if isinstance(version_raw, bytes) else str(version_raw or 0)
+    response = None
+    if entry_raw is not None:
+        try:
+            entry = json.loads(entry_raw)
+            if entry.get("version") == version:
+                response = OperationsOverviewResponse.model_validate(entry["response"])
+        except (ValueError, KeyError, TypeError):
+            response = None
+    record_cache_lookup("operations_overview", "miss" if response is None else "hit")
+    return response, version
+
+
+async def store_overview(
+    filters: Mapping[str, object],
+    version: str,
+    response: OperationsOverviewResponse,
+) -> None:
+    payload = json.dumps(
+        {"version": version, "response": response.model_dump(mode="json")},
+        ensure_ascii=False,
+    )
+    try:
+        await _client().set(overview_cache_key(filters), payload, ex=OVERVIEW_TTL_SECONDS)
+    except (RedisError, OSError):
+        logger.warning("Operations overview cache write failed")
+
+
+# Version bumps scheduled on the API loop; held so they are not collected mid-flight.
+_pending_bumps: set[asyncio.Task] = set()
+
+
+def invalidate_operations_overview() -> None:
+    """Make every cached overview stale. Called after commits that change queue rows.
+
+    AsyncSession commits run their hooks on the event loop, so there the bump is
+    scheduled on the async client instead of blocking the loop on a round trip.
+    Worker (sync session) commits have no running loop and bump inline.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is not None:
+        task = loop.create_task(_bump_version())
+        _pending_bumps.add(task)
+        task.add_done_callback(_pending_bumps.discard)
+        return
+    try:
+        _invalidation_client().incr(VERSION_KEY)
+    except (RedisError, OSError):
+        _invalidation_failed()
+
+
+async def _bump_version() -> None:
+    try:
+        await _client().incr(VERSION_KEY)
+    except (RedisError, OSError):
+        _invalidation_failed()
+
+
+def _invalidation_failed() -> None:
+    logger.warning("Operations overview cache invalidation failed; entries expire by TTL")
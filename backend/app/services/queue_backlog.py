@@ -0,0 +1,300 @@
+"""Per-queue Celery backlog read from the Redis broker, for autoscaling signals.
+
+Canary tasks only prove that each queue has a live consumer. Scaling the sov and
+reports workers for Monday and month-end peaks needs to know how much work is
+waiting, so this module reads kombu's Redis transport directly:
+
+- Each queue is a Redis list named after the queue. Publishers ``LPUSH`` and
+  workers ``BRPOP``, so the oldest ready message sits at index -1. Its
+  ``published_at`` header (stamped by app/workers/task_metrics.py) gives the
+  oldest-message age. No task is published with a priority, so the per-priority
+  keys kombu would add are never used.
+- With ``task_acks_late`` a message a worker has taken stays in the ``unacked``
+  hash, tagged with its routing key, until the task finishes. Those are the tasks
+  in flight. Redis has no native ETA, so countdown tasks also wait there inside a
+  worker; entries whose ``eta`` is still ahead are counted as scheduled instead.
+
+Predicted drain time needs task durations, which only the workers see. Each task
+appends its runtime to a short per-queue list in Redis (`record_task_runtime`,
+called from the task_postrun signal), and the estimate assumes the consumers busy
+right now keep working through the backlog at the recent mean runtime.
+
+`outstanding_work_seconds` is the total slot time still queued. It is the value
+to hand to a KEDA-style scaler: with a target of ``drain goal × concurrency per
+instance`` the scaler's ``ceil(value / target)`` is the number of instances that
+drains the queue within the goal.
+
+Reads are one pipelined round trip. Callers decide how to handle Redis failures:
+the scrape endpoint skips the gauges, the scaling endpoint answers 503.
+"""
+
+import json
+import logging
+import math
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import redis
+import redis.asyncio as redis_async
+from redis.exceptions import RedisError
+
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.metrics import (
+    CELERY_QUEUE_IN_FLIGHT,
+    CELERY_QUEUE_OLDEST_AGE_SECONDS,
+    CELERY_QUEUE_PREDICTED_DRAIN_SECONDS,
+    CELERY_QUEUE_READY,
+    CELERY_QUEUE_SCHEDULED,
+)
+
+logger = logging.getLogger(__name__)
+
+# kombu.transport.redis.Channel.unacked_key
+UNACKED_KEY = "unacked"
+RUNTIME_KEY_PREFIX = "reputation:queue-runtime:v1:"
+# Enough to smooth one slow task out; short enough to follow a change in the mix
+# (e.g. Monday's SoV runs replacing weekday regenerations).
+RUNTIME_SAMPLES = 100
+RUNTIME_TTL_SECONDS = 24 * 60 * 60
+
+
+def broker_queues() -> tuple[str, ...]:
+    """Every queue a task is routed to — the queues some worker pool consumes."""
+    return tuple(
+        sorted({route["queue"] for route in celery_app.conf.task_routes.values()})
+    )
+
+
+def runtime_key(queue: str) -> str:
+    return f"{RUNTIME_KEY_PREFIX}{queue}"
+
+
+@dataclass(frozen=True, slots=True)
+class QueueBacklog:
+    queue: str
+    ready: int
+    in_flight: int
+    scheduled: int
+    oldest_age_seconds: float | None
+    mean_runtime_seconds: float | None
+    runtime_samples: int
+
+    @property
+    def outstanding_work_seconds(self) -> float | None:
+        """Worker-slot seconds needed for everything ready or running."""
+        pending = self.ready + self.in_flight
+        if pending == 0:
+            return 0.0
+        if self.mean_runtime_seconds is None:
+            return None
+        return pending * self.mean_runtime_seconds
+
+    @property
+    def predicted_drain_seconds(self) -> float | None:
+        """Time until the queue is empty at the current number of busy consumers.
+
+        None when it cannot be estimated: no runtime samples yet, or a backlog with
+        no consumer working on the queue (scaled to zero or stuck).
+        """
+        work = self.outstanding_work_seconds
+        if work is None or (work > 0 and self.in_flight == 0):
+            return None
+        return work / max(self.in_flight, 1)
+
+    def as_payload(self) -> dict[str, Any]:
+        return {
+            "queue": self.queue,
+            "ready": self.ready,
+            "in_flight": self.in_flight,
+            "scheduled": self.scheduled,
+            "oldest_age_seconds": _rounded(self.oldest_age_seconds),
+            "mean_runtime_seconds": _rounded(self.mean_runtime_seconds),
+            "runtime_samples": self.runtime_samples,
+            "outstanding_work_seconds": _rounded(self.outstanding_work_seconds),
+            "predicted_drain_seconds": _rounded(self.predicted_drain_seconds),
+        }
+
+
+def _rounded(value: float | None) -> float | None:
+    return None if value is None else round(value, 1)
+
+
+def _published_at(message: Mapping[str, Any]) -> float | None:
+    headers = message.get("headers")
+    raw = headers.get("published_at") if isinstance(headers, Mapping) else None
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_scheduled(message: Mapping[str, Any], *, now: float) -> bool:
+    headers = message.get("headers")
+    eta = headers.get("eta") if isinstance(headers, Mapping) else None
+    if not isinstance(eta, str):
+        return False
+    try:
+        return datetime.fromisoformat(eta).timestamp() > now
+    except ValueError:
+        return False
+
+
+def _loads(raw: bytes | str | None) -> Any:
+    if raw is None:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+def _mean_runtime(samples: Iterable[bytes | str]) -> tuple[float | None, int]:
+    values = []
+    for raw in samples:
+        try:
+            value = float(raw)
+        except (TypeError, ValueError):
+            continue
+        if math.isfinite(value) and value >= 0:
+            values.append(value)
+    if not values:
+        return None, 0
+    return sum(values) / len(values), len(values)
+
+
+def build_backlog(
+    queues: Iterable[str],
+    *,
+    lengths: Mapping[str, int],
+    oldest: Mapping[str, bytes | str | None],
+    unacked: Iterable[bytes | str],
+    runtimes: Mapping[str, Iterable[bytes | str]],
+    now: float,
+) -> list[QueueBacklog]:
+    """Turn raw broker reads into per-queue backlog figures."""
+    in_flight: dict[str, int] = {}
+    scheduled: dict[str, int] = {}
+    for raw in unacked:
+        entry = _loads(raw)
+        # kombu stores ``[message, exchange, routing_key]``.
+        if not isinstance(entry, list) or len(entry) != 3 or not isinstance(entry[0], dict):
+            continue
+        message, _exchange, routing_key = entry
+        counts = scheduled if _is_scheduled(message, now=now) else in_flight
+        counts[routing_key] = counts.get(routing_key, 0) + 1
+
+    backlog = []
+    for queue in queues:
+        message = _loads(oldest.get(queue))
+        published_at = _published_at(message) if isinstance(message, dict) else None
+        mean_runtime, samples = _mean_runtime(runtimes.get(queue, ()))
+        backlog.append(
+            QueueBacklog(
+                queue=queue,
+                ready=int(lengths.get(queue, 0)),
+                in_flight=in_flight.get(queue, 0),
+                scheduled=scheduled.get(queue, 0),
+                oldest_age_seconds=(
+                    max(now - published_at, 0.0) if published_at is not None else None
+                ),
+                mean_runtime_seconds=mean_runtime,
+                runtime_samples=samples,
+            )
+        )
+    return backlog
+
+
+_async_client: redis_async.Redis | None = None
+_sync_client: redis.Redis | None = None
+
+
+def _client() -> redis_async.Redis:
+    global _async_client
+    if _async_client is None:
+        _async_client = redis_async.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+        )
+    return _async_client
+
+
+def _runtime_client() -> redis.Redis:
+    global _sync_client
+    if _sync_client is None:
+        # Runs in task_postrun on every task; a dead Redis must not hold the slot.
+        _sync_client = redis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5,
+        )
+    return _sync_client
+
+
+async def read_backlog(queues: Iterable[str] | None = None) -> list[QueueBacklog]:
+    """Read every queue's backlog in one pipelined round trip. Raises on Redis errors."""
+    names = tuple(queues) if queues is not None else broker_queues()
+    async with _client().pipeline(transaction=False) as pipe:
+        for queue in names:
+            pipe.llen(queue)
+            pipe.lindex(queue, -1)
+            pipe.lrange(runtime_key(queue), 0, RUNTIME_SAMPLES - 1)
+        pipe.hvals(UNACKED_KEY)
+        results = await pipe.execute()
+
+    per_queue = [results[index : index + 3] for index in range(0, len(names) * 3, 3)]
+    return build_backlog(
+        names,
+        lengths={queue: reads[0] for queue, reads in zip(names, per_queue, strict=True)},
+        oldest={queue: reads[1] for queue, reads in zip(names, per_queue, strict=True)},
+        runtimes={queue: reads[2] for queue, reads in zip(names, per_queue, strict=True)},
+        unacked=results[-1],
+        now=time.time(),
+    )
+
+
+def publish_backlog_metrics(backlog: Iterable[QueueBacklog]) -> None:
+    """Set the per-queue gauges. Unknown ages and drain times are dropped, not zeroed."""
+    for entry in backlog:
+        CELERY_QUEUE_READY.labels(entry.queue).set(entry.ready)
+        CELERY_QUEUE_IN_FLIGHT.labels(entry.queue).set(entry.in_flight)
+        CELERY_QUEUE_SCHEDULED.labels(entry.queue).set(entry.scheduled)
+        _set_or_remove(CELERY_QUEUE_OLDEST_AGE_SECONDS, entry.queue, entry.oldest_age_seconds)
+        _set_or_remove(
+            CELERY_QUEUE_PREDICTED_DRAIN_SECONDS, entry.queue, entry.predicted_drain_seconds
+        )
+
+
+def _set_or_remove(gauge, queue: str, value: float | None) -> None:
+    if value is not None:
+        gauge.labels(queue).set(value)
+        return
+    try:
+        gauge.remove(queue)
+    except KeyError:
+        pass
+
+
+async def refresh_backlog_metrics() -> None:
+    """Refresh the gauges before a scrape; a Redis outage leaves them as they were."""
+    try:
+        publish_backlog_metrics(await read_backlog())
+    except (RedisError, OSError) as exc:
+        logger.warning("queue backlog unavailable for metrics: %s", exc)
+
+
+def record_task_runtime(queue: str, seconds: float) -> None:
+    """Append one task runtime to the queue's recent-runtime list (best effort)."""
+    key = runtime_key(queue)
+    try:
+        pipe = _runtime_client().pipeline(transaction=False)
+        pipe.lpush(key, f"{seconds:.3f}")
+        pipe.ltrim(key, 0, RUNTIME_SAMPLES - 1)
+        pipe.expire(key, RUNTIME_TTL_SECONDS)
+        pipe.execute()
+    except (RedisError, OSError) as exc:
+        logger.debug("task runtime not recorded for queue %s: %s", queue, exc)
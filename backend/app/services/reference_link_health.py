@@ -0,0 +1,157 @@
+"""권위 출처 링크 상태 확인 — 병렬 probe + Redis 공유 캐시.
+
+검증 카탈로그(`utils/authority_sources`)는 같은 URL을 수백 건의 콘텐츠에 반복해서
+인용시킨다. 생성마다 참고 URL 전체를 순차 GET하면 같은 문서를 매번 다시 받아 오며
+프로덕션 생성 한 건에 수 초의 네트워크 대기가 직렬로 붙는다.
+
+- 판정(URL → 상태 코드·최종 URL)을 Redis에 TTL로 공유한다. 워커·재시도·병원이 달라도
+  같은 URL은 TTL 안에서 한 번만 확인한다.
+- 캐시에 없는 URL만 동시에 확인하되, 같은 호스트에는 `PER_HOST_CONCURRENCY`개까지만
+  보낸다. 권위 사이트는 봇 요청 폭주에 403/429로 답하기 때문이다.
+- 본문은 필요 없으므로 HEAD를 먼저 보내고, HEAD를 거부하거나 오류로 답하는 서버에만
+  `Range: bytes=0-0` GET으로 확정한다.
+
+판정 기준은 그대로다 — 404/410과 화이트리스트 밖 최종 호스트만 실패이고, 타임아웃·
+네트워크 오류는 자료를 살린다. 그런 일시 결과는 캐시하지 않아 다음 생성이 다시 확인한다.
+Redis 장애는 fail-open으로 캐시 없이 직접 확인한다.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+import httpx
+import redis.asyncio as redis_async
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "reference-link-health:"
+# 정상 판정은 길게, 실패 판정은 짧게 — 기관이 문서를 옮겼다 되살리는 일이 실제로 있다.
+HEALTHY_TTL_SECONDS = 7 * 24 * 3600
+BROKEN_TTL_SECONDS = 24 * 3600
+PER_HOST_CONCURRENCY = 2
+PROBE_TIMEOUT_SECONDS = 8
+
+BROKEN_STATUS_CODES = frozenset({404, 410})
+
+PROBE_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+        "Chrome/126.0.0.0 Safari/537.36"
+    )
+}
+
+
+@dataclass(frozen=True)
+class LinkHealth:
+    """한 URL의 확인 결과. `status_code`가 None이면 일시 오류(판정 보류)다."""
+
+    status_code: int | None
+    final_url: str
+
+    @property
+    def transient(self) -> bool:
+        return self.status_code is None
+
+
+_redis_client: redis_async.Redis | None = None
+
+
+def _client() -> redis_async.Redis:
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis_async.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+        )
+    return _redis_client
+
+
+def _key(url: str) -> str:
+    return KEY_PREFIX + hashlib.sha256(url.encode()).hexdigest()
+
+
+async def _read_cached(urls: list[str]) -> dict[str, LinkHealth]:
+    try:
+        raw_values = await _client().mget([_key(url) for url in urls])
+    except (RedisError, OSError):
+        logger.warning("Reference link-health cache unavailable; probing directly")
+        return {}
+    cached: dict[str, LinkHealth] = {}
+    for url, raw in zip(urls, raw_values):
+        if raw is None:
+            continue
+        try:
+            payload = json.loads(raw)
+            cached[url] = LinkHealth(
+                status_code=int(payload["status_code"]),
+                final_url=str(payload["final_url"]),
+            )
+        except (ValueError, KeyError, TypeError):
+            continue
+    return cached
+
+
+async def _write_cached(results: dict[str, LinkHealth]) -> None:
+    durable = {url: health for url, health in results.items() if not health.transient}
+    if not durable:
+        return
+    try:
+        async with _client().pipeline(transaction=False) as pipe:
+            for url, health in durable.items():
+                ttl = (
+                    BROKEN_TTL_SECONDS
+                    if health.status_code in BROKEN_STATUS_CODES
+                    else HEALTHY_TTL_SECONDS
+                )
+                pipe.set(
+                    _key(url),
+                    json.dumps({"status_code": health.status_code, "final_url": health.final_url}),
+                    ex=ttl,
+                )
+            await pipe.execute()
+    except (RedisError, OSError):
+        logger.warning("Reference link-health cache write failed; results not shared")
+
+
+async def _probe(client: httpx.AsyncClient, url: str) -> LinkHealth:
+    try:
+        response = await client.head(url, headers=PROBE_HEADERS)
+        if response.status_code >= 400:
+            # HEAD를 405/403/404로 답하는 서버가 흔하다. 본문 1바이트 GET으로 확정한다.
+            response = await client.get(url, headers={**PROBE_HEADERS, "Range": "bytes=0-0"})
+    except (httpx.TimeoutException, httpx.NetworkError):
+        return LinkHealth(status_code=None, final_url=url)
+    return LinkHealth(status_code=response.status_code, final_url=str(response.url))
+
+
+async def check_reference_links(urls: list[str]) -> dict[str, LinkHealth]:
+    """URL별 링크 상태. 캐시 적중은 네트워크 없이, 나머지는 호스트별 제한 하에 동시에."""
+    unique = list(dict.fromkeys(urls))
+    if not unique:
+        return {}
+    results = await _read_cached(unique)
+    pending = [url for url in unique if url not in results]
+    if not pending:
+        return results
+
+    host_limits: dict[str, asyncio.Semaphore] = {}
+
+    async def probe_with_host_limit(client: httpx.AsyncClient, url: str) -> LinkHealth:
+        host = (urlparse(url).hostname or "").lower()
+        semaphore = host_limits.setdefault(host, asyncio.Semaphore(PER_HOST_CONCURRENCY))
+        async with semaphore:
+            return await _probe(client, url)
+
+    async with httpx.AsyncClient(timeout=PROBE_TIMEOUT_SECONDS, follow_redirects=True) as client:
+        probed = await asyncio.gather(*(probe_with_host_limit(client, url) for url in pending))
+    fresh = dict(zip(pending, probed))
+    await _write_cached(fresh)
+    results.update(fresh)
+    return results
@@ -4,16 +4,18 @@ from __future__ import annotations
 
 import io
 from hashlib import sha256
+from typing import TYPE_CHECKING
 
 from pydantic import ValidationError
-from pypdf import PdfReader
-from pypdf.generic import DictionaryObject
 
 from app.services import doctor_pdf_contracts as _contracts
 from app.services.doctor_pdf_rendering import (
     render_validated_doctor_pdf as _render_validated_doctor_pdf,
 )
 
+if TYPE_CHECKING:
+    from pypdf.generic import DictionaryObject
+
 DoctorArtifactMetadata = _contracts.DoctorArtifactMetadata
 DoctorPdfExpectation = _contracts.DoctorPdfExpectation
 DoctorPdfValidationError = _contracts.DoctorPdfValidationError
@@ -37,6 +39,8 @@ def validate_doctor_pdf(
     expectation: DoctorPdfExpectation,
 ) -> DoctorArtifactMetadata:
     """Validate binary PDF facts before any public path is saved."""
+    # Imported here: admin routers load this module, and only artifact writers parse PDFs.
+    from pypdf import PdfReader
 
     try:
         reader = PdfReader(io.BytesIO(pdf_bytes), strict=True)
@@ -85,9 +85,15 @@ def hospital_site_paths(slug: str, treatments: list | None = None) -> list[str]:
 
 
 def content_site_paths(slug: str, content_id: object, treatments: list | None = None) -> list[str]:
+    return contents_site_paths(slug, [content_id], treatments)
+
+
+def contents_site_paths(
+    slug: str, content_ids: list, treatments: list | None = None
+) -> list[str]:
     return [
         *hospital_site_paths(slug, treatments),
-        f"/{slug}/contents/{content_id}",
+        *(f"/{slug}/contents/{content_id}" for content_id in content_ids),
     ]
 
 
@@ -145,38 +151,64 @@ async def trigger_content_site_revalidate_safe(
     발행 커밋 뒤 revalidate 실패로 500을 돌려주면 AE는 실패로 인지하고 재시도하다
     "Already published"를 만난다. 프로덕션 포함, 경고 로그 + Slack 운영 알림으로 강등.
     """
+    return await trigger_contents_site_revalidate_safe(
+        slug, [content_id], hospital_name=hospital_name, treatments=treatments
+    )
+
+
+async def trigger_contents_site_revalidate_safe(
+    slug: str,
+    content_ids: list,
+    *,
+    hospital_name: str | None = None,
+    treatments: list | None = None,
+) -> bool:
+    """한 병원의 여러 발행 글을 revalidate POST 한 번으로 묶는다.
+
+    글마다 따로 보내면 허브·목록·llms.txt 경로가 글 수만큼 반복 무효화된다. 실패하면
+    묶인 글마다 기존과 같은 내구성 재시도를 건다 — 재시도 단위는 여전히 글 하나다.
+    """
+    if not content_ids:
+        return True
     try:
-        return await trigger_site_revalidate(paths=content_site_paths(slug, content_id, treatments))
+        return await trigger_site_revalidate(
+            paths=contents_site_paths(slug, content_ids, treatments)
+        )
     except Exception as exc:
         logger.warning("post-commit site revalidate failed: code=%s", exc.__class__.__name__)
-        try:
-            parsed_content_id = uuid.UUID(str(content_id))
-        except (TypeError, ValueError):
-            logger.warning("revalidation failure has invalid content identity")
-            return False
-        try:
-            plan = await start_revalidation_failure(slug, parsed_content_id)
-            if plan is None:
-                logger.warning(
-                    "durable revalidation recovery skipped: code=tenant_or_publication_not_found"
-                )
-            elif plan.created and plan.delay_seconds is not None:
-                from app.core.celery_app import celery_app
-
-                celery_app.send_task(
-                    "app.workers.tasks.retry_site_revalidation",
-                    args=[str(plan.run_id), 0],
-                    queue="default",
-                    countdown=plan.delay_seconds,
-                    headers=build_dispatch_headers(
-                        "retry-site-revalidation", str(plan.run_id)
-                    ),
-                )
-        except Exception:
-            logger.exception("durable revalidation recovery setup failed (non-fatal)")
+        for content_id in content_ids:
+            await _schedule_content_revalidation_recovery(slug, content_id)
         return False
 
 
+async def _schedule_content_revalidation_recovery(slug: str, content_id: object) -> None:
+    try:
+        parsed_content_id = uuid.UUID(str(content_id))
+    except (TypeError, ValueError):
+        logger.warning("revalidation failure has invalid content identity")
+        return
+    try:
+        plan = await start_revalidation_failure(slug, parsed_content_id)
+        if plan is None:
+            logger.warning(
+                "durable revalidation recovery skipped: code=tenant_or_publication_not_found"
+            )
+        elif plan.created and plan.delay_seconds is not None:
+            from app.core.celery_app import celery_app
+
+            celery_app.send_task(
+                "app.workers.tasks.retry_site_revalidation",
+                args=[str(plan.run_id), 0],
+                queue="default",
+                countdown=plan.delay_seconds,
+                headers=build_dispatch_headers(
+                    "retry-site-revalidation", str(plan.run_id)
+                ),
+            )
+    except Exception:
+        logger.exception("durable revalidation recovery setup failed (non-fatal)")
+
+
 async def trigger_site_revalidate(*, paths: list[str]) -> bool:
     if not settings.SITE_REVALIDATE_URL or not settings.SITE_REVALIDATE_SECRET:
         if settings.APP_ENV.lower() == "production":
@@ -8,18 +8,21 @@ import re
 import threading
 from contextvars import ContextVar
 from itertools import product
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
-from google import genai as google_genai
-from google.genai import types as genai_types
-from openai import AsyncOpenAI
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
+from app.core import stage_timing
 from app.core.config import settings
+from app.core.metrics import observe_provider_call
 from app.services import query_mapper
 from app.services.keyword_analysis import KeywordClass, analyze_keyword, clinic_phrase
 
+if TYPE_CHECKING:
+    from google import genai as google_genai
+    from openai import AsyncOpenAI
+
 logger = logging.getLogger(__name__)
 
 # 동시성 풀 이름. 유료 측정(sov)과 무료 진단(leadgen)이 **다른 풀**을 쓴다.
@@ -96,15 +99,43 @@ OPENAI_TIMEOUT_SECONDS = 120.0
 # Gemini는 실측 p50 7.9s / 최대 10.4s로 훨씬 빠르다. 여유만 두고 과하게 늘리지 않는다.
 GEMINI_TIMEOUT_SECONDS = 60.0
 
-openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, timeout=OPENAI_TIMEOUT_SECONDS)
-# 측정 공급자 호출만 SDK 재시도를 끈다. 판정기(`openai_client`)는 기존 SDK 복원력을
-# 유지하고, 측정 경로의 실제 호출 횟수·백오프·영구 오류 중단은 Tenacity 한곳에서 통제한다.
-openai_query_client = AsyncOpenAI(
-    api_key=settings.OPENAI_API_KEY,
-    timeout=OPENAI_TIMEOUT_SECONDS,
-    max_retries=0,
-)
-_gemini_client: google_genai.Client | None = None
+# 공급자 SDK(openai·google-genai)와 클라이언트는 첫 호출 때 만든다. 두 SDK는 import만
+# 1초 넘게 걸리는데, 이 모듈은 API 라우터와 거의 모든 워커 모듈이 import한다 — 측정을
+# 하지 않는 프로세스(공개 API 콜드 스타트, 리포트·인증서 워커)까지 그 비용을 냈다.
+# 키가 없는 환경에서 모듈 import 자체가 OpenAIError로 죽던 문제도 함께 사라진다.
+# `sov_engine.openai_client` 같은 모듈 속성 접근은 그대로 된다(아래 `__getattr__`).
+_OPENAI_CLIENT_OPTIONS: dict[str, dict[str, Any]] = {
+    "openai_client": {},
+    # 측정 공급자 호출만 SDK 재시도를 끈다. 판정기(`openai_client`)는 기존 SDK 복원력을
+    # 유지하고, 측정 경로의 실제 호출 횟수·백오프·영구 오류 중단은 Tenacity 한곳에서 통제한다.
+    "openai_query_client": {"max_retries": 0},
+}
+_openai_client_lock = threading.Lock()
+_gemini_client: "google_genai.Client | None" = None
+
+
+def _openai(name: str) -> "AsyncOpenAI":
+    """프로세스 공용 OpenAI 클라이언트(`openai_client`/`openai_query_client`)."""
+    client = globals().get(name)
+    if client is None:
+        with _openai_client_lock:
+            client = globals().get(name)
+            if client is None:
+                from openai import AsyncOpenAI
+
+                client = AsyncOpenAI(
+                    api_key=settings.OPENAI_API_KEY,
+                    timeout=OPENAI_TIMEOUT_SECONDS,
+                    **_OPENAI_CLIENT_OPTIONS[name],
+                )
+                globals()[name] = client
+    return client
+
+
+def __getattr__(name: str) -> Any:
+    if name in _OPENAI_CLIENT_OPTIONS:
+        return _openai(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _root_provider_exception(exc: BaseException) -> BaseException:
@@ -182,9 +213,11 @@ def _should_retry_provider_exception(exc: BaseException) -> bool:
     return not is_terminal_provider_failure(provider_failure_reason(exc))
 
 
-def _get_gemini_client() -> google_genai.Client | None:
+def _get_gemini_client() -> "google_genai.Client | None":
     global _gemini_client
     if settings.GEMINI_API_KEY and _gemini_client is None:
+        from google import genai as google_genai
+
         _gemini_client = google_genai.Client(
             api_key=settings.GEMINI_API_KEY,
             http_options={"timeout": int(GEMINI_TIMEOUT_SECONDS * 1000)},  # ms
@@ -670,15 +703,16 @@ async def _query_chatgpt(query: str) -> dict[str, Any]:
     if settings.OPENAI_CHATGPT_USE_WEB_SEARCH:
         return await _query_chatgpt_with_search_result(query)
     await _record_sov_provider_call()
-    response = await openai_query_client.chat.completions.create(
-        model=settings.OPENAI_MODEL_QUERY,
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT_SOV},
-            {"role": "user", "content": query},
-        ],
-        temperature=0.7,
-        max_tokens=800,
-    )
+    with observe_provider_call("openai", settings.OPENAI_MODEL_QUERY):
+        response = await _openai("openai_query_client").chat.completions.create(
+            model=settings.OPENAI_MODEL_QUERY,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT_SOV},
+                {"role": "user", "content": query},
+            ],
+            temperature=0.7,
+            max_tokens=800,
+        )
     usage = _field(response, "usage")
     return {
         "text": response.choices[0].message.content or "",
@@ -701,20 +735,21 @@ async def _query_chatgpt_with_search_result(query: str) -> dict[str, Any]:
     """OpenAI Responses web search의 답변과 실제 인용 URL을 함께 보존한다."""
     await _record_sov_provider_call()
     try:
-        response = await openai_query_client.responses.create(
-            model=settings.OPENAI_MODEL_QUERY,
-            tools=[{"type": "web_search"}],
-            # 도구는 제공하되 강제하지 않는다 (측정 정책 v2). 매 요청 검색을 강제하면
-            # 지역 병원 디렉터리를 긁어와 나열하게 되어, 환자가 실제로 받는 답변보다
-            # 구조적으로 병원명이 많이 등장한다. 모델이 검색을 쓸지 고르는 것까지가
-            # 측정 대상이다.
-            tool_choice=OPENAI_SEARCH_TOOL_CHOICE,
-            # **지시문은 지시문 자리로 보낸다.** 이전에는 `input`에 이어붙였는데,
-            # 리포트는 그것을 "시스템 지시문"이라고 인쇄했다 — 역할이 다르면 같은
-            # 문자열이라도 모델 동작이 달라지므로, 공개한 조건으로 재현이 안 됐다.
-            instructions=SYSTEM_PROMPT_SOV,
-            input=query,
-        )
+        with observe_provider_call("openai", settings.OPENAI_MODEL_QUERY):
+            response = await _openai("openai_query_client").responses.create(
+                model=settings.OPENAI_MODEL_QUERY,
+                tools=[{"type": "web_search"}],
+                # 도구는 제공하되 강제하지 않는다 (측정 정책 v2). 매 요청 검색을 강제하면
+                # 지역 병원 디렉터리를 긁어와 나열하게 되어, 환자가 실제로 받는 답변보다
+                # 구조적으로 병원명이 많이 등장한다. 모델이 검색을 쓸지 고르는 것까지가
+                # 측정 대상이다.
+                tool_choice=OPENAI_SEARCH_TOOL_CHOICE,
+                # **지시문은 지시문 자리로 보낸다.** 이전에는 `input`에 이어붙였는데,
+                # 리포트는 그것을 "시스템 지시문"이라고 인쇄했다 — 역할이 다르면 같은
+                # 문자열이라도 모델 동작이 달라지므로, 공개한 조건으로 재현이 안 됐다.
+                instructions=SYSTEM_PROMPT_SOV,
+                input=query,
+            )
     except AttributeError:
         # SDK 버전이 responses API를 지원하지 않으면 chat.completions로 폴백
         # 운영자가 OPENAI_CHATGPT_USE_WEB_SEARCH=true로 켰지만 SDK 미지원이라 빈 결과로
@@ -771,24 +806,27 @@ async def _query_gemini_result(query: str) -> dict[str, Any]:
             "source_urls": [],
             "measurement_method": "GEMINI_GOOGLE_SEARCH",
         }
+    from google.genai import types as genai_types
+
     await _record_sov_provider_call()
-    response = await asyncio.wait_for(
-        asyncio.to_thread(
-            client.models.generate_content,
-            model=settings.GEMINI_MODEL,
-            contents=query,
-            config=genai_types.GenerateContentConfig(
-                temperature=1.0,
-                max_output_tokens=GEMINI_MAX_OUTPUT_TOKENS,
-                tools=[genai_types.Tool(google_search=genai_types.GoogleSearch())],
-                # OpenAI 경로와 **같은 문자열을 같은 역할로** 보낸다. 한쪽만 지시문을
-                # 질문에 이어붙이면 "ChatGPT n% vs Gemini m%"가 플랫폼 차이가 아니라
-                # 우리 호출 방식의 차이가 된다 (2026-07-29 비대칭 회귀와 같은 종류).
-                system_instruction=SYSTEM_PROMPT_SOV,
+    with observe_provider_call("gemini", settings.GEMINI_MODEL):
+        response = await asyncio.wait_for(
+            asyncio.to_thread(
+                client.models.generate_content,
+                model=settings.GEMINI_MODEL,
+                contents=query,
+                config=genai_types.GenerateContentConfig(
+                    temperature=1.0,
+                    max_output_tokens=GEMINI_MAX_OUTPUT_TOKENS,
+                    tools=[genai_types.Tool(google_search=genai_types.GoogleSearch())],
+                    # OpenAI 경로와 **같은 문자열을 같은 역할로** 보낸다. 한쪽만 지시문을
+                    # 질문에 이어붙이면 "ChatGPT n% vs Gemini m%"가 플랫폼 차이가 아니라
+                    # 우리 호출 방식의 차이가 된다 (2026-07-29 비대칭 회귀와 같은 종류).
+                    system_instruction=SYSTEM_PROMPT_SOV,
+                ),
             ),
-        ),
-        timeout=GEMINI_TIMEOUT_SECONDS,
-    )
+            timeout=GEMINI_TIMEOUT_SECONDS,
+        )
     input_tokens, output_tokens = _extract_gemini_usage(response)
     return {
         "text": response.text or "",
@@ -961,22 +999,23 @@ async def _parse_mention(hospital_name: str, response_text: str, region: str = "
         return _not_matched()
 
     await _record_sov_provider_call()
-    result = await openai_client.chat.completions.create(
-        model=settings.OPENAI_MODEL_PARSE,
-        messages=[
-            {
-                "role": "user",
-                "content": PARSE_PROMPT.format(
-                    response=response_text[:3000],
-                    hospital_name=hospital_name,
-                    region=region or "미상",
-                ),
-            }
-        ],
-        temperature=0,
-        max_tokens=300,
-        response_format={"type": "json_object"},
-    )
+    with observe_provider_call("openai", settings.OPENAI_MODEL_PARSE):
+        result = await _openai("openai_client").chat.completions.create(
+            model=settings.OPENAI_MODEL_PARSE,
+            messages=[
+                {
+                    "role": "user",
+                    "content": PARSE_PROMPT.format(
+                        response=response_text[:3000],
+                        hospital_name=hospital_name,
+                        region=region or "미상",
+                    ),
+                }
+            ],
+            temperature=0,
+            max_tokens=300,
+            response_format={"type": "json_object"},
+        )
     try:
         parsed = json.loads(result.choices[0].message.content or "{}")
     except Exception as exc:
@@ -1026,21 +1065,22 @@ async def _parse_competitors(competitors: list[str], response_text: str) -> list
         return [{"name": c, "is_mentioned": False, "mention_rank": None} for c in competitors]
 
     await _record_sov_provider_call()
-    result = await openai_client.chat.completions.create(
-        model=settings.OPENAI_MODEL_PARSE,
-        messages=[
-            {
-                "role": "user",
-                "content": COMPETITOR_PARSE_PROMPT.format(
-                    response=response_text[:3000],
-                    competitor_names="\n".join(f"- {c}" for c in competitors),
-                ),
-            }
-        ],
-        temperature=0,
-        max_tokens=500,
-        response_format={"type": "json_object"},
-    )
+    with observe_provider_call("openai", settings.OPENAI_MODEL_PARSE):
+        result = await _openai("openai_client").chat.completions.create(
+            model=settings.OPENAI_MODEL_PARSE,
+            messages=[
+                {
+                    "role": "user",
+                    "content": COMPETITOR_PARSE_PROMPT.format(
+                        response=response_text[:3000],
+                        competitor_names="\n".join(f"- {c}" for c in competitors),
+                    ),
+                }
+            ],
+            temperature=0,
+            max_tokens=500,
+            response_format={"type": "json_object"},
+        )
     # 판정기 장애를 "미언급"으로 삼키지 않는다. 자사 판정(_parse_mention)은 파싱 실패 시
     # ValueError를 던져 측정이 FAILED로 분모에서 빠지는데, 경쟁사만 조용히 전부 False를
     # 돌려주면 **같은 장애가 자사는 분모 제외, 경쟁사는 미언급으로 집계**된다. 방향이
@@ -1088,7 +1128,8 @@ async def run_single_query(
         provider_pool = f"{pool}:gemini" if platform == "gemini" else pool
         async with _get_semaphore(provider_pool):
             try:
-                provider_result = await query_fn(query_text)
+                with stage_timing.stage("provider_answer"):
+                    provider_result = await query_fn(query_text)
             except Exception as e:
                 # 쿼리 자체 실패 → raw="" 로 FAILED 처리.
                 failure_reason = provider_failure_reason(e)
@@ -1123,10 +1164,11 @@ async def run_single_query(
                     "failure_reason": "empty_raw_response",
                 }
             try:
-                parsed = await _parse_mention(hospital_name, raw, region)
-                comp_mentions = (
-                    await _parse_competitors(competitors or [], raw) if competitors else []
-                )
+                with stage_timing.stage("judge"):
+                    parsed = await _parse_mention(hospital_name, raw, region)
+                    comp_mentions = (
+                        await _parse_competitors(competitors or [], raw) if competitors else []
+                    )
                 return {
                     **parsed,
                     "raw_response": raw,
@@ -21,6 +21,7 @@ from sqlalchemy import select
 from app.core.database import SyncSessionLocal
 from app.models.content import ContentItem, ContentStatus
 from app.models.hospital import Hospital
+from app.services.image_derivatives import build_image_variants
 from app.services.image_direction import hospital_image_direction
 from app.services.image_engine import generate_image
 
@@ -91,6 +92,7 @@ def main() -> None:
                 continue
             item.image_url = url
             item.image_prompt = prompt
+            item.image_variants = build_image_variants(url)
             db.commit()  # 건별 커밋 — 부분 성공을 보존.
             done += 1
             logger.info("OK [%d/%d] %s — %s", done, len(items), hospital.slug, item.title)
@@ -17,7 +17,7 @@ def hospital_lock_key(hospital_id: uuid.UUID) -> int:
     return lock_key
 
 
-def _is_postgres_bind(db) -> bool:
+def is_postgres_bind(db) -> bool:
     """Postgres가 아닌 바인딩(단위 테스트의 fake/SQLite)에서는 advisory lock을 생략."""
     try:
         bind = db.get_bind()
@@ -29,21 +29,21 @@ def _is_postgres_bind(db) -> bool:
 
 def acquire_hospital_advisory_lock_sync(db, hospital_id: uuid.UUID) -> None:
     """pg_advisory_xact_lock — 트랜잭션 종료(commit/rollback) 시 자동 해제 (sync 세션용)."""
-    if not _is_postgres_bind(db):
+    if not is_postgres_bind(db):
         return
     db.execute(select(func.pg_advisory_xact_lock(hospital_lock_key(hospital_id))))
 
 
 async def acquire_hospital_advisory_lock(db, hospital_id: uuid.UUID) -> None:
     """pg_advisory_xact_lock — 트랜잭션 종료(commit/rollback) 시 자동 해제 (async 세션용)."""
-    if not _is_postgres_bind(db):
+    if not is_postgres_bind(db):
         return
     await db.execute(select(func.pg_advisory_xact_lock(hospital_lock_key(hospital_id))))
 
 
 def acquire_hospital_advisory_session_lock_sync(db, hospital_id: uuid.UUID) -> None:
     """pg_advisory_lock — 커넥션이 살아 있는 동안 유지. commit으로 풀리지 않는다."""
-    if not _is_postgres_bind(db):
+    if not is_postgres_bind(db):
         return
     db.execute(select(func.pg_advisory_lock(hospital_lock_key(hospital_id))))
 
@@ -55,6 +55,6 @@ def release_hospital_advisory_session_lock_sync(db, hospital_id: uuid.UUID) -> b
     "풀지 못했다"를 알아채고 커넥션을 폐기할 수 있도록 결과를 그대로 반환한다.
     Postgres가 아닌 바인딩에서는 락 자체가 없으므로 None.
     """
-    if not _is_postgres_bind(db):
+    if not is_postgres_bind(db):
         return None
     return db.execute(select(func.pg_advisory_unlock(hospital_lock_key(hospital_id)))).scalar()
@@ -3,8 +3,12 @@
 근거: 의료법 제56조, 보건복지부 의료광고 가이드라인 2판(2024.12),
 대한의사협회 의료광고심의회 2025.01 신규 심사 사례.
 """
+import itertools
+import operator
 import re
 import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
 
 # Zero-width / 비표시 문자 — 금지 표현 사이에 끼워 넣어 정규식을 회피하는 우회를 차단.
 # U+200B ZERO WIDTH SPACE, U+200C ZWNJ, U+200D ZWJ, U+2060 WORD JOINER, U+FEFF BOM, U+00AD SOFT HYPHEN.
@@ -21,29 +25,40 @@ FORBIDDEN_EXPRESSIONS = [
     "안전한 시술", "통증 없는", "흉터 없는",
 ]
 
+# 금지 표현 규칙: 기본 표현 → (매치가 시작할 수 있는 첫 글자들, 정규식 패턴(변형 포착)).
+# 첫 글자는 `_ForbiddenScanner`의 후보 위치 prefilter다. 패턴에 분기를 추가하면 그 분기의
+# 첫 글자도 여기에 적어야 한다 — 빠진 글자로 시작하는 매치는 검사되지 않는다.
+_FORBIDDEN_RULES: dict[str, tuple[str, re.Pattern]] = {
+    "1등": ("1일", re.compile(r"1등|일등|1위|일위")),
+    "최고": ("최으", re.compile(r"최고[의]?|최상[의]?|으뜸[인]?")),
+    "최우수": ("최가제탁", re.compile(r"최우수|가장\s*우수|제일\s*우수|탁월[한]?")),
+    "유일": ("유전오", re.compile(r"유일[한]?|유일무이|전국\s*유일|오직\s*이곳")),
+    "완치": ("완", re.compile(r"완치[율]?|완전\s*치료|완전\s*회복")),
+    "100%": ("1백", re.compile(r"100\s*%|백\s*퍼센트|100퍼")),
+    "성공률": ("성", re.compile(r"성공률|성공\s*확률|성공\s*보장")),
+    "부작용 없는": ("부", re.compile(r"부작용\s*(없|zero|제로|걱정\s*없)")),
+    "검증된": ("검입확", re.compile(r"검증[된]?|입증[된]?|확인[된]\s*효과")),
+    "가장 잘하는": ("가제", re.compile(r"가장\s*(잘|뛰어|훌륭)|제일\s*(잘|뛰어)")),
+    "국내 최초": ("국세아전", re.compile(r"(국내|세계|아시아|전국)\s*최초")),
+    "세계 최초": ("세", re.compile(r"세계\s*최초")),
+    "특허": ("특", re.compile(r"특허[를]?\s*(보유|획득|취득|출원|등록)")),
+    "독보적": ("독비", re.compile(r"독보적[인]?|비교\s*불가")),
+    # 2025 신규 — 의협 심의회 사례 + GEO 콘텐츠에 자주 새는 표현.
+    "노하우": ("저우병원차", re.compile(r"(저희|우리|병원|원장)[\w가-힣]*\s*만[의]?\s*노하우|차별화된\s*노하우")),
+    "효과 보장": ("효보", re.compile(r"효과[를]?\s*(보장|확실|약속)|보장[된]?\s*효과")),
+    "최첨단": ("최첨", re.compile(r"최첨단|첨단[의]?\s*(기술|장비|시술)")),
+    "안전한 시술": ("안1", re.compile(r"안전[한]?\s*(시술|수술|치료)[이가]?\s*보장|100%\s*안전")),
+    "통증 없는": ("통무아", re.compile(r"통증\s*없[는이]|무통[증]?[의]?\s*(시술|수술|치료)|아프지\s*않[은는]")),
+    "흉터 없는": ("흉", re.compile(r"흉터\s*(없|zero|제로|걱정\s*없|남지\s*않)")),
+}
+
 # 정규식 패턴 (변형 포착)
 FORBIDDEN_PATTERNS: dict[str, re.Pattern] = {
-    "1등": re.compile(r"1등|일등|1위|일위"),
-    "최고": re.compile(r"최고[의]?|최상[의]?|으뜸[인]?"),
-    "최우수": re.compile(r"최우수|가장\s*우수|제일\s*우수|탁월[한]?"),
-    "유일": re.compile(r"유일[한]?|유일무이|전국\s*유일|오직\s*이곳"),
-    "완치": re.compile(r"완치[율]?|완전\s*치료|완전\s*회복"),
-    "100%": re.compile(r"100\s*%|백\s*퍼센트|100퍼"),
-    "성공률": re.compile(r"성공률|성공\s*확률|성공\s*보장"),
-    "부작용 없는": re.compile(r"부작용\s*(없|zero|제로|걱정\s*없)"),
-    "검증된": re.compile(r"검증[된]?|입증[된]?|확인[된]\s*효과"),
-    "가장 잘하는": re.compile(r"가장\s*(잘|뛰어|훌륭)|제일\s*(잘|뛰어)"),
-    "국내 최초": re.compile(r"(국내|세계|아시아|전국)\s*최초"),
-    "세계 최초": re.compile(r"세계\s*최초"),
-    "특허": re.compile(r"특허[를]?\s*(보유|획득|취득|출원|등록)"),
-    "독보적": re.compile(r"독보적[인]?|비교\s*불가"),
-    # 2025 신규 — 의협 심의회 사례 + GEO 콘텐츠에 자주 새는 표현.
-    "노하우": re.compile(r"(저희|우리|병원|원장)[\w가-힣]*\s*만[의]?\s*노하우|차별화된\s*노하우"),
-    "효과 보장": re.compile(r"효과[를]?\s*(보장|확실|약속)|보장[된]?\s*효과"),
-    "최첨단": re.compile(r"최첨단|첨단[의]?\s*(기술|장비|시술)"),
-    "안전한 시술": re.compile(r"안전[한]?\s*(시술|수술|치료)[이가]?\s*보장|100%\s*안전"),
-    "통증 없는": re.compile(r"통증\s*없[는이]|무통[증]?[의]?\s*(시술|수술|치료)|아프지\s*않[은는]"),
-    "흉터 없는": re.compile(r"흉터\s*(없|zero|제로|걱정\s*없|남지\s*않)"),
+    label: pattern for label, (_first, pattern) in _FORBIDDEN_RULES.items()
+}
+# 규칙별 첫 글자 — 스캐너 prefilter용.
+FORBIDDEN_FIRST_CHARS: dict[str, str] = {
+    label: first for label, (first, _pattern) in _FORBIDDEN_RULES.items()
 }
 
 
@@ -55,10 +70,62 @@ def normalize_for_check(text: str) -> str:
     """
     if not text:
         return ""
-    normalized = unicodedata.normalize("NFKC", text)
+    # 한글 본문은 대부분 이미 NFKC다. 정규화 자체(분해→재조합)가 검사 전체보다 비싸므로
+    # 빠른 판정으로 확인되면 건너뛴다 — 결과는 같다.
+    if unicodedata.is_normalized("NFKC", text):
+        normalized = text
+    else:
+        normalized = unicodedata.normalize("NFKC", text)
     return normalized.translate(_ZERO_WIDTH)
 
 
+class _ForbiddenScanner:
+    """금지 표현 전체를 본문 한 번 훑기로 판정한다.
+
+    규칙마다 본문 전체를 `search`하면 비용이 규칙 수에 비례한다. 규칙이 시작할 수 있는
+    첫 글자를 모은 문자 집합 하나로 후보 위치만 찾고, 그 글자로 시작하는 규칙만 그
+    위치에 `match`로 확인한다(첫 글자 분기 prefilter + 정규식 확정). 본문 대부분은
+    후보 글자가 아니므로 규칙이 늘어도 훑기 비용은 거의 그대로다.
+
+    첫 글자는 규칙 표에 명시된 값을 쓴다(`FORBIDDEN_FIRST_CHARS`). 첫 글자가 없는 규칙은
+    종전처럼 본문 전체를 `search`한다 — 첫 글자가 빠짐없이 적혀 있으면 판정 결과는
+    규칙별 `search`와 같다.
+    """
+
+    def __init__(self, patterns: dict[str, re.Pattern], first_chars: dict[str, str]):
+        self._labels = tuple(patterns)
+        self._unanchored: list[tuple[str, re.Pattern]] = []
+        dispatch: dict[str, list[tuple[str, re.Pattern]]] = {}
+        for label, pattern in patterns.items():
+            first = first_chars.get(label)
+            if not first:
+                self._unanchored.append((label, pattern))
+                continue
+            for char in first:
+                dispatch.setdefault(char, []).append((label, pattern))
+        self._dispatch = dispatch
+        self._candidates = (
+            re.compile("[" + "".join(re.escape(char) for char in sorted(dispatch)) + "]")
+            if dispatch
+            else None
+        )
+
+    def labels(self, normalized: str) -> list[str]:
+        found = {label for label, pattern in self._unanchored if pattern.search(normalized)}
+        if self._candidates is not None:
+            for candidate in self._candidates.finditer(normalized):
+                position = candidate.start()
+                for label, pattern in self._dispatch[candidate.group()]:
+                    if label not in found and pattern.match(normalized, position):
+                        found.add(label)
+                if len(found) == len(self._labels):
+                    break
+        return [label for label in self._labels if label in found]
+
+
+_SCANNER = _ForbiddenScanner(FORBIDDEN_PATTERNS, FORBIDDEN_FIRST_CHARS)
+
+
 def check_forbidden(text: str) -> list[str]:
     """텍스트에서 의료광고 금지 표현을 찾아 매칭된 기본 표현 목록을 반환.
 
@@ -67,12 +134,7 @@ def check_forbidden(text: str) -> list[str]:
     """
     if not text:
         return []
-    normalized = normalize_for_check(text)
-    found = []
-    for label, pattern in FORBIDDEN_PATTERNS.items():
-        if pattern.search(normalized):
-            found.append(label)
-    return found
+    return _SCANNER.labels(normalize_for_check(text))
 
 
 # **짝이 맞는** `*` 강조만 제거한다.
@@ -123,21 +185,157 @@ _INLINE_LINK = re.compile(
 )
 
 
-def _strip_paired_emphasis(line: str) -> str:
+# 강조 구분자 글자. 줄에 하나도 없으면 강조 패스를 건너뛴다(대부분의 본문 줄).
+_DELIMITERS = frozenset("*_~")
+
+
+def _has_delimiter(text: str) -> bool:
+    return "*" in text or "_" in text or "~" in text
+
+
+# 원문 위치를 함께 들고 다니는 문자열 조각. `offsets[i]`는 `text[i]`의 원문 인덱스다.
+_Indexed = tuple[str, list[int]]
+
+
+def _keep_group(pattern: re.Pattern, indexed: _Indexed, group: int) -> _Indexed:
+    """매치마다 `group`만 남기는 `pattern.sub`와 같은 결과를 원문 위치와 함께 만든다."""
+    text, offsets = indexed
+    if pattern.search(text) is None:
+        return indexed
+    out: list[str] = []
+    out_offsets: list[int] = []
+    last = 0
+    for match in pattern.finditer(text):
+        out.append(text[last : match.start()])
+        out_offsets.extend(offsets[last : match.start()])
+        kept_start, kept_end = match.span(group)
+        out.append(text[kept_start:kept_end])
+        out_offsets.extend(offsets[kept_start:kept_end])
+        last = match.end()
+    out.append(text[last:])
+    out_offsets.extend(offsets[last:])
+    return "".join(out), out_offsets
+
+
+def _strip_paired_emphasis(line: _Indexed) -> _Indexed:
     """한 줄에서 화면에 보이지 않는 강조 구분자를 벗긴다(중첩 대응).
 
     `*`(단어 내부 포함), 단어 경계의 `_`, 그리고 `~~` 취소선 — 셋 다 렌더되면 사라진다.
     """
     for _ in range(4):  # ***중첩*** 정도까지. 무한 루프 방지용 상한.
-        stripped = _PAIRED_EMPHASIS.sub(r"\2", line)
-        stripped = _PAIRED_UNDERSCORE.sub(r"\2", stripped)
-        stripped = _PAIRED_STRIKETHROUGH.sub(r"\2", stripped)
-        if stripped == line:
+        stripped = _keep_group(_PAIRED_EMPHASIS, line, 2)
+        stripped = _keep_group(_PAIRED_UNDERSCORE, stripped, 2)
+        stripped = _keep_group(_PAIRED_STRIKETHROUGH, stripped, 2)
+        if stripped[0] == line[0]:
             return line
         line = stripped
     return line
 
 
+@dataclass(frozen=True)
+class VisibleText:
+    """마크다운 본문의 화면 텍스트와, 각 글자가 원문의 어디서 왔는지.
+
+    `spans`는 (화면 시작, 원문 시작, 길이) 연속 구간이다 — 강조 구분자처럼 화면에서
+    사라진 원문 글자 자리에서 구간이 끊긴다.
+    """
+
+    text: str
+    spans: tuple[tuple[int, int, int], ...]
+
+    def source_offsets(self, start: int, end: int) -> list[int]:
+        """화면 텍스트 `[start, end)` 글자들의 원문 인덱스."""
+        offsets: list[int] = []
+        for visible_start, source_start, length in self.spans:
+            low = max(start, visible_start)
+            high = min(end, visible_start + length)
+            if low < high:
+                shift = source_start - visible_start
+                offsets.extend(range(low + shift, high + shift))
+        return offsets
+
+
+def _compress_offsets(offsets: list[int]) -> tuple[tuple[int, int, int], ...]:
+    if not offsets:
+        return ()
+    # 구간 안에서는 (원문 인덱스 - 화면 인덱스)가 일정하다. 값이 바뀌는 자리가 구간 경계다.
+    # 글자마다 파이썬 루프를 돌지 않도록 map/compress로 경계만 뽑는다.
+    shifts = list(map(operator.sub, offsets, range(len(offsets))))
+    breaks = [
+        0,
+        *itertools.compress(range(1, len(shifts)), map(operator.ne, shifts[1:], shifts)),
+        len(shifts),
+    ]
+    return tuple(
+        (start, offsets[start], end - start) for start, end in zip(breaks, breaks[1:])
+    )
+
+
+@lru_cache(maxsize=256)
+def parse_markdown_visible(markdown_text: str) -> VisibleText:
+    """마크다운 본문을 한 번 해석해 화면 텍스트와 원문 위치를 돌려준다. 본문별로 캐시한다.
+
+    같은 본문이 생성 검증·정제 재검사·편집 검사·발행 게이트에서 거듭 검사된다. 해석은
+    펜스·코드 스팬·링크·강조(최대 4패스) 정규식을 줄마다 다시 돌리는 일이라, 본문 문자열을
+    키로 결과를 재사용한다. 반환값은 불변이다.
+    """
+    if not markdown_text:
+        return VisibleText("", ())
+
+    def _visible_outside_code(segment: _Indexed) -> _Indexed:
+        # 링크 목적지를 먼저 걷어낸 뒤(목적지 안의 `*`가 강조로 오인되지 않도록),
+        # 줄 단위로 강조를 벗긴다 — 강조가 블록 경계를 넘어 매칭되지 않게.
+        text, offsets = _keep_group(_INLINE_LINK, segment, 1)
+        if not _has_delimiter(text):
+            return text, offsets
+        out: list[str] = []
+        out_offsets: list[int] = []
+        line_start = 0
+        for line in text.split("\n"):
+            line_end = line_start + len(line)
+            if line_start:
+                out.append("\n")
+                out_offsets.append(offsets[line_start - 1])
+            if _has_delimiter(line):
+                line, line_offsets = _strip_paired_emphasis(
+                    (line, offsets[line_start:line_end])
+                )
+                out_offsets.extend(line_offsets)
+            else:
+                out_offsets.extend(offsets[line_start:line_end])
+            out.append(line)
+            line_start = line_end + 1
+        return "".join(out), out_offsets
+
+    out: list[str] = []
+    out_offsets: list[int] = []
+
+    def _emit(indexed: _Indexed) -> None:
+        out.append(indexed[0])
+        out_offsets.extend(indexed[1])
+
+    def _span(start: int, end: int) -> _Indexed:
+        return markdown_text[start:end], list(range(start, end))
+
+    def _split_on_code_spans(start: int, end: int) -> None:
+        last = start
+        for code in _CODE_SPAN.finditer(markdown_text, start, end):
+            _emit(_visible_outside_code(_span(last, code.start())))
+            # 구분자는 화면에 없고 내용만 보인다 → 내용을 그대로 남긴다.
+            _emit(_span(*code.span(1)))
+            last = code.end()
+        _emit(_visible_outside_code(_span(last, end)))
+
+    # 펜스 블록을 먼저 떼어낸다 — 여러 줄이라 인라인 백틱 규칙으로는 못 잡는다.
+    last = 0
+    for fence in _FENCED_CODE.finditer(markdown_text):
+        _split_on_code_spans(last, fence.start())
+        _emit(_span(*fence.span(1)))  # 펜스 내용은 별표까지 그대로 보인다
+        last = fence.end()
+    _split_on_code_spans(last, len(markdown_text))
+    return VisibleText("".join(out), _compress_offsets(out_offsets))
+
+
 def markdown_visible_text(markdown_text: str) -> str:
     """마크다운 본문에서 **환자에게 실제로 보이는 텍스트**에 가깝게 되돌린다.
 
@@ -156,35 +354,51 @@ def markdown_visible_text(markdown_text: str) -> str:
     React children으로 리터럴 렌더되므로 이 함수를 적용하면 오탐이 난다.
     필드별로 올바른 검사기를 고르려면 `check_forbidden_content_fields`를 쓸 것.
     """
-    if not markdown_text:
-        return ""
+    return parse_markdown_visible(markdown_text).text
 
-    def _visible_outside_code(segment: str) -> str:
-        # 링크 목적지를 먼저 걷어낸 뒤(목적지 안의 `*`가 강조로 오인되지 않도록),
-        # 줄 단위로 강조를 벗긴다 — 강조가 블록 경계를 넘어 매칭되지 않게.
-        segment = _INLINE_LINK.sub(r"\1", segment)
-        return "\n".join(_strip_paired_emphasis(line) for line in segment.split("\n"))
 
-    def _split_on(pattern, text: str) -> str:
-        out: list[str] = []
-        last = 0
-        for span in pattern.finditer(text):
-            out.append(_visible_outside_code(text[last : span.start()]))
-            # 구분자는 화면에 없고 내용만 보인다 → 내용을 그대로 남긴다.
-            out.append(span.group(1))
-            last = span.end()
-        out.append(_visible_outside_code(text[last:]))
-        return "".join(out)
+def _collapse_empty_delimiters(chars: list[str], site: int) -> None:
+    """`site` 양쪽이 같은 구분자의 같은 길이 런이면(지운 결과 빈 강조 쌍) 둘 다 지운다."""
+    left = site
+    while left > 0 and chars[left - 1] in _DELIMITERS and chars[left - 1] == chars[site - 1]:
+        left -= 1
+    right = site
+    while right < len(chars) and chars[right] in _DELIMITERS and chars[right] == chars[site - 1]:
+        right += 1
+    if left < site < right and site - left == right - site:
+        del chars[left:right]
 
-    # 펜스 블록을 먼저 떼어낸다 — 여러 줄이라 인라인 백틱 규칙으로는 못 잡는다.
-    out: list[str] = []
-    last = 0
-    for fence in _FENCED_CODE.finditer(markdown_text):
-        out.append(_split_on(_CODE_SPAN, markdown_text[last : fence.start()]))
-        out.append(fence.group(1))  # 펜스 내용은 별표까지 그대로 보인다
-        last = fence.end()
-    out.append(_split_on(_CODE_SPAN, markdown_text[last:]))
-    return "".join(out)
+
+def sanitize_forbidden_markdown(markdown_text: str, labels: list[str]) -> str:
+    """화면 텍스트 기준으로 잡힌 위반을 원문에서 해당 글자만 지워 없앤다.
+
+    원문 기준 정제(`pattern.sub`)는 `최**고**의`처럼 강조가 낀 위반을 못 지운다. 캐시된
+    해석의 원문 위치로 화면 글자만 지우므로 링크 목적지·코드 구분자는 그대로 남는다.
+    지운 자리에 남은 빈 강조 쌍(`****`)도 함께 걷어 화면에 별표가 드러나지 않게 한다.
+    입력은 `normalize_for_check`를 거친 본문이어야 한다 — 검사와 같은 글자를 보게.
+    """
+    visible = parse_markdown_visible(markdown_text)
+    doomed: set[int] = set()
+    for label in labels:
+        pattern = FORBIDDEN_PATTERNS.get(label)
+        if pattern is None:
+            continue
+        for match in pattern.finditer(visible.text):
+            doomed.update(visible.source_offsets(match.start(), match.end()))
+    if not doomed:
+        return markdown_text
+    chars: list[str] = []
+    sites: list[int] = []
+    for index, char in enumerate(markdown_text):
+        if index in doomed:
+            if not sites or sites[-1] != len(chars):
+                sites.append(len(chars))
+            continue
+        chars.append(char)
+    for site in reversed(sites):
+        if 0 < site < len(chars):
+            _collapse_empty_delimiters(chars, site)
+    return "".join(chars)
 
 
 def check_forbidden_markdown(markdown_text: str) -> list[str]:
@@ -197,7 +411,7 @@ def check_forbidden_markdown(markdown_text: str) -> list[str]:
     """
     if not markdown_text:
         return []
-    return check_forbidden(markdown_visible_text(markdown_text))
+    return check_forbidden(parse_markdown_visible(markdown_text).text)
 
 
 # 공개 표면에서 **마크다운으로 렌더되는** 필드. 나머지(title/meta_description/faq_*)는
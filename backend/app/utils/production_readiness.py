@@ -28,6 +28,7 @@ from app.workers.canary_tasks import read_queue_canaries
 EXPECTED_BEAT_SCHEDULES = {
     "canary-content",
     "canary-default",
+    "canary-images",
     "canary-leadgen",
     "canary-reports",
     "canary-sov",
@@ -45,6 +46,7 @@ EXPECTED_BEAT_SCHEDULES = {
     "purge-expired-leads",
     "reconcile-autonomous-workflows",
     "reconcile-essence-snapshots",
+    "reconcile-hospital-operating-stats",
     "stranded-content-recovery",
     "reconcile-monthly-artifact-incidents",
     "weekly-naver-source-sync",
@@ -57,6 +59,7 @@ EXPECTED_TASKS = {
     "app.workers.domain_certificate_tasks.provision_domain_certificate",
     "app.workers.canary_tasks.canary_content",
     "app.workers.canary_tasks.canary_default",
+    "app.workers.canary_tasks.canary_images",
     "app.workers.canary_tasks.canary_leadgen",
     "app.workers.canary_tasks.canary_reports",
     "app.workers.canary_tasks.canary_sov",
@@ -73,6 +76,7 @@ EXPECTED_TASKS = {
     "app.workers.tasks.adjust_query_priorities",
     "app.workers.tasks.auto_review_essence_snapshot",
     "app.workers.tasks.build_aeo_site",
+    "app.workers.tasks.generate_content_image_stage",
     "app.workers.tasks.generate_monthly_report_for_hospital",
     "app.workers.tasks.monitor_live_custom_domains",
     "app.workers.tasks.monthly_slot_generation",
@@ -81,6 +85,7 @@ EXPECTED_TASKS = {
     "app.workers.tasks.purge_expired_leads",
     "app.workers.tasks.regenerate_content_item",
     "app.workers.tasks.reconcile_essence_snapshots",
+    "app.workers.tasks.reconcile_hospital_operating_stats",
     "app.workers.tasks.retry_site_revalidation",
     "app.workers.tasks.run_monthly_reports",
     "app.workers.tasks.run_sov_for_hospital",
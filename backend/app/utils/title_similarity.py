@@ -0,0 +1,134 @@
+"""병원별 제목 유사도 인덱스 — 중복 회피를 프롬프트 길이가 아니라 로컬 비교로 보장한다.
+
+생성 프롬프트에 병원의 **모든** 기존 제목을 "중복 금지" 목록으로 붙이면 콘텐츠 이력이
+쌓일수록 프롬프트와 지연이 선형으로 늘고, 중복 회피는 모델이 수백 줄을 읽어 주는지에
+달린다. 여러 해 운영한 허브에서는 둘 다 성립하지 않는다.
+
+대신 정규화한 제목의 문자 n-gram(한국어는 음절 bigram) 집합으로 역색인을 만들어
+
+- 이번 브리프와 가까운 기존 제목 상위 K개만 프롬프트에 넣고(프롬프트 크기 고정),
+- 생성된 제목이 기존 제목과 거의 같으면 저장 전에 결정적으로 거부한다.
+
+제목은 수십 자라 MinHash 근사 없이 역색인 후보에 대해 정확한 Jaccard를 계산해도
+병원당 수천 건 규모에서 밀리초 단위다. 근사 오차로 중복을 놓칠 이유가 없다.
+"""
+import re
+import unicodedata
+from collections import Counter
+from collections.abc import Iterable
+
+# 한국어 제목은 음절 단위 정보 밀도가 높아 bigram이 조사 변화("통증이"/"통증의")에
+# 덜 민감하면서도 주제어를 충분히 구분한다.
+TITLE_SHINGLE_SIZE = 2
+
+# 프롬프트에 넣는 "가까운 기존 제목" 상한. 중복 판정은 로컬에서 하므로 이 목록은
+# 모델에게 주는 힌트일 뿐이고, 늘려도 판정 정확도는 변하지 않는다.
+PROMPT_NEIGHBOR_LIMIT = 15
+
+# 이 값 이상이면 같은 글의 변형으로 본다. "무릎 통증 원인과 치료 방법"과
+# "무릎 통증의 원인과 치료 방법"(0.75)은 걸리고, 틀만 같은 "어깨 통증 원인과
+# 치료 방법"(0.67)은 다른 글로 통과하는 선이다.
+NEAR_DUPLICATE_THRESHOLD = 0.7
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_title(title: str | None) -> str:
+    """비교용 제목 정규화 — NFKC, 대소문자 접기, 공백·문장부호 제거."""
+    if not title:
+        return ""
+    normalized = unicodedata.normalize("NFKC", title).casefold()
+    return _NON_WORD.sub("", normalized)
+
+
+def title_shingles(title: str | None) -> frozenset[str]:
+    normalized = normalize_title(title)
+    if len(normalized) <= TITLE_SHINGLE_SIZE:
+        return frozenset({normalized}) if normalized else frozenset()
+    return frozenset(
+        normalized[index:index + TITLE_SHINGLE_SIZE]
+        for index in range(len(normalized) - TITLE_SHINGLE_SIZE + 1)
+    )
+
+
+def jaccard(left: frozenset[str], right: frozenset[str]) -> float:
+    if not left or not right:
+        return 0.0
+    overlap = len(left & right)
+    return overlap / (len(left) + len(right) - overlap)
+
+
+class TitleSimilarityIndex:
+    """한 병원의 기존 제목 집합에 대한 n-gram 역색인.
+
+    입력 순서를 보존한다. 호출자가 오래된 것부터 넘기면 `recent()`가 최근 제목을 준다.
+    정규화 결과가 같은 제목은 한 번만 색인한다.
+    """
+
+    def __init__(self, titles: Iterable[str | None]):
+        self._titles: list[str] = []
+        self._shingles: list[frozenset[str]] = []
+        self._normalized: dict[str, int] = {}
+        self._postings: dict[str, list[int]] = {}
+        for title in titles:
+            normalized = normalize_title(title)
+            if not normalized or normalized in self._normalized:
+                continue
+            position = len(self._titles)
+            shingles = title_shingles(title)
+            self._titles.append(str(title).strip())
+            self._shingles.append(shingles)
+            self._normalized[normalized] = position
+            for shingle in shingles:
+                self._postings.setdefault(shingle, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def _scored(self, text: str | None) -> list[tuple[float, int]]:
+        query = title_shingles(text)
+        if not query:
+            return []
+        candidates: Counter[int] = Counter()
+        for shingle in query:
+            candidates.update(self._postings.get(shingle, ()))
+        scored = [
+            (jaccard(query, self._shingles[position]), position)
+            for position in candidates
+        ]
+        # 동점이면 최근 제목(뒤쪽)을 먼저 — 최근 글과의 충돌이 더 흔하다.
+        scored.sort(key=lambda pair: (-pair[0], -pair[1]))
+        return scored
+
+    def nearest(self, text: str | None, *, limit: int = PROMPT_NEIGHBOR_LIMIT) -> list[str]:
+        """`text`와 n-gram을 공유하는 기존 제목을 유사도 순으로 최대 `limit`개."""
+        if limit <= 0:
+            return []
+        return [
+            self._titles[position]
+            for score, position in self._scored(text)[:limit]
+            if score > 0
+        ]
+
+    def recent(self, limit: int = PROMPT_NEIGHBOR_LIMIT) -> list[str]:
+        if limit <= 0:
+            return []
+        return self._titles[-limit:]
+
+    def near_duplicate(
+        self,
+        title: str | None,
+        *,
+        threshold: float = NEAR_DUPLICATE_THRESHOLD,
+    ) -> str | None:
+        """`title`과 같거나 거의 같은 기존 제목. 없으면 None."""
+        normalized = normalize_title(title)
+        if not normalized:
+            return None
+        exact = self._normalized.get(normalized)
+        if exact is not None:
+            return self._titles[exact]
+        scored = self._scored(title)
+        if scored and scored[0][0] >= threshold:
+            return self._titles[scored[0][1]]
+        return None
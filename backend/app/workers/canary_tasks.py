@@ -26,6 +26,7 @@ from app.workers.dispatch_auth import require_dispatch
 EXPECTED_QUEUES: Final = (
     "default",
     "content",
+    "images",
     "sov",
     "reports",
     "leadgen",
@@ -153,6 +154,11 @@ def canary_content(task: Task) -> CanaryPayload:
     return _run_canary(task, "content")
 
 
+@celery_app.task(name="app.workers.canary_tasks.canary_images", bind=True)
+def canary_images(task: Task) -> CanaryPayload:
+    return _run_canary(task, "images")
+
+
 @celery_app.task(name="app.workers.canary_tasks.canary_sov", bind=True)
 def canary_sov(task: Task) -> CanaryPayload:
     return _run_canary(task, "sov")
@@ -33,7 +33,9 @@ TASK_PURPOSES = {
     "app.workers.tasks.regenerate_content_item": "regenerate-content",
     "app.workers.tasks.auto_review_essence_snapshot": "auto-review-essence-snapshot",
     "app.workers.tasks.reconcile_essence_snapshots": "reconcile-essence-snapshots",
+    "app.workers.tasks.reconcile_hospital_operating_stats": "reconcile-hospital-operating-stats",
     "app.workers.tasks.generate_content_image": "generate-content-image",
+    "app.workers.tasks.generate_content_image_stage": "content-image-stage",
     "app.workers.tasks.morning_content_auto_publish": "morning-content-auto-publish",
     "app.workers.tasks.run_sov_for_hospital": "run-sov",
     "app.workers.tasks.monthly_slot_generation": "monthly-slot-generation",
@@ -52,6 +54,7 @@ TASK_PURPOSES = {
     ),
     "app.workers.canary_tasks.canary_default": "canary-default",
     "app.workers.canary_tasks.canary_content": "canary-content",
+    "app.workers.canary_tasks.canary_images": "canary-images",
     "app.workers.canary_tasks.canary_sov": "canary-sov",
     "app.workers.canary_tasks.canary_reports": "canary-reports",
     "app.workers.canary_tasks.canary_leadgen": "canary-leadgen",
@@ -66,6 +69,7 @@ FIRST_ARG_TARGET_TASKS = frozenset(
         "app.workers.tasks.regenerate_content_item",
         "app.workers.tasks.auto_review_essence_snapshot",
         "app.workers.tasks.generate_content_image",
+        "app.workers.tasks.generate_content_image_stage",
         "app.workers.tasks.run_sov_for_hospital",
         "app.workers.tasks.generate_monthly_report_for_hospital",
         "app.workers.tasks.retry_site_revalidation",
@@ -1,11 +1,13 @@
 """Nightly generation batch progress persisted as one parent OperationRun."""
 
 import uuid
+from contextlib import ExitStack
 from datetime import UTC, date, datetime, timedelta
 
 from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
+from app.core.stage_timing import StageTimer
 from app.models.operations import JSONValue, OperationRun, OperationRunState
 from app.workers.generation_run_control import GenerationItemState, create_item_run
 
@@ -26,9 +28,13 @@ class GenerationBatchRecorder:
                 OperationRun.idempotency_key == key,
             )
         )
+        self._item_timer: StageTimer | None = None
+        self._item_scope = ExitStack()
         if existing is not None:
             self.run = existing
             self.items = _stored_items(existing.result_summary)
+            self.timings = StageTimer("nightly_generation", run_id=str(existing.id))
+            self.timings.merge(_stored_timings(existing.result_summary))
             existing.state = OperationRunState.RUNNING
             existing.completed_at = None
             existing.heartbeat_at = now
@@ -57,9 +63,26 @@ class GenerationBatchRecorder:
             skipped_count=0,
             version=1,
         )
+        self.timings = StageTimer("nightly_generation", run_id=str(self.run.id))
         db.add(self.run)
         db.commit()
 
+    def begin_item(self, item_id: uuid.UUID, hospital_id: uuid.UUID) -> None:
+        """Start timing one item's stages. The loop's ``finally`` calls `end_item`."""
+        self.end_item()
+        self._item_timer = StageTimer(
+            "nightly_generation.item", item_id=str(item_id), hospital_id=str(hospital_id)
+        )
+        self._item_scope.enter_context(self._item_timer.activate())
+
+    def end_item(self) -> None:
+        """Fold the item's stages into the batch summary (persisted on the next write)."""
+        if self._item_timer is None:
+            return
+        self._item_scope.close()
+        self.timings.merge(self._item_timer.summary())
+        self._item_timer = None
+
     def record(
         self,
         item_id: uuid.UUID,
@@ -76,6 +99,8 @@ class GenerationBatchRecorder:
             payload["safe_error_code"] = safe_error_code
             payload["safe_error_message"] = safe_error_message
             payload["next_retry_at"] = (datetime.now(UTC) + _NEXT_RETRY_DELAY).isoformat()
+        if self._item_timer is not None:
+            payload["stage_timings"] = self._item_timer.summary()
         self.items[str(item_id)] = payload
         self._persist(terminal=False)
 
@@ -104,7 +129,9 @@ class GenerationBatchRecorder:
         )
 
     def finish(self) -> OperationRunState:
-        return self._persist(terminal=True)
+        state = self._persist(terminal=True)
+        self.timings.log_summary(state=state.value, items=len(self.items))
+        return state
 
     def _persist(self, *, terminal: bool) -> OperationRunState:
         states = [item["state"] for item in self.items.values() if isinstance(item, dict)]
@@ -127,7 +154,7 @@ class GenerationBatchRecorder:
                 success_count=successes,
                 failure_count=failures,
                 skipped_count=skipped,
-                result_summary={"items": self.items},
+                result_summary={"items": self.items, "stage_timings": self.timings.summary()},
                 completed_at=datetime.now(UTC) if terminal else None,
                 lease_owner=None if terminal else self.run.lease_owner,
                 lease_expires_at=None if terminal else self.run.lease_expires_at,
@@ -157,3 +184,8 @@ def _stored_items(summary: dict[str, JSONValue] | None) -> dict[str, JSONValue]:
         return {}
     values = summary.get("items")
     return dict(values) if isinstance(values, dict) else {}
+
+
+def _stored_timings(summary: dict[str, JSONValue] | None) -> dict[str, JSONValue]:
+    values = (summary or {}).get("stage_timings")
+    return dict(values) if isinstance(values, dict) else {}
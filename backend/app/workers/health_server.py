@@ -12,6 +12,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.config import settings
 from app.core.database import SyncSessionLocal
+from app.core.metrics import metrics_authorized, metrics_payload
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -65,6 +66,9 @@ def is_ready() -> bool:
 
 class _HealthHandler(BaseHTTPRequestHandler):
     def do_GET(self) -> None:  # noqa: N802 — http.server interface
+        if self.path == "/metrics":
+            self._send_metrics()
+            return
         if self.path == "/live":
             healthy = _parent_process_alive()
         elif self.path == "/ready":
@@ -78,6 +82,19 @@ class _HealthHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(b"ok" if healthy else b"not-ready")
 
+    def _send_metrics(self) -> None:
+        # 워커 컨테이너는 PROMETHEUS_MULTIPROC_DIR로 prefork 자식들의 샘플을 모아 낸다.
+        if not metrics_authorized(self.headers.get("Authorization")):
+            self.send_response(401)
+            self.end_headers()
+            return
+        payload, content_type = metrics_payload()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
     def log_message(self, format: str, *args: object) -> None:  # noqa: A002
         return
 
@@ -1,17 +1,27 @@
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from sqlalchemy import func, or_, select, update
+from sqlalchemy import and_, func, or_, select, update
 from sqlalchemy.orm import joinedload
 
 from app.models.content import ContentItem, ContentStatus
 from app.models.hospital import Hospital, HospitalStatus
+from app.models.operating_stats import mark_operating_stats_stale
 
 NIGHTLY_GENERATION_CAP = 50
 NIGHTLY_GENERATION_CLAIM_TTL_HOURS = 2
 
 GENERATION_CATCHUP_DAYS = 7
 
+# 대표 이미지는 본문 write-back 뒤 `images` 큐의 별도 단계가 만든다
+# (`tasks.generate_content_image_stage`). 본문 생성 루프가 공급자 지연에 묶이지 않게 한다.
+IMAGE_STATUS_PENDING = "PENDING"
+IMAGE_STATUS_READY = "READY"
+IMAGE_STATUS_FAILED = "FAILED"
+# 이 시간 안의 PENDING은 단계가 아직 도는 중으로 보고 회수하지 않는다. 지나면 메시지가
+# 유실된 것으로 보고 야간 회수가 다시 잡는다(생성 claim TTL과 같은 기준).
+IMAGE_STAGE_PENDING_TTL_HOURS = 2
+
 # 생성 결과를 되쓸 수 있는 상태. 그 외(CANCELLED/PUBLISHED 등)는 운영자·발행 파이프라인이
 # 이미 확정한 상태이므로 야간 배치가 덮어쓰면 안 된다.
 GENERATION_WRITE_BACK_STATUSES = (
@@ -21,7 +31,9 @@ GENERATION_WRITE_BACK_STATUSES = (
 )
 
 
-def write_back_generated_content(db, *, item_id, values: dict[str, Any]) -> int:
+def write_back_generated_content(
+    db, *, item_id, values: dict[str, Any], hospital_id=None
+) -> int:
     """생성 결과를 **상태 가드와 함께** 쓴다. 반환값은 갱신된 행 수.
 
     0이면 생성이 도는 동안 운영자가 상태를 바꾼 것(취소 등)이므로 호출부는 결과를 버려야 한다.
@@ -40,6 +52,9 @@ def write_back_generated_content(db, *, item_id, values: dict[str, Any]) -> int:
         .values(**values)
         .execution_options(synchronize_session=False)
     )
+    if result.rowcount and hospital_id is not None:
+        # 본문·상태를 쓰는 write-back은 flush를 거치지 않으므로 운영 카운터에 직접 알린다.
+        mark_operating_stats_stale(db, hospital_id)
     return result.rowcount
 
 
@@ -59,11 +74,30 @@ def _nightly_generation_claim_filter(claim_cutoff: datetime):
     )
 
 
-def _needs_generation_recovery():
+def _image_stage_settled(image_cutoff: datetime):
+    # NOT(status = PENDING AND requested_at >= cutoff)를 NULL-안전하게 풀어 쓴 것 —
+    # 이력이 없는 행(NULL)이 SQL 3값 논리로 빠지지 않게 한다.
     return or_(
-        ContentItem.body.is_(None),
-        ContentItem.image_url.is_(None),
-        ContentItem.essence_check_summary["blocking"].as_boolean().is_(True),
+        ContentItem.image_status.is_(None),
+        ContentItem.image_status != IMAGE_STATUS_PENDING,
+        ContentItem.image_requested_at.is_(None),
+        ContentItem.image_requested_at < image_cutoff,
+    )
+
+
+def _needs_generation_recovery(image_cutoff: datetime | None = None):
+    # 이미지 단계가 도는 동안에는 image_url이 비어 있고 발행 검사도 이미지 미준비로
+    # blocking이다. 그 항목을 다시 잡으면 본문까지 재생성하므로 진행 중인 단계는 뺀다.
+    image_cutoff = image_cutoff or datetime.now(timezone.utc) - timedelta(
+        hours=IMAGE_STAGE_PENDING_TTL_HOURS
+    )
+    return and_(
+        or_(
+            ContentItem.body.is_(None),
+            ContentItem.image_url.is_(None),
+            ContentItem.essence_check_summary["blocking"].as_boolean().is_(True),
+        ),
+        _image_stage_settled(image_cutoff),
     )
 
 
@@ -0,0 +1,147 @@
+"""Celery signal bridge for task runtime, queue-wait, retry and DB statement metrics.
+
+Runtimes are also appended to a short per-queue list in Redis so the API can
+predict queue drain times (app/services/queue_backlog.py).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from collections.abc import Mapping
+from contextvars import Token
+from datetime import datetime
+from typing import Any
+
+from celery.signals import (
+    before_task_publish,
+    task_postrun,
+    task_prerun,
+    task_retry,
+    worker_process_shutdown,
+)
+
+from app.core import query_budget
+from app.core.metrics import (
+    MULTIPROC_DIR_ENV,
+    TASK_DB_STATEMENTS,
+    TASK_QUEUE_WAIT_SECONDS,
+    TASK_RETRIES,
+    TASK_RUNTIME_SECONDS,
+)
+from app.services.queue_backlog import record_task_runtime
+
+logger = logging.getLogger(__name__)
+
+PUBLISHED_AT_HEADER = "published_at"
+
+# task_id -> perf_counter at prerun. A prefork child runs one task at a time, but
+# thread pools may interleave, so this is keyed rather than a single slot.
+_started: dict[str, float] = {}
+# task_id -> DB statement tracking started at prerun. Celery runs prerun, the task
+# body and postrun in the same thread, so the context var covers the whole run.
+_db_tracking: dict[str, tuple[query_budget.QueryStats, Token]] = {}
+
+
+def _queue(request: Any) -> str:
+    delivery_info = getattr(request, "delivery_info", None)
+    if isinstance(delivery_info, Mapping):
+        return str(delivery_info.get("routing_key") or "unknown")
+    return "unknown"
+
+
+def _task_name(task: Any, sender: Any = None) -> str:
+    return str(getattr(task, "name", None) or getattr(sender, "name", None) or "unknown")
+
+
+@before_task_publish.connect(weak=False)
+def stamp_published_at(headers: dict[str, Any] | None = None, **_kwargs: Any) -> None:
+    """Stamp the wall-clock publish time. Retries republish, so each attempt is measured."""
+    if headers is not None:
+        headers[PUBLISHED_AT_HEADER] = repr(time.time())
+
+
+def queue_wait_seconds(request: Any, *, now: float) -> float | None:
+    """Seconds the message waited after it became runnable (publish time or ETA)."""
+    headers = getattr(request, "headers", None)
+    raw = headers.get(PUBLISHED_AT_HEADER) if isinstance(headers, Mapping) else None
+    if raw is None:
+        # Celery copies custom message headers onto the request itself.
+        raw = getattr(request, PUBLISHED_AT_HEADER, None)
+    try:
+        runnable_at = float(raw)
+    except (TypeError, ValueError):
+        return None
+    eta = getattr(request, "eta", None)
+    if isinstance(eta, str):
+        try:
+            eta = datetime.fromisoformat(eta)
+        except ValueError:
+            eta = None
+    if isinstance(eta, datetime):
+        # A countdown is intended delay, not queueing.
+        runnable_at = max(runnable_at, eta.timestamp())
+    return max(now - runnable_at, 0.0)
+
+
+@task_prerun.connect(weak=False)
+def track_task_start(task_id: str | None = None, task: Any = None, **_kwargs: Any) -> None:
+    if task_id is None:
+        return
+    _started[task_id] = time.perf_counter()
+    _db_tracking[task_id] = query_budget.start()
+    request = getattr(task, "request", None)
+    wait = queue_wait_seconds(request, now=time.time())
+    if wait is not None:
+        TASK_QUEUE_WAIT_SECONDS.labels(_task_name(task), _queue(request)).observe(wait)
+
+
+@task_postrun.connect(weak=False)
+def track_task_finish(
+    task_id: str | None = None,
+    task: Any = None,
+    state: str | None = None,
+    **_kwargs: Any,
+) -> None:
+    started = _started.pop(task_id, None) if task_id is not None else None
+    tracking = _db_tracking.pop(task_id, None) if task_id is not None else None
+    if started is None:
+        return
+    name, queue = _task_name(task), _queue(getattr(task, "request", None))
+    runtime = time.perf_counter() - started
+    TASK_RUNTIME_SECONDS.labels(name, queue, state or "UNKNOWN").observe(runtime)
+    if queue != "unknown":
+        record_task_runtime(queue, runtime)
+    if tracking is None:
+        return
+    stats, token = tracking
+    try:
+        query_budget.stop(token)
+    except ValueError:
+        # Token created in another context (a pool that hops threads) — the counts are
+        # still valid; only the reset is skipped.
+        pass
+    TASK_DB_STATEMENTS.labels(name, queue).observe(stats.statements)
+    logger.info(
+        "task %s",
+        json.dumps(
+            {"task": name, "queue": queue, "state": state or "UNKNOWN", **stats.fields()},
+            sort_keys=True,
+        ),
+    )
+
+
+@task_retry.connect(weak=False)
+def track_task_retry(sender: Any = None, request: Any = None, **_kwargs: Any) -> None:
+    TASK_RETRIES.labels(_task_name(sender), _queue(request)).inc()
+
+
+@worker_process_shutdown.connect(weak=False)
+def release_process_gauges(pid: int | None = None, **_kwargs: Any) -> None:
+    """Drop a recycled child's live gauges (``--max-tasks-per-child`` churns children)."""
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(pid or os.getpid())
@@ -15,6 +15,7 @@ import asyncio
 import hashlib
 import logging
 import threading
+import time
 import uuid
 from collections import Counter
 from collections.abc import Mapping, Sequence
@@ -29,6 +30,7 @@ from sqlalchemy import and_, delete, func, or_, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload, selectinload
 
+from app.core import stage_timing
 from app.core.celery_app import celery_app
 from app.core.config import settings
 from app.core.database import SyncSessionLocal, SyncSessionPinnedConnection
@@ -81,7 +83,7 @@ from app.services.essence_auto_review import (
     AUTO_ESSENCE_ACTOR,
     EssenceAiReview,
     EssenceRefreshStatus,
-    essence_refresh_needed,
+    essence_refresh_candidates,
     refresh_essence_snapshot,
     review_essence_candidate,
 )
@@ -91,13 +93,19 @@ from app.services.essence_engine import (
     ESSENCE_STATUS_NEEDS_REVIEW,
     build_monthly_essence_summary,
     compute_source_content_hash,
+    load_snapshot_sources,
     metered_llm_calls,
     process_source_asset,
     screen_content_against_philosophy,
     synthesize_philosophy,
     validate_source_excerpt,
 )
-from app.services.essence_readiness import get_current_approved_philosophy_sync
+from app.services.essence_readiness import (
+    get_current_approved_philosophy_sync,
+    verify_essence_readiness_projections,
+)
+from app.services.evidence_extraction_cache import default_extraction_cache
+from app.services.image_derivatives import build_image_variants
 from app.services.image_direction import hospital_image_direction
 from app.services.image_engine import generate_image
 from app.services.incident_types import IncidentFingerprint
@@ -128,6 +136,7 @@ from app.services.onboarding_notifications import (
     build_v0_ready_notification,
     enqueue_onboarding_notification_sync,
 )
+from app.services.operating_stats import reconcile_operating_stats
 from app.services.ops_incident_alerts import open_ops_incident, recover_ops_incident
 from app.services.post_publish_review_policy import (
     AUTO_PUBLISHABLE_STATUSES,
@@ -152,7 +161,7 @@ from app.services.site_revalidate import (
     content_site_paths,
     ensure_site_revalidate_configured,
     hospital_site_paths,
-    trigger_content_site_revalidate_safe,
+    trigger_contents_site_revalidate_safe,
     trigger_hospital_site_revalidate_safe,
     trigger_site_revalidate,
 )
@@ -201,6 +210,10 @@ from app.workers.monthly_slot_incident_control import (
 from app.workers.monthly_slots import create_next_month_slots_for_schedule
 from app.workers.nightly_generation_batch import (
     GENERATION_CATCHUP_DAYS,
+    GENERATION_WRITE_BACK_STATUSES,
+    IMAGE_STATUS_FAILED,
+    IMAGE_STATUS_PENDING,
+    IMAGE_STATUS_READY,
     NIGHTLY_GENERATION_CAP,
     _load_nightly_generation_batch,
     _nightly_generation_stmt,  # noqa: F401 — test_tasks_nightly가 tasks 경유로 참조하는 re-export
@@ -283,14 +296,15 @@ async def _generate_with_auto_review(
             automatic_rewrites += 1
 
         try:
-            last_content = await generate_content(
-                hospital,
-                item.content_type,
-                existing_titles,
-                philosophy,
-                approved_brief,
-                remediation_findings=findings,
-            )
+            with stage_timing.stage("generate"):
+                last_content = await generate_content(
+                    hospital,
+                    item.content_type,
+                    existing_titles,
+                    philosophy,
+                    approved_brief,
+                    remediation_findings=findings,
+                )
         except ValueError as exc:
             last_generation_error = exc
             findings = [f"생성 안전검사 실패: {' '.join(str(exc).split())[:300]}"]
@@ -308,12 +322,13 @@ async def _generate_with_auto_review(
                 break
             continue
 
-        last_ai_review = await review_generated_content(
-            hospital=hospital,
-            philosophy=philosophy,
-            content=last_content,
-            content_brief=approved_brief,
-        )
+        with stage_timing.stage("review"):
+            last_ai_review = await review_generated_content(
+                hospital=hospital,
+                philosophy=philosophy,
+                content=last_content,
+                content_brief=approved_brief,
+            )
         if last_ai_review.status in {
             ContentAiReviewStatus.PASS,
             ContentAiReviewStatus.UNAVAILABLE,
@@ -676,7 +691,9 @@ def _mark_source_processing_error(source_id: uuid.UUID, error: Exception) -> Non
 async def _metered_process_source_asset(source):
     """동기 근거 추출을 실제 공급자 호출 계수와 함께 실행한다."""
     async with metered_llm_calls():
-        return await asyncio.to_thread(process_source_asset, source)
+        return await asyncio.to_thread(
+            process_source_asset, source, cache=default_extraction_cache()
+        )
 
 
 @celery_app.task(
@@ -1020,7 +1037,11 @@ def _essence_reconcile_offset(
     bind=True,
 )
 def reconcile_essence_snapshots(self) -> dict[str, int]:
-    """Recover lost immediate dispatches for initial and changed snapshots."""
+    """Recover lost immediate dispatches for initial and changed snapshots.
+
+    The same rotating window also verifies the stored readiness projections, which
+    backfills hospitals that have no projection row yet.
+    """
 
     require_dispatch(self, "reconcile-essence-snapshots")
     with SyncSessionLocal() as db:
@@ -1031,9 +1052,16 @@ def reconcile_essence_snapshots(self) -> dict[str, int]:
             .scalars()
             .all()
         )
-        hospital_ids = [
-            hospital_id for hospital_id in candidate_ids if essence_refresh_needed(db, hospital_id)
-        ]
+        snapshot_sources = load_snapshot_sources(db, candidate_ids)
+        hospital_ids = essence_refresh_candidates(
+            db, candidate_ids, snapshot_sources=snapshot_sources
+        )
+        repaired = verify_essence_readiness_projections(
+            db, candidate_ids, snapshot_sources=snapshot_sources
+        )
+        db.commit()
+    if repaired:
+        logger.warning("reconcile_essence_snapshots repaired %d readiness projections", repaired)
     queued = 0
     for hospital_uuid in hospital_ids:
         hospital_id = str(hospital_uuid)
@@ -1043,7 +1071,42 @@ def reconcile_essence_snapshots(self) -> dict[str, int]:
             headers=build_dispatch_headers("auto-review-essence-snapshot", hospital_id),
         )
         queued += 1
-    return {"queued": queued}
+    return {"queued": queued, "repaired": repaired}
+
+
+OPERATING_STATS_RECONCILE_BATCH = 200
+
+
+@celery_app.task(
+    name="app.workers.tasks.reconcile_hospital_operating_stats",
+    bind=True,
+)
+def reconcile_hospital_operating_stats(self) -> dict[str, int]:
+    """운영 카운터(`HospitalOperatingStats`)를 전체 병원에 대해 다시 세어 어긋난 행을 고친다.
+
+    flush 리스너가 놓치는 쓰기(bulk SQL, 데이터 마이그레이션)만 어긋남을 만든다. 첫 실행이
+    카운터 행이 없는 병원을 모두 채운다. 병원 묶음마다 커밋해 잠금을 오래 잡지 않는다.
+    """
+
+    require_dispatch(self, "reconcile-hospital-operating-stats")
+    checked = 0
+    repaired = 0
+    last_id = None
+    with SyncSessionLocal() as db:
+        while True:
+            stmt = select(Hospital.id).order_by(Hospital.id).limit(OPERATING_STATS_RECONCILE_BATCH)
+            if last_id is not None:
+                stmt = stmt.where(Hospital.id > last_id)
+            hospital_ids = list(db.execute(stmt).scalars().all())
+            if not hospital_ids:
+                break
+            repaired += reconcile_operating_stats(db, hospital_ids)
+            db.commit()
+            checked += len(hospital_ids)
+            last_id = hospital_ids[-1]
+    if repaired:
+        logger.warning("reconcile_hospital_operating_stats repaired %d rows", repaired)
+    return {"checked": checked, "repaired": repaired}
 
 
 # ══════════════════════════════════════════════════════════════════
@@ -1490,6 +1553,33 @@ def build_aeo_site(self, hospital_id: str):
         db.commit()
 
 
+def _generated_image_values(image_url: str, image_prompt: str) -> dict:
+    """대표 이미지 write-back 값. 반응형 파생본을 원본 옆에 만들어 manifest도 함께 쓴다.
+
+    파생본 실패는 None(원본 서빙)으로 남고 이미지 저장을 막지 않는다.
+    """
+    return {
+        "image_url": image_url,
+        "image_prompt": image_prompt,
+        "image_variants": build_image_variants(image_url),
+        "image_status": IMAGE_STATUS_READY,
+    }
+
+
+def _enqueue_content_image_stage(item_id: uuid.UUID, parent_run_id: uuid.UUID) -> bool:
+    """본문 write-back 뒤 이미지 단계를 큐에 넣는다. 실패하면 False — 호출부가 PARTIAL로 남긴다."""
+    try:
+        generate_content_image_stage.apply_async(
+            args=[str(item_id), str(parent_run_id)],
+            queue="images",
+            headers=build_dispatch_headers("content-image-stage", str(item_id)),
+        )
+    except Exception:
+        logger.exception("content image stage enqueue failed: %s", item_id)
+        return False
+    return True
+
+
 # ══════════════════════════════════════════════════════════════════
 # 야간 콘텐츠 자동 생성 (매일 밤 23:00)
 # ══════════════════════════════════════════════════════════════════
@@ -1586,17 +1676,23 @@ def nightly_content_generation(self):
                     )
                 )
 
+            # 단계별 소요 시간 — 항목 기록과 배치 요약에 남는다(finally에서 닫는다).
+            recorder.begin_item(item_id, hospital_id)
             try:
-                # 기존 제목 목록 (중복 방지)
-                existing = db.execute(
-                    select(ContentItem.title).where(
-                        ContentItem.hospital_id == hospital.id,
-                        ContentItem.title.isnot(None),
+                with stage_timing.stage("essence"):
+                    # 기존 제목 목록 (중복 방지). 오래된 것부터 — 브리프가 없을 때 프롬프트에는
+                    # 최근 제목이 들어간다(content_engine._render_avoid_titles).
+                    existing = db.execute(
+                        select(ContentItem.title)
+                        .where(
+                            ContentItem.hospital_id == hospital.id,
+                            ContentItem.title.isnot(None),
+                        )
+                        .order_by(ContentItem.created_at)
                     )
-                )
-                existing_titles = [r[0] for r in existing.all()]
+                    existing_titles = [r[0] for r in existing.all()]
 
-                philosophy = get_current_approved_philosophy_sync(db, hospital.id)
+                    philosophy = get_current_approved_philosophy_sync(db, hospital.id)
                 if not philosophy:
                     item.content_philosophy_id = None
                     item.essence_status = ESSENCE_STATUS_MISSING_APPROVED
@@ -1686,18 +1782,19 @@ def nightly_content_generation(self):
                     continue
 
                 # Claude Sonnet 콘텐츠 생성
-                approved_brief = prepare_automatic_content_brief_sync(
-                    db,
-                    item=item,
-                    hospital=hospital,
-                    philosophy=philosophy,
-                )
-                # 플래너는 추적 객체(item.query_target_id / content_brief / brief_* 등)를
-                # 직접 변경한다. 그대로 두면 아래 조건부 UPDATE의 db.execute()가 autoflush를
-                # 먼저 돌려 **status 술어가 없는 UPDATE**를 emit하고, "추적 객체를 건드리지
-                # 않는다"는 가드의 전제가 깨진다. 여기서 확정해 item을 clean 상태로 만든다.
-                # (기획 메타데이터라 생성이 실패해도 남는 편이 맞고, claim 커밋과 같은 취급이다.)
-                db.commit()
+                with stage_timing.stage("brief"):
+                    approved_brief = prepare_automatic_content_brief_sync(
+                        db,
+                        item=item,
+                        hospital=hospital,
+                        philosophy=philosophy,
+                    )
+                    # 플래너는 추적 객체(item.query_target_id / content_brief / brief_* 등)를
+                    # 직접 변경한다. 그대로 두면 아래 조건부 UPDATE의 db.execute()가 autoflush를
+                    # 먼저 돌려 **status 술어가 없는 UPDATE**를 emit하고, "추적 객체를 건드리지
+                    # 않는다"는 가드의 전제가 깨진다. 여기서 확정해 item을 clean 상태로 만든다.
+                    # (기획 메타데이터라 생성이 실패해도 남는 편이 맞고, claim 커밋과 같은 취급이다.)
+                    db.commit()
                 content_data, screening = _run_async(
                     _generate_with_auto_review(
                         hospital=hospital,
@@ -1717,24 +1814,29 @@ def nightly_content_generation(self):
                 # execute/commit 앞에서 autoflush로 그 값을 먼저 써버려 취소가 되살아난다
                 # (세션은 expire_on_commit=False). 그래서 조건부 UPDATE 한 방으로만 쓰고,
                 # 0행이면 운영자의 취소가 이긴 것으로 보고 결과를 버린다.
-                written = write_back_generated_content(
-                    db,
-                    item_id=item.id,
-                    values={
-                        "title": content_data["title"],
-                        "body": content_data["body"],
-                        "meta_description": content_data.get("meta_description"),
-                        "references_list": content_data.get("references") or [],
-                        "faq_question": content_data.get("faq_question"),
-                        "faq_answer_summary": content_data.get("faq_answer_summary"),
-                        "generated_at": now,
-                        "body_updated_at": now,
-                        "status": ContentStatus.DRAFT,
-                        "content_philosophy_id": philosophy.id,
-                        "essence_status": screening.status,
-                        "essence_check_summary": screening.summary,
-                    },
-                )
+                with stage_timing.stage("write_back"):
+                    written = write_back_generated_content(
+                        db,
+                        item_id=item.id,
+                        hospital_id=item.hospital_id,
+                        values={
+                            "title": content_data["title"],
+                            "body": content_data["body"],
+                            "meta_description": content_data.get("meta_description"),
+                            "references_list": content_data.get("references") or [],
+                            "faq_question": content_data.get("faq_question"),
+                            "faq_answer_summary": content_data.get("faq_answer_summary"),
+                            "generated_at": now,
+                            "body_updated_at": now,
+                            "status": ContentStatus.DRAFT,
+                            "content_philosophy_id": philosophy.id,
+                            "essence_status": screening.status,
+                            "essence_check_summary": screening.summary,
+                            # 새 제목에 맞는 대표 이미지를 이미지 단계에 요청한다.
+                            "image_status": IMAGE_STATUS_PENDING,
+                            "image_requested_at": now,
+                        },
+                    )
                 if written == 0:
                     # 운영자가 생성 도중 상태를 바꿨다(취소/발행 등). 배치 결과보다
                     # 운영자 의도가 우선이므로 생성물을 버리고 다음 항목으로 넘어간다.
@@ -1754,65 +1856,33 @@ def nightly_content_generation(self):
                     continue
 
                 # 텍스트 콘텐츠 먼저 커밋 (이미지 실패가 텍스트를 롤백하지 않도록)
-                db.commit()
-                db.refresh(item)  # expire_on_commit=False — 조건부 UPDATE 결과를 다시 읽어온다
+                with stage_timing.stage("write_back"):
+                    db.commit()
+                    db.refresh(item)  # expire_on_commit=False — 조건부 UPDATE 결과를 다시 읽는다
                 logger.info(f"Content generated: {hospital.name} — {item.title}")
 
-                # 대표 이미지 생성 (gpt-image-2, 제목 주제 주입 — 실패해도 텍스트는 유지)
-                try:
-                    image_url, image_prompt = _run_async(
-                        generate_image(
-                            item.content_type,
-                            hospital.slug,
-                            topic=item.title,
-                            direction=hospital_image_direction(hospital),
-                        )
-                    )
-                    if not image_url:
-                        # generate_image는 실패·비용차단을 ("", "") 센티널로 알린다.
-                        # 그대로 대입하면 기존 이미지를 지우게 되므로 값이 있을 때만 쓴다.
-                        logger.warning(
-                            "Image generation returned no URL for %s (text saved)", item.id
-                        )
-                        item_state = GenerationItemState.PARTIAL
-                    else:
-                        image_written = write_back_generated_content(
-                            db,
-                            item_id=item.id,
-                            values={"image_url": image_url, "image_prompt": image_prompt},
-                        )
-                        if image_written == 0:
-                            # 이미지 생성 중 상태가 바뀌어 쓰지 못했다. 성공으로만 보고하면
-                            # 이미지 없는 글이 생긴 걸 아무도 모른다 — 요약에 드러낸다.
-                            db.rollback()
-                            db.refresh(item)
-                            logger.warning(
-                                "Image write-back skipped for %s — status changed during "
-                                "image generation",
-                                item.id,
-                            )
-                            item_state = GenerationItemState.DISCARDED
-                        else:
-                            db.commit()
-                            db.refresh(item)
-                except Exception as img_e:
-                    logger.warning(
-                        "Image generation failed for %s (text saved): %s",
-                        item.id,
-                        type(img_e).__name__,
-                    )
-                    db.rollback()
-                    db.refresh(item)  # re-sync after rollback
-                    item_state = GenerationItemState.PARTIAL
-
-                readiness_failure = None
-                if item_state != GenerationItemState.DISCARDED:
+                # 대표 이미지는 `images` 큐의 별도 단계가 만든다. 이 루프가 이미지 공급자를
+                # 기다리면(재시도·폴백 포함 수십 초) 다음 항목의 본문 생성이 그만큼 밀린다.
+                # 발행 판정을 먼저 기록한다 — 단계가 먼저 끝나 이미지 준비 판정을 쓴 뒤에
+                # 이 루프가 옛 값으로 "이미지 미준비"를 덮어쓰지 않게 하려는 순서다.
+                with stage_timing.stage("readiness"):
                     readiness_failure = _persist_publication_readiness(db, item, philosophy)
-                    if (
-                        readiness_failure is not None
-                        and item_state == GenerationItemState.SUCCEEDED
+                with stage_timing.stage("image_enqueue"):
+                    image_enqueued = _enqueue_content_image_stage(item.id, recorder.run.id)
+                if not image_enqueued:
+                    # PENDING으로 남기면 회수 주기가 TTL 동안 이 항목을 건너뛴다.
+                    if write_back_generated_content(
+                        db, item_id=item.id, values={"image_status": IMAGE_STATUS_FAILED}
                     ):
-                        item_state = GenerationItemState.FAILED
+                        db.commit()
+                    else:
+                        db.rollback()
+                    item_state = GenerationItemState.PARTIAL
+                elif (
+                    readiness_failure is not None
+                    and readiness_failure[0] != "CONTENT_IMAGE_NOT_READY"
+                ):
+                    item_state = GenerationItemState.FAILED
 
                 if item_state == GenerationItemState.FAILED:
                     code, message = readiness_failure or (
@@ -1891,14 +1961,6 @@ def nightly_content_generation(self):
                             notify=generation_notify_requested(code),
                         )
                     )
-                elif item_state == GenerationItemState.DISCARDED:
-                    recorder.record(item.id, item_state)
-                    recorder.item_run(
-                        item.id,
-                        hospital_id,
-                        "REGENERATE_CONTENT_IMAGE",
-                        OperationRunState.CANCELLED,
-                    )
                 else:
                     recorder.record(item.id, GenerationItemState.SUCCEEDED)
                     success_run = recorder.item_run(
@@ -1907,9 +1969,14 @@ def nightly_content_generation(self):
                         "REGENERATE_CONTENT",
                         OperationRunState.SUCCEEDED,
                     )
+                    # 이미지 인시던트는 이미지 단계가 실제로 끝났을 때 닫는다.
                     _run_async(
                         recover_generation_incidents(
-                            item.id, hospital_id, hospital_name, success_run.id
+                            item.id,
+                            hospital_id,
+                            hospital_name,
+                            success_run.id,
+                            include_image=False,
                         )
                     )
 
@@ -1944,6 +2011,7 @@ def nightly_content_generation(self):
                     )
                 )
             finally:
+                recorder.end_item()
                 released = release_unfinished_claims(
                     db,
                     [item_id],
@@ -2149,7 +2217,7 @@ def generate_content_image(self, content_id: str):
             written = write_back_generated_content(
                 db,
                 item_id=item.id,
-                values={"image_url": image_url, "image_prompt": image_prompt},
+                values=_generated_image_values(image_url, image_prompt),
             )
             if written == 0:
                 db.rollback()
@@ -2203,15 +2271,146 @@ def generate_content_image(self, content_id: str):
             raise
 
 
+@celery_app.task(
+    name="app.workers.tasks.generate_content_image_stage",
+    bind=True,
+    # 공급자 재시도(최대 3회)와 Google 폴백까지 한 번에 끝나야 한다.
+    soft_time_limit=900,
+    time_limit=960,
+    acks_late=True,
+)
+def generate_content_image_stage(self, content_id: str, parent_run_id: str):
+    """야간 생성이 본문을 쓴 뒤 큐잉하는 대표 이미지 단계 (`images` 큐).
+
+    본문 루프와 워커 슬롯을 나눠 이미지 공급자 지연이 다음 항목의 본문 생성을 막지 않게
+    한다. 이미지를 쓰면 발행 판정을 다시 기록해 "이미지 미준비" 차단을 푼다. 실패는
+    FAILED로 남기고, 다음 회수 주기(01·04·07시)가 항목을 다시 잡는다.
+    """
+    require_dispatch(self, "content-image-stage", content_id)
+    item_id = uuid.UUID(content_id)
+    attempt_kind = f"image-stage-{getattr(self.request, 'id', None) or uuid.uuid4()}"
+    with SyncSessionLocal() as db:
+        item = db.get(ContentItem, item_id)
+        # 재배달로 이미 끝났거나, 운영자가 확정(발행·취소)한 항목은 건드리지 않는다.
+        if (
+            item is None
+            or item.image_status != IMAGE_STATUS_PENDING
+            or item.status not in GENERATION_WRITE_BACK_STATUSES
+        ):
+            return {"status": "skipped"}
+        hospital = db.get(Hospital, item.hospital_id)
+        if hospital is None:
+            return {"status": "skipped"}
+
+        timer = stage_timing.StageTimer("content_image_stage", hospital_id=str(hospital.id))
+        try:
+            with timer.stage("image"):
+                image_url, image_prompt = _run_async(
+                    generate_image(
+                        item.content_type,
+                        hospital.slug,
+                        topic=item.title or "병원 의료 정보",
+                        direction=hospital_image_direction(hospital),
+                    )
+                )
+        except Exception as exc:  # noqa: BLE001 — 실패는 아래에서 FAILED로 기록한다.
+            logger.warning("Image stage failed for %s: %s", content_id, type(exc).__name__)
+            image_url, image_prompt = "", ""
+
+        if not image_url:
+            code = "IMAGE_GENERATION_FAILED"
+            message = "본문은 저장됐지만 대표 이미지 생성이 완료되지 않았습니다."
+            if write_back_generated_content(
+                db, item_id=item.id, values={"image_status": IMAGE_STATUS_FAILED}
+            ):
+                db.commit()
+            else:
+                db.rollback()
+            failed_run = create_item_run(
+                db,
+                parent_run_id=uuid.UUID(parent_run_id),
+                item_id=item.id,
+                hospital_id=hospital.id,
+                operation_type="REGENERATE_CONTENT_IMAGE",
+                state=OperationRunState.FAILED,
+                result={
+                    "state": "FAILED",
+                    "safe_error_code": code,
+                    "stage_timings": timer.summary(),
+                },
+                safe_error_code=code,
+                safe_error_message=message,
+                attempt_kind=attempt_kind,
+            )
+            _run_async(
+                open_generation_incident(
+                    item_id=item.id,
+                    hospital_id=hospital.id,
+                    hospital_name=hospital.name,
+                    run_id=failed_run.id,
+                    code=code,
+                    message=message,
+                    notify=generation_notify_requested(code),
+                )
+            )
+            return {"status": "failed"}
+
+        with timer.stage("write_back"):
+            written = write_back_generated_content(
+                db,
+                item_id=item.id,
+                values=_generated_image_values(image_url, image_prompt),
+            )
+            if written:
+                db.commit()
+        if written == 0:
+            db.rollback()
+            logger.warning(
+                "Image write-back skipped for %s — status changed during image generation",
+                content_id,
+            )
+            return {"status": "discarded"}
+        db.refresh(item)
+        with timer.stage("readiness"):
+            philosophy = get_current_approved_philosophy_sync(db, hospital.id)
+            readiness_failure = _persist_publication_readiness(db, item, philosophy)
+        success_run = create_item_run(
+            db,
+            parent_run_id=uuid.UUID(parent_run_id),
+            item_id=item.id,
+            hospital_id=hospital.id,
+            operation_type="REGENERATE_CONTENT_IMAGE",
+            state=OperationRunState.SUCCEEDED,
+            result={
+                "state": "SUCCEEDED",
+                "artifact": "image",
+                "stage_timings": timer.summary(),
+            },
+            attempt_kind=attempt_kind,
+        )
+        _run_async(
+            recover_generation_incidents(
+                item.id,
+                hospital.id,
+                hospital.name,
+                success_run.id,
+                safe_error_codes=("IMAGE_GENERATION_FAILED", "CONTENT_IMAGE_NOT_READY"),
+            )
+        )
+        return {"status": "succeeded", "publishable": readiness_failure is None}
+
+
 def _generate_single_content_item(
     db, item: ContentItem, hospital: Hospital
 ) -> tuple[GenerationItemState, str | None, str | None]:
     existing = db.execute(
-        select(ContentItem.title).where(
+        select(ContentItem.title)
+        .where(
             ContentItem.hospital_id == hospital.id,
             ContentItem.id != item.id,
             ContentItem.title.isnot(None),
         )
+        .order_by(ContentItem.created_at)
     )
     existing_titles = [row[0] for row in existing.all()]
 
@@ -2264,12 +2463,14 @@ def _generate_single_content_item(
         )
     )
     now = datetime.now(timezone.utc)
+    needs_image = not item.image_url
 
     # 배치 경로와 같은 상태 가드를 쓴다. 재생성이 도는 동안 AE가 이 슬롯을 종료(CANCELLED)할
     # 수 있고, 가드 없이 쓰면 종료된 슬롯에 미검수 본문이 들어간다(실제 DB에서 재현됨).
     written = write_back_generated_content(
         db,
         item_id=item.id,
+        hospital_id=item.hospital_id,
         values={
             "title": content_data["title"],
             "body": content_data["body"],
@@ -2283,6 +2484,13 @@ def _generate_single_content_item(
             "content_philosophy_id": philosophy.id,
             "essence_status": screening.status,
             "essence_check_summary": screening.summary,
+            # 대표 이미지가 없으면 아래에서 바로 만든다. 야간 이미지 단계와 같은 상태를 거쳐
+            # 도중에 워커가 죽어도 회수 주기가 PENDING TTL 뒤 다시 잡는다.
+            **(
+                {"image_status": IMAGE_STATUS_PENDING, "image_requested_at": now}
+                if needs_image
+                else {}
+            ),
         },
     )
     if written == 0:
@@ -2295,7 +2503,7 @@ def _generate_single_content_item(
     db.refresh(item)
 
     image_failed = False
-    if not item.image_url:
+    if needs_image:
         try:
             image_url, image_prompt = _run_async(
                 generate_image(
@@ -2312,7 +2520,7 @@ def _generate_single_content_item(
             elif write_back_generated_content(
                 db,
                 item_id=item.id,
-                values={"image_url": image_url, "image_prompt": image_prompt},
+                values=_generated_image_values(image_url, image_prompt),
             ):
                 db.commit()
                 db.refresh(item)
@@ -2333,6 +2541,13 @@ def _generate_single_content_item(
             db.refresh(item)
             image_failed = True
     if image_failed:
+        if write_back_generated_content(
+            db, item_id=item.id, values={"image_status": IMAGE_STATUS_FAILED}
+        ):
+            db.commit()
+            db.refresh(item)
+        else:
+            db.rollback()
         _persist_publication_readiness(db, item, philosophy)
         return (
             GenerationItemState.PARTIAL,
@@ -2378,57 +2593,40 @@ def morning_content_auto_publish(self):
             due_ids = list(db.execute(_auto_publish_due_stmt(today)).scalars().all())
 
         published_outcomes: list[dict] = []
-        for content_id in due_ids:
-            outcome = _auto_publish_one(content_id)
-            if outcome is None:
-                continue
-            if outcome["kind"] == "blocked":
-                _run_async(
-                    open_generation_incident(
-                        item_id=content_id,
-                        hospital_id=outcome["hospital_id"],
-                        hospital_name=outcome["hospital_name"],
-                        run_id=outcome["run_id"],
-                        code=outcome["code"],
-                        message=outcome["message"],
-                        notify=generation_notify_requested(outcome["code"]),
+        published_ids: list[uuid.UUID] = []
+        try:
+            for content_id in due_ids:
+                outcome = _auto_publish_one(content_id)
+                if outcome is None:
+                    continue
+                if outcome["kind"] == "blocked":
+                    _run_async(
+                        open_generation_incident(
+                            item_id=content_id,
+                            hospital_id=outcome["hospital_id"],
+                            hospital_name=outcome["hospital_name"],
+                            run_id=outcome["run_id"],
+                            code=outcome["code"],
+                            message=outcome["message"],
+                            notify=generation_notify_requested(outcome["code"]),
+                        )
                     )
-                )
-                continue
-
-            published_outcomes.append(outcome)
-            _run_async(
-                recover_generation_incidents(
-                    content_id,
-                    outcome["hospital_id"],
-                    outcome["hospital_name"],
-                    None,
-                )
-            )
-
-            revalidated = _run_async(
-                trigger_content_site_revalidate_safe(
-                    outcome["slug"],
-                    content_id,
-                    hospital_name=outcome["hospital_name"],
-                    treatments=outcome["treatments"],
-                )
-            )
-            if not revalidated and settings.APP_ENV.lower() == "production":
-                logger.warning("Auto-published content revalidation failed: %s", content_id)
+                    continue
 
-            # 색인 신호 — sitemap이 크롤러를 기다리는 동안 발행 사실을 즉시 밀어 넣는다.
-            # 실측(2026-07-29): AI가 병원 허브를 인용한 답변의 93%가 병원을 언급했고,
-            # 인용하지 않은 답변은 4%였다. 읽히지 않으면 언급되지 않으므로 색인 진입이
-            # 콘텐츠 발행만큼 중요하다. 실패해도 발행은 계속한다.
-            _run_async(
-                indexnow.submit_content_published_safe(
-                    slug=outcome["slug"],
-                    content_id=content_id,
-                    aeo_domain=outcome.get("aeo_domain"),
-                    treatments=outcome["treatments"],
+                published_outcomes.append(outcome)
+                published_ids.append(content_id)
+                _run_async(
+                    recover_generation_incidents(
+                        content_id,
+                        outcome["hospital_id"],
+                        outcome["hospital_name"],
+                        None,
+                    )
                 )
-            )
+        finally:
+            # 발행된 글은 루프가 중간에 실패해도 공개 표면 신호를 받아야 한다. 재시도 실행은
+            # 이미 발행된 글을 다시 고르지 않으므로 여기서 놓치면 다시 보낼 기회가 없다.
+            _run_async(_send_publish_signals(list(zip(published_ids, published_outcomes))))
         if published_outcomes:
             _enqueue_morning_content_publish_digest(today, published_outcomes)
         _enqueue_overdue_post_publish_review_notifications(datetime.now(timezone.utc))
@@ -2440,6 +2638,40 @@ def morning_content_auto_publish(self):
         raise self.retry(exc=exc, countdown=300)
 
 
+async def _send_publish_signals(published: list[tuple[uuid.UUID, dict]]) -> None:
+    """병원별로 모은 발행 글에 revalidate POST 한 번, IndexNow 제출 한 번씩 보낸다.
+
+    한 병원이 같은 아침에 여러 글을 발행하면 글마다 보내던 신호가 허브·목록 경로를
+    글 수만큼 반복 무효화·제출했다. 경로는 병원(호스트) 단위로 합쳐 한 번에 보낸다.
+    """
+    batches: dict[str, tuple[dict, list[uuid.UUID]]] = {}
+    for content_id, outcome in published:
+        batches.setdefault(outcome["slug"], (outcome, []))[1].append(content_id)
+    for slug, (outcome, content_ids) in batches.items():
+        revalidated = await trigger_contents_site_revalidate_safe(
+            slug,
+            content_ids,
+            hospital_name=outcome["hospital_name"],
+            treatments=outcome["treatments"],
+        )
+        if not revalidated and settings.APP_ENV.lower() == "production":
+            logger.warning(
+                "Auto-published content revalidation failed: %s",
+                ", ".join(str(content_id) for content_id in content_ids),
+            )
+
+        # 색인 신호 — sitemap이 크롤러를 기다리는 동안 발행 사실을 즉시 밀어 넣는다.
+        # 실측(2026-07-29): AI가 병원 허브를 인용한 답변의 93%가 병원을 언급했고,
+        # 인용하지 않은 답변은 4%였다. 읽히지 않으면 언급되지 않으므로 색인 진입이
+        # 콘텐츠 발행만큼 중요하다. 실패해도 발행은 계속한다.
+        await indexnow.submit_contents_published_safe(
+            slug=slug,
+            content_ids=content_ids,
+            aeo_domain=outcome.get("aeo_domain"),
+            treatments=outcome["treatments"],
+        )
+
+
 def _auto_publish_due_stmt(today):
     return (
         select(ContentItem.id)
@@ -2626,8 +2858,10 @@ def run_sov_for_hospital(self, hospital_id: str):
             hospital_id,
         )
         return
+    # 단계별 소요 시간 — 답변 호출/판정은 sov_engine이 활성 타이머에 직접 기록한다.
+    sov_timer = stage_timing.StageTimer("weekly_sov", hospital_id=hospital_id)
     try:
-        with SyncSessionLocal() as db:
+        with SyncSessionLocal() as db, sov_timer.activate():
             hospital = db.get(Hospital, uuid.UUID(hospital_id))
             if not hospital or hospital.status not in (
                 HospitalStatus.ACTIVE,
@@ -2635,6 +2869,7 @@ def run_sov_for_hospital(self, hospital_id: str):
             ):
                 return
 
+            spec_build_started = time.perf_counter()
             # priority 기반 쿼리 필터링 — beat은 월요일 02:00 KST(=일요일 UTC)에 발화하므로
             # UTC date.today()를 쓰면 ISO 주차 짝/홀이 뒤집히고 월초 판정도 어긋난다 (P1-5).
             today_kst = arrow.now("Asia/Seoul").date()
@@ -2730,6 +2965,7 @@ def run_sov_for_hospital(self, hospital_id: str):
                 )
                 raise RuntimeError("weekly_sov_no_measurement_manifest")
             db.commit()
+            sov_timer.add("spec_build", (time.perf_counter() - spec_build_started) * 1000)
             measurement_specs = [
                 {
                     "query_id": cell.query_matrix_id,
@@ -2847,15 +3083,18 @@ def run_sov_for_hospital(self, hospital_id: str):
                     records.append(record)
                     attempt_pairs.append((spec["manifest_cell"], record))
 
-            db.add_all(records)
-            db.flush()
-            db.add_all([link_attempt(cell, record) for cell, record in attempt_pairs])
-            _finish_measurement_run(run, success_count, failure_count)
-            db.commit()
+            with sov_timer.stage("persistence"):
+                db.add_all(records)
+                db.flush()
+                db.add_all([link_attempt(cell, record) for cell, record in attempt_pairs])
+                _finish_measurement_run(run, success_count, failure_count)
+                db.commit()
 
             # 결과가 생긴 직후 노출 갭/보완 액션을 갱신한다. 대시보드 GET 요청이 우연히
             # 액션 생성을 일으키는 구조에 의존하지 않고 다음 콘텐츠 생성이 최신 결과를 읽는다.
-            _refresh_exposure_actions_sync(hospital.id)
+            with sov_timer.stage("exposure_refresh"):
+                _refresh_exposure_actions_sync(hospital.id)
+            _record_sov_stage_timings(db, run, _operation_run_id_from_task(self), sov_timer)
             if failure_count > 0:
                 _record_weekly_sov_failure(
                     hospital,
@@ -2870,6 +3109,26 @@ def run_sov_for_hospital(self, hospital_id: str):
         raise self.retry(exc=exc, countdown=300)
 
 
+def _record_sov_stage_timings(
+    db, run: MeasurementRun, operation_run_id: uuid.UUID | None, timer
+) -> None:
+    """측정 run과 RUN_SOV 실행 기록에 단계별 소요 시간을 남긴다.
+
+    OperationRun은 version을 올리지 않는다 — 종료 신호의 version 비교가 이 갱신
+    때문에 어긋나면 실행이 RUNNING으로 남는다. 기존 요약(measurement_week)은 보존한다.
+    """
+    summary = timer.summary()
+    run.stage_timings = summary
+    operation_run = db.get(OperationRun, operation_run_id) if operation_run_id else None
+    if operation_run is not None:
+        operation_run.result_summary = {
+            **(operation_run.result_summary or {}),
+            "stage_timings": summary,
+        }
+    db.commit()
+    timer.log_summary(measurement_run_id=str(run.id), status=run.status)
+
+
 def _operation_run_id_from_task(task) -> uuid.UUID | None:
     headers = getattr(getattr(task, "request", None), "headers", None)
     if not isinstance(headers, Mapping):
@@ -4284,19 +4543,31 @@ def generate_monthly_report_for_hospital(
     return {"status": outcome, "year": anchor.year, "month": anchor.month}
 
 
-def _check_custom_domain_https(
-    client: httpx.Client,
+async def _check_custom_domain_https_async(
+    client: httpx.AsyncClient,
     domain: str,
     *,
     expected_hospital_id: uuid.UUID,
     expected_slug: str,
 ) -> tuple[bool, str]:
     try:
-        response = client.get(f"https://{domain}/.well-known/reputation-health")
+        response = await client.get(f"https://{domain}/.well-known/reputation-health")
     except httpx.TimeoutException:
         return False, "timeout"
     except httpx.HTTPError:
         return False, "tls_or_network_error"
+    return _evaluate_tenant_marker(
+        response, domain, expected_hospital_id=expected_hospital_id, expected_slug=expected_slug
+    )
+
+
+def _evaluate_tenant_marker(
+    response: httpx.Response,
+    domain: str,
+    *,
+    expected_hospital_id: uuid.UUID,
+    expected_slug: str,
+) -> tuple[bool, str]:
     if 300 <= response.status_code < 400:
         return False, "redirect_not_allowed"
     if response.status_code == 200:
@@ -4410,57 +4681,18 @@ def monitor_live_custom_domains():
             .all()
         )
 
-    new_failures = 0
-    recoveries = 0
-    state_unavailable = 0
-    refreshed = 0
-    timeout = httpx.Timeout(10.0, connect=5.0)
-    with httpx.Client(timeout=timeout, follow_redirects=False) as client:
-        for hospital in hospitals:
-            domain = (hospital.aeo_domain or "").strip().lower()
-            if not domain:
-                continue
-            healthy, reason = _check_custom_domain_https(
-                client,
-                domain,
-                expected_hospital_id=hospital.id,
-                expected_slug=hospital.slug,
-            )
-            # 배지·트래커가 읽는 도메인 상태를 이 관측으로 갱신한다. 인시던트 기록과
-            # 달리 여기서 실패해도 감시 자체는 계속돼야 하므로 별도 세션으로 격리한다.
-            refreshed += int(
-                _persist_live_domain_check(
-                    hospital.id,
-                    LiveDomainCheck(
-                        domain=domain,
-                        healthy=healthy,
-                        reason=reason,
-                        checked_at=datetime.now(timezone.utc),
-                        # 테넌트 마커 200은 DNS·TLS·라우팅이 모두 맞아야만 나온다.
-                        proves_certificate=True,
-                    ),
-                )
-            )
-            try:
-                outcome = _run_async(
-                    record_domain_health_check(
-                        hospital_id=hospital.id,
-                        canonical_host=domain,
-                        healthy=healthy,
-                        safe_reason=reason,
-                    )
-                )
-                new_failures += int(outcome.incident_opened)
-                recoveries += int(outcome.incident_recovered)
-            except Exception as exc:  # noqa: BLE001 — no fallback may invent incident truth.
-                state_unavailable += 1
-                logger.warning(
-                    "domain health persistence unavailable: code=%s",
-                    exc.__class__.__name__,
-                )
-
-            if not healthy:
-                logger.warning("custom domain marker rejected: reason=%s", reason)
+    targets = [
+        (hospital.id, hospital.slug, (hospital.aeo_domain or "").strip().lower())
+        for hospital in hospitals
+    ]
+    checks = _run_async(_check_live_domains([target for target in targets if target[2]]))
+    # 배지·트래커가 읽는 도메인 상태를 이 관측으로 갱신한다. 인시던트 기록과 달리
+    # 여기서 실패해도 감시 자체는 계속돼야 하므로 인시던트 기록과 세션을 분리한다.
+    refreshed = _persist_live_domain_checks(checks)
+    new_failures, recoveries, state_unavailable = _run_async(_record_domain_health(checks))
+    for _hospital_id, check in checks:
+        if not check.healthy:
+            logger.warning("custom domain marker rejected: reason=%s", check.reason)
     return {
         "checked": len(hospitals),
         "new_failures": new_failures,
@@ -4470,6 +4702,84 @@ def monitor_live_custom_domains():
     }
 
 
+# 도메인 하나가 타임아웃(최대 10초)에 걸려도 나머지 확인이 그 뒤에 줄 서지 않게 한다.
+# 전체 실행 시간은 도메인 수의 합이 아니라 가장 느린 도메인(과 이 상한)에 묶인다.
+LIVE_DOMAIN_CHECK_CONCURRENCY = 16
+
+
+async def _check_live_domains(
+    targets: list[tuple[uuid.UUID, str, str]],
+) -> list[tuple[uuid.UUID, LiveDomainCheck]]:
+    semaphore = asyncio.Semaphore(LIVE_DOMAIN_CHECK_CONCURRENCY)
+    timeout = httpx.Timeout(10.0, connect=5.0)
+
+    async def check(
+        client: httpx.AsyncClient, hospital_id: uuid.UUID, slug: str, domain: str
+    ) -> tuple[uuid.UUID, LiveDomainCheck]:
+        async with semaphore:
+            healthy, reason = await _check_custom_domain_https_async(
+                client, domain, expected_hospital_id=hospital_id, expected_slug=slug
+            )
+        return hospital_id, LiveDomainCheck(
+            domain=domain,
+            healthy=healthy,
+            reason=reason,
+            checked_at=datetime.now(timezone.utc),
+            # 테넌트 마커 200은 DNS·TLS·라우팅이 모두 맞아야만 나온다.
+            proves_certificate=True,
+        )
+
+    async with httpx.AsyncClient(timeout=timeout, follow_redirects=False) as client:
+        return list(
+            await asyncio.gather(
+                *(check(client, hospital_id, slug, domain) for hospital_id, slug, domain in targets)
+            )
+        )
+
+
+def _persist_live_domain_checks(checks: list[tuple[uuid.UUID, LiveDomainCheck]]) -> int:
+    """관측을 한 세션·한 커밋으로 반영한다. 실패하면 병원별 커밋으로 격리해 다시 한다."""
+    if not checks:
+        return 0
+    try:
+        with SyncSessionLocal() as db:
+            refreshed = 0
+            for hospital_id, check in checks:
+                hospital = db.get(Hospital, hospital_id)
+                if hospital is not None and apply_live_domain_check(hospital, check):
+                    refreshed += 1
+            db.commit()
+            return refreshed
+    except Exception as exc:  # noqa: BLE001 — 한 행의 실패가 전체 갱신을 막지 않게 격리한다.
+        logger.warning("batched domain status refresh failed: code=%s", exc.__class__.__name__)
+    return sum(
+        int(_persist_live_domain_check(hospital_id, check)) for hospital_id, check in checks
+    )
+
+
+async def _record_domain_health(
+    checks: list[tuple[uuid.UUID, LiveDomainCheck]],
+) -> tuple[int, int, int]:
+    new_failures = recoveries = state_unavailable = 0
+    for hospital_id, check in checks:
+        try:
+            outcome = await record_domain_health_check(
+                hospital_id=hospital_id,
+                canonical_host=check.domain,
+                healthy=check.healthy,
+                safe_reason=check.reason,
+            )
+            new_failures += int(outcome.incident_opened)
+            recoveries += int(outcome.incident_recovered)
+        except Exception as exc:  # noqa: BLE001 — no fallback may invent incident truth.
+            state_unavailable += 1
+            logger.warning(
+                "domain health persistence unavailable: code=%s",
+                exc.__class__.__name__,
+            )
+    return new_failures, recoveries, state_unavailable
+
+
 def _persist_live_domain_check(hospital_id: uuid.UUID, check: LiveDomainCheck) -> bool:
     try:
         with SyncSessionLocal() as db:
@@ -0,0 +1,472 @@
+"""핫 패스 벤치마크 — 주간 측정, 야간 생성, 우선순위 조정, 월간 리포트, Admin·공개 API.
+
+    cd backend
+    python -m benchmarks.seed_dataset                                 # 한 번만
+    python -m benchmarks.bench_hot_paths                              # 전체 시나리오
+    python -m benchmarks.bench_hot_paths --scenarios sov public_api --repeat 5
+    python -m benchmarks.bench_hot_paths --latency-scale 0            # 공급자 지연 없이
+    python -m benchmarks.bench_hot_paths --baseline benchmarks/results/baseline.json
+
+실제 태스크 함수와 FastAPI 앱을 그대로 돌리고, 공급자만 `fake_providers`로 바꾼다.
+마이그레이션된 로컬 Postgres와 Redis(docker compose)가 필요하고 `seed_dataset`으로 넣은
+`bench-` 병원을 대상으로 삼는다. 측정 중 Celery 메시지(이미지 생성 등)는 메모리 브로커로
+보내 버리고, 비용 상한 카운터는 끈다 — 둘 다 재려는 경로가 아니다.
+
+- `sov`: `run_sov_for_hospital`. 측정 계약이 병원·주 단위라 반복마다 이번 주에 아직
+  측정하지 않은 다른 병원을 쓴다. 병원이 모자라면 다시 시드한다.
+- `nightly`: 내일 날짜 DRAFT 슬롯을 `--nightly-batch`개 만들고 `nightly_content_generation`.
+  다른 개발 데이터에 같은 창의 미생성 슬롯이 있으면 그것도 함께 생성된다.
+- `priorities`: `adjust_query_priorities` 전체 순회. 우선순위를 실제로 바꾼다.
+- `monthly_report`: `_build_monthly_report_for_hospital(rebuild=True)` — PDF 렌더 포함.
+- `admin_api`·`public_api`: ASGI 전송으로 앱에 직접 요청한다(네트워크·uvicorn 제외).
+
+결과는 시나리오별 표본(ms)과 중앙값·p95, 결과 분포, 단계별 소요(측정·생성 실행이 남긴
+`stage_timings`)를 담은 JSON이다. `benchmarks/results/`에 저장하고 표준 출력에도 남긴다.
+`--baseline`을 주면 중앙값이 `--threshold`배를 넘은 시나리오를 표시하고 1로 끝난다.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+SCENARIOS = ("sov", "nightly", "priorities", "monthly_report", "admin_api", "public_api")
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+# ── 표본 요약 ─────────────────────────────────────────────────
+
+
+def summarize(samples: list[float], outcomes: Counter, **extra: Any) -> dict[str, Any]:
+    ordered = sorted(samples)
+    result: dict[str, Any] = {"samples": len(samples), "outcomes": dict(outcomes), **extra}
+    if ordered:
+        result.update(
+            median_ms=round(statistics.median(ordered), 1),
+            p95_ms=round(
+                statistics.quantiles(ordered, n=20)[-1] if len(ordered) > 1 else ordered[0], 1
+            ),
+            min_ms=round(ordered[0], 1),
+            max_ms=round(ordered[-1], 1),
+            samples_ms=[round(sample, 1) for sample in samples],
+        )
+    return result
+
+
+def measure(
+    targets: list[Any], fn: Callable[[Any], str], **extra: Any
+) -> dict[str, Any]:
+    samples: list[float] = []
+    outcomes: Counter = Counter()
+    for target in targets:
+        started = time.perf_counter()
+        try:
+            outcome = fn(target)
+        except Exception as exc:  # noqa: BLE001 - 실패도 결과다. 기록하고 다음 표본으로.
+            outcome = f"error:{type(exc).__name__}"
+        samples.append((time.perf_counter() - started) * 1000)
+        outcomes[outcome] += 1
+    return summarize(samples, outcomes, **extra)
+
+
+async def measure_async(
+    repeat: int, fn: Callable[[], Awaitable[str]]
+) -> dict[str, Any]:
+    samples: list[float] = []
+    outcomes: Counter = Counter()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        try:
+            outcome = await fn()
+        except Exception as exc:  # noqa: BLE001
+            outcome = f"error:{type(exc).__name__}"
+        samples.append((time.perf_counter() - started) * 1000)
+        outcomes[outcome] += 1
+    return summarize(samples, outcomes)
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[dict]:
+    """기준 결과 대비 중앙값이 `threshold`배를 넘은 시나리오 목록."""
+    regressions = []
+    for name, result in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name, {}).get("median_ms")
+        after = result.get("median_ms")
+        if not before or after is None:
+            continue
+        ratio = after / before
+        result["baseline_median_ms"] = before
+        result["ratio"] = round(ratio, 3)
+        if ratio > threshold:
+            regressions.append({"scenario": name, "baseline_ms": before, "median_ms": after})
+    return regressions
+
+
+# ── 환경 ───────────────────────────────────────────────────────
+
+
+def _prepare_environment(latency_scale: float):
+    from app.core.config import settings
+
+    if settings.APP_ENV == "production":
+        raise SystemExit("refusing to run benchmarks with APP_ENV=production")
+    # 공급자는 전부 가짜다. SDK 클라이언트가 import 시점에 키를 요구하므로, 측정 엔진을
+    # 불러오기 전에 비어 있는 키만 형식상 값으로 채운다(Gemini 키는 측정 플랫폼 구성도 정한다).
+    for name in ("OPENAI_API_KEY", "GEMINI_API_KEY", "ANTHROPIC_API_KEY"):
+        if not getattr(settings, name):
+            setattr(settings, name, "benchmark")
+    settings.COST_GUARD_ENABLED = False
+
+    from app.core.celery_app import celery_app
+    from app.core.rate_limit import limiter
+    from benchmarks.fake_providers import FakeProviders, ProviderLatency
+    from benchmarks.seed_dataset import mentioned_names
+
+    celery_app.conf.broker_url = "memory://"
+    limiter.enabled = False
+
+    providers = FakeProviders(
+        latency=ProviderLatency().scaled(latency_scale), mentions=mentioned_names
+    )
+    providers.install()
+    return settings, providers
+
+
+def _bench_hospitals(db, limit: int | None = None) -> list:
+    from sqlalchemy import select
+
+    from app.models.hospital import Hospital
+    from benchmarks.seed_dataset import SLUG_PREFIX
+
+    stmt = select(Hospital).where(Hospital.slug.startswith(SLUG_PREFIX)).order_by(Hospital.slug)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return list(db.execute(stmt).scalars())
+
+
+# ── 시나리오 ───────────────────────────────────────────────────
+
+
+def bench_sov(repeat: int, measured: list[uuid.UUID]) -> dict[str, Any]:
+    from sqlalchemy import exists, or_, select
+
+    from app.core.database import SyncSessionLocal
+    from app.core.stage_timing import StageTimer
+    from app.models.hospital import Hospital
+    from app.models.sov import MeasurementRun
+    from app.workers.tasks import run_sov_for_hospital
+    from benchmarks.seed_dataset import SLUG_PREFIX
+
+    # 시드가 넣은 과거 실행(run_label bench-week-*)이 아닌 실행이 최근 7일에 있으면 이번
+    # 주에 이미 측정한 병원이다. 같은 병원을 다시 돌리면 측정 없이 끝나 숫자가 무의미하다.
+    since = datetime.now(timezone.utc) - timedelta(days=7)
+    with SyncSessionLocal() as db:
+        hospital_ids = list(
+            db.execute(
+                select(Hospital.id)
+                .where(
+                    Hospital.slug.startswith(SLUG_PREFIX),
+                    ~exists().where(
+                        MeasurementRun.hospital_id == Hospital.id,
+                        MeasurementRun.created_at >= since,
+                        or_(
+                            MeasurementRun.run_label.is_(None),
+                            MeasurementRun.run_label.not_like("bench-week-%"),
+                        ),
+                    ),
+                )
+                .order_by(Hospital.slug)
+                .limit(repeat)
+            ).scalars()
+        )
+    if len(hospital_ids) < repeat:
+        print(
+            f"sov: only {len(hospital_ids)} unmeasured bench hospitals this week; reseed for more",
+            file=sys.stderr,
+        )
+    timer = StageTimer("benchmark_sov")
+
+    def run(hospital_id: uuid.UUID) -> str:
+        result = run_sov_for_hospital.apply(args=[str(hospital_id)])
+        with SyncSessionLocal() as db:
+            stage_timings = db.execute(
+                select(MeasurementRun.stage_timings)
+                .where(MeasurementRun.hospital_id == hospital_id)
+                .order_by(MeasurementRun.created_at.desc())
+                .limit(1)
+            ).scalar_one_or_none()
+        timer.merge(stage_timings or {})
+        if result.state == "SUCCESS":
+            measured.append(hospital_id)
+            return "SUCCESS"
+        return f"{result.state}:{type(result.result).__name__}"
+
+    summary = measure(hospital_ids, run)
+    summary["stage_timings"] = timer.summary()
+    return summary
+
+
+def bench_nightly(repeat: int, batch_size: int) -> dict[str, Any]:
+    import arrow
+    from sqlalchemy import delete, select
+
+    from app.core.database import SyncSessionLocal
+    from app.core.stage_timing import StageTimer
+    from app.models.content import ContentItem, ContentSchedule, ContentStatus, ContentType
+    from app.models.operations import OperationRun
+    from app.workers.tasks import nightly_content_generation
+
+    tomorrow = arrow.now("Asia/Seoul").shift(days=1).date()
+    timer = StageTimer("benchmark_nightly")
+    per_item: list[float] = []
+
+    def prepare() -> list[uuid.UUID]:
+        """내일 날짜 빈 슬롯을 병원당 1개씩 새로 만든다. 직전 반복의 결과는 지운다."""
+        with SyncSessionLocal() as db:
+            hospitals = _bench_hospitals(db, batch_size)
+            hospital_ids = [hospital.id for hospital in hospitals]
+            db.execute(
+                delete(ContentItem).where(
+                    ContentItem.hospital_id.in_(hospital_ids),
+                    ContentItem.scheduled_date == tomorrow,
+                )
+            )
+            schedules = dict(
+                db.execute(
+                    select(ContentSchedule.hospital_id, ContentSchedule.id).where(
+                        ContentSchedule.hospital_id.in_(hospital_ids)
+                    )
+                ).all()
+            )
+            items = [
+                ContentItem(
+                    hospital_id=hospital_id,
+                    schedule_id=schedules[hospital_id],
+                    content_type=ContentType.DISEASE,
+                    sequence_no=1,
+                    total_count=1,
+                    scheduled_date=tomorrow,
+                    status=ContentStatus.DRAFT,
+                )
+                for hospital_id in hospital_ids
+                if hospital_id in schedules
+            ]
+            db.add_all(items)
+            db.commit()
+            return [item.id for item in items]
+
+    def run(_index: int) -> str:
+        item_ids = prepare()
+        task_id = f"benchmark-{uuid.uuid4()}"
+        started = time.perf_counter()
+        result = nightly_content_generation.apply(task_id=task_id)
+        elapsed = time.perf_counter() - started
+        with SyncSessionLocal() as db:
+            generated = db.execute(
+                select(ContentItem.id).where(
+                    ContentItem.id.in_(item_ids), ContentItem.body.is_not(None)
+                )
+            ).all()
+            summary = db.execute(
+                select(OperationRun.result_summary).where(
+                    OperationRun.idempotency_key == f"nightly:{task_id}"
+                )
+            ).scalar_one_or_none()
+        timer.merge((summary or {}).get("stage_timings") or {})
+        per_item.append(elapsed * 1000 / max(len(item_ids), 1))
+        return f"{result.state}:generated {len(generated)}/{len(item_ids)}"
+
+    summary = measure(list(range(repeat)), run, batch_size=batch_size)
+    if per_item:
+        summary["per_item_median_ms"] = round(statistics.median(per_item), 1)
+    summary["stage_timings"] = timer.summary()
+    return summary
+
+
+def bench_priorities(repeat: int) -> dict[str, Any]:
+    from app.workers.tasks import adjust_query_priorities
+
+    def run(_index: int) -> str:
+        return adjust_query_priorities.apply().state
+
+    return measure(list(range(repeat)), run)
+
+
+def bench_monthly_report(repeat: int, measured: list[uuid.UUID]) -> dict[str, Any]:
+    import arrow
+
+    from app.core.database import SyncSessionLocal
+    from app.models.hospital import Hospital
+    from app.workers.tasks import _build_monthly_report_for_hospital
+
+    # 이번 달 측정 계약이 있는 병원(방금 `sov`가 측정한 병원)이 실제 리포트 경로를 탄다.
+    with SyncSessionLocal() as db:
+        hospital_ids = measured[:repeat] or [h.id for h in _bench_hospitals(db, repeat)]
+
+    def run(hospital_id: uuid.UUID) -> str:
+        with SyncSessionLocal() as db:
+            hospital = db.get(Hospital, hospital_id)
+            return _build_monthly_report_for_hospital(
+                db,
+                hospital,
+                arrow.now("Asia/Seoul"),
+                rebuild=True,
+                correlation_key=f"benchmark:{uuid.uuid4()}",
+            )
+
+    return measure(hospital_ids, run)
+
+
+def bench_api(repeat: int, settings, *, admin: bool) -> dict[str, Any]:
+    import httpx
+    from sqlalchemy import select
+
+    from app.core.database import SyncSessionLocal
+    from app.main import app
+    from app.models.content import ContentItem, ContentStatus
+    from app.workers.tasks import _run_async
+
+    with SyncSessionLocal() as db:
+        hospitals = _bench_hospitals(db, 1)
+        if not hospitals:
+            raise SystemExit("no bench hospitals; run `python -m benchmarks.seed_dataset` first")
+        hospital = hospitals[0]
+        content_id = db.execute(
+            select(ContentItem.id)
+            .where(
+                ContentItem.hospital_id == hospital.id,
+                ContentItem.status == ContentStatus.PUBLISHED,
+            )
+            .order_by(ContentItem.published_at.desc())
+            .limit(1)
+        ).scalar_one()
+    if admin:
+        base = f"/api/v1/admin/hospitals/{hospital.id}/sov"
+        paths = {
+            "admin.sov_trend": f"{base}/trend",
+            "admin.sov_queries": f"{base}/queries",
+            "admin.sov_measurement_runs": f"{base}/measurement-runs",
+        }
+        headers = {"X-Admin-Key": settings.ADMIN_SECRET_KEY}
+    else:
+        base = f"/api/v1/public/hospitals/{hospital.slug}"
+        paths = {
+            "public.hospitals": "/api/v1/public/hospitals",
+            "public.hospital": base,
+            "public.contents": f"{base}/contents",
+            "public.content": f"{base}/contents/{content_id}",
+        }
+        headers = {}
+
+    async def run_all() -> dict[str, Any]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark", headers=headers
+        ) as client:
+            results = {}
+            for name, path in paths.items():
+
+                async def request(path: str = path) -> str:
+                    return str((await client.get(path)).status_code)
+
+                await request()  # 첫 요청의 연결·캐시 준비는 표본에서 뺀다.
+                results[name] = await measure_async(repeat, request)
+            return results
+
+    # 태스크와 같은 스레드 루프를 써야 API 엔진의 커넥션 풀이 한 루프에만 묶인다.
+    return _run_async(run_all())
+
+
+# ── 실행 ───────────────────────────────────────────────────────
+
+
+def _git_sha() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    settings, providers = _prepare_environment(args.latency_scale)
+    from benchmarks.seed_dataset import dataset_counts
+
+    started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    measured: list[uuid.UUID] = []
+    scenarios: dict[str, Any] = {}
+    try:
+        for name in args.scenarios:
+            print(f"running {name}", file=sys.stderr)
+            if name == "sov":
+                scenarios[name] = bench_sov(args.repeat, measured)
+            elif name == "nightly":
+                scenarios[name] = bench_nightly(args.repeat, args.nightly_batch)
+            elif name == "priorities":
+                scenarios[name] = bench_priorities(args.repeat)
+            elif name == "monthly_report":
+                scenarios[name] = bench_monthly_report(args.repeat, measured)
+            else:
+                scenarios.update(bench_api(args.repeat, settings, admin=name == "admin_api"))
+    finally:
+        providers.restore()
+    return {
+        "git_sha": _git_sha(),
+        "started_at": started_at,
+        "dataset": dataset_counts(),
+        "provider_latency_s": vars(providers.latency),
+        "provider_calls": providers.calls,
+        "repeat": args.repeat,
+        "scenarios": scenarios,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--nightly-batch", type=int, default=10)
+    parser.add_argument(
+        "--latency-scale",
+        type=float,
+        default=1.0,
+        help="가짜 공급자 지연 배율 (0이면 우리 코드 비용만 남는다)",
+    )
+    parser.add_argument("--out", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args(argv)
+
+    result = run(args)
+    regressions = []
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(result, baseline, args.threshold)
+        result["baseline"] = {"file": str(args.baseline), "git_sha": baseline.get("git_sha")}
+        result["regressions"] = regressions
+
+    out = args.out or RESULTS_DIR / (
+        f"{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}-{result['git_sha']}.json"
+    )
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(result, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(f"wrote {out}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,180 @@
+"""의료광고 금지 표현 검사 벤치마크 — 규칙별 search 대비 단일 훑기 스캐너.
+
+    cd backend
+    python -m benchmarks.bench_medical_filter                # 내장 표본 본문
+    python -m benchmarks.bench_medical_filter --from-db 200  # 최근 생성 본문 200건
+    python -m benchmarks.bench_medical_filter --corpus bodies.jsonl
+
+`--corpus`는 한 줄에 `{"body": "..."}` 하나(JSONL) 또는 빈 줄 두 개로 나뉜 평문이다.
+규칙 수 배율(`--rule-multipliers`)은 같은 규칙을 이름만 바꿔 복제해, 규칙이 늘 때 두
+방식의 비용이 어떻게 변하는지 보여 준다. 결과는 표준 출력에 JSON 한 덩어리로 남긴다.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from app.utils.medical_filter import (
+    FORBIDDEN_FIRST_CHARS,
+    FORBIDDEN_PATTERNS,
+    _ForbiddenScanner,
+    check_forbidden,
+    check_forbidden_markdown,
+    markdown_visible_text,
+    normalize_for_check,
+    parse_markdown_visible,
+)
+
+_SAMPLE_PARAGRAPHS = (
+    "어깨 통증은 회전근개 힘줄의 미세 손상이나 석회성 건염, 유착성 관절낭염 등 여러 원인으로 "
+    "생길 수 있습니다. 통증이 밤에 심해지거나 팔을 들어 올리기 어렵다면 진료를 받아 원인을 "
+    "확인하는 것이 좋습니다.",
+    "진단은 문진과 이학적 검사로 시작하며 필요하면 **초음파**나 MRI로 힘줄 상태를 확인합니다. "
+    "검사 결과에 따라 치료 방향이 달라지므로 증상이 언제, 어떤 동작에서 심해지는지 기록해 "
+    "오시면 도움이 됩니다.",
+    "치료는 약물, 주사, 체외충격파, 운동치료를 증상과 경과에 맞춰 조합합니다. 개인에 따라 "
+    "회복 기간과 결과가 다를 수 있으며, 시술 후에는 붓기나 일시적인 통증이 있을 수 있습니다.",
+    "- 통증이 2주 이상 계속되는 경우\n- 야간 통증으로 잠을 설치는 경우\n"
+    "- 팔을 옆으로 들기 어려운 경우",
+    "대장내시경은 50세 이상이거나 가족력이 있는 경우 정기적으로 받는 것이 권고됩니다. "
+    "검사 전날에는 장정결제를 복용하고 식이 조절을 해야 정확한 관찰이 가능합니다.",
+    "[질병관리청 국가건강정보포털](https://health.kdca.go.kr/)에서 관련 정보를 더 확인할 수 "
+    "있습니다. 진료 예약은 전화 또는 온라인으로 가능합니다.",
+)
+
+
+def sample_bodies(count: int = 40) -> list[str]:
+    """운영 본문과 비슷한 구성(소제목·목록·강조·링크)의 1~2천 자 마크다운 본문."""
+    bodies = []
+    for index in range(count):
+        sections = []
+        for section in range(3 + index % 3):
+            paragraphs = [
+                _SAMPLE_PARAGRAPHS[(index + section + offset) % len(_SAMPLE_PARAGRAPHS)]
+                for offset in range(2 + (index + section) % 3)
+            ]
+            sections.append(f"## 섹션 {section + 1}\n\n" + "\n\n".join(paragraphs))
+        bodies.append("\n\n".join(sections))
+    return bodies
+
+
+def load_corpus(path: Path) -> list[str]:
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".jsonl":
+        return [
+            json.loads(line)["body"]
+            for line in text.splitlines()
+            if line.strip()
+        ]
+    return [chunk for chunk in text.split("\n\n\n") if chunk.strip()]
+
+
+def load_db_bodies(limit: int) -> list[str]:
+    from sqlalchemy import select
+
+    from app.core.database import SyncSessionLocal
+    from app.models.content import ContentItem
+
+    with SyncSessionLocal() as db:
+        rows = db.execute(
+            select(ContentItem.body)
+            .where(ContentItem.body.is_not(None))
+            .order_by(ContentItem.updated_at.desc())
+            .limit(limit)
+        )
+        return [body for (body,) in rows if body]
+
+
+def _per_rule_search(patterns, text: str) -> list[str]:
+    normalized = normalize_for_check(text)
+    return [label for label, pattern in patterns.items() if pattern.search(normalized)]
+
+
+def _time_per_body(fn, bodies: list[str], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for body in bodies:
+            fn(body)
+        samples.append((time.perf_counter() - started) / len(bodies))
+    return statistics.median(samples) * 1e6
+
+
+def run(bodies: list[str], *, repeat: int, rule_multipliers: list[int]) -> dict:
+    visible = [markdown_visible_text(body) for body in bodies]
+    for text in visible:
+        assert check_forbidden(text) == _per_rule_search(FORBIDDEN_PATTERNS, text)
+
+    scaling = []
+    for multiplier in rule_multipliers:
+        patterns = {
+            f"{label}#{copy}": pattern
+            for copy in range(multiplier)
+            for label, pattern in FORBIDDEN_PATTERNS.items()
+        }
+        first_chars = {
+            f"{label}#{copy}": first
+            for copy in range(multiplier)
+            for label, first in FORBIDDEN_FIRST_CHARS.items()
+        }
+        scanner = _ForbiddenScanner(patterns, first_chars)
+        scaling.append(
+            {
+                "rules": len(patterns),
+                "per_rule_search_us": round(
+                    _time_per_body(lambda t, p=patterns: _per_rule_search(p, t), visible, repeat),
+                    1,
+                ),
+                "scanner_us": round(
+                    _time_per_body(
+                        lambda t, s=scanner: s.labels(normalize_for_check(t)), visible, repeat
+                    ),
+                    1,
+                ),
+            }
+        )
+    return {
+        "bodies": len(bodies),
+        "median_body_chars": int(statistics.median(len(text) for text in visible)),
+        # 캐시를 거치지 않은 해석 한 번 — 본문이 처음 검사될 때의 비용.
+        "markdown_parse_cold_us": round(
+            _time_per_body(parse_markdown_visible.__wrapped__, bodies, repeat), 1
+        ),
+        # 같은 본문을 다시 검사할 때(정제 재검사·발행 게이트) — 해석은 캐시에서 온다.
+        "check_forbidden_markdown_us": round(
+            _time_per_body(check_forbidden_markdown, bodies, repeat),
+            1,
+        ),
+        "scaling": scaling,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--corpus", type=Path)
+    source.add_argument("--from-db", type=int, metavar="N")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--rule-multipliers", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args(argv)
+
+    if args.corpus:
+        bodies = load_corpus(args.corpus)
+    elif args.from_db:
+        bodies = load_db_bodies(args.from_db)
+    else:
+        bodies = sample_bodies()
+    if not bodies:
+        print("no bodies to benchmark", file=sys.stderr)
+        return 1
+    result = run(bodies, repeat=args.repeat, rule_multipliers=args.rule_multipliers)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,297 @@
+"""벤치마크용 결정적 가짜 공급자 — OpenAI·Gemini·Anthropic 클라이언트 자리를 채운다.
+
+실제 SDK 대신 같은 모양의 응답을 돌려주고, 호출마다 설정한 지연만큼 잠든다. 그래서
+벤치마크 숫자는 "공급자가 느린 만큼"을 고정한 채 우리 코드(동시성 상한·DB·판정·검증)의
+비용만 움직인다. 같은 입력에는 언제나 같은 응답이 나온다 — 실행 사이 비교가 가능하려면
+언급률·생성 성공률 같은 결과도 흔들리면 안 된다.
+
+교체 지점은 운영 코드가 공급자를 찾는 모듈 전역 하나씩이다.
+
+- `sov_engine.openai_query_client` — 측정 답변(Responses web search / chat.completions)
+- `sov_engine.openai_client` — 자사·경쟁사 언급 판정(JSON)
+- `sov_engine._gemini_client` — Gemini 측정 답변(동기 SDK, 스레드에서 호출)
+- `anthropic_client.get_async_client` — 본문 생성과 독립 AI 검수(`create_message` 경유)
+
+`install()`이 바꾸고 `restore()`가 되돌린다. 운영 프로세스에서 부를 일은 없다.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import re
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+
+from benchmarks.bench_medical_filter import sample_bodies
+
+# 생성 본문이 인용하는 참고 자료 — 인용 가능 화이트리스트에 있는 공공 문서여야 GEO 검증을 통과한다.
+_REFERENCE_URL = (
+    "https://health.kdca.go.kr/healthinfo/biz/health/gnrlzHealthInfo/gnrlzHealthInfoView.do"
+)
+_SOURCE_URLS = (
+    "https://health.kdca.go.kr/",
+    "https://www.hira.or.kr/",
+    "https://map.naver.com/",
+)
+_ANSWER_FILLER = (
+    "증상이 2주 이상 이어지면 진료를 받아 원인을 확인하는 것이 좋습니다. "
+    "병원을 고를 때는 접근성, 진료 시간, 검사 장비, 설명 방식을 함께 보세요."
+)
+_BODIES = sample_bodies(40)
+
+_PARSE_HOSPITAL_RE = re.compile(r'다음 AI 답변이 "(?P<name>.+?)"\(소재 지역')
+_COMPETITOR_LIST_RE = re.compile(r"\[분석 대상 병원 목록\]\n(?P<names>.*?)\n\n\[답변\]", re.S)
+_RESPONSE_RE = re.compile(r"\[답변\]\n(?P<response>.*?)\n\n반드시", re.S)
+_PROFILE_LINE_RE = {
+    key: re.compile(rf"^{label}:\s*(?P<value>.+)$", re.M)
+    for key, label in (("name", "병원명"), ("director", "원장명"), ("region", "지역"))
+}
+
+
+@dataclass
+class ProviderLatency:
+    """공급자별 1회 호출 지연(초). 기본값은 운영 실측 p50을 1/10로 줄인 값이다."""
+
+    openai_answer: float = 1.5
+    openai_parse: float = 0.1
+    gemini_answer: float = 0.8
+    anthropic_generate: float = 3.0
+    anthropic_review: float = 0.5
+
+    def scaled(self, factor: float) -> ProviderLatency:
+        return ProviderLatency(**{name: value * factor for name, value in vars(self).items()})
+
+
+@dataclass
+class FakeProviders:
+    """가짜 클라이언트 묶음과 호출 수.
+
+    `mentions`는 질의 문장을 받아 답변에 넣을 병원명 목록을 돌려준다. 시드가 질의에
+    심어 둔 표식으로 어느 병원이 언급될지 결정하므로 언급률도 실행마다 같다.
+    """
+
+    latency: ProviderLatency = field(default_factory=ProviderLatency)
+    mentions: Callable[[str], list[str]] = lambda _query: []
+    calls: dict[str, int] = field(default_factory=dict)
+    _originals: list[tuple[Any, str, Any]] = field(default_factory=list)
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    # ── SoV 답변 ────────────────────────────────────────────────
+    def answer_text(self, query: str) -> str:
+        names = self.mentions(query)
+        lines = [f"'{query}'에 대해 확인할 수 있는 선택지는 다음과 같습니다."]
+        lines += [f"{rank}. {name} — 진료 정보를 공개하고 있습니다." for rank, name in enumerate(names, 1)]
+        lines.append(_ANSWER_FILLER)
+        return "\n".join(lines)
+
+    # ── 판정 ───────────────────────────────────────────────────
+    @staticmethod
+    def judge(prompt: str) -> dict[str, Any]:
+        response_match = _RESPONSE_RE.search(prompt)
+        response = response_match.group("response") if response_match else ""
+        competitors = _COMPETITOR_LIST_RE.search(prompt)
+        if competitors:
+            names = [
+                line.removeprefix("- ").strip()
+                for line in competitors.group("names").splitlines()
+                if line.strip()
+            ]
+            return {
+                "competitors": [
+                    {
+                        "name": name,
+                        "is_mentioned": name in response,
+                        "mention_rank": _rank(response, name),
+                    }
+                    for name in names
+                ]
+            }
+        hospital = _PARSE_HOSPITAL_RE.search(prompt)
+        name = hospital.group("name") if hospital else ""
+        if name and name in response:
+            return {
+                "verdict": "MATCHED",
+                "matched_text": name,
+                "mention_rank": _rank(response, name),
+                "sentiment": "neutral",
+                "mention_context": next(
+                    (line for line in response.splitlines() if name in line), None
+                ),
+            }
+        return {
+            "verdict": "NOT_MATCHED",
+            "matched_text": None,
+            "mention_rank": None,
+            "sentiment": None,
+            "mention_context": None,
+        }
+
+    # ── 생성 ───────────────────────────────────────────────────
+    @staticmethod
+    def generated_content(user_message: str) -> dict[str, Any]:
+        profile = {
+            key: (match.group("value").strip() if (match := pattern.search(user_message)) else "")
+            for key, pattern in _PROFILE_LINE_RE.items()
+        }
+        region = profile["region"].split(",")[0].strip()
+        digest = hashlib.sha256(user_message.encode("utf-8")).hexdigest()
+        seed = int(digest[:8], 16)
+        intro = (
+            f"{region} {profile['name']} {profile['director']} 원장이 진료 전에 자주 받는 질문을 "
+            "정리했습니다. 아래 내용은 일반적인 안내이며 개인의 상태에 따라 달라질 수 있습니다."
+        )
+        body = "\n\n".join(
+            [intro] + [_BODIES[(seed + offset) % len(_BODIES)] for offset in range(3)]
+        )
+        return {
+            # 제목 중복 검사(유사도 색인)를 통과하도록 입력마다 다른 꼬리표를 단다.
+            "title": f"{region} 진료 전에 확인할 점 {digest[:6]}",
+            "body": body,
+            "meta_description": (
+                f"{profile['name']}에서 진료 전에 확인하면 좋은 증상 기록, 검사 과정, 치료 선택 "
+                "기준을 정리했습니다. 개인에 따라 경과가 다를 수 있어 진료로 확인하세요."
+            ),
+            "references": [
+                {"title": "국가건강정보포털 건강정보", "url": _REFERENCE_URL},
+            ],
+            "faq_question": None,
+            "faq_answer_summary": None,
+        }
+
+    # ── 설치·복원 ───────────────────────────────────────────────
+    def install(self) -> None:
+        from app.services import anthropic_client, content_ai_review, content_engine, sov_engine
+
+        generation_prompt = content_engine.SYSTEM_PROMPT
+        review_prompt = content_ai_review._SYSTEM_PROMPT
+        providers = self
+
+        async def answer_responses(**kwargs: Any) -> SimpleNamespace:
+            providers._count("openai_answer")
+            await asyncio.sleep(providers.latency.openai_answer)
+            return _openai_response(providers.answer_text(str(kwargs.get("input", ""))), kwargs)
+
+        async def answer_or_judge(**kwargs: Any) -> SimpleNamespace:
+            messages = kwargs.get("messages") or []
+            prompt = str(messages[-1]["content"]) if messages else ""
+            if kwargs.get("response_format"):
+                providers._count("openai_parse")
+                await asyncio.sleep(providers.latency.openai_parse)
+                content = json.dumps(providers.judge(prompt), ensure_ascii=False)
+            else:
+                providers._count("openai_answer")
+                await asyncio.sleep(providers.latency.openai_answer)
+                content = providers.answer_text(prompt)
+            return _chat_completion(content, kwargs)
+
+        def gemini_generate(**kwargs: Any) -> SimpleNamespace:
+            # 운영 코드가 asyncio.to_thread로 부르는 동기 SDK 자리다 — 잠도 동기로 잔다.
+            providers._count("gemini_answer")
+            time.sleep(providers.latency.gemini_answer)
+            return _gemini_response(providers.answer_text(str(kwargs.get("contents", ""))))
+
+        async def create_message(**kwargs: Any) -> SimpleNamespace:
+            system = kwargs.get("system")
+            messages = kwargs.get("messages") or []
+            user_message = str(messages[-1]["content"]) if messages else ""
+            if system == review_prompt:
+                providers._count("anthropic_review")
+                await asyncio.sleep(providers.latency.anthropic_review)
+                payload = {
+                    "decision": "PASS",
+                    "confidence": 0.95,
+                    "findings": [],
+                    "summary": "벤치마크 고정 검수 결과",
+                }
+            elif system == generation_prompt:
+                providers._count("anthropic_generate")
+                await asyncio.sleep(providers.latency.anthropic_generate)
+                payload = providers.generated_content(user_message)
+            else:
+                raise RuntimeError("benchmark fake has no response for this Anthropic prompt")
+            return SimpleNamespace(
+                content=[SimpleNamespace(type="text", text=json.dumps(payload, ensure_ascii=False))],
+                model=kwargs.get("model"),
+                stop_reason="end_turn",
+                usage=SimpleNamespace(input_tokens=len(user_message), output_tokens=2000),
+            )
+
+        openai_answer_client = SimpleNamespace(
+            responses=SimpleNamespace(create=answer_responses),
+            chat=SimpleNamespace(completions=SimpleNamespace(create=answer_or_judge)),
+        )
+        openai_judge_client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=answer_or_judge)),
+        )
+        gemini_client = SimpleNamespace(models=SimpleNamespace(generate_content=gemini_generate))
+        anthropic_fake = SimpleNamespace(messages=SimpleNamespace(create=create_message))
+
+        self._replace(sov_engine, "openai_query_client", openai_answer_client)
+        self._replace(sov_engine, "openai_client", openai_judge_client)
+        self._replace(sov_engine, "_gemini_client", gemini_client)
+        self._replace(anthropic_client, "get_async_client", lambda: anthropic_fake)
+
+    def restore(self) -> None:
+        while self._originals:
+            target, name, original = self._originals.pop()
+            setattr(target, name, original)
+
+    def _replace(self, target: Any, name: str, value: Any) -> None:
+        self._originals.append((target, name, getattr(target, name)))
+        setattr(target, name, value)
+
+
+def _rank(response: str, name: str) -> int | None:
+    for line in response.splitlines():
+        head, _, rest = line.partition(". ")
+        if head.isdigit() and name in rest:
+            return int(head)
+    return None
+
+
+def _openai_response(text: str, request: dict[str, Any]) -> SimpleNamespace:
+    annotations = [SimpleNamespace(type="url_citation", url=url) for url in _SOURCE_URLS[:2]]
+    return SimpleNamespace(
+        output_text=text,
+        output=[
+            SimpleNamespace(type="web_search_call", action=SimpleNamespace(sources=[])),
+            SimpleNamespace(
+                type="message",
+                content=[SimpleNamespace(type="output_text", text=text, annotations=annotations)],
+            ),
+        ],
+        usage=SimpleNamespace(input_tokens=120, output_tokens=len(text)),
+        model=request.get("model"),
+    )
+
+
+def _chat_completion(content: str, request: dict[str, Any]) -> SimpleNamespace:
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(prompt_tokens=120, completion_tokens=len(content)),
+        model=request.get("model"),
+    )
+
+
+def _gemini_response(text: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        text=text,
+        model_version="benchmark-gemini",
+        candidates=[
+            SimpleNamespace(
+                grounding_metadata=SimpleNamespace(
+                    grounding_chunks=[
+                        SimpleNamespace(web=SimpleNamespace(uri=_SOURCE_URLS[2])),
+                    ],
+                    web_search_queries=["benchmark"],
+                )
+            )
+        ],
+        usage_metadata=SimpleNamespace(prompt_token_count=120, candidates_token_count=len(text)),
+    )
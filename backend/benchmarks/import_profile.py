@@ -0,0 +1,141 @@
+"""기동 import 프로파일 — API와 큐별 워커가 첫 요청·첫 태스크 전에 내는 import 비용.
+
+    cd backend
+    python -m benchmarks.import_profile                          # api + 기본 워커 구성
+    python -m benchmarks.import_profile api worker:leadgen --repeat 5 --top 30
+    python -m benchmarks.import_profile --check                  # 무거운 SDK가 기동에 끼면 1
+
+Cloud Run은 0에서 스케일할 때 이 시간이 그대로 첫 요청 지연이 된다. 대상마다 새
+인터프리터를 `-X importtime`으로 띄워 총 시간(중앙값)과 누적 시간이 큰 모듈을 보여준다.
+
+- `api`: `import app.main` — 라우터 전체와 그 import 체인.
+- `worker:<큐,...>`: `CELERY_WORKER_QUEUES`를 그 값으로 두고 `app.core.celery_app`과
+  include 모듈을 import한다 — 워커가 부팅 때 하는 일과 같다. `worker`만 쓰면 전체 큐.
+
+공급자 SDK(anthropic·openai·google-genai), GCP Certificate Manager, PDF 파서·렌더러는
+실제로 부를 때 import하도록 되어 있다. `--check`는 그중 하나라도 기동 import에 다시
+끼어들면 실패한다.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_TARGETS = ("api", "worker", "worker:leadgen,certificates", "worker:images")
+# 기동 import에 있으면 안 되는 모듈 — 각각 import만 0.1~2초.
+DEFERRED_MODULES = (
+    "anthropic",
+    "openai",
+    "google.genai",
+    "google.cloud.certificate_manager_v1",
+    "pypdf",
+    "weasyprint",
+)
+
+_API_BOOT = "import app.main"
+_WORKER_BOOT = (
+    "import importlib\n"
+    "from app.core.celery_app import celery_app\n"
+    "for module in celery_app.conf.include:\n"
+    "    importlib.import_module(module)\n"
+)
+
+
+def _boot(target: str) -> tuple[str, dict[str, str]]:
+    env = dict(os.environ)
+    # 설정 검증을 통과할 최소 값 — 실제 값이 있으면 그대로 쓴다.
+    env.setdefault("APP_ENV", "development")
+    env.setdefault("ADMIN_SECRET_KEY", "import-profile")
+    if target == "api":
+        return _API_BOOT, env
+    kind, _, queues = target.partition(":")
+    if kind != "worker":
+        raise SystemExit(f"알 수 없는 대상: {target} (api 또는 worker[:큐,...])")
+    env["CELERY_WORKER_QUEUES"] = queues
+    return _WORKER_BOOT, env
+
+
+def _parse_importtime(stderr: str) -> tuple[dict[str, int], int]:
+    """`-X importtime` 출력 → (모듈별 누적 µs, 최상위 import 누적 합 µs).
+
+    이름 앞 들여쓰기가 중첩 깊이다. 최상위 항목의 누적 합이 그 실행의 총 import
+    시간이다(인터프리터 기동 때의 site 등 수십 ms 포함).
+    """
+    cumulative: dict[str, int] = {}
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, raw_name = line.split("|", 2)
+        if not cumulative_us.strip().isdigit():
+            continue
+        name = raw_name.strip()
+        cumulative[name] = int(cumulative_us)
+        if len(raw_name) - len(raw_name.lstrip()) <= 1:
+            total += int(cumulative_us)
+    return cumulative, total
+
+
+def profile(target: str, *, repeat: int) -> dict:
+    code, env = _boot(target)
+    runs: list[tuple[dict[str, int], int]] = []
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            env=env,
+            cwd=BACKEND_DIR,
+            check=False,
+        )
+        if completed.returncode != 0:
+            raise SystemExit(f"{target} import 실패:\n{completed.stderr[-2000:]}")
+        runs.append(_parse_importtime(completed.stderr))
+
+    totals = [total for _, total in runs]
+    fastest, _ = min(runs, key=lambda run: run[1])
+    return {
+        "target": target,
+        "median_ms": round(statistics.median(totals) / 1000, 1),
+        "min_ms": round(min(totals) / 1000, 1),
+        "modules": fastest,
+        "deferred_loaded": [name for name in DEFERRED_MODULES if name in fastest],
+    }
+
+
+def render(result: dict, *, top: int) -> str:
+    lines = [
+        f"{result['target']}: 중앙값 {result['median_ms']}ms (최소 {result['min_ms']}ms)",
+    ]
+    if result["deferred_loaded"]:
+        lines.append(f"  지연 대상이 기동에 로드됨: {', '.join(result['deferred_loaded'])}")
+    ranked = sorted(result["modules"].items(), key=lambda item: item[1], reverse=True)
+    for name, cumulative_us in ranked[:top]:
+        lines.append(f"  {cumulative_us / 1000:9.1f}ms  {name}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("targets", nargs="*", default=list(DEFAULT_TARGETS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for target in args.targets:
+        result = profile(target, repeat=max(1, args.repeat))
+        print(render(result, top=args.top))
+        print()
+        failed = failed or bool(result["deferred_loaded"])
+    return 1 if args.check and failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,428 @@
+"""벤치마크용 대량 시드 — 병원 수백 곳, SoV 기록 10만 건 이상, 수년치 발행 콘텐츠.
+
+    cd backend
+    python -m benchmarks.seed_dataset                       # 병원 300곳, 16주, 3년
+    python -m benchmarks.seed_dataset --hospitals 50 --weeks 8 --years 1
+    python -m benchmarks.seed_dataset --reset-only          # 벤치 병원만 지운다
+
+마이그레이션이 끝난 로컬 Postgres(docker compose)에 넣는다. 모든 병원은 slug가
+`bench-`로 시작하고 다시 시드하면 그 병원들만 지운 뒤 새로 만든다 — 다른 개발 데이터는
+건드리지 않는다. 병원·원천 자료·집필 기준은 ORM으로, 행 수가 큰 측정 실행·SoV 기록·발행
+콘텐츠는 Core 일괄 INSERT로 넣는다. 이름과 언급 여부는 번호에서 결정되므로 같은 인자로
+다시 시드하면 같은 분포가 나온다.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, insert, select
+
+from app.core.config import settings
+from app.core.database import SyncSessionLocal
+from app.models.content import ContentItem, ContentSchedule, ContentStatus, ContentType
+from app.models.essence import (
+    HospitalContentPhilosophy,
+    HospitalSourceAsset,
+    HospitalSourceEvidenceNote,
+    PhilosophyStatus,
+    SourceStatus,
+    SourceType,
+)
+from app.models.hospital import Hospital, HospitalStatus, Plan
+from app.models.sov import MeasurementRun, QueryMatrix, SovRecord
+from app.services.essence_engine import (
+    compute_source_content_hash,
+    process_source_asset,
+    synthesize_philosophy,
+)
+from benchmarks.bench_medical_filter import sample_bodies
+
+SLUG_PREFIX = "bench-"
+SEED_ACTOR = "Benchmark Seed"
+_INSERT_CHUNK = 5_000
+_PLATFORMS = ("chatgpt", "gemini")
+_PRIORITIES = ("HIGH", "HIGH", "HIGH", "HIGH", "NORMAL", "NORMAL", "NORMAL", "NORMAL", "LOW")
+_KEYWORDS = (
+    "무릎 통증",
+    "어깨 통증",
+    "허리 통증",
+    "목 통증",
+    "손목 통증",
+    "발목 염좌",
+    "스포츠 손상",
+    "도수재활",
+    "관절 주사",
+    "오십견",
+    "회전근개",
+    "족저근막염",
+)
+_CONTENT_TYPES = (
+    ContentType.DISEASE,
+    ContentType.TREATMENT,
+    ContentType.FAQ,
+    ContentType.HEALTH,
+    ContentType.LOCAL,
+    ContentType.COLUMN,
+)
+_QUERY_MARKER_RE = re.compile(r"벤치동(\d{4})")
+
+
+# ── 이름 규칙 ─────────────────────────────────────────────────
+# 가짜 공급자는 질의에 심은 "벤치동NNNN" 표식만 보고 어느 병원을 언급할지 정한다.
+
+
+def hospital_name(index: int) -> str:
+    return f"벤치{index:04d}정형외과의원"
+
+
+def competitor_name(index: int) -> str:
+    return f"벤치{index:04d}바른의원"
+
+
+def director_name(index: int) -> str:
+    # 숫자로 끝나는 이름은 "0007 원장"이 가격 표현 검사에 걸리므로 숫자를 음절로 바꾼다.
+    return "김" + "".join("가나다라마바사아자차"[int(digit)] for digit in f"{index:04d}")
+
+
+def region_term(index: int) -> str:
+    return f"벤치동{index:04d}"
+
+
+def _stable_fraction(text: str) -> float:
+    return int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16) / 0xFFFFFFFF
+
+
+def mentioned_names(query: str) -> list[str]:
+    """질의에 대한 가짜 답변이 언급할 병원명. 자사 약 45%, 경쟁사 약 60%."""
+    match = _QUERY_MARKER_RE.search(query)
+    if not match:
+        return []
+    index = int(match.group(1))
+    fraction = _stable_fraction(query)
+    names = []
+    if fraction < 0.6:
+        names.append(competitor_name(index))
+    if 0.15 <= fraction < 0.6:
+        names.append(hospital_name(index))
+    return names
+
+
+# ── 시드 ───────────────────────────────────────────────────────
+
+
+def reset(db) -> int:
+    ids = list(
+        db.execute(select(Hospital.id).where(Hospital.slug.startswith(SLUG_PREFIX))).scalars()
+    )
+    if ids:
+        # hospitals의 FK는 ON DELETE CASCADE라 하위 행이 함께 지워진다.
+        db.execute(delete(Hospital).where(Hospital.id.in_(ids)))
+        db.commit()
+    return len(ids)
+
+
+def seed(*, hospitals: int, weeks: int, years: int, contents_per_month: int) -> dict[str, int]:
+    today = date.today()
+    bodies = sample_bodies(40)
+    counts = {"hospitals": 0, "queries": 0, "measurement_runs": 0, "sov_records": 0, "contents": 0}
+    with SyncSessionLocal() as db:
+        counts["deleted_hospitals"] = reset(db)
+        hospital_ids = []
+        for index in range(1, hospitals + 1):
+            hospital = _create_hospital(index)
+            db.add(hospital)
+            db.flush()
+            _seed_philosophy(db, hospital)
+            queries = _seed_queries(db, hospital, index)
+            schedule = ContentSchedule(
+                hospital_id=hospital.id,
+                plan=Plan.PLAN_16.value,
+                publish_days=[0, 1, 2, 3, 4],
+                active_from=today.replace(day=1) - timedelta(days=365 * years),
+                is_active=True,
+            )
+            db.add(schedule)
+            db.flush()
+            run_count, record_count = _bulk_measurements(db, hospital, queries, weeks, today)
+            counts["contents"] += _bulk_contents(
+                db, hospital, schedule, bodies, years, contents_per_month, today
+            )
+            counts["hospitals"] += 1
+            counts["queries"] += len(queries)
+            counts["measurement_runs"] += run_count
+            counts["sov_records"] += record_count
+            hospital_ids.append(hospital.id)
+            db.commit()
+            if index % 25 == 0:
+                print(f"seeded {index}/{hospitals} hospitals", file=sys.stderr)
+        # 일괄 INSERT는 운영 카운터 갱신 경로를 거치지 않으므로 마지막에 다시 센다.
+        # (운영 카운터 모듈은 측정 엔진을 끌어와 import 시점에 공급자 키를 요구한다.)
+        from app.services import operating_stats
+
+        operating_stats.reconcile_operating_stats(db, hospital_ids)
+        db.commit()
+    return counts
+
+
+def dataset_counts() -> dict[str, int]:
+    """현재 DB에 있는 벤치 데이터 규모. 결과 파일의 메타데이터로 남긴다."""
+    with SyncSessionLocal() as db:
+        bench_ids = select(Hospital.id).where(Hospital.slug.startswith(SLUG_PREFIX))
+        return {
+            "hospitals": db.execute(
+                select(func.count()).select_from(bench_ids.subquery())
+            ).scalar_one(),
+            "sov_records": db.execute(
+                select(func.count()).where(SovRecord.hospital_id.in_(bench_ids))
+            ).scalar_one(),
+            "published_contents": db.execute(
+                select(func.count()).where(
+                    ContentItem.hospital_id.in_(bench_ids),
+                    ContentItem.status == ContentStatus.PUBLISHED,
+                )
+            ).scalar_one(),
+        }
+
+
+def _create_hospital(index: int) -> Hospital:
+    region = region_term(index)
+    return Hospital(
+        name=hospital_name(index),
+        slug=f"{SLUG_PREFIX}{index:04d}",
+        status=HospitalStatus.ACTIVE,
+        plan=Plan.PLAN_16,
+        address=f"서울시 성동구 {region}로 {index}",
+        phone=f"02-0000-{index:04d}",
+        region=["서울", region],
+        specialties=["정형외과"],
+        keywords=list(_KEYWORDS[:6]),
+        competitors=[competitor_name(index)],
+        director_name=director_name(index),
+        director_career="정형외과 전문의. 관절·척추 통증과 스포츠 손상을 진료합니다.",
+        director_philosophy="검사 결과와 생활 맥락을 함께 보고 단계별 치료 계획을 설명합니다.",
+        treatments=[
+            {"name": "무릎 통증 진료", "description": "통증 원인을 구분해 단계별 치료를 안내합니다."},
+            {"name": "어깨 통증 진료", "description": "진찰과 영상으로 원인을 확인합니다."},
+        ],
+        profile_complete=True,
+        v0_report_done=True,
+        site_built=True,
+        site_live=True,
+        schedule_set=True,
+    )
+
+
+def _seed_philosophy(db, hospital: Hospital) -> None:
+    """원천 자료 1건 → 근거 노트 → 승인된 집필 기준. LLM 없이 결정적 경로만 쓴다."""
+    title = f"{hospital.director_name} 원장 인터뷰"
+    raw_text = (
+        f"{hospital.name}은 서울 {hospital.region[-1]}에서 무릎 통증, 어깨 통증, 허리 통증을 "
+        f"진료하는 정형외과입니다. {hospital.director_name} 원장은 첫 진료에서 통증이 시작된 "
+        "시점과 악화되는 동작, 운동 습관을 함께 확인합니다. 치료는 운동 조절과 약물, 물리치료, "
+        "주사 상담을 단계적으로 검토하고, 필요한 경우 의뢰 기준을 분명히 안내합니다."
+    )
+    source = HospitalSourceAsset(
+        hospital_id=hospital.id,
+        source_type=SourceType.INTERVIEW,
+        title=title,
+        url=None,
+        raw_text=raw_text,
+        operator_note=None,
+        source_metadata={"channel": "benchmark"},
+        content_hash=compute_source_content_hash(title, None, raw_text, None),
+        status=SourceStatus.PROCESSED,
+        processed_at=datetime.now(timezone.utc),
+        created_by=SEED_ACTOR,
+    )
+    db.add(source)
+    db.flush()
+    notes = [
+        HospitalSourceEvidenceNote(
+            hospital_id=hospital.id,
+            source_asset_id=source.id,
+            note_type=payload.note_type,
+            claim=payload.claim,
+            source_excerpt=payload.source_excerpt,
+            excerpt_start=payload.excerpt_start,
+            excerpt_end=payload.excerpt_end,
+            confidence=payload.confidence,
+            note_metadata=payload.note_metadata,
+        )
+        for payload in process_source_asset(source, use_llm=False)
+    ]
+    db.add_all(notes)
+    db.flush()
+    db.add(
+        HospitalContentPhilosophy(
+            hospital_id=hospital.id,
+            version=1,
+            status=PhilosophyStatus.APPROVED,
+            created_by=SEED_ACTOR,
+            reviewed_by=SEED_ACTOR,
+            approval_note="Benchmark seed",
+            approved_at=datetime.now(timezone.utc),
+            **synthesize_philosophy(hospital, [source], notes, operator_note=None, use_llm=False),
+        )
+    )
+
+
+def _seed_queries(db, hospital: Hospital, index: int) -> list[QueryMatrix]:
+    region = region_term(index)
+    queries = [
+        QueryMatrix(
+            hospital_id=hospital.id,
+            query_text=f"{region} {keyword} 정형외과 추천",
+            priority=_PRIORITIES[position % len(_PRIORITIES)],
+        )
+        for position, keyword in enumerate(_KEYWORDS)
+    ]
+    db.add_all(queries)
+    db.flush()
+    return queries
+
+
+def _bulk_measurements(
+    db, hospital: Hospital, queries: list[QueryMatrix], weeks: int, today: date
+) -> tuple[int, int]:
+    runs = []
+    records = []
+    for week in range(weeks, 0, -1):
+        measured_at = datetime.combine(
+            today - timedelta(weeks=week), datetime.min.time(), tzinfo=timezone.utc
+        ) + timedelta(hours=17)
+        run_id = uuid.uuid4()
+        runs.append(
+            {
+                "id": run_id,
+                "hospital_id": hospital.id,
+                "run_label": f"bench-week-{week}",
+                "status": "COMPLETED",
+                "query_count": len(queries) * len(_PLATFORMS),
+                "success_count": len(queries) * len(_PLATFORMS),
+                "failure_count": 0,
+                "started_at": measured_at,
+                "completed_at": measured_at + timedelta(minutes=12),
+                "model_name": settings.OPENAI_MODEL_QUERY,
+                "search_mode": "web",
+                "config": {"benchmark": True},
+            }
+        )
+        for query in queries:
+            for platform in _PLATFORMS:
+                # 주차마다 언급 여부가 조금씩 바뀌어야 추세 집계가 의미 있는 일을 한다.
+                mentioned = _stable_fraction(f"{query.id}:{platform}:{week}") < 0.45
+                records.append(
+                    {
+                        "hospital_id": hospital.id,
+                        "query_id": query.id,
+                        "measurement_run_id": run_id,
+                        "ai_platform": platform,
+                        "measured_at": measured_at,
+                        "mention_verdict": "MATCHED" if mentioned else "NOT_MATCHED",
+                        "is_mentioned": mentioned,
+                        "mention_rank": 2 if mentioned else None,
+                        "mention_sentiment": "neutral" if mentioned else None,
+                        "mention_context": hospital.name if mentioned else None,
+                        "raw_response": f"{query.query_text}에 대한 벤치마크 답변입니다.",
+                        "competitor_mentions": [
+                            {"name": hospital.competitors[0], "is_mentioned": True, "mention_rank": 1}
+                        ],
+                        "measurement_method": "OPENAI_RESPONSES_WEB_SEARCH"
+                        if platform == "chatgpt"
+                        else "GEMINI_GOOGLE_SEARCH",
+                        "measurement_status": "SUCCESS",
+                        "source_urls": ["https://health.kdca.go.kr/"],
+                        "search_calls": 1,
+                    }
+                )
+    db.execute(insert(MeasurementRun), runs)
+    for start in range(0, len(records), _INSERT_CHUNK):
+        db.execute(insert(SovRecord), records[start : start + _INSERT_CHUNK])
+    return len(runs), len(records)
+
+
+def _bulk_contents(
+    db,
+    hospital: Hospital,
+    schedule: ContentSchedule,
+    bodies: list[str],
+    years: int,
+    contents_per_month: int,
+    today: date,
+) -> int:
+    rows = []
+    month = today.replace(day=1)
+    spacing = max(28 // contents_per_month, 1)
+    for month_offset in range(1, years * 12 + 1):
+        month_start = _shift_month(month, -month_offset)
+        for sequence_no in range(1, contents_per_month + 1):
+            scheduled = month_start + timedelta(days=(sequence_no - 1) * spacing)
+            published_at = datetime.combine(
+                scheduled, datetime.min.time(), tzinfo=timezone.utc
+            ) - timedelta(hours=1)
+            serial = month_offset * contents_per_month + sequence_no
+            body = bodies[serial % len(bodies)]
+            rows.append(
+                {
+                    "hospital_id": hospital.id,
+                    "schedule_id": schedule.id,
+                    "content_type": _CONTENT_TYPES[serial % len(_CONTENT_TYPES)],
+                    "sequence_no": sequence_no,
+                    "total_count": contents_per_month,
+                    "title": f"{hospital.name} 진료 안내 {scheduled:%Y-%m} #{sequence_no}",
+                    "body": f"{hospital.name} {hospital.director_name} 원장의 안내입니다.\n\n{body}",
+                    "meta_description": f"{hospital.name}의 {scheduled:%Y년 %m월} 진료 안내입니다.",
+                    "scheduled_date": scheduled,
+                    "status": ContentStatus.PUBLISHED,
+                    "references_list": [
+                        {"title": "국가건강정보포털", "url": "https://health.kdca.go.kr/"}
+                    ],
+                    "generated_at": published_at - timedelta(hours=8),
+                    "published_at": published_at,
+                    "published_by": SEED_ACTOR,
+                }
+            )
+    for start in range(0, len(rows), _INSERT_CHUNK):
+        db.execute(insert(ContentItem), rows[start : start + _INSERT_CHUNK])
+    return len(rows)
+
+
+def _shift_month(value: date, months: int) -> date:
+    total = value.year * 12 + value.month - 1 + months
+    return date(total // 12, total % 12 + 1, 1)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hospitals", type=int, default=300)
+    parser.add_argument("--weeks", type=int, default=16)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--contents-per-month", type=int, default=4)
+    parser.add_argument("--reset-only", action="store_true")
+    args = parser.parse_args(argv)
+
+    if settings.APP_ENV == "production":
+        print("refusing to seed benchmark data with APP_ENV=production", file=sys.stderr)
+        return 1
+    if args.reset_only:
+        with SyncSessionLocal() as db:
+            result = {"deleted_hospitals": reset(db)}
+    else:
+        result = seed(
+            hospitals=args.hospitals,
+            weeks=args.weeks,
+            years=args.years,
+            contents_per_month=args.contents_per_month,
+        )
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,20 +3,46 @@ set -euo pipefail
 
 SERVICE="${SERVICE:-api}"
 
+# Celery prefork 자식들은 각자 HTTP를 열 수 없다 — prometheus_client가 샘플을 이
+# 디렉터리의 프로세스별 파일로 쓰고, 헬스 서버가 /metrics에서 합쳐 낸다.
+# 이전 컨테이너 실행의 파일이 섞이지 않도록 시작할 때 비운다.
+prepare_metrics_dir() {
+  export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus-multiproc}"
+  rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+  mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+}
+
 case "$SERVICE" in
   api)
-    exec uvicorn app.main:app --host 0.0.0.0 --port "${PORT:-8000}"
+    # 요청 로그 한 줄은 앱(QueryStatsMiddleware)이 SQL 문장 수·DB 시간과 함께 남긴다.
+    exec uvicorn app.main:app --host 0.0.0.0 --port "${PORT:-8000}" --no-access-log
     ;;
   worker)
     # Cloud Run 서비스는 $PORT 리슨이 필수 — celery는 HTTP가 없으므로
     # 경량 헬스 서버를 사이드 프로세스로 띄운다 (없으면 revision ready 실패).
+    prepare_metrics_dir
     python -m app.workers.health_server &
+    # 큐를 좁힌 풀(예: CELERY_WORKER_QUEUES=leadgen,certificates)은 그 큐의 태스크 모듈만
+    # import한다 — 콘텐츠 생성·리포트 PDF 스택을 올리지 않아 콜드 스타트가 짧다.
+    export CELERY_WORKER_QUEUES="${CELERY_WORKER_QUEUES:-default,content,images,sov,reports,leadgen,certificates}"
     exec celery -A app.core.celery_app worker \
       --loglevel=info \
-      -Q default,content,sov,reports,leadgen,certificates \
+      -Q "$CELERY_WORKER_QUEUES" \
       -c "${CELERY_CONCURRENCY:-2}" \
       --max-tasks-per-child="${CELERY_MAX_TASKS_PER_CHILD:-50}"
     ;;
+  image-worker)
+    # 대표 이미지 단계 전용 풀(선택) — 공급자 동시 호출 예산을 이 풀의 동시성으로 묶는다.
+    # 기본 worker도 images를 소비하므로 이 서비스 없이도 단계는 실행된다.
+    prepare_metrics_dir
+    python -m app.workers.health_server &
+    export CELERY_WORKER_QUEUES=images
+    exec celery -A app.core.celery_app worker \
+      --loglevel=info \
+      -Q "$CELERY_WORKER_QUEUES" \
+      -c "${CELERY_IMAGE_CONCURRENCY:-2}" \
+      --max-tasks-per-child="${CELERY_MAX_TASKS_PER_CHILD:-50}"
+    ;;
   beat)
     python -m app.workers.health_server &
     exec celery -A app.core.celery_app beat --loglevel=info
@@ -59,7 +85,7 @@ case "$SERVICE" in
     ;;
   *)
     echo "Unknown SERVICE: $SERVICE"
-    echo "Valid values: api, worker, beat, flower, migrate, seed-admin, backfill-images, seed-colon-cluster, unpublish-flagged, fix-director-credential, inspect-schema"
+    echo "Valid values: api, worker, image-worker, beat, flower, migrate, seed-admin, backfill-images, seed-colon-cluster, unpublish-flagged, fix-director-credential, inspect-schema"
     exit 1
     ;;
 esac
@@ -0,0 +1,121 @@
+"""Real-Postgres proofs that the stored readiness projection follows its sources."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.models.essence import (
+    HospitalContentPhilosophy,
+    HospitalEssenceReadiness,
+    HospitalSourceAsset,
+    PhilosophyStatus,
+    SourceStatus,
+    SourceType,
+)
+from app.models.hospital import Hospital, HospitalStatus
+from app.services.essence_engine import compute_sources_snapshot_hash
+from app.services.essence_readiness import (
+    compute_essence_readiness_sync,
+    get_essence_readiness_sync,
+    verify_essence_readiness_projections,
+)
+
+
+@pytest.fixture
+def pg_session(pg_conn):
+    session = Session(
+        bind=pg_conn,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _seed_approved(pg_session):
+    hospital = Hospital(
+        id=uuid.uuid4(),
+        name="준비 상태 병원",
+        slug=f"readiness-{uuid.uuid4().hex[:8]}",
+        status=HospitalStatus.ACTIVE,
+        site_live=False,
+    )
+    source = HospitalSourceAsset(
+        id=uuid.uuid4(),
+        hospital_id=hospital.id,
+        source_type=SourceType.INTERVIEW,
+        title="원장 인터뷰",
+        raw_text="진료 전에 충분히 설명합니다.",
+        content_hash="readiness-source-hash",
+        status=SourceStatus.PROCESSED,
+        processed_at=datetime.now(timezone.utc),
+    )
+    philosophy = HospitalContentPhilosophy(
+        id=uuid.uuid4(),
+        hospital_id=hospital.id,
+        version=1,
+        status=PhilosophyStatus.APPROVED,
+        source_asset_ids=[str(source.id)],
+        source_snapshot_hash=compute_sources_snapshot_hash([source]),
+    )
+    pg_session.add_all([hospital, source, philosophy])
+    pg_session.flush()
+    return hospital, source, philosophy
+
+
+def _stored(pg_session, hospital_id):
+    return pg_session.execute(
+        select(
+            HospitalEssenceReadiness.public_philosophy_id,
+            HospitalEssenceReadiness.processed_source_count,
+            HospitalEssenceReadiness.required_source_count,
+        ).where(HospitalEssenceReadiness.hospital_id == hospital_id)
+    ).one()
+
+
+def test_flush_writes_the_projection_and_reads_match_recomputation(pg_session) -> None:
+    hospital, _source, philosophy = _seed_approved(pg_session)
+
+    assert _stored(pg_session, hospital.id) == (philosophy.id, 1, 1)
+    readiness = get_essence_readiness_sync(pg_session, hospital.id)
+    assert readiness == compute_essence_readiness_sync(pg_session, hospital.id)
+    assert readiness.current is philosophy
+
+
+def test_changed_baseline_source_withdraws_the_public_philosophy(pg_session) -> None:
+    hospital, source, philosophy = _seed_approved(pg_session)
+    pending = HospitalSourceAsset(
+        hospital_id=hospital.id,
+        source_type=SourceType.NAVER_BLOG,
+        title="새 글",
+        status=SourceStatus.PENDING,
+    )
+    pg_session.add(pending)
+    pg_session.flush()
+
+    assert _stored(pg_session, hospital.id) == (philosophy.id, 1, 2)
+
+    source.content_hash = "edited-source-hash"
+    pg_session.flush()
+
+    assert _stored(pg_session, hospital.id) == (None, 1, 2)
+    assert get_essence_readiness_sync(pg_session, hospital.id).current is None
+
+
+def test_verifier_repairs_a_projection_written_behind_the_orm(pg_session) -> None:
+    hospital, _source, philosophy = _seed_approved(pg_session)
+    assert verify_essence_readiness_projections(pg_session, [hospital.id]) == 0
+
+    pg_session.execute(
+        update(HospitalEssenceReadiness)
+        .where(HospitalEssenceReadiness.hospital_id == hospital.id)
+        .values(public_philosophy_id=None, processed_source_count=0)
+    )
+
+    assert verify_essence_readiness_projections(pg_session, [hospital.id]) == 1
+    assert _stored(pg_session, hospital.id) == (philosophy.id, 1, 1)
@@ -0,0 +1,162 @@
+"""Real-Postgres proofs that the operating counters follow the rows they count."""
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.models.content import ContentItem, ContentSchedule, ContentStatus, ContentType
+from app.models.hospital import Hospital, HospitalStatus
+from app.models.operating_stats import HospitalOperatingStats
+from app.models.report import MonthlyReport
+from app.models.sov import MeasurementRun, QueryMatrix, SovRecord
+from app.services.operating_stats import compute_operating_stats, reconcile_operating_stats
+
+
+@pytest.fixture
+def pg_session(pg_conn):
+    session = Session(
+        bind=pg_conn,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _seed_hospital(pg_session):
+    hospital = Hospital(
+        id=uuid.uuid4(),
+        name="운영 카운터 병원",
+        slug=f"stats-{uuid.uuid4().hex[:8]}",
+        status=HospitalStatus.ACTIVE,
+        site_live=False,
+    )
+    schedule = ContentSchedule(
+        id=uuid.uuid4(),
+        hospital_id=hospital.id,
+        plan="PLAN_12",
+        publish_days=[0, 3],
+        active_from=date(2026, 10, 1),
+    )
+    pg_session.add_all([hospital, schedule])
+    pg_session.flush()
+    return hospital, schedule
+
+
+def _item(hospital, schedule, sequence_no, status):
+    return ContentItem(
+        id=uuid.uuid4(),
+        hospital_id=hospital.id,
+        schedule_id=schedule.id,
+        content_type=ContentType.FAQ,
+        sequence_no=sequence_no,
+        total_count=12,
+        scheduled_date=date(2026, 10, sequence_no),
+        status=status,
+    )
+
+
+def _stored(pg_session, hospital_id):
+    return pg_session.execute(
+        select(HospitalOperatingStats).where(HospitalOperatingStats.hospital_id == hospital_id)
+    ).scalar_one()
+
+
+def test_commit_keeps_content_report_and_measurement_counters(pg_session):
+    hospital, schedule = _seed_hospital(pg_session)
+    draft = _item(hospital, schedule, 1, ContentStatus.DRAFT)
+    pg_session.add_all(
+        [
+            draft,
+            _item(hospital, schedule, 2, ContentStatus.PUBLISHED),
+            MonthlyReport(hospital_id=hospital.id, period_year=2026, period_month=9),
+        ]
+    )
+    pg_session.commit()
+
+    stats = _stored(pg_session, hospital.id)
+    pg_session.refresh(stats)
+    assert (stats.published_content_count, stats.report_count) == (1, 1)
+
+    draft.status = ContentStatus.PUBLISHED
+    query = QueryMatrix(id=uuid.uuid4(), hospital_id=hospital.id, query_text="강남 치과 추천")
+    run = MeasurementRun(
+        id=uuid.uuid4(),
+        hospital_id=hospital.id,
+        status="COMPLETED",
+        completed_at=datetime.now(timezone.utc) - timedelta(minutes=5),
+    )
+    pg_session.add_all([query, run])
+    pg_session.flush()
+    pg_session.add_all(
+        [
+            SovRecord(
+                hospital_id=hospital.id,
+                query_id=query.id,
+                measurement_run_id=run.id,
+                ai_platform="chatgpt",
+                is_mentioned=mentioned,
+                mention_verdict=verdict,
+            )
+            for mentioned, verdict in (
+                (True, "MATCHED"),
+                (False, "NOT_MATCHED"),
+                (None, "AMBIGUOUS"),
+            )
+        ]
+    )
+    pg_session.commit()
+
+    pg_session.refresh(stats)
+    assert stats.published_content_count == 2
+    assert stats.sov_record_count == 3
+    assert stats.latest_sov_pct == 50.0
+    assert stats.last_measured_at == run.completed_at
+
+
+def test_reconcile_repairs_counters_after_a_bulk_update(pg_session):
+    hospital, schedule = _seed_hospital(pg_session)
+    item = _item(hospital, schedule, 1, ContentStatus.READY)
+    pg_session.add(item)
+    pg_session.commit()
+
+    pg_session.execute(
+        update(ContentItem)
+        .where(ContentItem.id == item.id)
+        .values(status=ContentStatus.PUBLISHED)
+        .execution_options(synchronize_session=False)
+    )
+    stats = _stored(pg_session, hospital.id)
+    pg_session.refresh(stats)
+    assert stats.published_content_count == 0
+
+    assert reconcile_operating_stats(pg_session, [hospital.id]) == 1
+    assert reconcile_operating_stats(pg_session, [hospital.id]) == 0
+    pg_session.refresh(stats)
+    assert stats.published_content_count == 1
+    assert compute_operating_stats(pg_session, [hospital.id])[hospital.id][
+        "published_content_count"
+    ] == 1
+
+
+def test_counters_refresh_once_at_commit_and_ignore_rolled_back_flushes(pg_session):
+    hospital, schedule = _seed_hospital(pg_session)
+    pg_session.add(_item(hospital, schedule, 1, ContentStatus.PUBLISHED))
+    pg_session.flush()
+    stored = select(HospitalOperatingStats).where(
+        HospitalOperatingStats.hospital_id == hospital.id
+    )
+    assert pg_session.execute(stored).scalar_one_or_none() is None
+
+    savepoint = pg_session.begin_nested()
+    pg_session.add(_item(hospital, schedule, 2, ContentStatus.PUBLISHED))
+    pg_session.flush()
+    savepoint.rollback()
+    pg_session.commit()
+
+    assert _stored(pg_session, hospital.id).published_content_count == 1
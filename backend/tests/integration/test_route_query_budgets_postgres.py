@@ -0,0 +1,367 @@
+"""Route query budgets against real SQL: statement counts stay flat as rows double.
+
+`tests/test_query_budget.py` proves the counter and the strict failure on a
+synthetic app. The unit suite's fake sessions emit no Engine statements, so
+`QUERY_BUDGET_STRICT` there never sees the real routes. Here every budgeted route
+runs through the ASGI app on the integration Postgres, once with N rows and once
+with 2N: the statement count must not change and must stay within the declared
+budget (strict mode also fails the request itself when it goes over).
+
+The seeding session's identity map is cleared before each request so loads that
+would otherwise be served from it (``db.get``) run their SQL like in production.
+"""
+import json
+import logging
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core.database import get_db
+from app.main import app
+from app.models.admin_user import ROLE_OPERATOR, AdminUser
+from app.models.content import ContentItem, ContentSchedule, ContentStatus, ContentType
+from app.models.essence import (
+    HospitalContentPhilosophy,
+    HospitalSourceAsset,
+    PhilosophyStatus,
+    SourceStatus,
+    SourceType,
+)
+from app.models.hospital import Hospital, HospitalStatus
+from app.models.operations import Incident
+from app.models.sov import AIQueryTarget, AIQueryVariant, MeasurementRun, QueryMatrix, SovRecord
+from app.schemas.operations import OperationsQueue
+from app.services.essence_engine import ESSENCE_STATUS_ALIGNED, compute_sources_snapshot_hash
+from app.services.operating_stats import reconcile_operating_stats
+
+ROWS = 3
+PROCESSED_AT = datetime(2026, 7, 1, 9, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def _no_rate_limit(monkeypatch):
+    # 라우트마다 두 번씩 부른다 — admin/public 요청 한도가 측정을 가로막지 않게 한다.
+    monkeypatch.setattr(app.state.limiter, "enabled", False)
+
+
+class _Tenant:
+    def __init__(self, hospital, philosophy, schedule, operator):
+        self.hospital_id = hospital.id
+        self.slug = hospital.slug
+        self.philosophy_id = philosophy.id
+        self.schedule_id = schedule.id
+        self.operator_email = operator.email
+        self.sequence_no = 0
+        self.content_ids: list[uuid.UUID] = []
+
+
+def _hospital(**overrides) -> Hospital:
+    suffix = uuid.uuid4().hex[:8]
+    return Hospital(
+        **{
+            "id": uuid.uuid4(),
+            "name": f"쿼리예산{suffix}병원",
+            "slug": f"budget-{suffix}",
+            "status": HospitalStatus.ACTIVE,
+            "site_live": True,
+            "region": [],
+            "specialties": [],
+            "keywords": [],
+            "competitors": [],
+            "treatments": [],
+            **overrides,
+        }
+    )
+
+
+async def _seed_tenant(session) -> _Tenant:
+    """ACTIVE + site_live 병원 1곳, 승인된 운영 기준, 콘텐츠 일정, 운영자 계정."""
+    hospital = _hospital()
+    operator = AdminUser(
+        email=f"budget-{uuid.uuid4().hex[:8]}@example.com",
+        name="쿼리 예산 검수자",
+        role=ROLE_OPERATOR,
+        password_hash="not-used",
+        is_active=True,
+    )
+    session.add_all([hospital, operator])
+    await session.flush()
+    source = HospitalSourceAsset(
+        id=uuid.uuid4(),
+        hospital_id=hospital.id,
+        source_type=SourceType.HOMEPAGE,
+        title="홈페이지",
+        raw_text="근거 자료 본문",
+        content_hash=f"hash-{uuid.uuid4().hex}",
+        status=SourceStatus.PROCESSED,
+        processed_at=PROCESSED_AT,
+    )
+    session.add(source)
+    await session.flush()
+    philosophy = HospitalContentPhilosophy(
+        id=uuid.uuid4(),
+        hospital_id=hospital.id,
+        version=1,
+        status=PhilosophyStatus.APPROVED,
+        positioning_statement="근거 중심으로 충분히 설명합니다.",
+        patient_promise="확인된 정보만 환자에게 안내합니다.",
+        source_snapshot_hash=compute_sources_snapshot_hash([source]),
+        approved_at=PROCESSED_AT,
+    )
+    schedule = ContentSchedule(
+        id=uuid.uuid4(),
+        hospital_id=hospital.id,
+        plan="PLAN_12",
+        publish_days=[1, 3],
+        active_from=date(2026, 7, 1),
+    )
+    session.add_all([philosophy, schedule])
+    await session.flush()
+    return _Tenant(hospital, philosophy, schedule, operator)
+
+
+# ── 라우트별 행 시드 — 호출마다 `count`개를 더한다 ─────────────────────
+
+
+async def _add_listed_hospitals(session, tenant, count, *, projected=False):
+    hospitals = [_hospital() for _ in range(count)]
+    session.add_all(hospitals)
+    await session.flush()
+    if projected:
+        ids = [hospital.id for hospital in hospitals]
+        await session.run_sync(lambda sync_session: reconcile_operating_stats(sync_session, ids))
+
+
+async def _add_projected_hospitals(session, tenant, count):
+    await _add_listed_hospitals(session, tenant, count, projected=True)
+
+
+async def _add_measurement_runs(session, tenant, count):
+    session.add_all(
+        MeasurementRun(
+            hospital_id=tenant.hospital_id,
+            status="COMPLETED",
+            completed_at=datetime.now(timezone.utc) - timedelta(minutes=index + 1),
+        )
+        for index in range(count)
+    )
+    await session.flush()
+
+
+async def _add_measured_queries(session, tenant, count):
+    queries = [
+        QueryMatrix(
+            id=uuid.uuid4(),
+            hospital_id=tenant.hospital_id,
+            query_text=f"강남 치과 추천 {uuid.uuid4().hex[:6]}",
+        )
+        for _ in range(count)
+    ]
+    session.add_all(queries)
+    await session.flush()
+    session.add_all(
+        SovRecord(
+            hospital_id=tenant.hospital_id,
+            query_id=query.id,
+            ai_platform="chatgpt",
+            is_mentioned=mentioned,
+            mention_verdict="MATCHED" if mentioned else "NOT_MATCHED",
+            raw_response="답변",
+        )
+        for query in queries
+        for mentioned in (True, False)
+    )
+    await session.flush()
+    return queries
+
+
+async def _add_query_targets(session, tenant, count):
+    queries = await _add_measured_queries(session, tenant, count)
+    targets = [
+        AIQueryTarget(
+            id=uuid.uuid4(),
+            hospital_id=tenant.hospital_id,
+            name=query.query_text,
+            target_intent="LOCAL",
+        )
+        for query in queries
+    ]
+    session.add_all(targets)
+    await session.flush()
+    session.add_all(
+        AIQueryVariant(
+            query_target_id=target.id, query_text=query.query_text, query_matrix_id=query.id
+        )
+        for target, query in zip(targets, queries, strict=True)
+    )
+    await session.flush()
+
+
+async def _add_operations_rows(session, tenant, count):
+    # 온보딩 큐는 공개 전 병원, 장애 큐는 열린 incident로 채운다.
+    session.add_all(
+        _hospital(status=HospitalStatus.ONBOARDING, site_live=False) for _ in range(count)
+    )
+    session.add_all(
+        Incident(
+            hospital_id=tenant.hospital_id,
+            dedupe_key=f"budget:{uuid.uuid4().hex}",
+            incident_type="NAVER_SOURCE_FETCH_FAILED",
+            severity="MEDIUM",
+            customer_impact="근거 자료가 아직 반영되지 않았습니다.",
+            source_type="NAVER_POST",
+            next_action="실패한 글을 다시 수집해 주세요.",
+            admin_path=f"/hospitals/{tenant.hospital_id}/onboarding",
+        )
+        for _ in range(count)
+    )
+    await session.flush()
+
+
+async def _add_public_photos(session, tenant, count):
+    session.add_all(
+        HospitalSourceAsset(
+            id=uuid.uuid4(),
+            hospital_id=tenant.hospital_id,
+            source_type=SourceType.PHOTO_DOCTOR,
+            title="원장 사진",
+            file_url=f"gs://reputation-images/doctor-{uuid.uuid4().hex[:6]}.png",
+            mime_type="image/png",
+            is_public=True,
+            photo_source_owner="원장",
+            photo_rights_basis="OWNER_CONSENT",
+            photo_evidence_reference=f"consent/{uuid.uuid4().hex[:8]}",
+            photo_verified_by="owner@example.com",
+            photo_verified_at=PROCESSED_AT,
+            status=SourceStatus.PROCESSED,
+        )
+        for _ in range(count)
+    )
+    await session.flush()
+
+
+async def _add_published_contents(session, tenant, count):
+    items = []
+    for _ in range(count):
+        tenant.sequence_no += 1
+        items.append(
+            ContentItem(
+                id=uuid.uuid4(),
+                hospital_id=tenant.hospital_id,
+                schedule_id=tenant.schedule_id,
+                content_type=ContentType.FAQ,
+                sequence_no=tenant.sequence_no,
+                total_count=12,
+                title=f"발행 콘텐츠 {tenant.sequence_no}",
+                body="본문",
+                scheduled_date=date(2026, 7, tenant.sequence_no),
+                status=ContentStatus.PUBLISHED,
+                published_at=PROCESSED_AT + timedelta(days=tenant.sequence_no),
+                essence_status=ESSENCE_STATUS_ALIGNED,
+                content_philosophy_id=tenant.philosophy_id,
+            )
+        )
+    session.add_all(items)
+    await session.flush()
+    tenant.content_ids.extend(item.id for item in items)
+
+
+ADMIN = "/api/v1/admin"
+PUBLIC = "/api/v1/public/hospitals"
+ROUTES = [
+    pytest.param(lambda t: f"{ADMIN}/hospitals?limit=200", _add_listed_hospitals, id="hospitals"),
+    pytest.param(
+        lambda t: f"{ADMIN}/hospitals?limit=200", _add_projected_hospitals, id="hospitals-projected"
+    ),
+    pytest.param(
+        lambda t: f"{ADMIN}/hospitals/{t.hospital_id}/sov/measurement-runs",
+        _add_measurement_runs,
+        id="sov-measurement-runs",
+    ),
+    pytest.param(
+        lambda t: f"{ADMIN}/hospitals/{t.hospital_id}/sov/trend",
+        _add_measured_queries,
+        id="sov-trend",
+    ),
+    pytest.param(
+        lambda t: f"{ADMIN}/hospitals/{t.hospital_id}/sov/queries",
+        _add_measured_queries,
+        id="sov-queries",
+    ),
+    pytest.param(
+        lambda t: f"{ADMIN}/hospitals/{t.hospital_id}/query-targets",
+        _add_query_targets,
+        id="query-targets",
+    ),
+    pytest.param(lambda t: f"{ADMIN}/operations/overview", _add_operations_rows, id="overview"),
+    *(
+        pytest.param(
+            lambda t, queue=queue: f"{ADMIN}/operations/queues/{queue.value}",
+            _add_operations_rows,
+            id=f"queue-{queue.value.lower()}",
+        )
+        for queue in OperationsQueue
+    ),
+    pytest.param(lambda t: PUBLIC, _add_listed_hospitals, id="public-list"),
+    pytest.param(lambda t: f"{PUBLIC}/{t.slug}", _add_public_photos, id="public-hospital"),
+    pytest.param(
+        lambda t: f"{PUBLIC}/{t.slug}/contents?limit=500",
+        _add_published_contents,
+        id="public-contents",
+    ),
+    pytest.param(
+        lambda t: f"{PUBLIC}/{t.slug}/contents/{t.content_ids[0]}",
+        _add_published_contents,
+        id="public-content",
+    ),
+]
+
+
+async def _request_statements(session, tenant, path, caplog) -> tuple[int, int]:
+    """Run one GET through the app and return (statements, declared budget)."""
+    session.expunge_all()
+
+    async def override_db():
+        yield session
+
+    app.dependency_overrides[get_db] = override_db
+    caplog.clear()
+    try:
+        with caplog.at_level(logging.INFO, logger="app.access"):
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                response = await client.get(
+                    path,
+                    headers={
+                        "X-Admin-Key": "test-admin-key",
+                        "X-Admin-Actor": tenant.operator_email,
+                    },
+                )
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+    assert response.status_code == 200, response.text
+    (record,) = [r for r in caplog.records if r.name == "app.access"]
+    line = json.loads(record.getMessage().removeprefix("request "))
+    assert line["query_budget"] is not None, f"{path} declares no query budget"
+    return line["db_statements"], line["query_budget"]
+
+
+@pytest.mark.parametrize(("path", "add_rows"), ROUTES)
+async def test_budgeted_route_statements_do_not_grow_with_rows(
+    pg_async_session, caplog, path, add_rows
+):
+    tenant = await _seed_tenant(pg_async_session)
+
+    await add_rows(pg_async_session, tenant, ROWS)
+    statements, budget = await _request_statements(
+        pg_async_session, tenant, path(tenant), caplog
+    )
+    await add_rows(pg_async_session, tenant, ROWS)
+    doubled, _budget = await _request_statements(pg_async_session, tenant, path(tenant), caplog)
+
+    assert statements == doubled
+    assert doubled <= budget
@@ -42,7 +42,7 @@ class FakeDB:
         self.committed = True
 
 
-def test_live_domain_check_rejects_redirect_without_following_it():
+async def test_live_domain_check_rejects_redirect_without_following_it():
     requests: list[httpx.Request] = []
 
     def redirecting_handler(request: httpx.Request) -> httpx.Response:
@@ -53,12 +53,12 @@ def test_live_domain_check_rejects_redirect_without_following_it():
             request=request,
         )
 
-    with httpx.Client(
+    async with httpx.AsyncClient(
         transport=httpx.MockTransport(redirecting_handler),
         follow_redirects=False,
         timeout=httpx.Timeout(10.0, connect=5.0),
     ) as client:
-        healthy, reason = tasks._check_custom_domain_https(
+        healthy, reason = await tasks._check_custom_domain_https_async(
             client,
             "clinic.example.com",
             expected_hospital_id=uuid.uuid4(),
@@ -70,7 +70,7 @@ def test_live_domain_check_rejects_redirect_without_following_it():
     assert requests[0].url.path == "/.well-known/reputation-health"
 
 
-def test_live_domain_check_rejects_another_hospital_marker():
+async def test_live_domain_check_rejects_another_hospital_marker():
     expected_hospital_id = uuid.uuid4()
 
     def wrong_tenant_handler(request: httpx.Request) -> httpx.Response:
@@ -85,12 +85,12 @@ def test_live_domain_check_rejects_another_hospital_marker():
             request=request,
         )
 
-    with httpx.Client(
+    async with httpx.AsyncClient(
         transport=httpx.MockTransport(wrong_tenant_handler),
         follow_redirects=False,
         timeout=httpx.Timeout(10.0, connect=5.0),
     ) as client:
-        healthy, reason = tasks._check_custom_domain_https(
+        healthy, reason = await tasks._check_custom_domain_https_async(
             client,
             "clinic.example.com",
             expected_hospital_id=expected_hospital_id,
@@ -0,0 +1,91 @@
+import asyncio
+import os
+import weakref
+
+os.environ.setdefault("ADMIN_SECRET_KEY", "test-admin-key")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///tmp/reputation-test.db")
+os.environ.setdefault("SYNC_DATABASE_URL", "sqlite:///tmp/reputation-test.db")
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-anthropic-key")
+
+from types import SimpleNamespace  # noqa: E402
+
+from app.services import anthropic_client  # noqa: E402
+
+
+def _reset(monkeypatch):
+    monkeypatch.setattr(anthropic_client, "_async_clients", weakref.WeakKeyDictionary())
+    monkeypatch.setattr(anthropic_client, "_sync_client", None)
+    monkeypatch.setattr(anthropic_client, "_sync_semaphores", {})
+
+
+def test_async_client_is_shared_within_a_loop_and_rebuilt_for_a_new_loop(monkeypatch):
+    _reset(monkeypatch)
+
+    async def twice():
+        return anthropic_client.get_async_client(), anthropic_client.get_async_client()
+
+    first, second = asyncio.run(twice())
+    third, _ = asyncio.run(twice())
+
+    assert first is second
+    assert third is not first
+
+
+def test_each_live_loop_keeps_its_client_and_closed_loops_are_released(monkeypatch):
+    _reset(monkeypatch)
+    first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+
+    async def client():
+        return anthropic_client.get_async_client()
+
+    try:
+        first = first_loop.run_until_complete(client())
+        second = second_loop.run_until_complete(client())
+        # 스레드 루프가 둘인 워커에서 번갈아 호출해도 클라이언트를 갈아 끼우지 않는다.
+        assert first_loop.run_until_complete(client()) is first
+        assert second is not first
+
+        first_loop.close()
+        assert second_loop.run_until_complete(client()) is second
+        assert list(anthropic_client._async_clients) == [second_loop]
+    finally:
+        first_loop.close()
+        second_loop.close()
+
+
+def test_sync_client_is_process_wide_and_absent_without_key(monkeypatch):
+    _reset(monkeypatch)
+    assert anthropic_client.get_sync_client() is anthropic_client.get_sync_client()
+
+    _reset(monkeypatch)
+    monkeypatch.setattr(anthropic_client.settings, "ANTHROPIC_API_KEY", "")
+    assert anthropic_client.get_sync_client() is None
+
+
+def test_create_message_caps_concurrent_calls_per_model(monkeypatch):
+    _reset(monkeypatch)
+    monkeypatch.setattr(anthropic_client.settings, "ANTHROPIC_MODEL_CONCURRENCY", 2)
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def fake_create(*, model, **_kwargs):
+        in_flight[model] = in_flight.get(model, 0) + 1
+        peak[model] = max(peak.get(model, 0), in_flight[model])
+        await asyncio.sleep(0.01)
+        in_flight[model] -= 1
+        return model
+
+    fake_client = SimpleNamespace(messages=SimpleNamespace(create=fake_create))
+    monkeypatch.setattr(anthropic_client, "get_async_client", lambda: fake_client)
+
+    async def scenario():
+        calls = [
+            anthropic_client.create_message(model=model, max_tokens=10, messages=[])
+            for model in ["sonnet"] * 5 + ["haiku"] * 5
+        ]
+        return await asyncio.gather(*calls)
+
+    results = asyncio.run(scenario())
+
+    assert results.count("sonnet") == 5
+    assert peak == {"sonnet": 2, "haiku": 2}
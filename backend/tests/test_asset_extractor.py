@@ -4,6 +4,7 @@ import httpx
 import pytest
 
 from app.services import asset_extractor as asset_extractor_module
+from app.services import naver_feed_cache
 from app.services.asset_extractor import (
     FetchTarget,
     _assess_fetch_quality,
@@ -243,6 +244,14 @@ _SAMPLE_RSS = (
 )
 
 
+class _UnavailableRedis:
+    async def get(self, *_args, **_kwargs):
+        raise OSError("redis down")
+
+    async def set(self, *_args, **_kwargs):
+        raise OSError("redis down")
+
+
 def _patch_rss(monkeypatch, rss_bytes: bytes):
     from app.services import asset_extractor as ax
 
@@ -255,8 +264,12 @@ def _patch_rss(monkeypatch, rss_bytes: bytes):
     monkeypatch.setattr(ax, "_validate_fetch_target", lambda _url: (target, None))
     monkeypatch.setattr(ax, "_validate_response_peer", lambda _resp, _tgt: None)
 
+    monkeypatch.setattr(naver_feed_cache, "_client", lambda: _UnavailableRedis())
+
     class _Resp:
         content = rss_bytes
+        status_code = 200
+        headers: dict[str, str] = {}
 
         def raise_for_status(self):
             return None
@@ -312,6 +325,99 @@ async def test_fetch_naver_blog_post_urls_strips_tracking_query(monkeypatch):
     assert urls == ["https://blog.naver.com/jangpyeonhan/100"]
 
 
+class _MemoryRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+
+def _patch_conditional_rss(monkeypatch, responses):
+    """Serve queued (status, body, headers) RSS responses and record request headers."""
+    from app.services import asset_extractor as ax
+
+    _patch_rss(monkeypatch, b"")
+    redis = _MemoryRedis()
+    monkeypatch.setattr(naver_feed_cache, "_client", lambda: redis)
+    sent_headers = []
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *args):
+            return False
+
+        async def get(self, _url, headers=None):
+            sent_headers.append(dict(headers or {}))
+            status, body, response_headers = responses.pop(0)
+            return SimpleNamespace(
+                status_code=status,
+                content=body,
+                headers=response_headers,
+                raise_for_status=lambda: None,
+            )
+
+    monkeypatch.setattr(ax.httpx, "AsyncClient", _Client)
+    return ax, sent_headers
+
+
+@pytest.mark.asyncio
+async def test_unchanged_feed_is_revalidated_without_reparsing(monkeypatch):
+    ax, sent_headers = _patch_conditional_rss(
+        monkeypatch,
+        [
+            (200, _SAMPLE_RSS, {"etag": '"v1"', "last-modified": "Tue, 01 Oct 2024 00:00:00 GMT"}),
+            (304, b"", {}),
+            (200, _SAMPLE_RSS, {}),
+        ],
+    )
+
+    first, _ = await ax.fetch_naver_blog_post_urls("jangpyeonhan", max_posts=10)
+
+    def _no_parse(*_args, **_kwargs):
+        raise AssertionError("unchanged feed must not be parsed again")
+
+    import lxml.etree
+
+    monkeypatch.setattr(lxml.etree, "fromstring", _no_parse)
+    not_modified, error = await ax.fetch_naver_blog_post_urls("jangpyeonhan", max_posts=2)
+    same_body, _ = await ax.fetch_naver_blog_post_urls("jangpyeonhan", max_posts=10)
+
+    assert error is None
+    assert sent_headers[0].get("If-None-Match") is None
+    assert sent_headers[1]["If-None-Match"] == '"v1"'
+    assert sent_headers[1]["If-Modified-Since"] == "Tue, 01 Oct 2024 00:00:00 GMT"
+    assert not_modified == first[:2]
+    assert same_body == first
+
+
+@pytest.mark.asyncio
+async def test_changed_feed_replaces_cached_post_list(monkeypatch):
+    newer = _SAMPLE_RSS.replace(
+        b"<item><link>https://blog.naver.com/jangpyeonhan/300</link></item>",
+        b"<item><link>https://blog.naver.com/jangpyeonhan/400</link></item>",
+    )
+    ax, _sent = _patch_conditional_rss(
+        monkeypatch,
+        [(200, _SAMPLE_RSS, {"etag": '"v1"'}), (200, newer, {"etag": '"v2"'}), (304, b"", {})],
+    )
+
+    await ax.fetch_naver_blog_post_urls("jangpyeonhan", max_posts=10)
+    changed, _ = await ax.fetch_naver_blog_post_urls("jangpyeonhan", max_posts=10)
+    revalidated, _ = await ax.fetch_naver_blog_post_urls("jangpyeonhan", max_posts=10)
+
+    assert changed[-1] == "https://blog.naver.com/jangpyeonhan/400"
+    assert revalidated == changed
+
+
 @pytest.mark.asyncio
 async def test_fetch_naver_blog_post_urls_rejects_non_naver_ref(monkeypatch):
     from app.services import asset_extractor as ax
@@ -369,15 +475,36 @@ def _patch_html_fetch(monkeypatch, html: str):
     monkeypatch.setattr(ax, "_validate_fetch_target", lambda _url: (target, None))
     monkeypatch.setattr(ax, "_validate_response_peer", lambda _resp, _tgt: None)
 
+    ax, _consumed = _patch_streamed_body(monkeypatch, [html.encode("utf-8")])
+    return ax
+
+
+def _patch_streamed_body(monkeypatch, chunks):
+    """fetch_url_text의 스트림 응답이 `chunks`를 차례로 내보내게 한다. 소비한 조각 수를 센다."""
+    from app.services import asset_extractor as ax
+
+    consumed = []
+
     class _Resp:
         status_code = 200
         headers = {"content-type": "text/html; charset=utf-8"}
-        encoding = "utf-8"
-        content = html.encode("utf-8")
+        charset_encoding = "utf-8"
 
         def raise_for_status(self):
             return None
 
+        async def aiter_bytes(self):
+            for chunk in chunks:
+                consumed.append(len(chunk))
+                yield chunk
+
+    class _Stream:
+        async def __aenter__(self):
+            return _Resp()
+
+        async def __aexit__(self, *args):
+            return False
+
     class _Client:
         def __init__(self, *args, **kwargs):
             pass
@@ -388,11 +515,11 @@ def _patch_html_fetch(monkeypatch, html: str):
         async def __aexit__(self, *args):
             return False
 
-        async def get(self, *args, **kwargs):
-            return _Resp()
+        def stream(self, *args, **kwargs):
+            return _Stream()
 
     monkeypatch.setattr(ax.httpx, "AsyncClient", _Client)
-    return ax
+    return ax, consumed
 
 
 @pytest.mark.asyncio
@@ -423,6 +550,38 @@ async def test_fetch_url_text_keeps_normal_body_with_harmless_title(monkeypatch)
     assert quality is not None
 
 
+@pytest.mark.asyncio
+async def test_fetch_url_text_stops_reading_at_byte_cap(monkeypatch):
+    # 끝없이 이어지는 응답도 MAX_HTML_BYTES를 채우면 더 읽지 않는다.
+    monkeypatch.setattr(asset_extractor_module, "MAX_HTML_BYTES", 64 * 1024)
+    paragraph = "<p>" + "원장님은 치료 과정을 충분히 설명합니다. " * 100 + "</p>"
+    chunk = paragraph.encode("utf-8")
+
+    def endless():
+        yield b"<html><body>"
+        while True:
+            yield chunk
+
+    _patch_html_fetch(monkeypatch, "")
+    ax, consumed = _patch_streamed_body(monkeypatch, endless())
+    offloaded = []
+    original_to_thread = ax.asyncio.to_thread
+
+    async def tracking_to_thread(func, *args):
+        offloaded.append(func.__name__)
+        return await original_to_thread(func, *args)
+
+    monkeypatch.setattr(ax.asyncio, "to_thread", tracking_to_thread)
+
+    text, error, quality = await ax.fetch_url_text("https://example.com/page")
+
+    assert error is None
+    assert "충분히 설명합니다" in text
+    assert sum(consumed) <= 64 * 1024 + len(chunk)
+    # HTML→마크다운 변환은 이벤트 루프가 아니라 워커 스레드에서 돈다.
+    assert "_extract_page_text" in offloaded
+
+
 def test_validate_response_peer_falls_back_to_socket_getpeername():
     target = FetchTarget(
         url="https://example.com/source",
@@ -10,15 +10,22 @@ task_routes에 없는 태스크는 Celery 기본 "celery" 큐로 떨어져 영
 import re
 from pathlib import Path
 
-from app.core.celery_app import REDBEAT_SCHEDULE_VERSION, celery_app
+from app.core.celery_app import (
+    REDBEAT_SCHEDULE_VERSION,
+    WORKER_SIGNAL_MODULES,
+    WORKER_TASK_MODULES,
+    celery_app,
+    worker_modules,
+)
 
 _ENTRYPOINT = Path(__file__).resolve().parents[1] / "docker-entrypoint.sh"
 
 
 def _worker_queues_from_entrypoint() -> set[str]:
     text = _ENTRYPOINT.read_text(encoding="utf-8")
-    match = re.search(r"-Q\s+([a-z0-9_,\-]+)", text)
-    assert match, f"docker-entrypoint.sh에서 celery worker -Q 인자를 찾지 못했다: {_ENTRYPOINT}"
+    # 기본 worker의 -Q는 CELERY_WORKER_QUEUES 기본값을 그대로 쓴다.
+    match = re.search(r"CELERY_WORKER_QUEUES:-([a-z0-9_,\-]+)", text)
+    assert match, f"docker-entrypoint.sh에서 worker 큐 기본값을 찾지 못했다: {_ENTRYPOINT}"
     return {queue.strip() for queue in match.group(1).split(",") if queue.strip()}
 
 
@@ -86,6 +93,25 @@ def test_domain_certificate_task_is_loaded_and_routed():
     assert _resolved_queue(task_name) == "certificates"
 
 
+def test_every_routed_task_module_is_a_known_worker_module():
+    """큐별 include가 라우트에서 모듈을 고르므로, 목록에 없는 모듈의 태스크는 어느 워커도 못 연다."""
+    routed_modules = {name.rsplit(".", 1)[0] for name in celery_app.conf.task_routes}
+
+    assert routed_modules <= set(WORKER_TASK_MODULES)
+    assert worker_modules("") == [*WORKER_TASK_MODULES, *WORKER_SIGNAL_MODULES]
+
+
+def test_narrow_workers_skip_content_and_report_task_modules():
+    modules = worker_modules("leadgen, certificates")
+
+    assert "app.workers.lead_diagnosis_tasks" in modules
+    assert "app.workers.domain_certificate_tasks" in modules
+    assert "app.workers.tasks" not in modules
+    assert "app.workers.monthly_artifact_reconciliation" not in modules
+    assert set(WORKER_SIGNAL_MODULES) <= set(modules)
+    assert "app.workers.tasks" in worker_modules("images")
+
+
 def test_essence_auto_review_has_immediate_and_periodic_recovery_routes():
     review_task = "app.workers.tasks.auto_review_essence_snapshot"
     reconcile_task = "app.workers.tasks.reconcile_essence_snapshots"
@@ -98,6 +124,16 @@ def test_essence_auto_review_has_immediate_and_periodic_recovery_routes():
     assert REDBEAT_SCHEDULE_VERSION >= "2026-08-18.2"
 
 
+def test_operating_stats_reconcile_runs_daily_on_the_default_queue():
+    task_name = "app.workers.tasks.reconcile_hospital_operating_stats"
+    entry = celery_app.conf.beat_schedule["reconcile-hospital-operating-stats"]
+
+    assert _resolved_queue(task_name) == "default"
+    assert entry["task"] == task_name
+    assert (entry["schedule"].hour, entry["schedule"].minute) == ({4}, {30})
+    assert REDBEAT_SCHEDULE_VERSION >= "2026-10-19.1"
+
+
 def test_monthly_reports_close_after_the_next_month_boundary():
     """월간 리포트는 마감 뒤 일주일 동안 자동 재시도한다."""
     schedule = celery_app.conf.beat_schedule["monthly-reports"]["schedule"]
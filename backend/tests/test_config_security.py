@@ -25,6 +25,7 @@ def _valid_prod_kwargs(**overrides):
         ADMIN_SECRET_KEY="admin-secret",
         WORKER_DISPATCH_SECRET="worker-only-secret-32-bytes-minimum",
         SLACK_WEBHOOK_URL="https://hooks.slack.com/services/T00/B00/xxxx",
+        METRICS_BEARER_TOKEN="scrape-secret",
         DATABASE_URL="postgresql+asyncpg://postgres:postgres@db/reputation",
         SYNC_DATABASE_URL="postgresql+psycopg2://postgres:postgres@db/reputation",
         REDIS_URL="redis://redis.internal:6379/0",
@@ -53,6 +54,7 @@ def test_production_builds_database_urls_from_secret_parts(monkeypatch):
         ADMIN_SECRET_KEY="admin-secret",
         WORKER_DISPATCH_SECRET="worker-only-secret-32-bytes-minimum",
         SLACK_WEBHOOK_URL="https://hooks.slack.com/services/T00/B00/xxxx",
+        METRICS_BEARER_TOKEN="scrape-secret",
         DB_USER="reputation",
         DB_PASSWORD="p@ss word",
         DB_NAME="reputation",
@@ -160,6 +162,14 @@ def test_production_rejects_missing_worker_dispatch_secret(monkeypatch):
         Settings(**_valid_prod_kwargs(WORKER_DISPATCH_SECRET=""))
 
 
+def test_production_fails_fast_when_metrics_bearer_token_empty(monkeypatch):
+    # 토큰이 비면 /metrics·/queues/backlog가 무인증으로 열린다 — 프로덕션 부팅을 막는다.
+    monkeypatch.delenv("GCP_PROJECT_ID", raising=False)
+    monkeypatch.delenv("METRICS_BEARER_TOKEN", raising=False)
+    with pytest.raises(ValueError, match="METRICS_BEARER_TOKEN"):
+        Settings(**_valid_prod_kwargs(METRICS_BEARER_TOKEN=""))
+
+
 def test_production_does_not_probe_optional_unmanaged_jina_secret(monkeypatch):
     from app.core import config
 
@@ -15,6 +15,7 @@ from tenacity import stop_after_attempt  # noqa: E402
 from app.models.content import ContentType  # noqa: E402
 from app.services import content_engine  # noqa: E402
 from app.services.content_engine import (  # noqa: E402
+    FORBIDDEN_CHECK_FIELDS,
     _build_content_brief_context,
     _build_philosophy_context,
     _build_remediation_context,
@@ -29,7 +30,10 @@ from app.services.content_engine import (  # noqa: E402
     _validate_unverified_price_claims,
     forbidden_check_text,
 )
-from app.utils.medical_filter import check_forbidden  # noqa: E402
+from app.utils.medical_filter import (  # noqa: E402
+    check_forbidden,
+    check_forbidden_content_fields,
+)
 
 
 def test_parse_json_response_accepts_fenced_json():
@@ -206,6 +210,17 @@ def test_sanitize_forbidden_removes_obfuscated_terms():
     assert remaining == [], f"sanitizer left obfuscated violations: {remaining}"
 
 
+
+def test_sanitize_forbidden_removes_violations_split_by_markdown_emphasis():
+    result = {"title": "어깨 진료", "body": "최**고**의 치료를 안내합니다.", "meta_description": None}
+
+    violations = check_forbidden_content_fields(result, FORBIDDEN_CHECK_FIELDS)
+
+    sanitized = _sanitize_forbidden(result, violations)
+
+    assert sanitized["body"] == " 치료를 안내합니다."
+    assert check_forbidden_content_fields(sanitized, FORBIDDEN_CHECK_FIELDS) == []
+
 # ── references 정규화 순서 회귀 (P-2: GEO hard-fail이 raw references로 검증되던 버그) ──
 
 def _geo_hospital() -> SimpleNamespace:
@@ -276,13 +291,13 @@ async def test_generate_content_hard_fails_end_to_end_for_non_whitelisted_only_r
     class _FakeResponse:
         content = [SimpleNamespace(text=json.dumps(payload))]
 
-    def fake_create(*_args, **_kwargs):
+    async def fake_create(*_args, **_kwargs):
         return _FakeResponse()
 
     async def _no_sleep(*_args, **_kwargs):
         return None
 
-    monkeypatch.setattr(content_engine.client.messages, "create", fake_create)
+    monkeypatch.setattr(content_engine, "create_message", fake_create)
     monkeypatch.setattr(content_engine.generate_content.retry, "stop", stop_after_attempt(1))
     monkeypatch.setattr(content_engine.generate_content.retry, "sleep", _no_sleep)
 
@@ -355,3 +370,75 @@ def test_legacy_empty_approved_philosophy_gets_runtime_safety_floor():
 
     assert "의료광고 공통 금지 표현" in context
     assert "치료 효과·성공·완치·안전성을 단정하거나 보장하지 않습니다." in context
+
+
+# ── 기존 제목: 가까운 K개만 프롬프트에, 중복은 로컬에서 거부 ──────────────────────
+
+def _title_test_hospital():
+    return SimpleNamespace(
+        name="테스트병원",
+        address="서울",
+        phone="02-000-0000",
+        business_hours="",
+        region=["강남"],
+        specialties=["정형외과"],
+        keywords=["어깨 통증"],
+        director_name="김원장",
+        director_career="",
+        director_philosophy="",
+        treatments=[],
+    )
+
+
+async def test_generate_content_prompt_lists_only_nearest_existing_titles(monkeypatch):
+    existing_titles = [f"감기 예방 수칙 {n}" for n in range(200)] + ["어깨 통증 스트레칭"]
+    prompts: list[str] = []
+
+    async def fake_create(*_args, **kwargs):
+        prompts.append(kwargs["messages"][0]["content"])
+        raise ValueError("stop after prompt capture")
+
+    async def _no_sleep(*_args, **_kwargs):
+        return None
+
+    monkeypatch.setattr(content_engine, "create_message", fake_create)
+    monkeypatch.setattr(content_engine.generate_content.retry, "stop", stop_after_attempt(1))
+    monkeypatch.setattr(content_engine.generate_content.retry, "sleep", _no_sleep)
+
+    with pytest.raises(ValueError, match="stop after prompt capture"):
+        await content_engine.generate_content(
+            _title_test_hospital(),
+            ContentType.DISEASE,
+            existing_titles,
+            content_brief={"target_query": "어깨 통증"},
+        )
+
+    avoid_block = prompts[0].split("이미 작성된 제목 (중복 금지):\n", 1)[1]
+    listed = [line for line in avoid_block.splitlines() if line.startswith("- ")]
+    assert listed[0] == "- 어깨 통증 스트레칭"
+    assert len(listed) <= content_engine.PROMPT_NEIGHBOR_LIMIT
+    assert "감기 예방 수칙 0" not in prompts[0]
+
+
+async def test_generate_content_rejects_near_duplicate_title_before_write_back(monkeypatch):
+    payload = {"title": "어깨 통증의 원인과 치료 방법", "body": "## 증상\n본문"}
+
+    class _FakeResponse:
+        content = [SimpleNamespace(text=json.dumps(payload))]
+
+    async def fake_create(**_kwargs):
+        return _FakeResponse()
+
+    async def _no_sleep(*_args, **_kwargs):
+        return None
+
+    monkeypatch.setattr(content_engine, "create_message", fake_create)
+    monkeypatch.setattr(content_engine.generate_content.retry, "stop", stop_after_attempt(1))
+    monkeypatch.setattr(content_engine.generate_content.retry, "sleep", _no_sleep)
+
+    with pytest.raises(ValueError, match="duplicates existing content"):
+        await content_engine.generate_content(
+            _title_test_hospital(),
+            ContentType.DISEASE,
+            ["어깨 통증 원인과 치료 방법"],
+        )
@@ -373,8 +373,9 @@ class TestValidateGeo:
 
 
 class _ReferenceClient:
-    def __init__(self, responses, *args, **kwargs):
+    def __init__(self, responses, *args, calls=None, **kwargs):
         self.responses = responses
+        self.calls = calls if calls is not None else []
 
     async def __aenter__(self):
         return self
@@ -382,7 +383,15 @@ class _ReferenceClient:
     async def __aexit__(self, *_args):
         return False
 
+    async def head(self, url, headers):
+        self.calls.append(("HEAD", url))
+        return self._respond(url)
+
     async def get(self, url, headers):
+        self.calls.append(("GET", url))
+        return self._respond(url)
+
+    def _respond(self, url):
         status, final_url = self.responses[url]
         return httpx.Response(
             status,
@@ -392,6 +401,14 @@ class _ReferenceClient:
         ) if final_url == url else SimpleNamespace(status_code=status, url=httpx.URL(final_url))
 
 
+class _UnavailableRedis:
+    async def mget(self, _keys):
+        raise OSError("redis down")
+
+    def pipeline(self, **_kwargs):
+        raise OSError("redis down")
+
+
 @pytest.mark.asyncio
 async def test_reference_verification_drops_404_and_external_redirect(monkeypatch):
     refs = [
@@ -405,9 +422,12 @@ async def test_reference_verification_drops_404_and_external_redirect(monkeypatc
         refs[2]["url"]: (200, "https://example.com/landing"),
     }
     monkeypatch.setattr(
-        "app.services.content_engine.httpx.AsyncClient",
+        "app.services.reference_link_health.httpx.AsyncClient",
         lambda *args, **kwargs: _ReferenceClient(responses, *args, **kwargs),
     )
+    monkeypatch.setattr(
+        "app.services.reference_link_health._client", lambda: _UnavailableRedis()
+    )
 
     kept = await _drop_definitively_broken_references(refs)
 
@@ -1,8 +1,11 @@
 import json
 import uuid
+from datetime import datetime, timezone
 from types import SimpleNamespace
 
+from app.models.essence import SourceStatus
 from app.services import essence_auto_review
+from app.services.essence_engine import compute_sources_snapshot_hash
 
 
 def _empty_candidate(source_id: uuid.UUID) -> dict:
@@ -266,3 +269,43 @@ def test_second_ai_adjudicator_fails_closed_below_confidence(monkeypatch) -> Non
     assert review.approves is False
     assert review.decision == "ESCALATE"
     assert review.findings == ("근거 범위 확인 필요",)
+
+
+def test_refresh_candidates_hash_every_hospital_from_one_projected_source_load(monkeypatch) -> None:
+    def source(status=SourceStatus.PROCESSED):
+        return SimpleNamespace(
+            id=uuid.uuid4(),
+            content_hash="hash",
+            status=status,
+            processed_at=datetime(2026, 5, 1, tzinfo=timezone.utc),
+        )
+
+    unchanged, changed, pending, empty = (uuid.uuid4() for _ in range(4))
+    snapshot_sources = {
+        unchanged: [source()],
+        changed: [source(), source()],
+        pending: [source(), source(SourceStatus.PENDING)],
+        empty: [],
+    }
+    approved_hashes = [(unchanged, compute_sources_snapshot_hash(snapshot_sources[unchanged]))]
+    statements = []
+
+    class _Db:
+        def execute(self, statement):
+            statements.append(statement)
+            return SimpleNamespace(all=lambda: approved_hashes)
+
+    checked = []
+    monkeypatch.setattr(
+        essence_auto_review,
+        "_snapshot_refresh_unclaimed",
+        lambda _db, hospital_id, _hash, _ids: checked.append(hospital_id) or True,
+    )
+
+    needed = essence_auto_review.essence_refresh_candidates(
+        _Db(), list(snapshot_sources), snapshot_sources=snapshot_sources
+    )
+
+    assert needed == [changed]
+    assert checked == [changed]
+    assert len(statements) == 1
@@ -104,6 +104,205 @@ def test_llm_source_processing_keeps_only_verbatim_excerpts(monkeypatch, llm_key
     assert fake.messages.calls[0]["output_config"]["format"]["type"] == "json_schema"
 
 
+class _DictExtractionCache:
+    def __init__(self):
+        self.values: dict[str, list[dict]] = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, notes):
+        self.values[key] = notes
+
+
+_CACHED_SOURCE_TEXT = "원장님은 치료 전 충분한 설명을 드리는 것을 중요하게 생각합니다."
+_CACHED_SOURCE_NOTES = json.dumps(
+    {
+        "evidence_notes": [
+            {
+                "note_type": "DOCTOR_PHILOSOPHY",
+                "claim": "원장은 충분한 설명을 중요하게 여긴다.",
+                "source_excerpt": "치료 전 충분한 설명을 드리는 것을 중요하게 생각합니다",
+                "confidence": 0.9,
+                "note_metadata": {},
+            }
+        ]
+    }
+)
+
+
+def test_identical_source_text_reuses_cached_extraction(monkeypatch, llm_key):
+    fake = _patch_client(monkeypatch, _CACHED_SOURCE_NOTES)
+    cache = _DictExtractionCache()
+
+    def asset():
+        return SimpleNamespace(
+            title="블로그 글", url="https://blog.naver.com/x/1", raw_text=_CACHED_SOURCE_TEXT,
+            operator_note=None,
+        )
+
+    first = process_source_asset(asset(), cache=cache)
+    second = process_source_asset(asset(), cache=cache)
+
+    assert len(fake.messages.calls) == 1
+    assert [n.source_excerpt for n in second] == [n.source_excerpt for n in first]
+    assert second[0].excerpt_start == first[0].excerpt_start
+
+
+def test_changed_text_or_protocol_misses_the_extraction_cache(monkeypatch, llm_key):
+    fake = _patch_client(monkeypatch, _CACHED_SOURCE_NOTES)
+    cache = _DictExtractionCache()
+    asset = SimpleNamespace(
+        title="자료", url=None, raw_text=_CACHED_SOURCE_TEXT, operator_note=None
+    )
+
+    process_source_asset(asset, cache=cache)
+    asset.operator_note = "상담 시간을 충분히 둡니다."
+    process_source_asset(asset, cache=cache)
+    monkeypatch.setattr(essence_engine.settings, "CLAUDE_MODEL_FAST", "claude-other-model")
+    process_source_asset(asset, cache=cache)
+
+    assert len(fake.messages.calls) == 3
+
+
+def test_unusable_llm_response_is_not_cached(monkeypatch, llm_key):
+    fake = _patch_client(monkeypatch, json.dumps({"evidence_notes": []}))
+    cache = _DictExtractionCache()
+    asset = SimpleNamespace(
+        title="자료", url=None, raw_text=_CACHED_SOURCE_TEXT, operator_note=None
+    )
+
+    process_source_asset(asset, cache=cache)
+    process_source_asset(asset, cache=cache)
+
+    assert cache.values == {}
+    assert len(fake.messages.calls) == 2
+
+
+def test_long_source_text_splits_into_overlapping_contiguous_chunks():
+    paragraphs = [f"{index}번 문단입니다. " + "가" * 300 for index in range(40)]
+    raw_text = "\n\n".join(paragraphs)
+
+    chunks = essence_engine.split_raw_text_chunks(raw_text, chunk_chars=2000, overlap_chars=200)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 2000 for chunk in chunks)
+    assert all(chunk in raw_text for chunk in chunks)
+    # 구간 경계는 문단 경계이고, 다음 구간은 앞 구간의 끝부분을 다시 포함한다.
+    assert all(raw_text[raw_text.find(chunk) + len(chunk)] == "\n" for chunk in chunks[:-1])
+    assert all(chunk[-200:] in chunks[index + 1] for index, chunk in enumerate(chunks[:-1]))
+    assert chunks[-1].endswith(paragraphs[-1])
+    assert essence_engine.split_raw_text_chunks("짧은 원문") == ["짧은 원문"]
+
+
+class _ChunkRoutingMessages:
+    """구간 메시지에 들어 있는 문장에 따라 다른 노트를 돌려준다."""
+
+    def __init__(self, notes_by_marker: dict[str, dict]):
+        self._notes_by_marker = notes_by_marker
+        self.calls: list[dict] = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        content = kwargs["messages"][0]["content"]
+        notes = [note for marker, note in self._notes_by_marker.items() if marker in content]
+        return _FakeMessage(json.dumps({"evidence_notes": notes}))
+
+
+def test_long_source_extracts_every_chunk_and_verifies_against_full_text(monkeypatch, llm_key):
+    head = "원장님은 치료 전 충분한 설명을 드리는 것을 중요하게 생각합니다."
+    tail = "치질 수술은 환자 상태에 따라 상담 후 결정합니다."
+    filler = "\n\n".join("병원 소개 문단입니다. " + "나" * 500 for _ in range(120))
+    raw_text = f"{head}\n\n{filler}\n\n{tail}"
+    assert len(raw_text) > essence_engine._RAW_TEXT_FOR_LLM_LIMIT * 2
+    head_note = {
+        "note_type": "DOCTOR_PHILOSOPHY",
+        "claim": "원장은 충분한 설명을 중요하게 여긴다.",
+        "source_excerpt": "치료 전 충분한 설명을 드리는 것을 중요하게 생각합니다",
+        "confidence": 0.9,
+        "note_metadata": {},
+    }
+    tail_note = {
+        "note_type": "TREATMENT_SIGNAL",
+        "claim": "치질 수술은 상담 후 결정한다.",
+        "source_excerpt": "치질 수술은 환자 상태에 따라 상담 후 결정합니다",
+        "confidence": 0.8,
+        "note_metadata": {"treatment": "치질 수술"},
+    }
+    # 모든 구간이 같은 문단을 보고 같은 노트를 내도 한 번만 남아야 한다.
+    filler_note = {
+        "note_type": "KEY_MESSAGE",
+        "claim": "병원을 소개한다.",
+        "source_excerpt": "병원 소개 문단입니다.",
+        "confidence": 0.6,
+        "note_metadata": {},
+    }
+    fake = _FakeAnthropic("")
+    fake.messages = _ChunkRoutingMessages(
+        {head: head_note, tail: tail_note, "병원 소개 문단입니다.": filler_note}
+    )
+    monkeypatch.setattr(essence_engine, "_anthropic_client", lambda: fake)
+    cache = _DictExtractionCache()
+    asset = SimpleNamespace(title="안내 책자", url=None, raw_text=raw_text, operator_note=None)
+
+    notes = process_source_asset(asset, cache=cache)
+
+    chunk_count = len(essence_engine.split_raw_text_chunks(raw_text))
+    assert len(fake.messages.calls) == chunk_count > 1
+    excerpts = [n.source_excerpt for n in notes]
+    assert excerpts.count("병원 소개 문단입니다.") == 1
+    tail_payload = next(n for n in notes if n.source_excerpt == tail_note["source_excerpt"])
+    # 마지막 구간에서 나온 발췌도 원문 전체 기준 오프셋을 갖는다.
+    assert tail_payload.excerpt_start == raw_text.index(tail_note["source_excerpt"])
+    assert head_note["source_excerpt"] in excerpts
+
+    process_source_asset(asset, cache=cache)
+    assert len(fake.messages.calls) == chunk_count
+
+
+class _ParagraphNotesMessages:
+    """구간 메시지에 보이는 문단마다 노트를 하나씩, 구간당 노트 상한까지 돌려준다."""
+
+    def __init__(self, sentences: list[str]):
+        self._sentences = sentences
+        self.calls: list[dict] = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        content = kwargs["messages"][0]["content"]
+        notes = [
+            {
+                "note_type": "KEY_MESSAGE",
+                "claim": sentence,
+                "source_excerpt": sentence,
+                "confidence": 0.7,
+                "note_metadata": {},
+            }
+            for sentence in self._sentences
+            if sentence in content
+        ][: essence_engine._MAX_NOTES_PER_SOURCE]
+        return _FakeMessage(json.dumps({"evidence_notes": notes}))
+
+
+def test_chunked_source_keeps_notes_from_every_chunk_under_the_note_cap(monkeypatch, llm_key):
+    sentences = [f"{index:03d}번 안내 문단은 진료 과정을 설명합니다." for index in range(200)]
+    raw_text = "\n\n".join(sentence + " " + "다" * 500 for sentence in sentences)
+    chunks = essence_engine.split_raw_text_chunks(raw_text)
+    assert 4 <= len(chunks) <= essence_engine._RAW_TEXT_MAX_CHUNKS
+    fake = _FakeAnthropic("")
+    fake.messages = _ParagraphNotesMessages(sentences)
+    monkeypatch.setattr(essence_engine, "_anthropic_client", lambda: fake)
+    asset = SimpleNamespace(title="안내 책자", url=None, raw_text=raw_text, operator_note=None)
+
+    notes = process_source_asset(asset)
+
+    assert len(notes) == essence_engine._MAX_NOTES_PER_CHUNKED_SOURCE
+    excerpts = {note.source_excerpt for note in notes}
+    # 앞 두 구간의 노트(구간당 20개)만으로 상한이 차지 않고, 3번째 이후 구간도 남는다.
+    for chunk in chunks[2:]:
+        assert any(sentence in chunk and sentence in excerpts for sentence in sentences)
+
+
 def test_llm_synthesis_produces_grounded_voice_and_narrative(monkeypatch, llm_key):
     note_voice = SimpleNamespace(
         id=uuid.uuid4(),
@@ -2,9 +2,18 @@ import uuid
 from datetime import datetime, timezone
 from types import SimpleNamespace
 
-from app.models.essence import SourceStatus, SourceType
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.models.essence import (
+    HospitalContentPhilosophy,
+    HospitalSourceAsset,
+    PhilosophyStatus,
+    SourceStatus,
+    SourceType,
+    _readiness_hospital_ids,
+)
 from app.services.essence_engine import compute_sources_snapshot_hash
-from app.services.essence_readiness import resolve_essence_readiness
+from app.services.essence_readiness import _readiness_from_projection, resolve_essence_readiness
 
 
 def _source(*, status=SourceStatus.PROCESSED, source_type=SourceType.HOMEPAGE):
@@ -64,3 +73,70 @@ def test_absorbed_new_processed_source_keeps_public_on_intact_approved_baseline(
     assert readiness.public_philosophy is philosophy
     assert readiness.is_fresh is False
     assert readiness.is_stale is True
+
+
+def _persistent(session, obj):
+    make_transient_to_detached(obj)
+    session.add(obj)
+    return obj
+
+
+def test_flush_tracking_only_marks_hospitals_whose_readiness_inputs_changed():
+    session = Session()
+    edited, renamed, moved_from, moved_to, added = (uuid.uuid4() for _ in range(5))
+    status_change = _persistent(
+        session,
+        HospitalSourceAsset(id=uuid.uuid4(), hospital_id=edited, status=SourceStatus.PENDING),
+    )
+    title_change = _persistent(
+        session, HospitalSourceAsset(id=uuid.uuid4(), hospital_id=renamed, title="before")
+    )
+    philosophy = _persistent(
+        session,
+        HospitalContentPhilosophy(
+            id=uuid.uuid4(), hospital_id=moved_from, status=PhilosophyStatus.DRAFT
+        ),
+    )
+    session.add(HospitalSourceAsset(hospital_id=added, title="new"))
+
+    status_change.status = SourceStatus.PROCESSED
+    title_change.title = "after"
+    philosophy.hospital_id = moved_to
+
+    assert _readiness_hospital_ids(session) == {edited, moved_from, moved_to, added}
+
+
+def _projection_row(philosophy, *, public_philosophy_id):
+    return SimpleNamespace(
+        HospitalContentPhilosophy=philosophy,
+        approved_philosophy_id=philosophy.id if philosophy is not None else None,
+        public_philosophy_id=public_philosophy_id,
+        processed_source_count=2,
+        required_source_count=3,
+        current_snapshot_hash="snapshot",
+        complete_snapshot_is_fresh=False,
+    )
+
+
+def test_projection_row_resolves_public_philosophy_without_source_rows():
+    philosophy = SimpleNamespace(id=uuid.uuid4(), status=PhilosophyStatus.APPROVED)
+
+    public = _readiness_from_projection(
+        _projection_row(philosophy, public_philosophy_id=philosophy.id)
+    )
+    withheld = _readiness_from_projection(_projection_row(philosophy, public_philosophy_id=None))
+
+    assert public.current is philosophy
+    assert public.has_unprocessed_sources is True
+    assert public.is_stale is True
+    assert withheld.approved is philosophy
+    assert withheld.current is None
+
+
+def test_projection_pointing_at_an_unapproved_philosophy_falls_back_to_recomputation():
+    archived = SimpleNamespace(id=uuid.uuid4(), status=PhilosophyStatus.ARCHIVED)
+    row = _projection_row(archived, public_philosophy_id=archived.id)
+    missing = SimpleNamespace(**{**vars(row), "HospitalContentPhilosophy": None})
+
+    assert _readiness_from_projection(row) is None
+    assert _readiness_from_projection(missing) is None
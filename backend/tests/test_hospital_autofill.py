@@ -106,9 +106,10 @@ async def test_autofill_profile_happy_path(monkeypatch):
         "address": {"value": "수원시 팔달구", "source": "naver", "confidence": 0.95, "evidence": "수원시 팔달구"},
         "director_career": {"value": "완치율 최고 보장", "source": "homepage", "confidence": 0.6, "evidence": "완치율 최고 보장"},
     }
-    monkeypatch.setattr(
-        af._client.messages, "create", lambda **kwargs: _fake_claude_response(fields)
-    )
+    async def fake_create(**_kwargs):
+        return _fake_claude_response(fields)
+
+    monkeypatch.setattr(af, "create_message", fake_create)
 
     res = await af.autofill_profile("장편한외과의원", "http://hp", "http://blog")
 
@@ -142,11 +143,11 @@ async def test_autofill_profile_all_sources_fail_returns_empty(monkeypatch):
     # Claude는 호출되면 안 되지만, 호출돼도 빈 결과를 보장.
     called = {"n": 0}
 
-    def _should_not_call(**kwargs):
+    async def _should_not_call(**kwargs):
         called["n"] += 1
         return _fake_claude_response({})
 
-    monkeypatch.setattr(af._client.messages, "create", _should_not_call)
+    monkeypatch.setattr(af, "create_message", _should_not_call)
 
     res = await af.autofill_profile("없는병원", "http://hp", None)
     assert res.draft == {}
@@ -194,9 +195,10 @@ async def test_autofill_profile_direct_fetch_unpacks_three_tuple(monkeypatch):
     monkeypatch.setattr(af.naver_place, "scrape_naver_place", fake_naver)
 
     fields = {"director_name": {"value": "김원장", "source": "homepage", "confidence": 0.9, "evidence": "김원장"}}
-    monkeypatch.setattr(
-        af._client.messages, "create", lambda **kwargs: _fake_claude_response(fields)
-    )
+    async def fake_create(**_kwargs):
+        return _fake_claude_response(fields)
+
+    monkeypatch.setattr(af, "create_message", fake_create)
 
     res = await af.autofill_profile("장편한외과의원", "http://hp", "http://blog")
 
@@ -218,7 +220,10 @@ async def test_autofill_rejects_ungrounded_specialty_and_hours(monkeypatch):
         "specialties": {"value": ["소아청소년과"], "source": "homepage", "confidence": 0.9, "evidence": "내과 진료"},
         "business_hours": {"value": {"mon": "09:00-20:00"}, "source": "homepage", "confidence": 0.9, "evidence": "월요일 09:00-18:00"},
     }
-    monkeypatch.setattr(af._client.messages, "create", lambda **kwargs: _fake_claude_response(fields))
+    async def fake_create(**_kwargs):
+        return _fake_claude_response(fields)
+
+    monkeypatch.setattr(af, "create_message", fake_create)
 
     res = await af.autofill_profile("병원", "http://hp", None)
 
@@ -274,9 +279,10 @@ async def test_autofill_endpoint_end_to_end_with_real_signature(monkeypatch):
     monkeypatch.setattr(af, "fetch_url_text", ok_fetch)
     monkeypatch.setattr(af.naver_place, "scrape_naver_place", fake_naver)
     fields = {"director_name": {"value": "김원장", "source": "homepage", "confidence": 0.9, "evidence": "김원장"}}
-    monkeypatch.setattr(
-        af._client.messages, "create", lambda **kwargs: _fake_claude_response(fields)
-    )
+    async def fake_create(**_kwargs):
+        return _fake_claude_response(fields)
+
+    monkeypatch.setattr(af, "create_message", fake_create)
 
     import uuid as _uuid
     from types import SimpleNamespace
@@ -0,0 +1,140 @@
+import uuid
+from io import BytesIO
+
+import pytest
+from fastapi.responses import FileResponse
+from PIL import Image
+
+from app.api.public.assets import public_image_response
+from app.services import asset_storage, image_derivatives
+
+
+def _png(width: int, height: int) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), (40, 120, 160)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def local_original(tmp_path, monkeypatch):
+    monkeypatch.setattr(asset_storage, "LOCAL_UPLOAD_DIR", tmp_path)
+    hospital_id = uuid.uuid4()
+    (tmp_path / str(hospital_id)).mkdir()
+    data = _png(1200, 675)
+    (tmp_path / str(hospital_id) / "cover.png").write_bytes(data)
+    return hospital_id, f"local://{hospital_id}/cover.png", data
+
+
+def test_store_image_variants_writes_bounded_widths_next_to_the_original(local_original):
+    hospital_id, original_ref, _data = local_original
+
+    manifest = image_derivatives.build_image_variants(original_ref)
+
+    assert manifest is not None
+    assert (manifest["width"], manifest["height"]) == (1200, 675)
+    assert manifest["placeholder"].startswith("data:image/webp;base64,")
+    formats = image_derivatives.available_formats()
+    # 1600은 원본보다 넓어 원본 폭으로 잘린다 — 늘린 파생본은 만들지 않는다.
+    assert sorted({variant["width"] for variant in manifest["variants"]}) == [480, 960, 1200]
+    assert len(manifest["variants"]) == 3 * len(formats)
+    for variant in manifest["variants"]:
+        assert variant["ref"] == f"local://{hospital_id}/cover.w{variant['width']}.{variant['format']}"
+        path = asset_storage.resolve_local_asset_path(variant["ref"], expected_hospital_id=hospital_id)
+        with Image.open(path) as stored:
+            assert stored.width == variant["width"]
+            assert stored.height == variant["height"]
+
+
+def test_store_image_variants_fails_open_on_unreadable_bytes(local_original):
+    _hospital_id, original_ref, _data = local_original
+
+    assert image_derivatives.store_image_variants(original_ref, b"not an image") is None
+
+
+_MANIFEST = {
+    "width": 1200,
+    "height": 675,
+    "placeholder": None,
+    "variants": [
+        {"format": fmt, "width": width, "height": 1, "ref": f"gs://b/c/x.w{width}.{fmt}"}
+        for width in (480, 960, 1200)
+        for fmt in ("avif", "webp")
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    ("accept", "width", "image_format", "expected"),
+    [
+        ("image/avif,image/webp,*/*", None, None, ("avif", 1200)),
+        ("image/webp,*/*", 500, None, ("webp", 960)),
+        ("image/avif;q=0,image/webp", 2000, None, ("webp", 1200)),
+        ("image/avif,image/webp", 300, "webp", ("webp", 480)),
+        ("image/png,*/*", None, None, None),
+        ("image/avif", None, "original", None),
+    ],
+)
+def test_choose_image_variant_negotiates_format_and_width(accept, width, image_format, expected):
+    chosen = image_derivatives.choose_image_variant(
+        _MANIFEST, accept=accept, width=width, image_format=image_format
+    )
+
+    if expected is None:
+        assert chosen is None
+    else:
+        assert (chosen["format"], chosen["width"]) == expected
+
+
+def test_public_image_response_serves_negotiated_variant_and_varies_on_accept(local_original):
+    hospital_id, original_ref, _data = local_original
+    manifest = image_derivatives.build_image_variants(original_ref)
+
+    response = public_image_response(
+        original_ref,
+        manifest,
+        hospital_id=hospital_id,
+        media_type="image/png",
+        accept="image/webp",
+        width=400,
+    )
+
+    assert isinstance(response, FileResponse)
+    assert response.media_type == "image/webp"
+    assert str(response.path).endswith("cover.w480.webp")
+    assert response.headers["Vary"] == "Accept"
+
+
+def test_public_image_response_ignores_variant_refs_outside_the_original(local_original):
+    hospital_id, original_ref, _data = local_original
+    forged = {
+        "variants": [
+            {"format": "webp", "width": 480, "height": 270, "ref": "gs://other-bucket/secret.webp"}
+        ]
+    }
+
+    response = public_image_response(
+        original_ref,
+        forged,
+        hospital_id=hospital_id,
+        media_type="image/png",
+        accept="image/webp",
+    )
+
+    assert response.media_type == "image/png"
+    assert str(response.path).endswith("cover.png")
+
+
+def test_content_items_and_photos_serialize_dimensions_with_the_same_keys(local_original):
+    _hospital_id, original_ref, data = local_original
+    manifest = image_derivatives.store_image_variants(original_ref, data)
+
+    assert image_derivatives.image_dimensions(manifest) == {
+        "image_width": 1200,
+        "image_height": 675,
+        "image_placeholder": manifest["placeholder"],
+    }
+    assert image_derivatives.image_dimensions(None) == {
+        "image_width": None,
+        "image_height": None,
+        "image_placeholder": None,
+    }
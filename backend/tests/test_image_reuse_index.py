@@ -0,0 +1,110 @@
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageDraw
+
+from app.services import image_engine, image_reuse_index
+
+
+def _png(draw_shape) -> bytes:
+    image = Image.new("RGB", (320, 180), (235, 228, 214))
+    draw_shape(ImageDraw.Draw(image))
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _reencoded_jpeg(data: bytes) -> bytes:
+    buffer = BytesIO()
+    with Image.open(BytesIO(data)) as image:
+        image.convert("RGB").save(buffer, format="JPEG", quality=70)
+    return buffer.getvalue()
+
+
+_CIRCLE = _png(lambda draw: draw.ellipse((20, 20, 140, 140), fill=(30, 50, 110)))
+_BARS = _png(lambda draw: draw.rectangle((200, 0, 320, 180), fill=(180, 150, 60)))
+
+
+class _MemoryIndex:
+    def __init__(self):
+        self.prompts: dict[str, str] = {}
+        self.images: dict[str, list[tuple[int, str]]] = {}
+
+    def find_prompt_asset(self, fingerprint):
+        return self.prompts.get(fingerprint)
+
+    def remember_prompt_asset(self, fingerprint, ref):
+        self.prompts[fingerprint] = ref
+
+    def near_duplicate(self, scope, phash):
+        for stored, ref in self.images.get(scope, []):
+            distance = image_reuse_index.hash_distance(stored, phash)
+            if distance <= image_reuse_index.NEAR_DUPLICATE_DISTANCE:
+                return ref
+        return None
+
+    def remember_image(self, scope, phash, ref):
+        self.images.setdefault(scope, []).insert(0, (phash, ref))
+
+
+@pytest.fixture
+def memory_index(monkeypatch):
+    index = _MemoryIndex()
+    monkeypatch.setattr(image_engine, "default_image_reuse_index", lambda: index)
+    return index
+
+
+def test_perceptual_hash_survives_reencoding_but_separates_compositions():
+    circle = image_reuse_index.perceptual_hash(_CIRCLE)
+
+    reencoded = image_reuse_index.perceptual_hash(_reencoded_jpeg(_CIRCLE))
+    bars = image_reuse_index.perceptual_hash(_BARS)
+
+    assert image_reuse_index.hash_distance(circle, reencoded) <= (
+        image_reuse_index.NEAR_DUPLICATE_DISTANCE
+    )
+    assert image_reuse_index.hash_distance(circle, bars) > (
+        image_reuse_index.NEAR_DUPLICATE_DISTANCE
+    )
+
+
+def test_near_duplicate_within_a_hospital_is_rejected_before_upload(monkeypatch, memory_index):
+    uploads = []
+
+    def fake_upload(image_bytes, hospital_name):
+        uploads.append(hospital_name)
+        return f"gs://bucket/content/{hospital_name}/{len(uploads)}.png"
+
+    monkeypatch.setattr(image_engine, "_upload_png_to_gcs", fake_upload)
+
+    first = image_engine._store_generated_png(_CIRCLE, "clinic-a", "topic prompt")
+    with pytest.raises(image_engine.NearDuplicateImageError):
+        image_engine._store_generated_png(_reencoded_jpeg(_CIRCLE), "clinic-a", "other topic")
+    # 다른 병원의 이미지와는 비교하지 않는다.
+    other = image_engine._store_generated_png(_CIRCLE, "clinic-b", "topic prompt")
+
+    assert first == "gs://bucket/content/clinic-a/1.png"
+    assert other == "gs://bucket/content/clinic-b/2.png"
+    assert uploads == ["clinic-a", "clinic-b"]
+
+
+def test_safety_fallback_reuses_the_existing_asset_without_a_provider_call(
+    monkeypatch, memory_index
+):
+    calls = []
+
+    def fake_generate(prompt, hospital_name, *, counter=None):
+        calls.append((prompt, hospital_name))
+        if counter is not None:
+            counter.tick()
+        return f"gs://bucket/content/{hospital_name}/fallback.png"
+
+    monkeypatch.setattr(image_engine, "_generate_and_upload", fake_generate)
+    counter = image_engine._CallCounter()
+
+    first = image_engine._reuse_or_generate_safety_fallback("clinic-a", counter=counter)
+    second = image_engine._reuse_or_generate_safety_fallback("clinic-b", counter=counter)
+
+    assert first == second == "gs://bucket/content/clinic-a/fallback.png"
+    assert calls == [(image_engine.GOOGLE_SAFETY_FALLBACK_PROMPT, "clinic-a")]
+    assert counter.count == 1
@@ -0,0 +1,45 @@
+"""Boot imports: provider SDKs and heavy optional libraries load on first use only."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.import_profile import DEFERRED_MODULES
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+_LOADED = (
+    "import json, sys\n"
+    "{boot}\n"
+    "print(json.dumps(sorted(name for name in {deferred!r} if name in sys.modules)))\n"
+)
+
+
+def _deferred_loaded(boot: str, **env: str) -> list[str]:
+    completed = subprocess.run(
+        [sys.executable, "-c", _LOADED.format(boot=boot, deferred=DEFERRED_MODULES)],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **env},
+        cwd=BACKEND_DIR,
+        check=True,
+    )
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+def test_api_boot_defers_heavy_imports() -> None:
+    assert _deferred_loaded("import app.main") == []
+
+
+def test_narrow_worker_boot_skips_fastapi_and_heavy_imports() -> None:
+    boot = (
+        "import importlib\n"
+        "from app.core.celery_app import celery_app\n"
+        "for module in celery_app.conf.include:\n"
+        "    importlib.import_module(module)\n"
+        "assert 'fastapi' not in sys.modules, 'fastapi loaded'\n"
+        "assert 'app.workers.tasks' not in sys.modules, 'content tasks loaded'\n"
+    )
+    assert _deferred_loaded(boot, CELERY_WORKER_QUEUES="leadgen,certificates") == []
@@ -1,10 +1,18 @@
+import re
+
 from app.services.content_engine import FORBIDDEN_CHECK_FIELDS
 from app.utils.authority_sources import infer_source_type, is_whitelisted_url
 from app.utils.medical_filter import (
+    FORBIDDEN_FIRST_CHARS,
+    FORBIDDEN_PATTERNS,
+    _ForbiddenScanner,
     check_forbidden,
     check_forbidden_content_fields,
     check_forbidden_markdown,
     markdown_visible_text,
+    normalize_for_check,
+    parse_markdown_visible,
+    sanitize_forbidden_markdown,
 )
 
 
@@ -54,6 +62,52 @@ def test_check_forbidden_allows_neutral_medical_text():
     assert violations == []
 
 
+def test_single_pass_scanner_agrees_with_searching_every_rule():
+    texts = [
+        "세계 최초로 100% 안전한 시술을 약속합니다.",
+        "아시아 최초 도입, 비교 불가한 최첨단 장비와 국내 최초 특허 등록",
+        "가장 우수한 의료진이 가장 잘하는 무통 시술로 아프지 않은 치료",
+        "병원만의 노하우와 검증된 효과, 완전 회복과 완치율 1위",
+        "오직 이곳, 유일무이한 일등 병원 — 흉터 걱정 없는 시술, 성공 보장",
+        # 규칙 표의 나머지 분기 — 각 분기의 첫 글자가 선언에서 빠지면 여기서 갈린다.
+        "으뜸인 탁월한 의료진, 제일 우수한 장비, 전국 유일 백 퍼센트 100퍼 만족",
+        "입증된 방법과 확인된 효과, 제일 뛰어난 원장, 특허를 보유한 최상의 일위 병원",
+        "차별화된 노하우로 보장된 효과, 첨단 장비와 통증 없는 치료, 효과를 약속",
+        "성공 확률 1등, 완전 치료, 부작용 제로, 세계최초",
+        "수술 후 회복기에는 무리한 운동을 피하는 것이 좋습니다.",
+        "",
+    ]
+
+    for text in texts:
+        expected = [label for label, pattern in FORBIDDEN_PATTERNS.items() if pattern.search(text)]
+        assert check_forbidden(text) == expected, text
+
+
+def test_every_rule_declares_the_first_characters_it_can_match():
+    assert set(FORBIDDEN_FIRST_CHARS) == set(FORBIDDEN_PATTERNS)
+    for label, first in FORBIDDEN_FIRST_CHARS.items():
+        assert first, label
+        # 선언된 첫 글자가 실제 첫 글자보다 적으면 그 분기를 놓친다 — 기본 표현 자체는
+        # 항상 잡혀야 하고, 그 첫 글자는 선언에 있어야 한다.
+        match = FORBIDDEN_PATTERNS[label].search(normalize_for_check(label))
+        if match is not None:
+            assert match.group()[0] in first, label
+
+
+def test_scanner_falls_back_to_search_for_rules_without_declared_first_characters():
+    scanner = _ForbiddenScanner(
+        {
+            "anchored": re.compile(r"완치"),
+            "lookbehind": re.compile(r"(?<=시술\s)보장"),
+            "category": re.compile(r"\d+\s*%"),
+        },
+        {"anchored": "완"},
+    )
+
+    assert scanner.labels("시술 보장, 효과 90%") == ["lookbehind", "category"]
+    assert scanner.labels("완치 가능") == ["anchored"]
+
+
 # ── 마크다운 렌더 기준 검사 ────────────────────────────────────────────
 # 공개 표면(site/app/[slug]/contents/[contentId]/page.tsx)이 ReactMarkdown + remarkGfm로
 # 렌더하므로, 검사 시점 텍스트와 환자에게 보이는 텍스트가 달라지면 발행 게이트가 무의미해진다.
@@ -188,3 +242,24 @@ def test_link_syntax_that_is_not_a_link_stays_visible_and_is_checked():
     # 반대로 진짜 링크의 목적지는 화면에 없으므로 검사하지 않는다.
     assert check_forbidden_markdown("[안내](https://example.test/최고-병원)") == []
     assert check_forbidden_markdown('[안내](https://example.test/a "최고 자료")') == []
+
+
+def test_parsed_visible_text_maps_every_character_back_to_the_source():
+    body = "## 안내\n\n최**고**의 `코드*` [링크](https://x/y) ~~취소~~\n```\n펜스 *내용*\n```\n끝"
+
+    parsed = parse_markdown_visible(body)
+    offsets = parsed.source_offsets(0, len(parsed.text))
+
+    assert parsed.text == markdown_visible_text(body)
+    assert [body[offset] for offset in offsets] == list(parsed.text)
+    # 같은 본문은 다시 해석하지 않는다.
+    assert parse_markdown_visible(body) is parsed
+
+
+def test_markdown_sanitizer_removes_emphasis_split_violations_without_touching_links():
+    body = "최**고**의 진료와 [안내](https://example.com/최고)\n\n**완치**를 돕습니다"
+
+    sanitized = sanitize_forbidden_markdown(body, ["최고", "완치"])
+
+    assert sanitized == " 진료와 [안내](https://example.com/최고)\n\n를 돕습니다"
+    assert check_forbidden_markdown(sanitized) == []
@@ -0,0 +1,126 @@
+"""Prometheus metrics: bounded labels, provider status mapping, task signals, pools."""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+
+from app.core import metrics
+from app.main import app
+from app.workers import task_metrics
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_http_metrics_use_the_route_template_not_the_raw_path() -> None:
+    labels = {"method": "GET", "route": "/health/live", "status": "200"}
+    before = _sample("reputation_http_request_duration_seconds_count", **labels)
+
+    with TestClient(app) as client:
+        assert client.get("/health/live").status_code == 200
+        assert client.get("/no-such-page/12345").status_code == 404
+
+    assert _sample("reputation_http_request_duration_seconds_count", **labels) == before + 1
+    assert _sample("reputation_http_response_size_bytes_count", **labels) >= 1
+    assert (
+        _sample(
+            "reputation_http_request_duration_seconds_count",
+            method="GET",
+            route="unmatched",
+            status="404",
+        )
+        >= 1
+    )
+
+
+def test_metrics_endpoint_requires_the_configured_token(monkeypatch) -> None:
+    monkeypatch.setattr(metrics.settings, "METRICS_BEARER_TOKEN", "scrape-secret")
+
+    with TestClient(app) as client:
+        assert client.get("/metrics").status_code == 401
+        response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+
+    assert response.status_code == 200
+    assert "reputation_http_request_duration_seconds" in response.text
+
+
+@pytest.mark.parametrize(
+    ("exc", "status"),
+    [
+        (type("RateLimited", (Exception,), {"status_code": 429})(), "429"),
+        (type("GenaiError", (Exception,), {"code": 503})(), "503"),
+        (TimeoutError(), "timeout"),
+        (ValueError("bad json"), "error"),
+    ],
+)
+def test_provider_call_failures_are_labelled_by_status(exc, status) -> None:
+    labels = {"provider": "openai", "model": "test-model", "status": status}
+    before = _sample("reputation_provider_call_duration_seconds_count", **labels)
+
+    with pytest.raises(type(exc)), metrics.observe_provider_call("openai", "test-model"):
+        raise exc
+
+    assert _sample("reputation_provider_call_duration_seconds_count", **labels) == before + 1
+
+
+def test_queue_wait_starts_at_the_eta_for_countdown_tasks() -> None:
+    now = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+    published = (now - timedelta(minutes=10)).timestamp()
+    request = SimpleNamespace(
+        headers={task_metrics.PUBLISHED_AT_HEADER: repr(published)},
+        eta=(now - timedelta(seconds=3)).isoformat(),
+    )
+
+    assert task_metrics.queue_wait_seconds(request, now=now.timestamp()) == pytest.approx(3)
+    assert task_metrics.queue_wait_seconds(SimpleNamespace(headers={}), now=0) is None
+
+
+def test_task_signals_record_runtime_wait_and_retries() -> None:
+    request = SimpleNamespace(
+        headers={},
+        published_at=repr(datetime.now(UTC).timestamp() - 2),
+        eta=None,
+        delivery_info={"routing_key": "sov"},
+    )
+    task = SimpleNamespace(name="app.workers.tasks.example", request=request)
+    base = {"task": "app.workers.tasks.example", "queue": "sov"}
+    runtime_before = _sample(
+        "reputation_celery_task_runtime_seconds_count", **base, state="SUCCESS"
+    )
+
+    task_metrics.track_task_start(task_id="t-1", task=task)
+    task_metrics.track_task_finish(task_id="t-1", task=task, state="SUCCESS")
+    task_metrics.track_task_retry(sender=task, request=request)
+
+    assert (
+        _sample("reputation_celery_task_runtime_seconds_count", **base, state="SUCCESS")
+        == runtime_before + 1
+    )
+    assert _sample("reputation_celery_task_queue_wait_seconds_sum", **base) >= 2
+    assert _sample("reputation_celery_task_retries_total", **base) >= 1
+
+
+def test_timed_pool_records_checkout_wait_and_occupancy() -> None:
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        poolclass=metrics.TimedQueuePool,
+        pool_logging_name="metrics-test",
+    )
+    metrics.instrument_pool(engine)
+    checkouts_before = _sample("reputation_db_pool_checkout_seconds_count", pool="metrics-test")
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert _sample("reputation_db_pool_checked_out_connections", pool="metrics-test") == 1
+
+    assert _sample("reputation_db_pool_checked_out_connections", pool="metrics-test") == 0
+    assert (
+        _sample("reputation_db_pool_checkout_seconds_count", pool="metrics-test")
+        == checkouts_before + 1
+    )
+    engine.dispose()
@@ -23,9 +23,14 @@ IMAGE_POLICY = "0053_add_content_image_policy_verification"
 CONTENT_CUSTOMIZATION = "0054_add_hospital_content_customization"
 PHOTO_KIND_BACKFILL = "0055_backfill_photo_asset_kind"
 DOMAIN_LIVE_CHECK = "0056_add_domain_live_check"
+CONTENT_IMAGE_VARIANTS = "0057_add_content_image_variants"
+CONTENT_IMAGE_STAGE = "0058_add_content_image_stage_state"
+ESSENCE_READINESS = "0059_add_hospital_essence_readiness"
+OPERATING_STATS = "0060_add_hospital_operating_stats"
+MEASUREMENT_STAGE_TIMINGS = "0061_add_measurement_run_stage_timings"
 
 PRODUCTION_STAMP = CONTENT_CUSTOMIZATION
-HEAD = DOMAIN_LIVE_CHECK
+HEAD = MEASUREMENT_STAGE_TIMINGS
 
 
 def _script_directory() -> ScriptDirectory:
@@ -94,7 +99,15 @@ def test_upgrade_from_the_production_stamp_runs_the_linear_tail() -> None:
         revision.revision for revision in script.iterate_revisions("heads", PRODUCTION_STAMP)
     ]
 
-    assert pending == [DOMAIN_LIVE_CHECK, PHOTO_KIND_BACKFILL]
+    assert pending == [
+        MEASUREMENT_STAGE_TIMINGS,
+        OPERATING_STATS,
+        ESSENCE_READINESS,
+        CONTENT_IMAGE_STAGE,
+        CONTENT_IMAGE_VARIANTS,
+        DOMAIN_LIVE_CHECK,
+        PHOTO_KIND_BACKFILL,
+    ]
 
 
 def test_fresh_database_applies_the_whole_chain_in_order() -> None:
@@ -105,11 +118,16 @@ def test_fresh_database_applies_the_whole_chain_in_order() -> None:
     ]
 
     assert len(applied) == len(set(applied))
-    assert applied[-6:] == [
+    assert applied[-11:] == [
         VISUAL_IDENTITY,
         PHOTO_PROVENANCE,
         IMAGE_POLICY,
         CONTENT_CUSTOMIZATION,
         PHOTO_KIND_BACKFILL,
         DOMAIN_LIVE_CHECK,
+        CONTENT_IMAGE_VARIANTS,
+        CONTENT_IMAGE_STAGE,
+        ESSENCE_READINESS,
+        OPERATING_STATS,
+        MEASUREMENT_STAGE_TIMINGS,
     ]
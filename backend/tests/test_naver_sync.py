@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from types import SimpleNamespace
 
@@ -137,6 +138,104 @@ async def test_sync_handoff_keeps_mixed_url_outcomes_without_fake_evidence(monke
     assert len(sources) == 1
 
 
+class _CountingDB(_DB):
+    def __init__(self, rows=None):
+        super().__init__(rows)
+        self.executes = 0
+
+    async def execute(self, stmt):
+        self.executes += 1
+        return await super().execute(stmt)
+
+
+@pytest.mark.asyncio
+async def test_sync_loads_dedupe_index_once_and_overlaps_fetches(monkeypatch):
+    urls = [f"https://blog.naver.com/sw_hang/{index}" for index in range(1, 13)]
+    in_flight = 0
+    peak = 0
+    fetched = []
+
+    async def fake_urls(_ref, max_posts):
+        return urls, None
+
+    async def fake_text(url):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        fetched.append(url)
+        return f"{url} 본문 " + ("충분한 설명 " * 30), None, SimpleNamespace(looks_like_shell=False)
+
+    monkeypatch.setattr(naver_handoff, "fetch_naver_blog_post_urls", fake_urls)
+    monkeypatch.setattr(naver_handoff, "fetch_url_text", fake_text)
+    db = _CountingDB(rows=[("https://blog.naver.com/sw_hang/1", "existing-hash")])
+    hospital = SimpleNamespace(
+        id=uuid.uuid4(), name="테스트 의원", blog_url="https://blog.naver.com/sw_hang"
+    )
+
+    result = await naver_sync.sync_hospital_naver_sources(db, hospital)
+
+    assert result.created == 11
+    assert result.skipped_duplicate == 1
+    # 이미 있는 글은 받지 않고, 나머지는 상한 안에서 겹쳐 받는다.
+    assert "https://blog.naver.com/sw_hang/1" not in fetched
+    assert 1 < peak <= naver_handoff.NAVER_FETCH_CONCURRENCY
+    # 색인 1회 + 저장할 글마다 잠금 아래 단건 조회 1회 — 글마다 전체 재스캔하지 않는다.
+    assert db.executes == 1 + result.created
+    # 시작 1 + 새 글마다 1 + 마감 2 — 건너뛴 중복 글만 항목 요약 쓰기를 모아 둔다.
+    assert db.commits == 1 + result.created + 2
+
+
+class _LockTrackingDB(_DB):
+    """커밋마다 그때까지 add된 자료 수를 남겨 락이 언제 풀리는지 본다."""
+
+    def __init__(self, rows=None):
+        super().__init__(rows)
+        self.sources_at_commit = []
+
+    @property
+    def sources(self):
+        return sum(isinstance(value, HospitalSourceAsset) for value in self.added)
+
+    async def commit(self):
+        await super().commit()
+        self.sources_at_commit.append(self.sources)
+
+
+@pytest.mark.asyncio
+async def test_sync_commits_each_new_source_before_the_next_fetch(monkeypatch):
+    urls = [f"https://blog.naver.com/sw_hang/{index}" for index in range(1, 8)]
+    db = _LockTrackingDB(rows=[(url, f"existing-{url}") for url in urls[:3]])
+    committed_before_store = []
+
+    async def fake_urls(_ref, max_posts):
+        return urls, None
+
+    async def fake_text(url):
+        await asyncio.sleep(0)
+        return f"{url} 본문 " + ("충분한 설명 " * 30), None, SimpleNamespace(looks_like_shell=False)
+
+    async def store(process, item, fetched, index):
+        # 다음 글을 저장하러 들어올 때는 앞 글이 이미 커밋돼 있어야 한다(락 해제).
+        committed_before_store.append(db.sources_at_commit[-1] == db.sources)
+        return await naver_handoff_sources.store_naver_fetch(process, item, fetched, index)
+
+    monkeypatch.setattr(naver_handoff, "fetch_naver_blog_post_urls", fake_urls)
+    monkeypatch.setattr(naver_handoff, "fetch_url_text", fake_text)
+    monkeypatch.setattr(naver_handoff, "store_naver_fetch", store)
+    hospital = SimpleNamespace(
+        id=uuid.uuid4(), name="테스트 의원", blog_url="https://blog.naver.com/sw_hang"
+    )
+
+    result = await naver_sync.sync_hospital_naver_sources(db, hospital)
+
+    assert result.created == 4
+    assert committed_before_store == [True] * result.created
+    # 시작 1 + 새 글 4 + 마감 2 — 앞쪽 중복 3건의 요약은 첫 새 글 커밋에 함께 실린다.
+    assert db.commits == 1 + result.created + 2
+
+
 # ── 주간 배치 등록 회귀 가드 ────────────────────────────────────────────
 # sync_hospital_naver_sources는 오랫동안 테스트에서만 호출되는 죽은 경로였다.
 # Celery 등록(include/task_routes/beat_schedule) 중 하나라도 빠지면 "주간 네이버
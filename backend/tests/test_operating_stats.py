@@ -0,0 +1,110 @@
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.api.admin.hospitals import _serialize_operating_stats
+from app.models.content import ContentItem, ContentStatus
+from app.models.operating_stats import (
+    _SOV_DELTA_KEY,
+    _STALE_STATS_KEY,
+    _remember_deleted_stats,
+    _stats_hospital_ids,
+    mark_operating_stats_stale,
+)
+from app.models.report import MonthlyReport
+from app.models.sov import MeasurementRun, SovRecord
+
+
+def _persistent(session, obj):
+    make_transient_to_detached(obj)
+    session.add(obj)
+    return obj
+
+
+def test_flush_tracking_marks_only_hospitals_whose_counters_can_change():
+    session = Session()
+    published, retitled, measured, reported, measuring = (uuid.uuid4() for _ in range(5))
+    item = _persistent(
+        session,
+        ContentItem(id=uuid.uuid4(), hospital_id=published, status=ContentStatus.READY),
+    )
+    retitled_item = _persistent(
+        session, ContentItem(id=uuid.uuid4(), hospital_id=retitled, title="before")
+    )
+    run = _persistent(
+        session, MeasurementRun(id=uuid.uuid4(), hospital_id=measured, status="RUNNING")
+    )
+    session.add(MonthlyReport(hospital_id=reported, period_year=2026, period_month=9))
+    session.add(SovRecord(hospital_id=measuring, is_mentioned=True))
+    session.add(SovRecord(hospital_id=measuring, is_mentioned=False))
+
+    item.status = ContentStatus.PUBLISHED
+    retitled_item.title = "after"
+    run.status = "COMPLETED"
+
+    assert _stats_hospital_ids(session) == {published, measured, reported, measuring}
+    assert session.info[_SOV_DELTA_KEY] == {measuring: 2}
+
+
+def test_deleted_sov_records_are_remembered_before_the_flush_expires_them():
+    session = Session()
+    hospital_id = uuid.uuid4()
+    record = _persistent(session, SovRecord(id=uuid.uuid4(), hospital_id=hospital_id))
+    session.delete(record)
+
+    _remember_deleted_stats(session, None, None)
+
+    assert _stats_hospital_ids(session) == {hospital_id}
+    assert session.info[_SOV_DELTA_KEY] == {hospital_id: -1}
+
+
+def test_rollbacks_discard_pending_counter_changes():
+    hospital_id, retried = uuid.uuid4(), uuid.uuid4()
+    session = Session(create_engine("sqlite://"))
+    session.connection()
+    session.info[_STALE_STATS_KEY] = {hospital_id}
+    session.info[_SOV_DELTA_KEY] = Counter({hospital_id: 1})
+
+    savepoint = session.begin_nested()
+    session.info[_STALE_STATS_KEY].add(retried)
+    session.info[_SOV_DELTA_KEY][retried] -= 1
+    savepoint.rollback()
+
+    # savepoint 롤백은 그 안에서 모은 것만 버린다.
+    assert session.info[_STALE_STATS_KEY] == {hospital_id}
+    assert session.info[_SOV_DELTA_KEY] == {hospital_id: 1}
+
+    session.rollback()
+
+    assert _STALE_STATS_KEY not in session.info
+    assert _SOV_DELTA_KEY not in session.info
+
+
+def test_stale_marks_are_skipped_without_a_postgres_bind():
+    session = Session()
+
+    mark_operating_stats_stale(session, uuid.uuid4())
+
+    assert _stats_hospital_ids(session) == set()
+
+
+def test_list_summary_serializes_the_last_measurement_time():
+    measured_at = datetime(2026, 10, 1, 3, 0, tzinfo=timezone.utc)
+
+    summary = _serialize_operating_stats(
+        {
+            "published_content_count": 4,
+            "essence_blocked_content_count": 1,
+            "report_count": 2,
+            "sov_record_count": 120,
+            "last_measured_at": measured_at,
+            "latest_sov_pct": 37.5,
+        }
+    )
+
+    assert summary["last_measured_at"] == measured_at.isoformat()
+    assert summary["latest_sov_pct"] == 37.5
+    assert summary["essence_blocked_content_count"] == 1
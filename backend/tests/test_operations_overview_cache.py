@@ -0,0 +1,138 @@
+import asyncio
+
+from sqlalchemy import create_engine, false, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.api.admin import operations_center_read_routes as read_routes
+from app.models.operations import Incident, OperationRun
+from app.schemas.operations import (
+    OperationsOverviewResponse,
+    OperationsQueue,
+    OperationsQueueSummary,
+)
+from app.services import operations_overview_cache as overview_cache
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+
+    async def mget(self, *keys):
+        return [self.values.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value.encode() if isinstance(value, str) else value
+
+    async def incr(self, key):
+        self.values[key] = str(int(self.values.get(key, b"0")) + 1).encode()
+
+
+class _BlockingRedis:
+    """The worker-side client; must never be used while an event loop is running."""
+
+    def __init__(self, values: dict[str, bytes]) -> None:
+        self.values = values
+        self.calls = 0
+
+    def incr(self, key):
+        self.calls += 1
+        self.values[key] = str(int(self.values.get(key, b"0")) + 1).encode()
+
+
+def _overview(total: int) -> OperationsOverviewResponse:
+    return OperationsOverviewResponse(
+        queues=[OperationsQueueSummary(queue=OperationsQueue.INCIDENTS, total=total, overdue=0)],
+        items=[],
+    )
+
+
+async def test_overview_entries_are_shared_per_filter_set_until_a_write_bumps_the_version(
+    monkeypatch,
+):
+    redis = _FakeRedis()
+    blocking = _BlockingRedis(redis.values)
+    monkeypatch.setattr(overview_cache, "_client", lambda: redis)
+    monkeypatch.setattr(overview_cache, "_invalidation_client", lambda: blocking)
+    filters = {"owner": None, "status": "OPEN", "severity": None, "sla": None}
+
+    cached, version = await overview_cache.load_overview(filters)
+    assert cached is None
+    await overview_cache.store_overview(filters, version, _overview(3))
+
+    cached, _version = await overview_cache.load_overview(filters)
+    assert cached is not None and cached.queues[0].total == 3
+    other, _version = await overview_cache.load_overview({**filters, "status": None})
+    assert other is None
+
+    overview_cache.invalidate_operations_overview()
+    await asyncio.gather(*overview_cache._pending_bumps)
+    cached, _version = await overview_cache.load_overview(filters)
+    assert cached is None
+    # On the event loop the bump goes through the async client, never the blocking one.
+    assert blocking.calls == 0
+
+
+def test_sync_commits_bump_the_version_with_the_blocking_client(monkeypatch):
+    values: dict[str, bytes] = {}
+    blocking = _BlockingRedis(values)
+    monkeypatch.setattr(overview_cache, "_invalidation_client", lambda: blocking)
+
+    overview_cache.invalidate_operations_overview()
+
+    assert blocking.calls == 1
+    assert values[overview_cache.VERSION_KEY] == b"1"
+
+
+def test_commits_with_incident_or_run_statements_invalidate_the_overview(monkeypatch):
+    invalidations = []
+    monkeypatch.setattr(
+        overview_cache, "invalidate_operations_overview", lambda: invalidations.append(1)
+    )
+    engine = create_engine("sqlite://")
+    Incident.__table__.create(engine)
+    OperationRun.__table__.create(engine)
+
+    with Session(engine) as session:
+        session.execute(update(Incident).where(false()).values(state="RECOVERED"))
+        session.rollback()
+        session.commit()
+        assert invalidations == []
+
+        session.execute(update(OperationRun).where(false()).values(state="FAILED"))
+        session.commit()
+        assert invalidations == [1]
+
+
+async def test_overview_miss_loads_queues_concurrently_on_the_request_session_plus_one_each(
+    monkeypatch,
+):
+    engine = create_async_engine("postgresql+asyncpg://reputation@localhost/reputation")
+    request_session = AsyncSession(engine)
+    redis = _FakeRedis()
+    monkeypatch.setattr(overview_cache, "_client", lambda: redis)
+    in_flight = 0
+    peak = 0
+    sessions = {}
+
+    async def load(session, queue, _filters, **_kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        sessions[queue] = session
+        return 0, []
+
+    monkeypatch.setattr(read_routes, "load_operations_queue", load)
+
+    response = await read_routes.get_operations_overview(db=request_session, _actor=None)
+
+    assert [summary.queue for summary in response.queues] == list(OperationsQueue)
+    assert peak == len(OperationsQueue)
+    first, *others = OperationsQueue
+    assert sessions[first] is request_session
+    assert len({id(sessions[queue]) for queue in others} | {id(request_session)}) == len(
+        OperationsQueue
+    )
+    await engine.dispose()
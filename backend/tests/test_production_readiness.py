@@ -9,6 +9,7 @@ from app.workers import canary_tasks
 EXPECTED_CANARY_ROUTES = {
     "app.workers.canary_tasks.canary_default": "default",
     "app.workers.canary_tasks.canary_content": "content",
+    "app.workers.canary_tasks.canary_images": "images",
     "app.workers.canary_tasks.canary_sov": "sov",
     "app.workers.canary_tasks.canary_reports": "reports",
     "app.workers.canary_tasks.canary_leadgen": "leadgen",
@@ -161,11 +161,11 @@ def test_content_generation_records_a_call_before_each_anthropic_request(monkeyp
     class FakeResponse:
         content = [type("Block", (), {"text": "{}"})()]
 
-    def fake_create(**_kwargs):
+    async def fake_create(**_kwargs):
         attempts["n"] += 1
         raise RuntimeError("anthropic 5xx")
 
-    monkeypatch.setattr(content_engine.client.messages, "create", fake_create)
+    monkeypatch.setattr(content_engine, "create_message", fake_create)
     # 프롬프트 조립은 이 테스트의 관심사가 아니다 — 계수 지점만 본다.
     monkeypatch.setattr(content_engine, "_build_profile_context", lambda _h: "프로파일")
     monkeypatch.setattr(content_engine, "_build_philosophy_context", lambda _p: "")
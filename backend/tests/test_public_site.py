@@ -380,6 +380,7 @@ def test_serialize_item_uses_stable_content_image_proxy_url():
         title="t",
         meta_description="m",
         image_url="gs://reputation-images/content/x/y.png",
+        image_variants=None,
         scheduled_date=date(2026, 6, 1),
         published_at=datetime(2026, 6, 1, 8, 0, 0),
         body_updated_at=None,
@@ -0,0 +1,131 @@
+"""Query budgets: statement counting, request log line, strict failures and task totals."""
+
+import asyncio
+import json
+import logging
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core import query_budget
+from app.core.query_budget import QueryBudgetExceeded, QueryStatsMiddleware
+from app.workers import task_metrics
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+def _run_statements(engine, count: int) -> None:
+    with engine.connect() as conn:
+        for _ in range(count):
+            conn.execute(text("SELECT 1"))
+
+
+def _budgeted_app(engine, statements: int) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/hospitals/{hospital_id}/rows", dependencies=[query_budget.query_budget(2)])
+    def rows(hospital_id: str):
+        _run_statements(engine, statements)
+        return {"hospital_id": hospital_id}
+
+    return app
+
+
+def _request_line(caplog) -> dict:
+    (record,) = [r for r in caplog.records if r.name == "app.access"]
+    return json.loads(record.getMessage().removeprefix("request "))
+
+
+def test_statements_are_counted_only_while_tracking(engine) -> None:
+    _run_statements(engine, 2)
+
+    with query_budget.track() as stats:
+        _run_statements(engine, 3)
+    _run_statements(engine, 1)
+
+    assert stats.statements == 3
+    assert stats.db_ms > 0
+    assert query_budget.current() is None
+
+
+def test_threadpool_work_counts_towards_the_tracking_context(engine) -> None:
+    async def concurrent_reads() -> None:
+        await asyncio.gather(*(asyncio.to_thread(_run_statements, engine, 1) for _ in range(3)))
+
+    with query_budget.track() as stats:
+        asyncio.new_event_loop().run_until_complete(concurrent_reads())
+
+    assert stats.statements == 3
+
+
+def test_request_log_line_carries_route_and_db_totals(engine, caplog) -> None:
+    with caplog.at_level(logging.INFO, logger="app.access"):
+        with TestClient(_budgeted_app(engine, statements=2)) as client:
+            response = client.get("/hospitals/h-1/rows")
+
+    assert response.status_code == 200
+    line = _request_line(caplog)
+    assert line["route"] == "/hospitals/{hospital_id}/rows"
+    assert line["path"] == "/hospitals/h-1/rows"
+    assert line["status"] == 200
+    assert line["db_statements"] == 2
+    assert line["query_budget"] == 2
+
+
+def test_strict_mode_fails_a_route_over_its_budget(engine, monkeypatch) -> None:
+    monkeypatch.setattr(query_budget.settings, "QUERY_BUDGET_STRICT", True)
+
+    with TestClient(_budgeted_app(engine, statements=3)) as client:
+        with pytest.raises(QueryBudgetExceeded, match=r"ran 3 SQL statements \(budget 2\)"):
+            client.get("/hospitals/h-1/rows")
+
+
+def test_over_budget_only_warns_outside_strict_mode(engine, monkeypatch, caplog) -> None:
+    monkeypatch.setattr(query_budget.settings, "QUERY_BUDGET_STRICT", False)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.query_budget"):
+        with TestClient(_budgeted_app(engine, statements=3)) as client:
+            assert client.get("/hospitals/h-1/rows").status_code == 200
+
+    assert any(
+        "GET /hospitals/{hospital_id}/rows ran 3 SQL statements" in record.getMessage()
+        for record in caplog.records
+    )
+
+
+def test_slow_statements_are_logged_without_a_tracker(engine, monkeypatch, caplog) -> None:
+    monkeypatch.setattr(query_budget.settings, "SLOW_QUERY_MS", 0)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.query_budget"):
+        _run_statements(engine, 1)
+
+    assert "slow SQL statement" in caplog.text
+    assert "SELECT 1" in caplog.text
+
+
+def test_task_signals_log_statement_totals_per_task(engine, caplog) -> None:
+    task = SimpleNamespace(
+        name="app.workers.tasks.example",
+        request=SimpleNamespace(headers={}, delivery_info={"routing_key": "sov"}),
+    )
+
+    with caplog.at_level(logging.INFO, logger="app.workers.task_metrics"):
+        task_metrics.track_task_start(task_id="t-1", task=task)
+        _run_statements(engine, 2)
+        task_metrics.track_task_finish(task_id="t-1", task=task, state="SUCCESS")
+
+    (record,) = [r for r in caplog.records if r.getMessage().startswith("task ")]
+    line = json.loads(record.getMessage().removeprefix("task "))
+    assert line["task"] == "app.workers.tasks.example"
+    assert line["queue"] == "sov"
+    assert line["db_statements"] == 2
+    assert query_budget.current() is None
@@ -0,0 +1,208 @@
+"""Queue backlog: broker reads, in-flight vs scheduled, drain estimates, gauges, endpoint."""
+
+import json
+from datetime import UTC, datetime, timedelta
+
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.main import app
+from app.services import queue_backlog
+from app.services.queue_backlog import QueueBacklog
+
+
+class _FakeBroker:
+    """Just the list/hash commands kombu's Redis transport and the runtime list use."""
+
+    def __init__(self) -> None:
+        self.lists: dict[str, list[bytes]] = {}
+        self.unacked: dict[str, bytes] = {}
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self)
+
+    def lpush(self, key, value):
+        self.lists.setdefault(key, []).insert(0, str(value).encode())
+
+    def ltrim(self, key, start, end):
+        self.lists[key] = self.lists.get(key, [])[start : end + 1]
+
+    def expire(self, key, seconds):
+        return True
+
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    def lindex(self, key, index):
+        values = self.lists.get(key, [])
+        return values[index] if values else None
+
+    def lrange(self, key, start, end):
+        return self.lists.get(key, [])[start : end + 1]
+
+    def hvals(self, key):
+        assert key == queue_backlog.UNACKED_KEY
+        return list(self.unacked.values())
+
+
+class _Pipeline:
+    def __init__(self, broker: _FakeBroker) -> None:
+        self.broker = broker
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self.calls.append((name, args))
+            return self
+
+        return queue
+
+    def execute(self):
+        return [getattr(self.broker, name)(*args) for name, args in self.calls]
+
+    async def __aenter__(self):
+        return _AsyncPipeline(self.broker)
+
+    async def __aexit__(self, *_exc):
+        return False
+
+
+class _AsyncPipeline(_Pipeline):
+    async def execute(self):
+        return super().execute()
+
+
+def _message(*, published_at: float | None = None, eta: datetime | None = None) -> dict:
+    headers = {"task": "app.workers.tasks.example"}
+    if published_at is not None:
+        headers["published_at"] = repr(published_at)
+    if eta is not None:
+        headers["eta"] = eta.isoformat()
+    return {"body": "", "headers": headers, "properties": {}}
+
+
+def _publish(broker: _FakeBroker, queue: str, message: dict) -> None:
+    broker.lpush(queue, json.dumps(message))
+
+
+def _take(broker: _FakeBroker, tag: str, queue: str, message: dict) -> None:
+    broker.unacked[tag] = json.dumps([message, "", queue]).encode()
+
+
+def _sample(name: str, queue: str) -> float | None:
+    return REGISTRY.get_sample_value(name, {"queue": queue})
+
+
+def test_broker_queues_cover_every_routed_worker_queue() -> None:
+    assert {"content", "sov", "reports", "leadgen", "certificates", "default", "images"} <= set(
+        queue_backlog.broker_queues()
+    )
+
+
+async def test_backlog_reads_depth_oldest_age_in_flight_and_runtimes(monkeypatch) -> None:
+    broker = _FakeBroker()
+    monkeypatch.setattr(queue_backlog, "_client", lambda: broker)
+    monkeypatch.setattr(queue_backlog, "_runtime_client", lambda: broker)
+    now = datetime.now(UTC).timestamp()
+    _publish(broker, "sov", _message(published_at=now - 120))
+    _publish(broker, "sov", _message(published_at=now - 5))
+    _publish(broker, "sov", _message(published_at=now - 1))
+    _take(broker, "t-1", "sov", _message(published_at=now - 300))
+    _take(broker, "t-2", "reports", _message(eta=datetime.now(UTC) + timedelta(hours=1)))
+    for seconds in (20.0, 40.0):
+        queue_backlog.record_task_runtime("sov", seconds)
+
+    sov, reports = await queue_backlog.read_backlog(["sov", "reports"])
+
+    assert (sov.ready, sov.in_flight, sov.scheduled) == (3, 1, 0)
+    assert 119 <= sov.oldest_age_seconds <= 125
+    assert (sov.mean_runtime_seconds, sov.runtime_samples) == (30.0, 2)
+    assert sov.outstanding_work_seconds == 120.0
+    assert sov.predicted_drain_seconds == 120.0
+    assert (reports.ready, reports.in_flight, reports.scheduled) == (0, 0, 1)
+    assert reports.oldest_age_seconds is None
+    assert reports.predicted_drain_seconds == 0.0
+
+
+def test_runtime_list_keeps_only_recent_samples(monkeypatch) -> None:
+    broker = _FakeBroker()
+    monkeypatch.setattr(queue_backlog, "_runtime_client", lambda: broker)
+
+    for seconds in range(queue_backlog.RUNTIME_SAMPLES + 10):
+        queue_backlog.record_task_runtime("reports", float(seconds))
+
+    samples = broker.lists[queue_backlog.runtime_key("reports")]
+    assert len(samples) == queue_backlog.RUNTIME_SAMPLES
+    assert float(samples[0]) == queue_backlog.RUNTIME_SAMPLES + 9
+
+
+def test_drain_time_is_unknown_without_runtimes_or_busy_consumers() -> None:
+    def backlog(**overrides) -> QueueBacklog:
+        fields = dict(
+            queue="sov",
+            ready=10,
+            in_flight=2,
+            scheduled=0,
+            oldest_age_seconds=60.0,
+            mean_runtime_seconds=30.0,
+            runtime_samples=5,
+        )
+        return QueueBacklog(**{**fields, **overrides})
+
+    assert backlog().predicted_drain_seconds == 180.0
+    assert backlog(mean_runtime_seconds=None).outstanding_work_seconds is None
+    assert backlog(mean_runtime_seconds=None).predicted_drain_seconds is None
+    # Backlog but nothing consuming: scaled to zero or stuck — no finite estimate.
+    assert backlog(in_flight=0).outstanding_work_seconds == 300.0
+    assert backlog(in_flight=0).predicted_drain_seconds is None
+
+
+def test_gauges_follow_the_latest_backlog_and_drop_unknown_values() -> None:
+    known = QueueBacklog("leadgen", 4, 1, 2, 30.0, 10.0, 3)
+    queue_backlog.publish_backlog_metrics([known])
+
+    assert _sample("reputation_celery_queue_ready_messages", "leadgen") == 4
+    assert _sample("reputation_celery_queue_in_flight_messages", "leadgen") == 1
+    assert _sample("reputation_celery_queue_scheduled_messages", "leadgen") == 2
+    assert _sample("reputation_celery_queue_oldest_message_age_seconds", "leadgen") == 30.0
+    assert _sample("reputation_celery_queue_predicted_drain_seconds", "leadgen") == 50.0
+
+    queue_backlog.publish_backlog_metrics([QueueBacklog("leadgen", 0, 0, 0, None, None, 0)])
+
+    assert _sample("reputation_celery_queue_ready_messages", "leadgen") == 0
+    assert _sample("reputation_celery_queue_oldest_message_age_seconds", "leadgen") is None
+    assert _sample("reputation_celery_queue_predicted_drain_seconds", "leadgen") == 0.0
+
+
+def test_scaling_endpoint_reports_each_queue_and_fails_closed_on_redis(monkeypatch) -> None:
+    async def backlog():
+        return [QueueBacklog("sov", 6, 2, 0, 90.0, 45.0, 12)]
+
+    monkeypatch.setattr(queue_backlog.settings, "METRICS_BEARER_TOKEN", "scrape-secret")
+    monkeypatch.setattr("app.main.read_backlog", backlog)
+    headers = {"Authorization": "Bearer scrape-secret"}
+
+    with TestClient(app) as client:
+        assert client.get("/queues/backlog").status_code == 401
+        response = client.get("/queues/backlog", headers=headers)
+
+        async def unavailable():
+            raise RedisConnectionError("down")
+
+        monkeypatch.setattr("app.main.read_backlog", unavailable)
+        down = client.get("/queues/backlog", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["queues"]["sov"] == {
+        "queue": "sov",
+        "ready": 6,
+        "in_flight": 2,
+        "scheduled": 0,
+        "oldest_age_seconds": 90.0,
+        "mean_runtime_seconds": 45.0,
+        "runtime_samples": 12,
+        "outstanding_work_seconds": 360.0,
+        "predicted_drain_seconds": 180.0,
+    }
+    assert down.status_code == 503
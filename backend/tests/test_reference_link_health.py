@@ -0,0 +1,150 @@
+import os
+
+os.environ.setdefault("ADMIN_SECRET_KEY", "test-admin-key")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///tmp/reputation-test.db")
+os.environ.setdefault("SYNC_DATABASE_URL", "sqlite:///tmp/reputation-test.db")
+
+import asyncio  # noqa: E402
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+
+from app.services import reference_link_health  # noqa: E402
+from app.services.reference_link_health import LinkHealth, check_reference_links  # noqa: E402
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    def pipeline(self, **_kwargs):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.pending = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_args):
+        return False
+
+    def set(self, key, value, ex):
+        self.pending.append((key, value, ex))
+
+    async def execute(self):
+        for key, value, ex in self.pending:
+            self.redis.values[key] = value
+            self.redis.ttls[key] = ex
+
+
+class _ProbeClient:
+    """HEAD/GET 응답을 URL별로 돌려주고, 호스트별 동시 요청 수의 최댓값을 기록한다."""
+
+    def __init__(self, head, get=None, *, delay=0.0):
+        self.head_responses = head
+        self.get_responses = get or {}
+        self.delay = delay
+        self.calls: list[tuple[str, str, dict]] = []
+        self.in_flight: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_args):
+        return False
+
+    async def _respond(self, method, url, headers, table):
+        self.calls.append((method, url, headers))
+        host = httpx.URL(url).host
+        self.in_flight[host] = self.in_flight.get(host, 0) + 1
+        self.peak[host] = max(self.peak.get(host, 0), self.in_flight[host])
+        try:
+            await asyncio.sleep(self.delay)
+            outcome = table[url]
+            if isinstance(outcome, Exception):
+                raise outcome
+            status, final_url = outcome
+            return httpx.Response(status, request=httpx.Request(method, final_url))
+        finally:
+            self.in_flight[host] -= 1
+
+    async def head(self, url, headers):
+        return await self._respond("HEAD", url, headers, self.head_responses)
+
+    async def get(self, url, headers):
+        return await self._respond("GET", url, headers, self.get_responses)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = _FakeRedis()
+    monkeypatch.setattr(reference_link_health, "_client", lambda: redis)
+    return redis
+
+
+def _use_client(monkeypatch, client):
+    monkeypatch.setattr(reference_link_health.httpx, "AsyncClient", lambda *a, **k: client)
+
+
+async def test_cached_verdict_skips_the_network(monkeypatch, fake_redis):
+    url = "https://health.kdca.go.kr/doc"
+    first = _ProbeClient({url: (200, url)})
+    _use_client(monkeypatch, first)
+    assert await check_reference_links([url, url]) == {url: LinkHealth(200, url)}
+    assert len(first.calls) == 1
+
+    second = _ProbeClient({})
+    _use_client(monkeypatch, second)
+    assert await check_reference_links([url]) == {url: LinkHealth(200, url)}
+    assert second.calls == []
+
+
+async def test_head_rejection_is_confirmed_with_a_ranged_get(monkeypatch, fake_redis):
+    url = "https://www.cancer.go.kr/doc"
+    client = _ProbeClient({url: (405, url)}, {url: (206, url)})
+    _use_client(monkeypatch, client)
+
+    result = await check_reference_links([url])
+
+    assert result[url].status_code == 206
+    assert [call[0] for call in client.calls] == ["HEAD", "GET"]
+    assert client.calls[1][2]["Range"] == "bytes=0-0"
+
+
+async def test_broken_verdict_uses_shorter_ttl_and_transient_errors_are_not_cached(
+    monkeypatch, fake_redis
+):
+    missing = "https://health.kdca.go.kr/missing"
+    flaky = "https://health.kdca.go.kr/flaky"
+    client = _ProbeClient(
+        {missing: (404, missing), flaky: httpx.ConnectTimeout("slow")},
+        {missing: (404, missing)},
+    )
+    _use_client(monkeypatch, client)
+
+    result = await check_reference_links([missing, flaky])
+
+    assert result[missing].status_code == 404
+    assert result[flaky].transient
+    assert list(fake_redis.ttls.values()) == [reference_link_health.BROKEN_TTL_SECONDS]
+
+
+async def test_probes_run_concurrently_but_respect_the_per_host_limit(monkeypatch, fake_redis):
+    urls = [f"https://health.kdca.go.kr/doc{n}" for n in range(6)]
+    urls.append("https://www.cdc.gov/doc")
+    client = _ProbeClient({url: (200, url) for url in urls}, delay=0.01)
+    _use_client(monkeypatch, client)
+
+    await check_reference_links(urls)
+
+    assert client.peak["health.kdca.go.kr"] == reference_link_health.PER_HOST_CONCURRENCY
+    assert client.peak["www.cdc.gov"] == 1
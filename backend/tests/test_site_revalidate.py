@@ -85,6 +85,43 @@ async def test_trigger_content_site_revalidate_safe_returns_true_on_success(monk
     assert await site_revalidate.trigger_content_site_revalidate_safe("test-clinic", "content-1") is True
 
 
+async def test_batched_content_revalidation_posts_once_and_recovers_each_item(monkeypatch):
+    posted = []
+    started = []
+
+    async def fine(*, paths):
+        posted.append(paths)
+        return True
+
+    monkeypatch.setattr(site_revalidate, "trigger_site_revalidate", fine)
+
+    assert await site_revalidate.trigger_contents_site_revalidate_safe(
+        "test-clinic", ["content-1", "content-2"]
+    ) is True
+    assert len(posted) == 1
+    assert posted[0].count("/test-clinic/contents") == 1
+    assert "/test-clinic/contents/content-1" in posted[0]
+    assert "/test-clinic/contents/content-2" in posted[0]
+
+    async def boom(*, paths):
+        raise RuntimeError("revalidate endpoint down")
+
+    async def fake_start(slug, content_id):
+        started.append(content_id)
+        return None
+
+    monkeypatch.setattr(site_revalidate, "trigger_site_revalidate", boom)
+    monkeypatch.setattr(site_revalidate, "start_revalidation_failure", fake_start)
+    ids = [
+        "f5aa8f49-fc76-46b6-b6d5-d372dad2522a",
+        "0b3c7f0e-7d43-4a3f-9a77-3fdc6c0c0a11",
+    ]
+
+    assert await site_revalidate.trigger_contents_site_revalidate_safe("test-clinic", ids) is False
+    # 재시도는 여전히 글 단위로 건다.
+    assert [str(content_id) for content_id in started] == ids
+
+
 async def test_hospital_revalidation_failure_is_persisted_and_requeued(monkeypatch):
     scheduled = []
 
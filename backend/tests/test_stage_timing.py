@@ -0,0 +1,125 @@
+"""Stage timings: accumulation, async propagation and the operations projection."""
+
+import asyncio
+import logging
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from app.api.admin.operations_center_serializers import run_summary, stage_timings
+from app.core import stage_timing
+from app.core.stage_timing import StageTimer
+from app.models.operations import OperationRun, OperationRunState
+
+
+def test_stage_accumulates_count_total_and_max() -> None:
+    timer = StageTimer("weekly_sov", hospital_id="h-1")
+    timer.add("judge", 120.4)
+    timer.add("judge", 30.6)
+    timer.add("persistence", 5)
+
+    assert timer.summary() == {
+        "judge": {"count": 2, "total_ms": 151, "max_ms": 120},
+        "persistence": {"count": 1, "total_ms": 5, "max_ms": 5},
+    }
+
+
+def test_stage_records_even_when_the_stage_raises() -> None:
+    timer = StageTimer("nightly_generation")
+
+    with pytest.raises(RuntimeError), timer.stage("generate"):
+        raise RuntimeError("provider down")
+
+    assert timer.summary()["generate"]["count"] == 1
+
+
+def test_module_stage_is_a_no_op_without_an_active_timer() -> None:
+    with stage_timing.stage("provider_answer"):
+        pass
+
+    timer = StageTimer("weekly_sov")
+    with timer.activate(), stage_timing.stage("provider_answer"):
+        pass
+    with stage_timing.stage("provider_answer"):
+        pass
+
+    assert timer.summary()["provider_answer"]["count"] == 1
+
+
+def test_concurrent_async_stages_reach_the_activating_timer() -> None:
+    async def repeat() -> None:
+        with stage_timing.stage("provider_answer"):
+            await asyncio.sleep(0)
+
+    async def measure() -> None:
+        await asyncio.gather(*(repeat() for _ in range(3)))
+
+    timer = StageTimer("weekly_sov")
+    with timer.activate():
+        asyncio.new_event_loop().run_until_complete(measure())
+
+    assert timer.summary()["provider_answer"]["count"] == 3
+
+
+def test_merge_folds_item_timers_into_the_batch() -> None:
+    batch = StageTimer("nightly_generation")
+    batch.merge({"generate": {"count": 1, "total_ms": 900, "max_ms": 900}})
+    batch.merge({"generate": {"count": 1, "total_ms": 300, "max_ms": 300}})
+
+    assert batch.summary() == {"generate": {"count": 2, "total_ms": 1200, "max_ms": 900}}
+
+
+def test_log_summary_emits_one_structured_line(caplog) -> None:
+    timer = StageTimer("weekly_sov", hospital_id="h-1")
+    timer.add("judge", 10)
+
+    with caplog.at_level(logging.INFO, logger="app.core.stage_timing"):
+        timer.log_summary(status="COMPLETED")
+
+    (record,) = caplog.records
+    assert '"run": "weekly_sov"' in record.getMessage()
+    assert '"judge": {"count": 1' in record.getMessage()
+
+
+def _run(result_summary: dict | None) -> OperationRun:
+    return OperationRun(
+        id=uuid.uuid4(),
+        operation_type="RUN_SOV",
+        state=OperationRunState.SUCCEEDED,
+        attempt_count=1,
+        total_count=1,
+        success_count=1,
+        failure_count=0,
+        skipped_count=0,
+        requested_at=datetime(2026, 10, 19, tzinfo=UTC),
+        version=3,
+        result_summary=result_summary,
+    )
+
+
+def test_run_summary_lists_stage_timings_slowest_first() -> None:
+    run = _run(
+        {
+            "measurement_week": "2026-W42",
+            "stage_timings": {
+                "judge": {"count": 12, "total_ms": 4000, "max_ms": 600},
+                "provider_answer": {"count": 12, "total_ms": 90000, "max_ms": 14000},
+            },
+        }
+    )
+
+    summary = run_summary(uuid.uuid4(), run)
+
+    assert [timing.stage for timing in summary.stage_timings] == ["provider_answer", "judge"]
+    assert summary.stage_timings[0].max_ms == 14000
+
+
+def test_single_item_runs_expose_their_item_timings() -> None:
+    timings = {"image": {"count": 1, "total_ms": 41000, "max_ms": 41000}}
+
+    assert [row.stage for row in stage_timings({"items": {"i-1": {"stage_timings": timings}}})] == [
+        "image"
+    ]
+    assert stage_timings({"items": {"a": {}, "b": {}}}) == []
+    assert stage_timings(None) == []
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from types import SimpleNamespace
 
@@ -68,13 +69,13 @@ def test_domain_monitor_uses_bounded_no_redirect_probe_and_durable_control(monke
             assert follow_redirects is False
             clients.append(self)
 
-        def __enter__(self):
+        async def __aenter__(self):
             return self
 
-        def __exit__(self, *_args):
+        async def __aexit__(self, *_args):
             return None
 
-        def get(self, url):
+        async def get(self, url):
             request = httpx.Request("GET", url)
             return httpx.Response(
                 200,
@@ -92,7 +93,7 @@ def test_domain_monitor_uses_bounded_no_redirect_probe_and_durable_control(monke
         return SimpleNamespace(incident_opened=False, incident_recovered=True)
 
     monkeypatch.setattr(tasks, "SyncSessionLocal", lambda: _Session([hospital]))
-    monkeypatch.setattr(tasks.httpx, "Client", Client)
+    monkeypatch.setattr(tasks.httpx, "AsyncClient", Client)
     monkeypatch.setattr(tasks, "record_domain_health_check", record)
     monkeypatch.setattr(
         tasks,
@@ -125,6 +126,58 @@ def test_domain_monitor_uses_bounded_no_redirect_probe_and_durable_control(monke
     assert hospital.domain_cert_job_state == "DONE"
 
 
+def test_domain_monitor_checks_domains_concurrently_and_commits_once(monkeypatch):
+    hospitals = [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            slug=f"clinic-{index}",
+            aeo_domain=f"clinic-{index}.example.com",
+            domain_cert_job_state="DONE",
+            domain_cert_dns_verified_at=None,
+            domain_last_checked_at=None,
+            domain_last_check_ok=None,
+            domain_last_check_reason=None,
+        )
+        for index in range(5)
+    ]
+    in_flight = 0
+    peak = 0
+    commits = []
+
+    class Client:
+        def __init__(self, **_kwargs):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *_args):
+            return None
+
+        async def get(self, url):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            raise httpx.ConnectTimeout("slow domain", request=httpx.Request("GET", url))
+
+    async def record(**_facts):
+        return SimpleNamespace(incident_opened=True, incident_recovered=False)
+
+    monkeypatch.setattr(tasks, "SyncSessionLocal", lambda: _Session(hospitals, commits))
+    monkeypatch.setattr(tasks.httpx, "AsyncClient", Client)
+    monkeypatch.setattr(tasks, "record_domain_health_check", record)
+
+    result = tasks.monitor_live_custom_domains.run()
+
+    assert peak == len(hospitals)
+    assert result["new_failures"] == len(hospitals)
+    assert result["status_refreshed"] == len(hospitals)
+    assert commits == [True]
+    assert all(hospital.domain_last_check_reason == "timeout" for hospital in hospitals)
+
+
 def test_site_revalidation_worker_retries_cache_only_at_control_delay(monkeypatch):
     run_id = uuid.uuid4()
     content_id = uuid.uuid4()
@@ -11,7 +11,7 @@ from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.sql.dml import Update
 
-from app.models.content import ContentItem
+from app.models.content import ContentItem, ContentStatus
 from app.models.essence import (
     HospitalContentPhilosophy,
     HospitalSourceAsset,
@@ -532,6 +532,12 @@ class _NightlyTaskRecorder:
         self.db = db
         self.run = SimpleNamespace(id=uuid.uuid4())
 
+    def begin_item(self, *_args):
+        return None
+
+    def end_item(self):
+        return None
+
     def record(self, *_args, **_kwargs):
         return None
 
@@ -724,7 +730,7 @@ def test_site_build_requires_profile_and_v0(profile_complete, v0_report_done, ex
     assert tasks._site_build_prerequisites_met(hospital) is expected
 
 
-def test_custom_domain_https_health_contract():
+async def test_custom_domain_https_health_contract():
     hospital_id = uuid.uuid4()
 
     def handler(request: httpx.Request) -> httpx.Response:
@@ -740,8 +746,10 @@ def test_custom_domain_https_health_contract():
             )
         return httpx.Response(503)
 
-    with httpx.Client(transport=httpx.MockTransport(handler), follow_redirects=False) as client:
-        assert tasks._check_custom_domain_https(
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), follow_redirects=False
+    ) as client:
+        assert await tasks._check_custom_domain_https_async(
             client,
             "healthy.example.com",
             expected_hospital_id=hospital_id,
@@ -750,7 +758,7 @@ def test_custom_domain_https_health_contract():
             True,
             "tenant_marker_ok",
         )
-        assert tasks._check_custom_domain_https(
+        assert await tasks._check_custom_domain_https_async(
             client,
             "broken.example.com",
             expected_hospital_id=hospital_id,
@@ -994,6 +1002,82 @@ def test_generate_single_content_item_stays_draft_until_manual_publish(monkeypat
     assert item.published_by is None
 
 
+def test_generate_single_content_item_marks_inline_image_pending_then_failed(monkeypatch):
+    item = SimpleNamespace(
+        id="content-1",
+        hospital_id="hospital-1",
+        content_type=SimpleNamespace(value="FAQ"),
+        title=None,
+        image_url=None,
+        brief_status=None,
+        content_brief=None,
+    )
+    hospital = SimpleNamespace(id="hospital-1", slug="test-clinic", image_direction=None)
+    philosophy = SimpleNamespace(id="philosophy-1")
+
+    class _ExistingTitles:
+        def all(self):
+            return []
+
+    class _WriteBackResult:
+        rowcount = 1
+
+    class _GenerationDB:
+        def __init__(self):
+            self.written_values = []
+
+        def execute(self, stmt):
+            if isinstance(stmt, Update):
+                self.written_values.append(
+                    {
+                        str(getattr(col, "key", col)): getattr(val, "value", val)
+                        for col, val in (stmt._values or {}).items()
+                    }
+                )
+                return _WriteBackResult()
+            return _ExistingTitles()
+
+        def commit(self):
+            pass
+
+        def rollback(self):
+            pass
+
+        def refresh(self, _obj):
+            pass
+
+    async def fake_generate_content(*_args, **_kwargs):
+        return {"title": "치질 수술 전 확인할 점", "body": "진료 방향을 설명합니다."}
+
+    async def failing_generate_image(*_args, **_kwargs):
+        raise RuntimeError("provider down")
+
+    readiness = []
+    monkeypatch.setattr(tasks, "generate_content", fake_generate_content)
+    monkeypatch.setattr(tasks, "generate_image", failing_generate_image)
+    monkeypatch.setattr(tasks, "hospital_image_direction", lambda _hospital: None)
+    monkeypatch.setattr(tasks, "get_current_approved_philosophy_sync", lambda *_args: philosophy)
+    monkeypatch.setattr(
+        tasks,
+        "screen_content_against_philosophy",
+        lambda _item, _philosophy: SimpleNamespace(status="ALIGNED", summary={"ok": True}),
+    )
+    monkeypatch.setattr(
+        tasks, "_persist_publication_readiness", lambda *_args: readiness.append(True)
+    )
+
+    db = _GenerationDB()
+    outcome, code, _message = tasks._generate_single_content_item(db, item, hospital)
+
+    assert (outcome, code) == (tasks.GenerationItemState.PARTIAL, "IMAGE_GENERATION_FAILED")
+    text_values, failed_values = db.written_values
+    # 본문 저장과 함께 PENDING을 남겨, 이미지 도중 워커가 죽어도 회수 주기가 다시 잡는다.
+    assert text_values["image_status"] == tasks.IMAGE_STATUS_PENDING
+    assert text_values["image_requested_at"] is not None
+    assert failed_values == {"image_status": tasks.IMAGE_STATUS_FAILED}
+    assert readiness == [True]
+
+
 def test_unapproved_essence_skips_before_cost_or_provider_call(monkeypatch):
     item = SimpleNamespace(
         id=uuid.uuid4(),
@@ -1672,6 +1756,41 @@ def test_morning_publish_cycle_enqueues_one_digest_without_per_item_rows(monkeyp
     assert digest_db.commits == 1
 
 
+@pytest.mark.asyncio
+async def test_morning_publish_signals_are_coalesced_per_hospital(monkeypatch):
+    first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    revalidated = []
+    submitted = []
+
+    async def fake_revalidate(slug, content_ids, **_kwargs):
+        revalidated.append((slug, list(content_ids)))
+        return True
+
+    async def fake_indexnow(*, slug, content_ids, aeo_domain, treatments):
+        submitted.append((slug, list(content_ids), aeo_domain))
+        return True
+
+    monkeypatch.setattr(tasks, "trigger_contents_site_revalidate_safe", fake_revalidate)
+    monkeypatch.setattr(tasks.indexnow, "submit_contents_published_safe", fake_indexnow)
+
+    def outcome(slug, domain):
+        return {"slug": slug, "hospital_name": slug, "aeo_domain": domain, "treatments": []}
+
+    await tasks._send_publish_signals(
+        [
+            (first, outcome("first", "first.example.com")),
+            (second, outcome("second", None)),
+            (third, outcome("first", "first.example.com")),
+        ]
+    )
+
+    assert revalidated == [("first", [first, third]), ("second", [second])]
+    assert submitted == [
+        ("first", [first, third], "first.example.com"),
+        ("second", [second], None),
+    ]
+
+
 def test_auto_publish_one_commits_publication_before_external_effects(monkeypatch):
     content_id = uuid.uuid4()
     hospital = SimpleNamespace(
@@ -1892,8 +2011,9 @@ def _arm_external_effect_tripwires(monkeypatch) -> dict[str, list]:
         calls["published_slack"].append(kwargs)
         return True
 
-    monkeypatch.setattr(tasks, "trigger_content_site_revalidate_safe", fake_revalidate)
+    monkeypatch.setattr(tasks, "trigger_contents_site_revalidate_safe", fake_revalidate)
     monkeypatch.setattr(tasks.indexnow, "submit_content_published_safe", fake_indexnow)
+    monkeypatch.setattr(tasks.indexnow, "submit_contents_published_safe", fake_indexnow)
     monkeypatch.setattr(tasks.notifier, "notify_content_auto_published", fake_published_slack)
     return calls
 
@@ -2137,3 +2257,152 @@ def test_regeneration_discards_its_result_when_the_slot_was_cancelled(monkeypatc
     # 추적 객체가 오염되지 않아야 다음 반복이 안전하다.
     assert item.title is None
     assert item.body is None
+
+
+def test_nightly_generation_stmt_skips_items_whose_image_stage_is_in_flight():
+    compiled = str(
+        tasks._nightly_generation_stmt(date(2026, 8, 11), date(2026, 8, 19)).compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+    assert "content_items.image_status IS NULL" in compiled
+    assert "content_items.image_status != 'PENDING'" in compiled
+    assert "content_items.image_requested_at <" in compiled
+
+
+class _ImageStageDB:
+    def __init__(self, item, hospital):
+        self.item = item
+        self.hospital = hospital
+        self.written_values = []
+        self.commits = 0
+
+    def get(self, model, _key):
+        return self.item if model is ContentItem else self.hospital
+
+    def execute(self, statement):
+        assert isinstance(statement, Update)
+        self.written_values.append(
+            {
+                str(getattr(column, "key", column)): getattr(value, "value", value)
+                for column, value in (statement._values or {}).items()
+            }
+        )
+        return SimpleNamespace(rowcount=1)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        return None
+
+    def refresh(self, item):
+        for key, value in self.written_values[-1].items():
+            setattr(item, key, value)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+
+def _image_stage_item(image_status):
+    hospital = SimpleNamespace(id=uuid.uuid4(), name="이미지의원", slug="image-clinic")
+    item = SimpleNamespace(
+        id=uuid.uuid4(),
+        hospital_id=hospital.id,
+        status=ContentStatus.DRAFT,
+        content_type=SimpleNamespace(value="FAQ"),
+        title="무릎 통증",
+        image_url=None,
+        image_status=image_status,
+    )
+    return item, hospital
+
+
+def _patch_image_stage_shell(monkeypatch, db):
+    monkeypatch.setattr(tasks, "SyncSessionLocal", lambda: db)
+    monkeypatch.setattr(tasks, "require_dispatch", lambda *_args: None)
+    monkeypatch.setattr(tasks, "hospital_image_direction", lambda _hospital: None)
+    monkeypatch.setattr(tasks, "build_image_variants", lambda _ref: None)
+    monkeypatch.setattr(
+        tasks,
+        "create_item_run",
+        lambda *_args, **kwargs: SimpleNamespace(id=uuid.uuid4(), **kwargs),
+    )
+
+
+def test_image_stage_writes_ready_image_and_rechecks_publication(monkeypatch):
+    item, hospital = _image_stage_item(tasks.IMAGE_STATUS_PENDING)
+    db = _ImageStageDB(item, hospital)
+    _patch_image_stage_shell(monkeypatch, db)
+    readiness_checks = []
+    recovered = []
+
+    async def fake_generate_image(*_args, **_kwargs):
+        return "gs://bucket/cover.png", "prompt"
+
+    async def capture_recovery(*args, **kwargs):
+        recovered.append((args, kwargs))
+
+    monkeypatch.setattr(tasks, "generate_image", fake_generate_image)
+    monkeypatch.setattr(tasks, "get_current_approved_philosophy_sync", lambda *_args: "philosophy")
+    monkeypatch.setattr(
+        tasks,
+        "_persist_publication_readiness",
+        lambda _db, checked, _philosophy: readiness_checks.append(checked.image_url),
+    )
+    monkeypatch.setattr(tasks, "recover_generation_incidents", capture_recovery)
+
+    result = tasks.generate_content_image_stage.run(str(item.id), str(uuid.uuid4()))
+
+    assert result == {"status": "succeeded", "publishable": True}
+    assert db.written_values[-1]["image_status"] == tasks.IMAGE_STATUS_READY
+    assert db.written_values[-1]["image_url"] == "gs://bucket/cover.png"
+    # 발행 판정은 이미지를 쓴 뒤의 항목으로 다시 내린다.
+    assert readiness_checks == ["gs://bucket/cover.png"]
+    assert recovered[0][1]["safe_error_codes"] == (
+        "IMAGE_GENERATION_FAILED",
+        "CONTENT_IMAGE_NOT_READY",
+    )
+
+
+def test_image_stage_failure_marks_failed_and_opens_incident(monkeypatch):
+    item, hospital = _image_stage_item(tasks.IMAGE_STATUS_PENDING)
+    db = _ImageStageDB(item, hospital)
+    _patch_image_stage_shell(monkeypatch, db)
+    incidents = []
+
+    async def empty_image(*_args, **_kwargs):
+        return "", ""
+
+    async def capture_incident(**kwargs):
+        incidents.append(kwargs)
+
+    monkeypatch.setattr(tasks, "generate_image", empty_image)
+    monkeypatch.setattr(tasks, "open_generation_incident", capture_incident)
+
+    result = tasks.generate_content_image_stage.run(str(item.id), str(uuid.uuid4()))
+
+    assert result == {"status": "failed"}
+    assert db.written_values == [{"image_status": tasks.IMAGE_STATUS_FAILED}]
+    assert incidents[0]["code"] == "IMAGE_GENERATION_FAILED"
+
+
+@pytest.mark.parametrize("image_status", [None, "READY", "FAILED"])
+def test_image_stage_redelivery_skips_items_not_pending(monkeypatch, image_status):
+    item, hospital = _image_stage_item(image_status)
+    db = _ImageStageDB(item, hospital)
+    _patch_image_stage_shell(monkeypatch, db)
+
+    async def forbidden_image(*_args, **_kwargs):
+        raise AssertionError("이미 끝난 단계를 다시 생성했다")
+
+    monkeypatch.setattr(tasks, "generate_image", forbidden_image)
+
+    assert tasks.generate_content_image_stage.run(str(item.id), str(uuid.uuid4())) == {
+        "status": "skipped"
+    }
+    assert db.written_values == []
@@ -0,0 +1,60 @@
+from app.utils.title_similarity import (
+    TitleSimilarityIndex,
+    jaccard,
+    normalize_title,
+    title_shingles,
+)
+
+
+def test_normalize_title_folds_width_case_and_punctuation():
+    assert normalize_title("ＭＲＩ 검사, 언제 필요할까?") == "mri검사언제필요할까"
+    assert normalize_title(None) == ""
+
+
+def test_particle_variation_is_a_near_duplicate():
+    index = TitleSimilarityIndex(["무릎 통증 원인과 치료 방법"])
+
+    assert index.near_duplicate("무릎 통증의 원인과 치료 방법") == "무릎 통증 원인과 치료 방법"
+
+
+def test_same_template_different_body_part_is_not_a_duplicate():
+    index = TitleSimilarityIndex(["무릎 통증 원인과 치료 방법"])
+
+    assert index.near_duplicate("어깨 통증 원인과 치료 방법") is None
+
+
+def test_exact_match_after_normalization_is_always_a_duplicate():
+    index = TitleSimilarityIndex(["대장내시경 전 식단"])
+
+    assert index.near_duplicate("대장내시경  전 식단!") == "대장내시경 전 식단"
+
+
+def test_nearest_ranks_by_similarity_and_caps_the_prompt_list():
+    titles = [f"감기 예방 수칙 {n}" for n in range(40)] + [
+        "대장내시경 준비 과정",
+        "대장내시경 전날 식단",
+        "위내시경 수면 마취",
+    ]
+    index = TitleSimilarityIndex(titles)
+
+    nearest = index.nearest("대장내시경 준비", limit=2)
+
+    assert nearest == ["대장내시경 준비 과정", "대장내시경 전날 식단"]
+    assert len(index.nearest("감기 예방", limit=5)) == 5
+
+
+def test_nearest_ignores_titles_without_shared_ngrams():
+    index = TitleSimilarityIndex(["허리 디스크 운동"])
+
+    assert index.nearest("대장내시경") == []
+
+
+def test_recent_returns_the_tail_in_input_order_without_duplicates():
+    index = TitleSimilarityIndex(["하나", "둘", "하나", None, "셋"])
+
+    assert len(index) == 3
+    assert index.recent(2) == ["둘", "셋"]
+
+
+def test_jaccard_of_empty_sets_is_zero():
+    assert jaccard(frozenset(), title_shingles("무릎")) == 0.0
@@ -10,6 +10,7 @@ from app.workers import dispatch_auth, generation_run_control
 CANARY_TASKS = {
     "app.workers.canary_tasks.canary_default": "canary-default",
     "app.workers.canary_tasks.canary_content": "canary-content",
+    "app.workers.canary_tasks.canary_images": "canary-images",
     "app.workers.canary_tasks.canary_sov": "canary-sov",
     "app.workers.canary_tasks.canary_reports": "canary-reports",
     "app.workers.canary_tasks.canary_leadgen": "canary-leadgen",
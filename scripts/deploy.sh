@@ -123,6 +123,8 @@ BACKEND_BASE_REQUIRED_SECRET_NAMES=(
   "SLACK_WEBHOOK_URL"
   "ADMIN_SECRET_KEY"
   "WORKER_DISPATCH_SECRET"
+  # /metrics·/queues/backlog 스크레이프 토큰. config.py가 프로덕션에서 비어 있으면 부팅을 막는다.
+  "METRICS_BEARER_TOKEN"
   "ADMIN_SESSION_SECRET"
   "SITE_BFF_SECRET"
   "REDIS_URL"
@@ -50,6 +50,14 @@ resource "google_secret_manager_secret" "worker_dispatch_secret" {
   }
 }
 
+resource "google_secret_manager_secret" "metrics_bearer_token" {
+  secret_id = "METRICS_BEARER_TOKEN"
+  project   = var.project_id
+  replication {
+    auto {}
+  }
+}
+
 resource "google_secret_manager_secret" "admin_session_secret" {
   secret_id = "ADMIN_SESSION_SECRET"
   project   = var.project_id
@@ -137,6 +145,7 @@ locals {
     SLACK_WEBHOOK_URL        = google_secret_manager_secret.slack_webhook_url.secret_id
     ADMIN_SECRET_KEY         = google_secret_manager_secret.admin_secret_key.secret_id
     WORKER_DISPATCH_SECRET   = google_secret_manager_secret.worker_dispatch_secret.secret_id
+    METRICS_BEARER_TOKEN     = google_secret_manager_secret.metrics_bearer_token.secret_id
     ADMIN_SESSION_SECRET     = google_secret_manager_secret.admin_session_secret.secret_id
     DB_PASSWORD              = google_secret_manager_secret.db_password.secret_id
     SITE_REVALIDATE_SECRET   = google_secret_manager_secret.site_revalidate_secret.secret_id